@@ -0,0 +1,82 @@
+"""
+Gunicorn configuration (PRODUCTION) - loaded automatically from the working directory
+
+All settings can be overridden via environment or .env (GUNICORN_*, see env_template):
+- Workers: 2 x CPU + 1, capped at 8 - every worker has its own DB pool
+  (DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW connections)
+- gthread workers: the timeout is a worker heartbeat, not a per-request limit, so long
+  LLM calls and streamed downloads are not killed; threads serve other requests meanwhile
+- Workers are recycled after max_requests (+ jitter, so they don't all restart at once)
+
+Prometheus multiprocess mode: every worker writes its metric samples to
+PROMETHEUS_MULTIPROC_DIR, /metrics aggregates them. The directory must be set
+before the workers import the app and is wiped on server start (stale files of
+a previous run would be summed up otherwise).
+
+preload_app: the master imports the app once (~1-2 s of imports, see
+`make importtime`), workers are forked with the modules already loaded and share
+them copy-on-write. Worker (re)starts then take milliseconds. Nothing may open
+connections at import time - the DB engine and S3 clients are created on first use,
+post_fork replaces anything the master created anyway. Code changes need a full
+restart (HUP reloads config but re-forks the preloaded app).
+"""
+
+import multiprocessing
+import os
+import shutil
+
+from dotenv import load_dotenv
+
+
+# Same .env as the app (config/settings.py), read before the app is imported so GUNICORN_* apply
+load_dotenv(os.getenv("DOTENV_FILE", ".env"))
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/aiproxy-prometheus")
+# preload_app imports the app (and creates its metric files) before on_starting runs
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5050")
+workers = int(os.getenv("GUNICORN_WORKERS") or min(multiprocessing.cpu_count() * 2 + 1, 8))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "180"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Header fields up to 32 KB (gunicorn default: 8190 bytes)
+limit_request_field_size = 32768
+
+
+def on_starting(server):  # noqa: ARG001
+    """Reset the metrics directory before the first worker is forked (workers open their own files)"""
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def post_fork(server, worker):  # noqa: ARG001
+    """Do not share DB connections or S3 clients of the master with the forked worker"""
+    from db.database import reset_engine_after_fork
+    from infrastructure.storage.s3_storage import reset_clients_after_fork
+
+    reset_engine_after_fork()
+    reset_clients_after_fork()
+
+
+def worker_exit(server, worker):  # noqa: ARG001
+    """Close DB and S3 connections of a stopping worker (recycled, scaled down or shut down)"""
+    from db.database import close_engine
+    from infrastructure.storage.s3_storage import close_clients
+
+    close_engine()
+    close_clients()
+
+
+def child_exit(server, worker):  # noqa: ARG001
+    """Remove live gauges (in-flight requests, checked out connections) of an exited worker"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
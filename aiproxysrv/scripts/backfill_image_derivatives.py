@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Backfill image derivatives (thumb/preview) for existing images and release covers
+
+New images get their derivatives on save. This script generates them for images
+stored before (generated images, text overlays, release covers). Decoding and
+encoding is CPU bound, so images are processed in a process pool. Images with
+existing derivatives are skipped (idempotent, safe to re-run).
+
+Usage:
+    # Backfill all images (one process per CPU)
+    python backfill_image_derivatives.py
+
+    # Regenerate everything with 2 processes (e.g. after changing IMAGE_DERIVATIVE_FORMAT)
+    python backfill_image_derivatives.py --force --workers 2
+
+Example Output:
+    ✓ 412 images: 398 generated, 12 skipped, 2 failed
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from business.image_derivative_orchestrator import backfill_image_derivatives
+from config.settings import S3_IMAGES_BUCKET, S3_SONG_RELEASES_BUCKET
+from db.database import SessionLocal
+from db.models import GeneratedImage, SongRelease
+
+
+def fetch_image_keys() -> list[tuple[str, str]]:
+    """Collect (bucket, s3_key) of all S3 images and release covers"""
+    db = SessionLocal()
+    try:
+        image_keys = [
+            (S3_IMAGES_BUCKET, s3_key)
+            for (s3_key,) in db.query(GeneratedImage.s3_key)
+            .filter(GeneratedImage.storage_backend == "s3", GeneratedImage.s3_key.isnot(None))
+            .order_by(GeneratedImage.created_at.desc())
+        ]
+        cover_keys = [
+            (S3_SONG_RELEASES_BUCKET, s3_key)
+            for (s3_key,) in db.query(SongRelease.cover_s3_key).filter(SongRelease.cover_s3_key.isnot(None))
+        ]
+        return image_keys + cover_keys
+    finally:
+        db.close()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Backfill image derivatives (thumb/preview)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Regenerate existing derivatives")
+    args = parser.parse_args()
+
+    keys = fetch_image_keys()
+    print(f"Processing {len(keys)} images with {args.workers} processes...")
+
+    results = Counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(backfill_image_derivatives, bucket, s3_key, args.force) for bucket, s3_key in keys]
+        for future in futures:
+            results[future.result()] += 1
+
+    print(
+        f"✓ {len(keys)} images: {results['generated']} generated, {results['skipped']} skipped, "
+        f"{results['failed']} failed"
+    )
+    sys.exit(1 if results["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
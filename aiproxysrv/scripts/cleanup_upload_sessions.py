@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Clean up expired song project upload sessions (resumable chunked uploads)
+
+Open sessions without activity for SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS are
+aborted, which frees their already uploaded S3 multipart parts. Expired session
+rows (open, completed or aborted) are deleted. Run this script periodically
+(e.g. hourly via cron).
+
+Usage:
+    python cleanup_upload_sessions.py
+
+Example Output:
+    ✓ Aborted 2 open sessions, deleted 14 expired sessions, 0 failed
+"""
+
+import sys
+
+from business.song_project_orchestrator import song_project_orchestrator
+from db.database import SessionLocal
+
+
+def main():
+    """Main entry point"""
+    db = SessionLocal()
+    try:
+        stats = song_project_orchestrator.cleanup_expired_upload_sessions(db)
+    finally:
+        db.close()
+
+    print(
+        f"✓ Aborted {stats['aborted']} open sessions, deleted {stats['deleted']} expired sessions, "
+        f"{stats['failed']} failed"
+    )
+    sys.exit(1 if stats["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
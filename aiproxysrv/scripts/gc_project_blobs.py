@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Delete unreferenced song project blobs (content-addressed storage)
+
+Blobs whose reference count dropped to 0 are kept for a grace period
+(SONG_PROJECT_BLOB_GC_GRACE_HOURS) so that in-flight uploads and claims can still
+reference them. Run this script periodically (e.g. daily via cron).
+
+Usage:
+    # Delete blobs unreferenced for longer than the configured grace period
+    python gc_project_blobs.py
+
+    # Show what would be deleted
+    python gc_project_blobs.py --dry-run
+
+    # Custom grace period
+    python gc_project_blobs.py --grace-hours 72
+
+Example Output:
+    ✓ Deleted 12 blobs (340.5 MB freed), 0 failed
+"""
+
+import argparse
+import sys
+
+from business.song_project_orchestrator import song_project_orchestrator
+from config.settings import SONG_PROJECT_BLOB_GC_GRACE_HOURS
+from db.database import SessionLocal
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Delete unreferenced song project blobs")
+    parser.add_argument(
+        "--grace-hours",
+        type=float,
+        default=SONG_PROJECT_BLOB_GC_GRACE_HOURS,
+        help=f"Minimum hours without references (default: {SONG_PROJECT_BLOB_GC_GRACE_HOURS})",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="Blobs per transaction (default: 100)")
+    parser.add_argument("--dry-run", action="store_true", help="Only count candidates (first batch)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        stats = song_project_orchestrator.gc_unreferenced_blobs(
+            db, grace_hours=args.grace_hours, batch_size=args.batch_size, dry_run=args.dry_run
+        )
+    finally:
+        db.close()
+
+    freed_mb = stats["freed_bytes"] / (1024 * 1024)
+    if args.dry_run:
+        print(f"Dry-run: {stats['deleted']} blobs ({freed_mb:.1f} MB) would be deleted")
+    else:
+        print(f"✓ Deleted {stats['deleted']} blobs ({freed_mb:.1f} MB freed), {stats['failed']} failed")
+
+    sys.exit(1 if stats["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
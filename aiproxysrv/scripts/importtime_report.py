@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Import time report for the WSGI entry point
+
+Runs `python -X importtime -c "import wsgi"` in a fresh interpreter and lists the
+slowest modules, so heavy top-level imports show up before they slow down every
+gunicorn start and worker restart. No S3 / DB access (engine and storage are lazy).
+
+Usage:
+    python importtime_report.py
+    python importtime_report.py --top 40 --module api.app
+    python importtime_report.py --self        # sort by self time instead of cumulative
+
+Example Output:
+    Total: 1183.2 ms (import wsgi)
+
+      cumul ms    self ms  module
+       1183.2        0.6  wsgi
+       1101.4        2.1  api.app
+        ...
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def measure(module: str) -> list[tuple[int, int, str]]:
+    """(self_us, cumulative_us, module) for every import done by `import <module>`"""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        # "| name" - nested imports are indented by two more spaces per level
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()[1:]))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show the slowest imports of the app entry point")
+    parser.add_argument("--module", default="wsgi", help="Module to import (default: wsgi)")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to list (default: 25)")
+    parser.add_argument("--self", dest="by_self", action="store_true", help="Sort by self time")
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    # Top-level imports are the ones without indentation
+    total_us = sum(cumulative for _, cumulative, name in rows if not name.startswith(" "))
+    print(f"Total: {total_us / 1000:.1f} ms (import {args.module})\n")
+
+    rows.sort(key=lambda row: row[0] if args.by_self else row[1], reverse=True)
+    print(f"{'cumul ms':>10} {'self ms':>10}  module")
+    for self_us, cumulative_us, name in rows[: args.top]:
+        print(f"{cumulative_us / 1000:>10.1f} {self_us / 1000:>10.1f}  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
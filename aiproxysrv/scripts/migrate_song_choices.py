@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Migrate song choice audio files from the Mureka CDN to S3 (proactive, in the background)
+
+Picks choices of successful songs whose files (SONG_MIGRATION_FILE_TYPES) are not in
+S3 yet - newest songs first - and streams them CDN -> S3 with bounded concurrency
+(SONG_MIGRATION_CONCURRENCY). Failed choices are retried with exponential backoff up
+to SONG_MIGRATION_MAX_ATTEMPTS. A DB lease prevents double transfers with the API
+workers, which migrate on first playback.
+
+Run as sidecar (--watch) or periodically via cron.
+
+Usage:
+    # Migrate one batch
+    python migrate_song_choices.py
+
+    # Keep polling for new successful songs
+    python migrate_song_choices.py --watch --interval 30
+
+Example Output:
+    ✓ 12 choices: 11 migrated, 1 failed, 0 skipped
+"""
+
+import argparse
+import sys
+import time
+
+from business.song_migration_worker import SongMigrationWorker
+from config.settings import SONG_MIGRATION_CONCURRENCY, SONG_MIGRATION_ENABLED
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Migrate song choice audio files from Mureka to S3")
+    parser.add_argument("--batch-size", type=int, default=100, help="Choices per batch (default: 100)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SONG_MIGRATION_CONCURRENCY,
+        help=f"Parallel transfers (default: {SONG_MIGRATION_CONCURRENCY})",
+    )
+    parser.add_argument("--watch", action="store_true", help="Keep running and poll for pending choices")
+    parser.add_argument("--interval", type=float, default=30.0, help="Seconds between idle polls (default: 30)")
+    args = parser.parse_args()
+
+    if not SONG_MIGRATION_ENABLED:
+        print("Song migration disabled (SONG_MIGRATION_ENABLED=false)")
+        sys.exit(0)
+
+    worker = SongMigrationWorker(max_workers=args.concurrency)
+    failed = 0
+    while True:
+        stats = worker.migrate_pending(limit=args.batch_size)
+        failed += stats["failed"]
+        if stats["choices"]:
+            print(
+                f"✓ {stats['choices']} choices: {stats['migrated']} migrated, "
+                f"{stats['failed']} failed, {stats['skipped']} skipped"
+            )
+
+        if not args.watch:
+            break
+        # Next batch right away while there is work left
+        if stats["choices"] < args.batch_size:
+            time.sleep(args.interval)
+
+    if not stats["choices"]:
+        print("✓ No pending choices")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import requests
 
 from config.settings import CHAT_DEBUG_LOGGING, CLAUDE_API_KEY, CLAUDE_API_VERSION, CLAUDE_BASE_URL, CLAUDE_TIMEOUT
 from utils.logger import logger
+from utils.metrics import track_upstream
 
 
 class ClaudeAPIClient:
@@ -62,7 +63,9 @@ class ClaudeAPIClient:
             )
 
         try:
-            resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+            with track_upstream("claude", payload.get("model")) as call:
+                resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+                call.set_status(resp.status_code)
 
             # Log response status
             if CHAT_DEBUG_LOGGING:
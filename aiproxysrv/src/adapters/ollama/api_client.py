@@ -7,6 +7,7 @@ import requests
 
 from config.settings import CHAT_DEBUG_LOGGING, OLLAMA_TIMEOUT, OLLAMA_URL
 from utils.logger import logger
+from utils.metrics import track_upstream
 
 
 class OllamaAPIClient:
@@ -54,7 +55,9 @@ class OllamaAPIClient:
             logger.debug("Calling Ollama API", api_url=api_url, model=model)
 
         try:
-            resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+            with track_upstream("ollama", model) as call:
+                resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+                call.set_status(resp.status_code)
 
             if CHAT_DEBUG_LOGGING:
                 logger.debug("Ollama API response received", status_code=resp.status_code)
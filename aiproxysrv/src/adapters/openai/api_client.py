@@ -6,6 +6,7 @@ import requests
 
 from config.settings import CHAT_DEBUG_LOGGING, OPENAI_ADMIN_BASE_URL, OPENAI_API_KEY, OPENAI_TIMEOUT
 from utils.logger import logger
+from utils.metrics import track_upstream
 
 
 class OpenAIAPIClient:
@@ -56,7 +57,9 @@ class OpenAIAPIClient:
             )
 
         try:
-            resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+            with track_upstream("openai", payload.get("model")) as call:
+                resp = requests.post(api_url, headers=headers, json=payload, timeout=self.timeout)
+                call.set_status(resp.status_code)
 
             # Log response status
             if CHAT_DEBUG_LOGGING:
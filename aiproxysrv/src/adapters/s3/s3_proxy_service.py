@@ -32,7 +32,13 @@ class S3ProxyService:
     """Generic service for proxying S3 resources to browser via backend"""
 
     @staticmethod
-    def serve_resource(bucket: str, s3_key: str, filename: str) -> Response:
+    def serve_resource(
+        bucket: str,
+        s3_key: str,
+        filename: str,
+        fallback_s3_key: str | None = None,
+        fallback_filename: str | None = None,
+    ) -> Response:
         """
         Stream S3 resource to browser (generic proxy method)
 
@@ -40,6 +46,8 @@ class S3ProxyService:
             bucket: S3 bucket name
             s3_key: S3 object key (full path)
             filename: Original filename (for Content-Type detection)
+            fallback_s3_key: Served instead if s3_key can't be loaded (e.g. derivative not generated yet)
+            fallback_filename: Filename of the fallback (default: filename)
 
         Returns:
             Flask Response with binary data
@@ -57,7 +65,16 @@ class S3ProxyService:
         try:
             # Download from S3
             storage = get_storage(bucket=bucket)
-            data = storage.download(s3_key)
+            try:
+                data = storage.download(s3_key)
+            except Exception as e:
+                if not fallback_s3_key:
+                    raise
+                logger.debug(
+                    "S3 resource missing, serving fallback", s3_key=s3_key, fallback=fallback_s3_key, error=str(e)
+                )
+                s3_key, filename = fallback_s3_key, fallback_filename or filename
+                data = storage.download(s3_key)
 
             # Determine Content-Type from filename
             content_type = S3ProxyService._get_content_type(filename)
@@ -0,0 +1,41 @@
+"""add (folder_id, relative_path, id) indexes for paged folder listings
+
+Folder file pages seek with WHERE folder_id = :folder AND (relative_path, id) > (:path, :id)
+ORDER BY relative_path, id. The composite index serves filter, seek and order in one range scan.
+
+Every folder listing also filters relative_path LIKE '<folder>/<prefix>%'. A btree on the
+default operator class only serves LIKE under the "C" collation, so the prefix gets its own
+varchar_pattern_ops index (relative_path is VARCHAR(500)); pattern_ops indexes cannot serve
+ORDER BY, which is why the ordered index above stays.
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: str | None = "f7a8b9c0d1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_project_files_folder_path_id", "project_files", ["folder_id", "relative_path", "id"])
+    op.create_index(
+        "idx_project_files_folder_path_prefix",
+        "project_files",
+        ["folder_id", "relative_path"],
+        postgresql_ops={"relative_path": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_project_files_folder_path_prefix", "project_files")
+    op.drop_index("idx_project_files_folder_path_id", "project_files")
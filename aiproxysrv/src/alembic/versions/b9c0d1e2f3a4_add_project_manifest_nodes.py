@@ -0,0 +1,48 @@
+"""add project_manifest_nodes (folder Merkle manifest for incremental Mirror sync)
+
+Nodes are built lazily per folder on the first manifest request and then kept
+up to date by song_project_service on every file create/update/delete/move,
+so no backfill is needed here.
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9c0d1e2f3a4"
+down_revision: str | None = "a8b9c0d1e2f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_manifest_nodes",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("folder_id", sa.UUID(), nullable=False),
+        sa.Column("path", sa.String(length=500), nullable=False),
+        sa.Column("parent_path", sa.String(length=500), nullable=True),
+        sa.Column("node_hash", sa.String(length=64), nullable=False),
+        sa.Column("file_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["folder_id"], ["project_folders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("folder_id", "path", name="uq_project_manifest_nodes_folder_path"),
+    )
+    op.create_index(op.f("ix_project_manifest_nodes_folder_id"), "project_manifest_nodes", ["folder_id"])
+    op.create_index("idx_project_manifest_nodes_folder_parent", "project_manifest_nodes", ["folder_id", "parent_path"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_project_manifest_nodes_folder_parent", table_name="project_manifest_nodes")
+    op.drop_index(op.f("ix_project_manifest_nodes_folder_id"), table_name="project_manifest_nodes")
+    op.drop_table("project_manifest_nodes")
@@ -0,0 +1,43 @@
+"""add project_file_blobs (content-addressed, deduplicated song project storage)
+
+Files with storage_backend='blob' share one object per SHA256 (blobs/sha256/...).
+Existing files keep storage_backend='s3' and their per-project objects.
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d1e2f3a4b5"
+down_revision: str | None = "b9c0d1e2f3a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_file_blobs",
+        sa.Column("file_hash", sa.String(length=64), nullable=False),
+        sa.Column("s3_key", sa.String(length=255), nullable=False),
+        sa.Column("file_size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("mime_type", sa.String(length=100), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("unreferenced_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("file_hash"),
+    )
+    op.create_index(op.f("ix_project_file_blobs_unreferenced_at"), "project_file_blobs", ["unreferenced_at"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_project_file_blobs_unreferenced_at"), table_name="project_file_blobs")
+    op.drop_table("project_file_blobs")
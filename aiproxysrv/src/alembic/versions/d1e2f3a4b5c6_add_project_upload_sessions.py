@@ -0,0 +1,58 @@
+"""add project_upload_sessions (resumable chunked uploads via S3 multipart)
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e2f3a4b5c6"
+down_revision: str | None = "c0d1e2f3a4b5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_upload_sessions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("folder_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("relative_path", sa.String(length=500), nullable=False),
+        sa.Column("file_size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("file_hash", sa.String(length=64), nullable=False),
+        sa.Column("staging_key", sa.String(length=255), nullable=False),
+        sa.Column("upload_id", sa.String(length=255), nullable=False),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="open"),
+        sa.Column("file_id", sa.UUID(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["song_projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["folder_id"], ["project_folders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_project_upload_sessions_id"), "project_upload_sessions", ["id"])
+    op.create_index(op.f("ix_project_upload_sessions_project_id"), "project_upload_sessions", ["project_id"])
+    op.create_index(op.f("ix_project_upload_sessions_expires_at"), "project_upload_sessions", ["expires_at"])
+    op.create_index(
+        "idx_project_upload_sessions_lookup", "project_upload_sessions", ["folder_id", "relative_path", "status"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_project_upload_sessions_lookup", table_name="project_upload_sessions")
+    op.drop_index(op.f("ix_project_upload_sessions_expires_at"), table_name="project_upload_sessions")
+    op.drop_index(op.f("ix_project_upload_sessions_project_id"), table_name="project_upload_sessions")
+    op.drop_index(op.f("ix_project_upload_sessions_id"), table_name="project_upload_sessions")
+    op.drop_table("project_upload_sessions")
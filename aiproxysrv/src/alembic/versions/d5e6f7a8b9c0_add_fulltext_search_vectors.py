@@ -0,0 +1,53 @@
+"""add full-text search vectors with GIN indexes
+
+Replaces ILIKE '%term%' search (sequential scan on Text columns) with generated
+tsvector columns. Expressions must stay identical to db.models (build_search_vector_sql).
+
+Revision ID: d5e6f7a8b9c0
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: str | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# table -> {column: weight}
+SEARCH_VECTORS = {
+    "songs": {"title": "A", "tags": "B", "lyrics": "C"},
+    "song_sketches": {"title": "A", "tags": "B", "prompt": "C", "lyrics": "D"},
+    "generated_images": {"title": "A", "user_prompt": "B", "prompt": "C"},
+    "song_projects": {"project_name": "A", "description": "B"},
+    "equipment": {"name": "A", "manufacturer": "B", "software_tags": "B", "plugin_tags": "B"},
+}
+
+
+def _search_vector_sql(weighted_columns: dict[str, str]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('simple'::regconfig, coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns.items()
+    )
+
+
+def upgrade() -> None:
+    for table, weighted_columns in SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({_search_vector_sql(weighted_columns)}) STORED"
+        )
+        op.create_index(f"idx_{table}_search_vector", table, ["search_vector"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for table in reversed(list(SEARCH_VECTORS)):
+        op.drop_index(f"idx_{table}_search_vector", table)
+        op.drop_column(table, "search_vector")
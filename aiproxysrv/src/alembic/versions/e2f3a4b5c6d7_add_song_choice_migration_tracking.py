@@ -0,0 +1,32 @@
+"""add song_choices migration tracking (background Mureka CDN -> S3 migration)
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f3a4b5c6d7"
+down_revision: str | None = "d1e2f3a4b5c6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("song_choices", sa.Column("s3_migration_attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("song_choices", sa.Column("s3_migration_error", sa.Text(), nullable=True))
+    op.add_column("song_choices", sa.Column("s3_migration_next_attempt_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("song_choices", "s3_migration_next_attempt_at")
+    op.drop_column("song_choices", "s3_migration_error")
+    op.drop_column("song_choices", "s3_migration_attempts")
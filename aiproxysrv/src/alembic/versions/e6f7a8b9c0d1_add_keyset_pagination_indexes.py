@@ -0,0 +1,42 @@
+"""add composite indexes for keyset (cursor) pagination
+
+Cursor pagination seeks with WHERE (sort_key, id) < (:value, :id) ORDER BY sort_key, id.
+These indexes let PostgreSQL start the scan directly at the cursor instead of
+sorting/skipping all earlier rows (OFFSET).
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: str | None = "d5e6f7a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# (index name, table, columns)
+KEYSET_INDEXES = [
+    ("idx_songs_created_at_id", "songs", ["created_at", "id"]),
+    ("idx_generated_images_created_at_id", "generated_images", ["created_at", "id"]),
+    ("idx_song_sketches_created_at_id", "song_sketches", ["created_at", "id"]),
+    ("idx_equipment_user_name_id", "equipment", ["user_id", "name", "id"]),
+    ("idx_conversations_user_updated_at_id", "conversations", ["user_id", "updated_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for index_name, table, columns in KEYSET_INDEXES:
+        op.create_index(index_name, table, columns)
+
+
+def downgrade() -> None:
+    for index_name, table, _columns in reversed(KEYSET_INDEXES):
+        op.drop_index(index_name, table)
@@ -0,0 +1,46 @@
+"""add llm_call_telemetry (per-call LLM performance telemetry)
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a4b5c6d7e8"
+down_revision: str | None = "e2f3a4b5c6d7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_call_telemetry",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("source", sa.String(length=100), nullable=True),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("total_ms", sa.Integer(), nullable=False),
+        sa.Column("queue_wait_ms", sa.Integer(), nullable=True),
+        sa.Column("ttft_ms", sa.Integer(), nullable=True),
+        sa.Column("load_ms", sa.Integer(), nullable=True),
+        sa.Column("prompt_eval_ms", sa.Integer(), nullable=True),
+        sa.Column("eval_ms", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_llm_call_telemetry_created_model", "llm_call_telemetry", ["created_at", "model"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_llm_call_telemetry_created_model", table_name="llm_call_telemetry")
+    op.drop_table("llm_call_telemetry")
@@ -0,0 +1,65 @@
+"""add maintained file statistics to song_projects and project_folders
+
+file_count / total_size_bytes / files_modified_at are updated by song_project_service
+in the same transaction as every file create/update/delete/move, so project details
+no longer need to load all project_files rows to show totals.
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: str | None = "e6f7a8b9c0d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# table -> foreign key column in project_files
+STATS_TABLES = {
+    "song_projects": "project_id",
+    "project_folders": "folder_id",
+}
+
+
+def upgrade() -> None:
+    for table, fk_column in STATS_TABLES.items():
+        op.add_column(table, sa.Column("file_count", sa.Integer(), nullable=False, server_default="0"))
+        op.add_column(table, sa.Column("total_size_bytes", sa.BigInteger(), nullable=False, server_default="0"))
+        op.add_column(table, sa.Column("files_modified_at", sa.DateTime(timezone=True), nullable=True))
+
+        # Backfill from existing files
+        op.execute(
+            f"""
+            UPDATE {table} t
+            SET file_count = s.file_count,
+                total_size_bytes = s.total_size_bytes,
+                files_modified_at = s.files_modified_at
+            FROM (
+                SELECT {fk_column} AS id,
+                       COUNT(*) AS file_count,
+                       COALESCE(SUM(file_size_bytes), 0) AS total_size_bytes,
+                       MAX(COALESCE(updated_at, created_at)) AS files_modified_at
+                FROM project_files
+                WHERE {fk_column} IS NOT NULL
+                GROUP BY {fk_column}
+            ) s
+            WHERE t.id = s.id
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(list(STATS_TABLES)):
+        op.drop_column(table, "files_modified_at")
+        op.drop_column(table, "total_size_bytes")
+        op.drop_column(table, "file_count")
@@ -3,18 +3,36 @@ Flask App mit allen Blueprints + OpenAPI/Swagger Integration
 """
 
 import contextlib
+import hmac
+import random
+import time
 import traceback
-from pathlib import Path
 
-import tomli
-import yaml
-from apispec import APISpec
-from flask import Blueprint, Flask, Response, jsonify
+from flask import Blueprint, Flask, Response, g, jsonify, request
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from config.settings import (
+    DEBUG,
+    METRICS_AUTH_TOKEN,
+    METRICS_ENABLED,
+    PROFILER_DIR,
+    PROFILER_INTERVAL_MS,
+    PROFILER_MAX_PROFILES,
+    PROFILER_MODE,
+    PROFILER_SAMPLE_RATE,
+    PROFILER_SECRET,
+    TRACING_ENABLED,
+)
+from db.database import get_engine
+from db.query_stats import finish_request_stats, get_pool_status, start_request_stats
 from utils.logger import logger
+from utils.metrics import HTTP_REQUESTS_IN_PROGRESS, generate_metrics, observe_http_request
+from utils.profiler import PROFILE_HEADER, PROFILE_ID_HEADER, PROFILE_QUERY_PARAM, RequestProfile, should_profile
+from utils.tracing import KIND_ROUTE, TRACE_ID_HEADER, TRACE_TOKEN_HEADER, finish_trace, start_trace
+from utils.version import get_version
 
+from .json_provider import FastJSONProvider
 from .routes.chat_routes import api_chat_v1
 from .routes.claude_chat_routes import api_claude_chat_v1
 from .routes.conversation_routes import api_conversation_v1
@@ -22,29 +40,28 @@ from .routes.cost_routes import api_openai_costs_v1
 from .routes.equipment_routes import api_equipment_v1
 from .routes.health_routes import api_health_v1
 from .routes.image_routes import api_image_v1
+from .routes.llm_telemetry_routes import api_llm_telemetry_v1
 from .routes.lyric_parsing_rule_routes import api_lyric_parsing_rule_v1
 from .routes.ollama_routes import api_ollama_v1
 from .routes.openai_chat_routes import api_openai_chat_v1
+from .routes.profiler_routes import api_profiler_v1
 from .routes.prompt_routes import api_prompt_v1
 from .routes.sketch_routes import api_sketch_v1
 from .routes.song_project_routes import api_song_projects_v1
 from .routes.song_release_routes import api_song_releases_v1
 from .routes.song_routes import api_song_v1
+from .routes.tracing_routes import api_tracing_v1, is_tracing_admin_token
 from .routes.user_routes import api_user_v1
 from .routes.workshop_routes import api_workshop_v1
 
 
-def get_version() -> str:
-    """Read version from pyproject.toml"""
-    try:
-        # Path from src/api/app.py to aiproxysrv root (2 levels up)
-        pyproject_path = Path(__file__).parents[2] / "pyproject.toml"
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomli.load(f)
-            return pyproject_data.get("project", {}).get("version", "unknown")
-    except Exception as e:
-        logger.warning("Failed to read version from pyproject.toml", error=str(e))
-        return "unknown"
+def _serializable_errors(errors: list[dict]) -> list[dict]:
+    """Pydantic error list with exceptions in ctx (raised by validators) replaced by their message"""
+    for err in errors:
+        ctx = err.get("ctx")
+        if ctx:
+            err["ctx"] = {key: str(value) if isinstance(value, Exception) else value for key, value in ctx.items()}
+    return errors
 
 
 def create_app():
@@ -54,47 +71,173 @@ def create_app():
     # Add ProxyFix middleware to handle reverse proxy headers
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=1)
 
-    # Monkey patch json.dumps to handle ValueError serialization globally
-    import json
-
-    original_dumps = json.dumps
-
-    def patched_dumps(obj, **kwargs):
-        try:
-            return original_dumps(obj, **kwargs)
-        except TypeError as e:
-            if "ValueError" in str(e) and "not JSON serializable" in str(e):
-                # Convert ValueError objects to strings recursively
-                def convert_valueerrors(o):
-                    if isinstance(o, ValueError):
-                        return str(o)
-                    elif isinstance(o, dict):
-                        return {k: convert_valueerrors(v) for k, v in o.items()}
-                    elif isinstance(o, list):
-                        return [convert_valueerrors(item) for item in o]
-                    return o
-
-                converted_obj = convert_valueerrors(obj)
-                return original_dumps(converted_obj, **kwargs)
-            raise e
-
-    # Replace json.dumps globally
-    json.dumps = patched_dumps
+    # orjson-backed jsonify/get_json (dates/UUIDs as before, see FastJSONProvider)
+    app.json = FastJSONProvider(app)
 
     # Configure CORS to allow requests from Angular frontend
     CORS(app, origins="*", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
 
-    # OpenAPI/Swagger Configuration
-    spec = APISpec(
-        title="thWellys AI-Proxy API",
-        version=get_version(),
-        openapi_version="3.0.2",
-        info={
-            "description": "API für AI-Services: Bildgenerierung, Musikgenerierung und Chat-Integration",
-            "contact": {"name": "rwellinger", "url": "https://github.com/rwellinger/thwellys-ai-toolbox"},
-        },
-        servers=[{"url": "http://localhost:5050/api/v1", "description": "Development Server"}],
-    )
+    # Opt-in request profiler (signed X-Profile trigger or sample rate) - registered first so
+    # it also covers the other hooks; without PROFILER_SECRET there is no per-request cost
+    if PROFILER_SECRET:
+
+        @app.before_request
+        def start_request_profile():
+            if request.blueprint == api_profiler_v1.name:
+                return
+            trigger = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_PARAM)
+            if should_profile(
+                PROFILER_SECRET, request.path, trigger, PROFILER_SAMPLE_RATE, time.time(), random.random()
+            ):
+                try:
+                    g.request_profile = RequestProfile(PROFILER_MODE, PROFILER_INTERVAL_MS)
+                except ValueError as e:
+                    # cProfile on Python 3.12+: only one active profiler per process
+                    logger.debug("Request profiler busy, skipped", error=str(e))
+
+        @app.after_request
+        def finish_request_profile(response):
+            profile = g.pop("request_profile", None)
+            if profile is not None:
+                try:
+                    name = profile.finish(PROFILER_DIR, PROFILER_MAX_PROFILES, request.method, request.path)
+                    response.headers[PROFILE_ID_HEADER] = name
+                    logger.info("Request profiled", request=f"{request.method} {request.path}", profile=name)
+                except OSError as e:
+                    logger.warning("Storing request profile failed", error=str(e))
+            return response
+
+        @app.teardown_request
+        def abort_request_profile(exc):  # noqa: ARG001
+            # after_request is skipped if building the response failed - stop the sampler thread anyway
+            profile = g.pop("request_profile", None)
+            if profile is not None:
+                profile.stop()
+
+    # Request tracing (route -> controller -> orchestrator -> DB/S3/LLM spans) - registered before the
+    # other hooks so their after_request work is part of the trace; Server-Timing shows the breakdown
+    # (internal stages and timings - only in debug mode or with the tracing admin token)
+    if TRACING_ENABLED:
+
+        @app.before_request
+        def start_request_trace():
+            if request.blueprint == api_tracing_v1.name:
+                return
+            route = request.url_rule.rule if request.url_rule else request.path
+            start_trace(
+                f"{request.method} {route}",
+                KIND_ROUTE,
+                **{"http.method": request.method, "http.target": request.path, "http.route": route},
+            )
+
+        @app.after_request
+        def finish_request_trace(response):
+            trace = finish_trace(response.status_code)
+            if trace is not None:
+                if DEBUG or is_tracing_admin_token(request.headers.get(TRACE_TOKEN_HEADER, "")):
+                    response.headers["Server-Timing"] = trace.to_server_timing()
+                response.headers[TRACE_ID_HEADER] = trace.trace_id
+            return response
+
+        @app.teardown_request
+        def abort_request_trace(exc):
+            # after_request is skipped if building the response failed
+            finish_trace(error=type(exc).__name__ if exc else None)
+
+    # Per-request SQL instrumentation (query count, DB time, connection hold time); the live
+    # stats are part of the log context, so every log line of the request carries them
+    @app.before_request
+    def start_query_stats():
+        stats = start_request_stats(f"{request.method} {request.path}")
+        log_context = contextlib.ExitStack()
+        log_context.enter_context(logger.contextualize(request=stats.label, db=stats))
+        g.query_stats_log_context = log_context
+
+    @app.after_request
+    def report_query_stats(response):
+        stats = finish_request_stats()
+        if stats is None or not stats.connections_checked_out:
+            return response
+
+        pool = get_pool_status(get_engine().pool)
+        logger.debug(
+            "Request DB stats",
+            status=response.status_code,
+            pool_checked_out=pool["checked_out"],
+            pool_utilization=pool["utilization"],
+            **stats.to_log_fields(),
+        )
+        if DEBUG:
+            response.headers["X-DB-Stats"] = stats.to_header()
+        return response
+
+    @app.teardown_request
+    def end_query_stats_log_context(exc):  # noqa: ARG001
+        # Runs after the after_request logs (and also if building the response failed)
+        log_context = g.pop("query_stats_log_context", None)
+        if log_context is not None:
+            log_context.close()
+
+    # Prometheus request metrics (latency per blueprint/endpoint/status, in-flight requests)
+    if METRICS_ENABLED:
+
+        @app.before_request
+        def start_request_metrics():
+            g.metrics_start_time = time.perf_counter()
+            HTTP_REQUESTS_IN_PROGRESS.inc()
+
+        @app.after_request
+        def record_request_metrics(response):
+            start_time = g.get("metrics_start_time")
+            if start_time is not None:
+                observe_http_request(
+                    request.blueprint,
+                    request.endpoint,
+                    request.method,
+                    response.status_code,
+                    time.perf_counter() - start_time,
+                )
+            return response
+
+        @app.teardown_request
+        def finish_request_metrics(exc):  # noqa: ARG001
+            # Runs even if the response could not be built
+            if g.pop("metrics_start_time", None) is not None:
+                HTTP_REQUESTS_IN_PROGRESS.dec()
+
+        if not METRICS_AUTH_TOKEN:
+            # Default: no auth - the endpoint must only be reachable by the scraper (internal network)
+            logger.warning(
+                "/metrics is served without authentication - set METRICS_AUTH_TOKEN or block it at the proxy"
+            )
+
+        @app.route("/metrics")
+        def metrics():
+            """Prometheus scrape endpoint (aggregated over all gunicorn workers)"""
+            if METRICS_AUTH_TOKEN:
+                auth_header = request.headers.get("Authorization", "")
+                if not hmac.compare_digest(auth_header, f"Bearer {METRICS_AUTH_TOKEN}"):
+                    return jsonify({"error": "Unauthorized"}), 401
+            payload, content_type = generate_metrics()
+            return Response(payload, mimetype=None, content_type=content_type)
+
+    # OpenAPI/Swagger Configuration - built on the first spec request, keeps apispec out of app startup
+    def get_openapi_spec():
+        """Shared APISpec instance (schemas/paths are registered into it by openapi_spec)"""
+        if "apispec" not in app.extensions:
+            from apispec import APISpec
+
+            app.extensions["apispec"] = APISpec(
+                title="thWellys AI-Proxy API",
+                version=get_version(),
+                openapi_version="3.0.2",
+                info={
+                    "description": "API für AI-Services: Bildgenerierung, Musikgenerierung und Chat-Integration",
+                    "contact": {"name": "rwellinger", "url": "https://github.com/rwellinger/thwellys-ai-toolbox"},
+                },
+                servers=[{"url": "http://localhost:5050/api/v1", "description": "Development Server"}],
+            )
+        return app.extensions["apispec"]
 
     # Global API Blueprint
     api_v1 = Blueprint("api_v1", __name__, url_prefix="/api/v1")
@@ -111,6 +254,8 @@ def create_app():
     def openapi_spec():
         """OpenAPI JSON specification endpoint"""
         try:
+            spec = get_openapi_spec()
+
             # Import and register schemas
             # Equipment schemas (defined in controller)
             from api.controllers.equipment_controller import (
@@ -471,6 +616,8 @@ def create_app():
                     return json_response
 
                 openapi_dict = json_response.get_json()
+                import yaml
+
                 yaml_content = yaml.dump(openapi_dict, default_flow_style=False, allow_unicode=True)
 
                 return Response(
@@ -543,7 +690,7 @@ def create_app():
         logger.error("Pydantic validation error", error=str(error), fields=error_details)
 
         error_message = "; ".join(error_details) if error_details else str(error)
-        return jsonify({"error": error_message, "validation_errors": error.errors()}), 400
+        return jsonify({"error": error_message, "validation_errors": _serializable_errors(error.errors())}), 400
 
     @app.errorhandler(ValueError)
     def handle_value_error(error):
@@ -587,5 +734,10 @@ def create_app():
     app.register_blueprint(api_claude_chat_v1)
     app.register_blueprint(api_equipment_v1)
     app.register_blueprint(api_workshop_v1)
+    app.register_blueprint(api_llm_telemetry_v1)
+    if PROFILER_SECRET:
+        app.register_blueprint(api_profiler_v1)
+    if TRACING_ENABLED:
+        app.register_blueprint(api_tracing_v1)
 
     return app
@@ -3,8 +3,10 @@
 from typing import Any
 
 from business.chat_orchestrator import ChatOrchestrator
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class ChatController:
     """Controller for chat generation (HTTP handling only, delegates to orchestrator)."""
 
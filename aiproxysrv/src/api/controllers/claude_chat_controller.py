@@ -4,11 +4,13 @@ from typing import Any
 
 from adapters.claude.api_client import ClaudeAPIError  # noqa: F401 # Re-export for backward compatibility
 from business.claude_chat_orchestrator import ClaudeChatOrchestrator
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
 __all__ = ["ClaudeChatController", "ClaudeAPIError"]
 
 
+@trace_methods(KIND_CONTROLLER)
 class ClaudeChatController:
     """Controller for Claude Messages API integration (HTTP handling only, delegates to orchestrator)."""
 
@@ -17,7 +19,7 @@ class ClaudeChatController:
 
     def send_chat_message(
         self, model: str, messages: list[dict[str, str]], max_tokens: int, temperature: float = 0.7
-    ) -> tuple[str, int, int]:
+    ) -> tuple[str, int, int, int, int]:
         """
         Send chat message to Claude Messages API.
 
@@ -28,7 +30,7 @@ class ClaudeChatController:
             temperature: Sampling temperature (0.0-1.0)
 
         Returns:
-            Tuple of (assistant_content, input_tokens, output_tokens)
+            Tuple of (assistant_content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens)
 
         Raises:
             ClaudeAPIError: If API call fails
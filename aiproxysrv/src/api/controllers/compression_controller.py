@@ -6,8 +6,10 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from business.compression_orchestrator import CompressionOrchestrator
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class CompressionController:
     """Controller for compressing conversations (HTTP handling only, delegates to orchestrator)."""
 
@@ -1,7 +1,9 @@
 """Conversation Controller - Handles business logic for AI chat conversations."""
 
+import time
 import traceback
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
@@ -13,12 +15,15 @@ from api.controllers.claude_chat_controller import ClaudeAPIError as ClaudeError
 from api.controllers.claude_chat_controller import ClaudeChatController
 from api.controllers.openai_chat_controller import OpenAIAPIError as OpenAIError
 from api.controllers.openai_chat_controller import OpenAIChatController
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import build_ollama_telemetry
 from config.model_context_windows import (
     get_context_window_size,
     get_external_provider_context_window,
 )
 from config.settings import CLAUDE_MAX_TOKENS, OLLAMA_TIMEOUT, OLLAMA_URL, OPENAI_MAX_TOKENS
 from db.models import Conversation, Message, MessageArchive
+from db.pagination_helpers import InvalidCursorError, apply_keyset_pagination, build_keyset_page
 from schemas.conversation_schemas import (
     ConversationCreate,
     ConversationResponse,
@@ -26,8 +31,11 @@ from schemas.conversation_schemas import (
     MessageResponse,
 )
 from utils.logger import logger
+from utils.metrics import track_upstream
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class ConversationController:
     """Controller for managing AI chat conversations."""
 
@@ -39,6 +47,8 @@ class ConversationController:
         limit: int = 20,
         provider: str = None,
         archived: bool = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict[str, Any], int]:
         """
         List all conversations for a user.
@@ -50,6 +60,8 @@ class ConversationController:
             limit: Pagination limit
             provider: Optional provider filter ('internal' or 'external')
             archived: Optional archived filter (None = only non-archived, True = only archived, False = all)
+            cursor: Keyset cursor ("" = first page), None for skip/limit pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_data, status_code)
@@ -78,10 +90,20 @@ class ConversationController:
                 query = query.filter(Conversation.archived == True)  # noqa: E712
             # If archived is False, no filter is applied (show all)
 
-            query = query.group_by(Conversation.id).order_by(Conversation.updated_at.desc())
+            query = query.group_by(Conversation.id)
 
-            total = query.count()
-            conversations_with_count = query.offset(skip).limit(limit).all()
+            if cursor is not None:
+                total = query.count() if include_total else None
+                query = apply_keyset_pagination(
+                    query, Conversation.updated_at, Conversation.id, "desc", cursor, limit, nullable=True
+                )
+                conversations_with_count, next_cursor = build_keyset_page(
+                    query.all(), limit, Conversation.updated_at, "desc"
+                )
+            else:
+                query = query.order_by(Conversation.updated_at.desc())
+                total = query.count()
+                conversations_with_count = query.offset(skip).limit(limit).all()
 
             # Build response
             conversations = []
@@ -90,6 +112,15 @@ class ConversationController:
                 conv_dict["message_count"] = msg_count
                 conversations.append(conv_dict)
 
+            if cursor is not None:
+                return {
+                    "conversations": conversations,
+                    "total": total,
+                    "limit": limit,
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None,
+                }, 200
+
             return {
                 "conversations": conversations,
                 "total": total,
@@ -97,6 +128,9 @@ class ConversationController:
                 "limit": limit,
             }, 200
 
+        except InvalidCursorError as e:
+            logger.warning("Invalid conversation list cursor", error=str(e), user_id=str(user_id))
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error(
                 "Error listing conversations",
@@ -213,13 +247,18 @@ class ConversationController:
                 .all()
             )
 
+            # Group archived messages by their summary message (single pass, keeps original order)
+            archived_by_summary: dict[uuid.UUID, list[MessageArchive]] = defaultdict(list)
+            for archive in archived_messages:
+                archived_by_summary[archive.summary_message_id].append(archive)
+
             # Build complete message list
             all_messages = []
 
             for msg in active_messages:
                 if msg.is_summary and msg.id:
                     # Replace summary with archived messages
-                    related_archived = [a for a in archived_messages if a.summary_message_id == msg.id]
+                    related_archived = archived_by_summary.get(msg.id, [])
                     # Add archived messages as dict (with original timestamps)
                     for archive in related_archived:
                         all_messages.append(
@@ -509,6 +548,10 @@ class ConversationController:
             for msg in messages:
                 chat_messages.append({"role": msg.role, "content": msg.content})
 
+            # Prompt cache usage (Claude only, NULL for providers without prompt caching)
+            cache_creation_tokens = None
+            cache_read_tokens = None
+
             # Route to appropriate provider
             try:
                 if conversation.provider == "external":
@@ -528,9 +571,16 @@ class ConversationController:
                         enhanced_messages = self._enhance_claude_system_context(chat_messages, conversation.model)
 
                         # Call Claude Chat API
-                        assistant_content, prompt_eval_count, eval_count = self._call_claude_chat_api(
-                            conversation.model, enhanced_messages
-                        )
+                        (
+                            assistant_content,
+                            prompt_eval_count,
+                            eval_count,
+                            cache_creation_tokens,
+                            cache_read_tokens,
+                        ) = self._call_claude_chat_api(conversation.model, enhanced_messages)
+
+                        # Claude reports cached prefix tokens separately from input_tokens
+                        prompt_eval_count += cache_creation_tokens + cache_read_tokens
                     elif conversation.external_provider == "openai":
                         # Call OpenAI Chat API
                         assistant_content, prompt_eval_count, eval_count = self._call_openai_chat_api(
@@ -568,6 +618,8 @@ class ConversationController:
                 role="assistant",
                 content=assistant_content,
                 token_count=eval_count,
+                cache_creation_tokens=cache_creation_tokens,
+                cache_read_tokens=cache_read_tokens,
                 created_at=datetime.utcnow(),
             )
             db.add(assistant_message)
@@ -628,14 +680,23 @@ class ConversationController:
         }
 
         try:
-            resp = requests.post(
-                api_url,
-                json=payload,
-                timeout=OLLAMA_TIMEOUT,
-            )
+            started = time.perf_counter()
+            with track_upstream("ollama", model) as call:
+                resp = requests.post(
+                    api_url,
+                    json=payload,
+                    timeout=OLLAMA_TIMEOUT,
+                )
+                call.set_status(resp.status_code)
             resp.raise_for_status()
 
             resp_json = resp.json()
+            llm_telemetry_orchestrator.record(
+                "ollama",
+                model,
+                build_ollama_telemetry(resp_json, (time.perf_counter() - started) * 1000),
+                source="conversation",
+            )
             logger.debug("Ollama chat API response received")
 
             # Extract assistant message
@@ -692,7 +753,7 @@ class ConversationController:
             logger.error("OpenAI API Error", error=str(e), stacktrace=traceback.format_exc())
             raise
 
-    def _call_claude_chat_api(self, model: str, messages: list[dict[str, str]]) -> tuple[str, int, int]:
+    def _call_claude_chat_api(self, model: str, messages: list[dict[str, str]]) -> tuple[str, int, int, int, int]:
         """
         Call Claude chat API.
 
@@ -701,7 +762,7 @@ class ConversationController:
             messages: List of messages with role and content
 
         Returns:
-            Tuple of (assistant_content, input_tokens, output_tokens)
+            Tuple of (assistant_content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens)
 
         Raises:
             ClaudeError: If API call fails
@@ -710,14 +771,20 @@ class ConversationController:
         logger.debug("Calling Claude chat API", model=model)
 
         try:
-            content, input_tokens, output_tokens = claude_controller.send_chat_message(
-                model=model, messages=messages, max_tokens=CLAUDE_MAX_TOKENS
+            content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens = (
+                claude_controller.send_chat_message(model=model, messages=messages, max_tokens=CLAUDE_MAX_TOKENS)
             )
 
-            logger.debug("Token counts extracted", input_tokens=input_tokens, output_tokens=output_tokens)
+            logger.debug(
+                "Token counts extracted",
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_creation_tokens=cache_creation_tokens,
+                cache_read_tokens=cache_read_tokens,
+            )
 
             # Claude uses input_tokens/output_tokens, we map to prompt_tokens/completion_tokens
-            return content, input_tokens, output_tokens
+            return content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens
 
         except ClaudeError as e:
             logger.error("Claude API Error", error=str(e), stacktrace=traceback.format_exc())
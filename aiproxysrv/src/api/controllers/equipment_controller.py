@@ -14,7 +14,9 @@ from pydantic import BaseModel, Field
 
 from business.equipment_orchestrator import EquipmentOrchestratorError, equipment_orchestrator
 from db.equipment_service import equipment_service
+from db.pagination_helpers import InvalidCursorError
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
 # ===================================
@@ -115,6 +117,7 @@ class EquipmentListResponse(BaseModel):
 # ===================================
 
 
+@trace_methods(KIND_CONTROLLER)
 class EquipmentController:
     """HTTP request/response handling for equipment"""
 
@@ -186,6 +189,8 @@ class EquipmentController:
         type_filter: str | None,
         status_filter: str | None,
         search: str | None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict, int]:
         """
         List equipment with pagination and filters (no sensitive fields).
@@ -198,6 +203,8 @@ class EquipmentController:
             type_filter: Filter by type
             status_filter: Filter by status
             search: Search term
+            cursor: Keyset cursor ("" = first page), None for offset pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_dict, status_code)
@@ -208,7 +215,7 @@ class EquipmentController:
         """
         try:
             result = equipment_service.get_equipment_paginated(
-                db, user_id, limit, offset, type_filter, status_filter, search
+                db, user_id, limit, offset, type_filter, status_filter, search, cursor, include_total
             )
 
             # Convert to list response format (no sensitive fields)
@@ -232,6 +239,9 @@ class EquipmentController:
                 user_id=user_id,
             )
             return {"data": equipment_list, "pagination": result["pagination"]}, 200
+        except InvalidCursorError as e:
+            logger.warning("Invalid equipment list cursor", error=str(e), user_id=user_id)
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error("Failed to list equipment via API", error=str(e), user_id=user_id)
             return {"error": "Internal server error"}, 500
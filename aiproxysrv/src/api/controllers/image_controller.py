@@ -5,8 +5,10 @@ from typing import Any
 from business.image_orchestrator import ImageGenerationError, ImageOrchestrator
 from db.image_service import ImageService
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class ImageController:
     """Controller for image HTTP request handling"""
 
@@ -74,6 +76,8 @@ class ImageController:
         search: str = "",
         sort_by: str = "created_at",
         sort_direction: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict[str, Any], int]:
         """
         Get list of generated images with pagination, search and sorting
@@ -84,16 +88,27 @@ class ImageController:
             search: Search term for title and prompt (default '')
             sort_by: Field to sort by (default 'created_at')
             sort_direction: Sort direction 'asc' or 'desc' (default 'desc')
+            cursor: Keyset cursor ("" = first page), None for offset pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_data, status_code)
         """
         try:
             result = self.orchestrator.get_images_with_pagination(
-                limit=limit, offset=offset, search=search, sort_by=sort_by, sort_direction=sort_direction
+                limit=limit,
+                offset=offset,
+                search=search,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+                cursor=cursor,
+                include_total=include_total,
             )
             return result, 200
 
+        except ValueError as e:
+            logger.warning(f"Invalid image list request: {e}")
+            return {"error": str(e)}, 400
         except ImageGenerationError as e:
             logger.error(f"Failed to retrieve images: {e}")
             return {"error": str(e)}, 500
@@ -326,6 +341,38 @@ class ImageController:
             )
             return {"error": f"Internal server error: {str(e)}"}, 500
 
+    def preview_text_overlay(
+        self, image_id: str, max_edge: int, image_format: str, **overlay_params: Any
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Render a low-resolution text overlay preview (nothing is stored)
+
+        Args:
+            image_id: ID of the source image
+            max_edge: Longest preview edge in pixels
+            image_format: 'jpeg' or 'webp'
+            **overlay_params: Overlay parameters (see add_text_overlay)
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data on success: {'data': bytes, 'mimetype': str, 'width': int, 'height': int}
+        """
+        try:
+            result = self.orchestrator.preview_text_overlay(
+                source_image_id=image_id, max_edge=max_edge, image_format=image_format, **overlay_params
+            )
+            return result, 200
+
+        except ImageGenerationError as e:
+            logger.warning("Text overlay preview failed", image_id=image_id, error=str(e))
+            status_code = 404 if "not found" in str(e).lower() else 500
+            return {"error": str(e)}, status_code
+        except Exception as e:
+            logger.error(
+                "Unexpected error previewing text overlay", image_id=image_id, error_type=type(e).__name__, error=str(e)
+            )
+            return {"error": f"Internal server error: {str(e)}"}, 500
+
     def assign_to_project(
         self,
         image_id: str,
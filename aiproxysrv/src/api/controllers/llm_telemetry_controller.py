@@ -0,0 +1,56 @@
+"""LLM Telemetry Controller - p50/p95 rollups of per-call LLM telemetry"""
+
+import traceback
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import parse_rollup_days
+from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
+
+
+@trace_methods(KIND_CONTROLLER)
+class LlmTelemetryController:
+    """Controller for LLM telemetry rollups"""
+
+    @staticmethod
+    def get_rollup(
+        db: Session,
+        days: str | None,
+        per_day: bool,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Get p50/p95 telemetry per model (and day)
+
+        Args:
+            db: Database session
+            days: Raw ?days= value (default 7, max 90)
+            per_day: Group by UTC day in addition to provider/model
+            provider: Optional provider filter
+            model: Optional model filter
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        try:
+            window_days = parse_rollup_days(days)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        try:
+            result = llm_telemetry_orchestrator.get_rollup(
+                db, window_days, per_day=per_day, provider=provider or None, model=model or None
+            )
+            return {"data": result}, 200
+        except Exception as e:
+            logger.error(
+                "LLM telemetry rollup failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                stacktrace=traceback.format_exc(),
+            )
+            return {"error": "Failed to load LLM telemetry"}, 500
@@ -14,8 +14,10 @@ from schemas.lyric_parsing_rule_schemas import (
     LyricParsingRuleResponse,
     LyricParsingRuleUpdate,
 )
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class LyricParsingRuleController:
     """Controller for lyric parsing rule operations"""
 
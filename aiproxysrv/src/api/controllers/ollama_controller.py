@@ -3,8 +3,10 @@
 from typing import Any
 
 from business.ollama_orchestrator import OllamaOrchestrator
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class OllamaController:
     """Controller for Ollama API integration (HTTP handling only, delegates to orchestrator)."""
 
@@ -4,11 +4,13 @@ from typing import Any
 
 from adapters.openai.api_client import OpenAIAPIError  # noqa: F401 # Re-export for backward compatibility
 from business.openai_chat_orchestrator import OpenAIChatOrchestrator
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
 __all__ = ["OpenAIChatController", "OpenAIAPIError"]
 
 
+@trace_methods(KIND_CONTROLLER)
 class OpenAIChatController:
     """Controller for OpenAI Chat API integration (HTTP handling only, delegates to orchestrator)."""
 
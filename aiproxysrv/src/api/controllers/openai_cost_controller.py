@@ -13,8 +13,10 @@ from config.settings import OPENAI_ADMIN_API_KEY, OPENAI_ADMIN_BASE_URL, OPENAI_
 from db.api_cost_service import ApiCostService
 from db.database import SessionLocal
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class OpenAICostController:
     """Controller for OpenAI Admin Cost API integration"""
 
@@ -0,0 +1,64 @@
+"""Profiler Controller - List stored request profiles and sign profile triggers"""
+
+import time
+from typing import Any
+
+from config.settings import PROFILER_DIR, PROFILER_SECRET
+from utils.profiler import (
+    MAX_TRIGGER_TTL_SECONDS,
+    PROFILE_HEADER,
+    PROFILE_QUERY_PARAM,
+    list_profiles,
+    sign_profile_trigger,
+)
+from utils.tracing import KIND_CONTROLLER, trace_methods
+
+
+DEFAULT_TRIGGER_TTL_SECONDS = 900
+
+
+@trace_methods(KIND_CONTROLLER)
+class ProfilerController:
+    """Controller for the admin profiler routes"""
+
+    @staticmethod
+    def list_profiles() -> tuple[dict[str, Any], int]:
+        """
+        List stored profiles (newest first)
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        profiles = list_profiles(PROFILER_DIR)
+        return {"data": profiles, "count": len(profiles)}, 200
+
+    @staticmethod
+    def sign_trigger(path: Any, ttl_seconds: Any = None) -> tuple[dict[str, Any], int]:
+        """
+        Create a signed trigger that profiles requests to one path
+
+        Args:
+            path: Request path as seen by the server (e.g. "/api/v1/song-projects")
+            ttl_seconds: Validity in seconds (default 900, max 24h)
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        if not isinstance(path, str) or not path.startswith("/"):
+            return {"error": "path must be an absolute request path (e.g. /api/v1/song-projects)"}, 400
+
+        ttl = DEFAULT_TRIGGER_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        if not isinstance(ttl, int) or isinstance(ttl, bool) or not 1 <= ttl <= MAX_TRIGGER_TTL_SECONDS:
+            return {"error": f"ttl_seconds must be an integer between 1 and {MAX_TRIGGER_TTL_SECONDS}"}, 400
+
+        expires = int(time.time()) + ttl
+        trigger = sign_profile_trigger(PROFILER_SECRET, path, expires)
+        return {
+            "data": {
+                "path": path,
+                "expires_at": expires,
+                "trigger": trigger,
+                "header": f"{PROFILE_HEADER}: {trigger}",
+                "query": f"{PROFILE_QUERY_PARAM}={trigger}",
+            }
+        }, 200
@@ -17,8 +17,10 @@ from schemas.prompt_schemas import (
     PromptTemplateUpdate,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class PromptController:
     """Controller for prompt template HTTP request handling (uses orchestrator)"""
 
@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from business.sketch_orchestrator import SketchOrchestrator, SketchOrchestratorError
+from db.pagination_helpers import InvalidCursorError
 from db.sketch_service import sketch_service
 from schemas.common_schemas import PaginationMeta
 from schemas.sketch_schemas import (
@@ -16,8 +17,10 @@ from schemas.sketch_schemas import (
     SketchUpdateRequest,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class SketchController:
     """Controller for sketch operations"""
 
@@ -64,6 +67,8 @@ class SketchController:
         sketch_type: str | None = None,
         sort_by: str = "created_at",
         sort_direction: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict[str, Any], int]:
         """
         Get list of sketches with pagination, search and filtering
@@ -77,6 +82,8 @@ class SketchController:
             sketch_type: Optional sketch type filter (song, inspiration)
             sort_by: Field to sort by (created_at, updated_at, title)
             sort_direction: Sort direction (asc, desc)
+            cursor: Keyset cursor ("" = first page), None for offset pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_data, status_code)
@@ -91,6 +98,8 @@ class SketchController:
                 sketch_type=sketch_type,
                 sort_by=sort_by,
                 sort_direction=sort_direction,
+                cursor=cursor,
+                include_total=include_total,
             )
 
             sketches = result.get("items", [])
@@ -110,12 +119,18 @@ class SketchController:
             sketch_responses = [SketchResponse.model_validate(sketch) for sketch in enriched_sketches]
 
             # Create pagination metadata
-            pagination = PaginationMeta(
-                total=total,
-                offset=offset,
-                limit=limit,
-                has_more=(offset + len(sketches)) < total,
-            )
+            if cursor is not None:
+                next_cursor = result.get("next_cursor")
+                pagination = PaginationMeta(
+                    total=total, limit=limit, has_more=next_cursor is not None, next_cursor=next_cursor
+                )
+            else:
+                pagination = PaginationMeta(
+                    total=total,
+                    offset=offset,
+                    limit=limit,
+                    has_more=(offset + len(sketches)) < total,
+                )
 
             response = SketchListResponse(
                 data=sketch_responses,
@@ -124,6 +139,9 @@ class SketchController:
 
             return response.model_dump(), 200
 
+        except InvalidCursorError as e:
+            logger.warning("sketch_list_invalid_request", error=str(e))
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error("sketch_list_error", error=str(e), error_type=type(e).__name__)
             return {"error": f"Failed to retrieve sketches: {str(e)}"}, 500
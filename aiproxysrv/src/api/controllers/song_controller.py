@@ -4,8 +4,10 @@ from typing import Any
 
 from business.song_orchestrator import SongOrchestrator, SongOrchestratorError
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class SongController:
     """Controller for song read/update/delete operations"""
 
@@ -21,6 +23,8 @@ class SongController:
         sort_by: str = "created_at",
         sort_direction: str = "desc",
         workflow: str = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict[str, Any], int]:
         """
         Get list of songs with pagination, search and sorting
@@ -33,6 +37,8 @@ class SongController:
             sort_by: Field to sort by (created_at, title, lyrics)
             sort_direction: Sort direction (asc, desc)
             workflow: Optional workflow filter (onWork, inUse, notUsed)
+            cursor: Keyset cursor ("" = first page), None for offset pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_data, status_code)
@@ -46,9 +52,14 @@ class SongController:
                 sort_by=sort_by,
                 sort_direction=sort_direction,
                 workflow=workflow,
+                cursor=cursor,
+                include_total=include_total,
             )
             return result, 200
 
+        except ValueError as e:
+            logger.warning(f"Invalid song list request: {e}")
+            return {"error": str(e)}, 400
         except SongOrchestratorError as e:
             logger.error(f"Failed to retrieve songs: {e}")
             return {"error": str(e)}, 500
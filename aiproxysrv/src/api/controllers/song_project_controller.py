@@ -5,24 +5,32 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from business.song_project_orchestrator import song_project_orchestrator
+from business.song_project_orchestrator import UploadSessionError, song_project_orchestrator
+from db.pagination_helpers import InvalidCursorError
 from db.song_project_service import song_project_service
 from schemas.common_schemas import PaginationMeta
 from schemas.song_project_schemas import (
     BatchDeleteRequest,
     BatchDeleteResponse,
+    FileClaimRequest,
+    FolderFileListRequest,
+    FolderManifestRequest,
     MirrorRequest,
     MirrorResponse,
+    ProjectArchiveRequest,
     ProjectCompleteDownloadResponse,
     ProjectCreateRequest,
     ProjectDetailResponse,
     ProjectListResponse,
     ProjectResponse,
     ProjectUpdateRequest,
+    UploadSessionCreateRequest,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class SongProjectController:
     """Controller for song project operations (HTTP handling only)"""
 
@@ -67,6 +75,8 @@ class SongProjectController:
         search: str = "",
         tags: str | None = None,
         project_status: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> tuple[dict[str, Any], int]:
         """
         Get list of projects for user (paginated)
@@ -79,6 +89,8 @@ class SongProjectController:
             search: Search term
             tags: Comma-separated tags
             project_status: Status filter ('new', 'progress', 'archived', or None for all non-archived)
+            cursor: Keyset cursor ("" = first page), None for offset pagination
+            include_total: Include total count in cursor mode
 
         Returns:
             Tuple of (response_data, status_code)
@@ -92,6 +104,8 @@ class SongProjectController:
                 search=search,
                 tags=tags,
                 project_status=project_status,
+                cursor=cursor,
+                include_total=include_total,
             )
 
             projects = result.get("projects", [])
@@ -103,9 +117,10 @@ class SongProjectController:
             # Create pagination metadata
             pagination = PaginationMeta(
                 total=pagination_data.get("total", 0),
-                offset=pagination_data.get("offset", 0),
+                offset=pagination_data.get("offset"),
                 limit=pagination_data.get("limit", limit),
                 has_more=pagination_data.get("has_more", False),
+                next_cursor=pagination_data.get("next_cursor"),
             )
 
             response = ProjectListResponse(
@@ -115,6 +130,9 @@ class SongProjectController:
 
             return response.model_dump(), 200
 
+        except InvalidCursorError as e:
+            logger.warning("Project list invalid request", error=str(e))
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error("Project list error", error=str(e), error_type=type(e).__name__)
             return {"error": f"Failed to retrieve projects: {str(e)}"}, 500
@@ -156,7 +174,9 @@ class SongProjectController:
             return {"error": f"Failed to retrieve project: {str(e)}"}, 500
 
     @staticmethod
-    def get_project_with_details(db: Session, user_id: UUID, project_id: str) -> tuple[dict[str, Any], int]:
+    def get_project_with_details(
+        db: Session, user_id: UUID, project_id: str, include_files: bool = True
+    ) -> tuple[dict[str, Any], int]:
         """
         Get a specific project with all folders and files
 
@@ -164,6 +184,7 @@ class SongProjectController:
             db: Database session
             user_id: User ID (from JWT)
             project_id: Project UUID
+            include_files: False = folders with file statistics only (lightweight mode)
 
         Returns:
             Tuple of (response_data, status_code)
@@ -179,6 +200,7 @@ class SongProjectController:
                 db=db,
                 project_id=project_uuid,
                 user_id=user_id,
+                include_files=include_files,
             )
 
             if not result:
@@ -306,9 +328,9 @@ class SongProjectController:
             except ValueError:
                 return {"error": "Invalid ID format"}, 400
 
-            # Get project with details to find folder name
+            # Get project folders to find folder name (lightweight: no file lists)
             project_details = song_project_orchestrator.get_project_with_details(
-                db=db, project_id=project_uuid, user_id=user_id
+                db=db, project_id=project_uuid, user_id=user_id, include_files=False
             )
 
             if not project_details:
@@ -369,9 +391,9 @@ class SongProjectController:
             except ValueError:
                 return {"error": "Invalid ID format"}, 400
 
-            # Get project with details to find folder name
+            # Get project folders to find folder name (lightweight: no file lists)
             project_details = song_project_orchestrator.get_project_with_details(
-                db=db, project_id=project_uuid, user_id=user_id
+                db=db, project_id=project_uuid, user_id=user_id, include_files=False
             )
 
             if not project_details:
@@ -399,19 +421,23 @@ class SongProjectController:
             return {"error": f"Batch upload failed: {str(e)}"}, 500
 
     @staticmethod
-    def get_folder_files(db: Session, user_id: UUID, project_id: str, folder_id: str) -> tuple[dict[str, Any], int]:
+    def get_folder_files(
+        db: Session, user_id: UUID, project_id: str, folder_id: str, query: FolderFileListRequest | None = None
+    ) -> tuple[dict[str, Any], int]:
         """
-        Get all files in a folder with download URLs (for CLI download)
+        Get files in a folder with download URLs (for CLI download and folder browsing)
 
         Args:
             db: Database session
             user_id: User ID (from JWT)
             project_id: Project UUID
             folder_id: Folder UUID
+            query: Paging/browsing parameters (None = all files, legacy behaviour)
 
         Returns:
             Tuple of (response_data, status_code)
-            response_data: {'data': [{'id': '...', 'filename': '...', 'relative_path': '...', 'download_url': '...', 'file_size_bytes': 123}]}
+            response_data: {'data': [{'id': '...', 'filename': '...', 'relative_path': '...', 'download_url': '...', 'file_size_bytes': 123}],
+                            'pagination': {...} (paged mode), 'subdirectories': [...] (recursive=false)}
         """
         try:
             # Validate UUID formats
@@ -421,47 +447,32 @@ class SongProjectController:
             except ValueError:
                 return {"error": "Invalid ID format"}, 400
 
-            # Get project details (checks ownership)
-            project_details = song_project_orchestrator.get_project_with_details(
-                db=db, project_id=project_uuid, user_id=user_id
+            query = query or FolderFileListRequest()
+            result = song_project_orchestrator.list_folder_files(
+                db=db,
+                project_id=project_uuid,
+                folder_id=folder_uuid,
+                user_id=user_id,
+                limit=query.limit,
+                cursor=query.cursor,
+                prefix=query.prefix,
+                recursive=query.recursive,
+                sort_by=query.sort_by,
+                sort_direction=query.sort_direction,
             )
 
-            if not project_details:
-                return {"error": "Project not found or unauthorized"}, 404
+            if result is None:
+                return {"error": "Project or folder not found or unauthorized"}, 404
 
-            # Find folder by ID
-            folders = project_details.get("folders", [])
-            folder = next((f for f in folders if str(f.get("id")) == str(folder_uuid)), None)
-            if not folder:
-                return {"error": f"Folder not found: {folder_id}"}, 404
-
-            # Get files from folder
-            files = folder.get("files", [])
-
-            # Generate backend proxy URLs (instead of presigned S3 URLs)
-            file_list = []
-            for f in files:
-                file_id = f.get("id")
-                s3_key = f.get("s3_key")
-
-                # Generate backend proxy URL (CLI will combine with api_url)
-                download_url = None
-                if s3_key and file_id:
-                    download_url = f"/api/v1/song-projects/{project_id}/files/{file_id}/download"
-
-                file_list.append(
-                    {
-                        "id": file_id,
-                        "filename": f.get("filename"),
-                        "relative_path": f.get("relative_path"),
-                        "download_url": download_url,
-                        "file_size_bytes": f.get("file_size_bytes"),
-                        "s3_key": s3_key,
-                    }
-                )
-
-            return {"data": file_list}, 200
+            response: dict[str, Any] = {"data": result["files"]}
+            if result["pagination"] is not None:
+                response["pagination"] = result["pagination"]
+            if result["subdirectories"] is not None:
+                response["subdirectories"] = result["subdirectories"]
+            return response, 200
 
+        except InvalidCursorError as e:
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error("Get folder files error", project_id=project_id, error=str(e), error_type=type(e).__name__)
             return {"error": f"Failed to get folder files: {str(e)}"}, 500
@@ -501,7 +512,12 @@ class SongProjectController:
 
             # Call orchestrator
             result = song_project_orchestrator.mirror_compare_files(
-                db=db, project_id=project_uuid, user_id=user_id, folder_id=folder_uuid, local_files=local_files
+                db=db,
+                project_id=project_uuid,
+                user_id=user_id,
+                folder_id=folder_uuid,
+                local_files=local_files,
+                scopes=mirror_data.scopes,
             )
 
             if not result:
@@ -524,6 +540,296 @@ class SongProjectController:
             )
             return {"error": f"Mirror compare failed: {str(e)}"}, 500
 
+    @staticmethod
+    def claim_files(
+        db: Session, user_id: UUID, project_id: str, folder_id: str, claim_data: FileClaimRequest
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Create/update files from already stored content (upload only what is missing)
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            project_id: Project UUID string
+            folder_id: Folder UUID string
+            claim_data: Files with folder-relative path, hash and size
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data: {'data': {'claimed': [...], 'missing': [...]}}
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                folder_uuid = UUID(folder_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            project = song_project_orchestrator.get_project_by_id(db=db, project_id=project_uuid, user_id=user_id)
+            if project and project.get("project_status") == "archived":
+                return {"error": "Cannot upload to archived project. Unarchive it first."}, 403
+
+            result = song_project_orchestrator.claim_files_by_hash(
+                db=db,
+                project_id=project_uuid,
+                folder_id=folder_uuid,
+                user_id=user_id,
+                files=[f.model_dump() for f in claim_data.files],
+            )
+
+            if result is None:
+                return {"error": "Project or folder not found or unauthorized"}, 404
+
+            return {"data": result}, 200
+
+        except Exception as e:
+            logger.error(
+                "Claim files error",
+                project_id=project_id,
+                folder_id=folder_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {"error": f"Failed to claim files: {str(e)}"}, 500
+
+    @staticmethod
+    def create_upload_session(
+        db: Session, user_id: UUID, project_id: str, folder_id: str, session_data: UploadSessionCreateRequest
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Start or resume a resumable chunked upload
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            project_id: Project UUID string
+            folder_id: Folder UUID string
+            session_data: Target path, SHA256 and size of the file
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data: {'data': {'id': '...', 'chunk_size': int, 'part_count': int, 'missing_parts': [...]}}
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                folder_uuid = UUID(folder_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            project = song_project_orchestrator.get_project_by_id(db=db, project_id=project_uuid, user_id=user_id)
+            if project and project.get("project_status") == "archived":
+                return {"error": "Cannot upload to archived project. Unarchive it first."}, 403
+
+            result = song_project_orchestrator.create_upload_session(
+                db=db,
+                project_id=project_uuid,
+                folder_id=folder_uuid,
+                user_id=user_id,
+                relative_path=session_data.relative_path,
+                file_hash=session_data.file_hash.lower(),
+                file_size_bytes=session_data.file_size_bytes,
+            )
+            return {"data": result}, 201
+
+        except UploadSessionError as e:
+            return {"error": str(e)}, e.status_code
+        except Exception as e:
+            logger.error(
+                "Create upload session error", project_id=project_id, error=str(e), error_type=type(e).__name__
+            )
+            return {"error": f"Failed to create upload session: {str(e)}"}, 500
+
+    @staticmethod
+    def get_upload_session(db: Session, user_id: UUID, project_id: str, session_id: str) -> tuple[dict[str, Any], int]:
+        """
+        Get upload session state (received and missing parts)
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                session_uuid = UUID(session_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.get_upload_session_status(
+                db=db, project_id=project_uuid, session_id=session_uuid, user_id=user_id
+            )
+            return {"data": result}, 200
+
+        except UploadSessionError as e:
+            return {"error": str(e)}, e.status_code
+        except Exception as e:
+            logger.error("Get upload session error", session_id=session_id, error=str(e), error_type=type(e).__name__)
+            return {"error": f"Failed to get upload session: {str(e)}"}, 500
+
+    @staticmethod
+    def upload_session_part(
+        db: Session,
+        user_id: UUID,
+        project_id: str,
+        session_id: str,
+        part_number: int,
+        data: bytes,
+        chunk_hash: str | None = None,
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Store one chunk of an upload session
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            project_id: Project UUID string
+            session_id: Session UUID string
+            part_number: 1-based chunk number
+            data: Raw chunk bytes (request body)
+            chunk_hash: Optional SHA256 of the chunk (X-Chunk-SHA256 header)
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                session_uuid = UUID(session_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.upload_session_part(
+                db=db,
+                project_id=project_uuid,
+                session_id=session_uuid,
+                user_id=user_id,
+                part_number=part_number,
+                data=data,
+                chunk_hash=chunk_hash,
+            )
+            return {"data": result}, 200
+
+        except UploadSessionError as e:
+            return {"error": str(e)}, e.status_code
+        except Exception as e:
+            logger.error(
+                "Upload session part error",
+                session_id=session_id,
+                part_number=part_number,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {"error": f"Failed to store part: {str(e)}"}, 500
+
+    @staticmethod
+    def complete_upload_session(
+        db: Session, user_id: UUID, project_id: str, session_id: str
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Complete an upload session (assemble, verify SHA256, create/update the file)
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data: {'data': {'session': {...}, 'file': {...}}}
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                session_uuid = UUID(session_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.complete_upload_session(
+                db=db, project_id=project_uuid, session_id=session_uuid, user_id=user_id
+            )
+            return {"data": result, "message": "Upload completed"}, 200
+
+        except UploadSessionError as e:
+            return {"error": str(e)}, e.status_code
+        except Exception as e:
+            logger.error(
+                "Complete upload session error", session_id=session_id, error=str(e), error_type=type(e).__name__
+            )
+            return {"error": f"Failed to complete upload: {str(e)}"}, 500
+
+    @staticmethod
+    def abort_upload_session(
+        db: Session, user_id: UUID, project_id: str, session_id: str
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Abort an upload session (stored parts are discarded)
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                session_uuid = UUID(session_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.abort_upload_session(
+                db=db, project_id=project_uuid, session_id=session_uuid, user_id=user_id
+            )
+            return {"data": result}, 200
+
+        except UploadSessionError as e:
+            return {"error": str(e)}, e.status_code
+        except Exception as e:
+            logger.error("Abort upload session error", session_id=session_id, error=str(e), error_type=type(e).__name__)
+            return {"error": f"Failed to abort upload: {str(e)}"}, 500
+
+    @staticmethod
+    def get_folder_manifest(
+        db: Session, user_id: UUID, project_id: str, folder_id: str, query: FolderManifestRequest
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Get folder manifest nodes (Merkle tree hashes) for incremental Mirror sync
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            project_id: Project UUID string
+            folder_id: Folder UUID string
+            query: Requested directory paths and whether to include their children
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data: {'data': {'nodes': [{'path': '', 'hash': '...', 'file_count': 12,
+                            'directories': [...], 'files': [...]}]}}
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                folder_uuid = UUID(folder_id)
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.get_folder_manifest(
+                db=db,
+                project_id=project_uuid,
+                folder_id=folder_uuid,
+                user_id=user_id,
+                paths=query.paths,
+                include_children=query.children,
+            )
+
+            if result is None:
+                return {"error": "Project or folder not found or unauthorized"}, 404
+
+            return {"data": result}, 200
+
+        except Exception as e:
+            logger.error(
+                "Get folder manifest error",
+                project_id=project_id,
+                folder_id=folder_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {"error": f"Failed to get folder manifest: {str(e)}"}, 500
+
     @staticmethod
     def batch_delete_files(
         db: Session, user_id: UUID, project_id: str, delete_data: BatchDeleteRequest
@@ -741,6 +1047,43 @@ class SongProjectController:
             )
             return {"error": f"Failed to get all project files: {str(e)}"}, 500
 
+    @staticmethod
+    def download_project_archive(
+        db: Session, user_id: UUID, project_id: str, archive_data: ProjectArchiveRequest
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Prepare a streaming ZIP download of a project, folder or file selection
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            project_id: Project UUID string
+            archive_data: Optional folder_id / file_ids selection
+
+        Returns:
+            Tuple of (response_data, status_code)
+            response_data on success: {'filename': str, 'file_count': int, 'total_size_bytes': int, 'stream': Iterator}
+        """
+        try:
+            try:
+                project_uuid = UUID(project_id)
+                folder_uuid = UUID(archive_data.folder_id) if archive_data.folder_id else None
+                file_uuids = [UUID(file_id) for file_id in archive_data.file_ids] if archive_data.file_ids else None
+            except ValueError:
+                return {"error": "Invalid ID format"}, 400
+
+            result = song_project_orchestrator.prepare_project_archive(
+                db=db, project_id=project_uuid, user_id=user_id, folder_id=folder_uuid, file_ids=file_uuids
+            )
+            if result is None:
+                return {"error": "Project or folder not found or unauthorized"}, 404
+
+            return result, 200
+
+        except Exception as e:
+            logger.error("Project archive error", project_id=project_id, error=str(e), error_type=type(e).__name__)
+            return {"error": f"Failed to prepare archive: {str(e)}"}, 500
+
     @staticmethod
     def clear_folder_files(
         db: Session,
@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from business.song_release_orchestrator import song_release_orchestrator
+from db.pagination_helpers import InvalidCursorError
 from schemas.song_release_schemas import (
     ReleaseCreateRequest,
     ReleaseFilterRequest,
@@ -14,8 +15,10 @@ from schemas.song_release_schemas import (
     ReleaseUpdateRequest,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class SongReleaseController:
     """Controller for song release operations (HTTP handling only)"""
 
@@ -109,11 +112,16 @@ class SongReleaseController:
                 offset=filters.offset,
                 status_filter=filters.status_filter,
                 search=filters.search,
+                cursor=filters.cursor,
+                include_total=filters.include_total,
             )
 
             response = ReleaseListResponse(**result)
             return response.model_dump(), 200
 
+        except InvalidCursorError as e:
+            logger.warning("Get releases invalid request", error=str(e))
+            return {"error": str(e)}, 400
         except Exception as e:
             logger.error("Get releases error", error=str(e), error_type=e.__class__.__name__)
             return {"error": f"Failed to retrieve releases: {str(e)}"}, 500
@@ -0,0 +1,55 @@
+"""Tracing Controller - Recent request traces of this worker process"""
+
+import os
+from typing import Any
+
+from utils.tracing import trace_ring
+
+
+DEFAULT_TRACE_LIMIT = 50
+
+
+class TracingController:
+    """Controller for the admin tracing routes"""
+
+    @staticmethod
+    def list_traces(limit: Any = None, min_duration_ms: Any = None, name: Any = None) -> tuple[dict[str, Any], int]:
+        """
+        List recent traces (newest first) with their per-stage breakdown
+
+        Args:
+            limit: Max number of traces (query string, default 50)
+            min_duration_ms: Only traces at least this slow (query string)
+            name: Only traces whose name (e.g. "GET /api/v1/song-projects/<project_id>") contains this text
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        try:
+            max_items = DEFAULT_TRACE_LIMIT if limit is None else int(limit)
+            min_ms = 0.0 if min_duration_ms is None else float(min_duration_ms)
+        except ValueError:
+            return {"error": "limit must be an integer and min_duration_ms a number"}, 400
+        if max_items < 1:
+            return {"error": "limit must be at least 1"}, 400
+
+        traces = [
+            trace.to_summary()
+            for trace in trace_ring.list()
+            if trace.duration_ms >= min_ms and (not name or name in trace.name)
+        ][:max_items]
+        # The ring lives in one gunicorn worker - pid tells which one answered
+        return {"data": traces, "count": len(traces), "pid": os.getpid()}, 200
+
+    @staticmethod
+    def get_trace(trace_id: str) -> tuple[dict[str, Any], int]:
+        """
+        Get one trace with all spans
+
+        Returns:
+            Tuple of (response_data, status_code)
+        """
+        trace = trace_ring.get(trace_id)
+        if trace is None:
+            return {"error": "Trace not found (expired or recorded by another worker)", "pid": os.getpid()}, 404
+        return {"data": trace.to_dict(), "pid": os.getpid()}, 200
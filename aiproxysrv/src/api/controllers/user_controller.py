@@ -30,8 +30,10 @@ from schemas.user_schemas import (
     UserUpdateResponse,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class UserController:
     """Controller for user authentication and management operations"""
 
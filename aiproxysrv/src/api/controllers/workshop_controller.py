@@ -16,8 +16,10 @@ from schemas.workshop_schemas import (
     WorkshopUpdateRequest,
 )
 from utils.logger import logger
+from utils.tracing import KIND_CONTROLLER, trace_methods
 
 
+@trace_methods(KIND_CONTROLLER)
 class WorkshopController:
     """Controller for workshop operations"""
 
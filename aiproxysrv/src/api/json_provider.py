@@ -0,0 +1,86 @@
+"""Flask JSON provider - orjson serialization, timed as "json" span of the request trace"""
+
+from datetime import UTC, date, datetime
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from flask.wrappers import Response
+
+from utils.tracing import KIND_JSON, span
+
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def http_date(value: date) -> str:
+    """
+    RFC 822 date like werkzeug.http.http_date (naive = UTC), without the email.utils detour
+
+    Examples:
+        >>> http_date(datetime(2026, 1, 1, 12, 30))
+        'Thu, 01 Jan 2026 12:30:00 GMT'
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC)
+    else:
+        value = datetime(value.year, value.month, value.day)
+    return (
+        f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} {value.year:04d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT"
+    )
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, date):
+        return http_date(o)
+    return DefaultJSONProvider.default(o)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    DefaultJSONProvider backed by orjson (jsonify, response bodies, request.get_json)
+
+    Same output as the stdlib provider apart from non-ASCII characters (written as
+    UTF-8 instead of \\uXXXX escapes): keys sorted (sort_keys), compact unless debug,
+    dates as HTTP dates, Decimal/__html__ via DefaultJSONProvider.default.
+    Responses are built from the serialized bytes without a str round trip.
+    Calls with stdlib json kwargs (indent, separators, cls, ...) use the stdlib provider.
+    """
+
+    default = staticmethod(_default)
+
+    def _options(self, indent: bool = False) -> int:
+        # Dates go through default() (HTTP date) so the API keeps its date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _dump_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        with span("json.dumps", KIND_JSON):
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._options(indent))
+            except orjson.JSONEncodeError:
+                # Integers beyond 64 bit, recursion limit - the stdlib encoder handles or reports them
+                return super().dumps(obj).encode()
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            with span("json.dumps", KIND_JSON):
+                return super().dumps(obj, **kwargs)
+        return self._dump_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._dump_bytes(obj, indent) + b"\n", mimetype=self.mimetype)
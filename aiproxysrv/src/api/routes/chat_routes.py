@@ -35,22 +35,21 @@ def generate_unified(body: UnifiedChatRequest):
 
         # Conditional logging based on .env setting
         if CHAT_DEBUG_LOGGING:
-            input_text_short = body.input_text[:50] + "..." if len(body.input_text) > 50 else body.input_text
-            structured_prompt = (
-                f"[INSTRUCTION] {body.pre_condition} [USER] {body.input_text} [FORMAT] {body.post_condition}"
-            )
-
-            logger.debug(
-                "Unified chat request",
+            # Prompt strings are only built if DEBUG is enabled (lazy=True calls the lambdas)
+            logger.bind(
                 category=body.category,
                 action=body.action,
                 model=body.model,
                 temperature=body.temperature,
                 max_tokens=body.max_tokens,
                 pre_condition=body.pre_condition,
-                input_text=input_text_short,
-                post_condition=body.post_condition,
-                final_prompt=structured_prompt,
+            ).opt(lazy=True).debug(
+                "Unified chat request",
+                input_text=lambda: body.input_text[:50] + "..." if len(body.input_text) > 50 else body.input_text,
+                post_condition=lambda: body.post_condition,
+                final_prompt=lambda: (
+                    f"[INSTRUCTION] {body.pre_condition} [USER] {body.input_text} [FORMAT] {body.post_condition}"
+                ),
             )
         else:
             # Minimal logging
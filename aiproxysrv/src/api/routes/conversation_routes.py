@@ -46,8 +46,19 @@ def list_conversations():
         elif archived_param == "false":
             archived = False  # Show all conversations (no filter)
 
+        # Keyset pagination: cursor="" for the first page, then next_cursor from the response
+        cursor = request.args.get("cursor", default=None, type=str)
+        include_total = request.args.get("include_total", "false").lower() == "true"
+
         response_data, status_code = conversation_controller.list_conversations(
-            db=db, user_id=user_id, skip=skip, limit=limit, provider=provider, archived=archived
+            db=db,
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            provider=provider,
+            archived=archived,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         return jsonify(response_data), status_code
@@ -94,6 +94,8 @@ def list_equipment():
         - type (str, optional): Filter by type ('Software' | 'Plugin')
         - status (str, optional): Filter by status ('active' | 'trial' | 'expired' | 'archived')
         - search (str, optional): Search in name, manufacturer, tags
+        - cursor (str, optional): Keyset cursor ('' for the first page, then next_cursor); replaces offset
+        - include_total (bool, optional): Include total count in cursor mode (default false)
 
     Response:
         200: {
@@ -105,6 +107,7 @@ def list_equipment():
                 'has_more': true
             }
         }
+        400: {'error': 'Malformed cursor'}
         401: {'error': 'Unauthorized'}
         500: {'error': 'Internal server error'}
 
@@ -126,11 +129,13 @@ def list_equipment():
     type_filter = request.args.get("type")
     status_filter = request.args.get("status")
     search = request.args.get("search")
+    cursor = request.args.get("cursor")
+    include_total = request.args.get("include_total", "false").lower() == "true"
 
     db: Session = next(get_db())
     try:
         result, status_code = EquipmentController.list_equipment(
-            db, str(user_id), limit, offset, type_filter, status_filter, search
+            db, str(user_id), limit, offset, type_filter, status_filter, search, cursor, include_total
         )
         return jsonify(result), status_code
     finally:
@@ -5,6 +5,8 @@ Health Check Routes - System health monitoring endpoints
 from flask import Blueprint, jsonify
 
 from api.auth_middleware import jwt_required
+from db.database import get_engine
+from db.query_stats import get_pool_status
 from infrastructure.storage.s3_storage import S3Storage
 from utils.logger import logger
 
@@ -52,3 +54,25 @@ def check_storage():
         error_msg = f"Health check failed: {str(e)}"
         logger.error("Storage health check error", error=str(e), error_type=type(e).__name__)
         return jsonify({"status": "unhealthy", "message": error_msg}), 503
+
+
+@api_health_v1.route("/db-pool", methods=["GET"])
+@jwt_required
+def check_db_pool():
+    """
+    Report database connection pool utilization of the worker serving this request
+
+    Each gunicorn worker has its own pool, so repeated calls may hit different
+    workers (see pid in the response).
+
+    Response:
+        200: {'pid': 12, 'pool_class': 'QueuePool', 'size': 10, 'checked_out': 1,
+              'overflow': 0, 'max_overflow': 20, 'utilization': 0.033}
+
+    Example:
+        GET /api/v1/health/db-pool
+        Headers: Authorization: Bearer <JWT_TOKEN>
+    """
+    status = get_pool_status(get_engine().pool)
+    logger.debug("DB pool status", **status)
+    return jsonify(status), 200
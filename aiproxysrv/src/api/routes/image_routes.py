@@ -4,7 +4,7 @@ DALL-E Image Generation Routes with Pydantic validation
 
 import traceback
 
-from flask import Blueprint, jsonify, request, send_from_directory
+from flask import Blueprint, Response, jsonify, request, send_from_directory
 from flask_pydantic import validate
 
 from api.auth_middleware import get_current_user_id, jwt_required
@@ -56,7 +56,13 @@ def list_images(query: ImageListRequest):
     """Get list of generated images with pagination, search and sorting"""
     try:
         response_data, status_code = image_controller.get_images(
-            limit=query.limit, offset=query.offset, search=query.search, sort_by=query.sort, sort_direction=query.order
+            limit=query.limit,
+            offset=query.offset,
+            search=query.search,
+            sort_by=query.sort,
+            sort_direction=query.order,
+            cursor=query.cursor,
+            include_total=query.include_total,
         )
         return jsonify(response_data), status_code
     except Exception as e:
@@ -97,13 +103,25 @@ def serve_image(filename):
 @api_image_v1.route("/s3/<string:image_id>", methods=["GET"])
 @jwt_required
 def serve_s3_image(image_id):
-    """Serve S3-stored images via backend proxy (streams from S3)"""
+    """Serve S3-stored images via backend proxy (streams from S3)
+
+    Query Parameters:
+        - size (str, optional): thumb (320px), preview (1024px) or original (default)
+    """
+    from business.image_derivative_transformer import parse_image_size
+
+    try:
+        size = parse_image_size(request.args.get("size"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     try:
         from adapters.s3.s3_proxy_service import s3_proxy_service
+        from business.image_derivative_orchestrator import image_derivative_orchestrator
         from config.settings import S3_IMAGES_BUCKET
         from db.image_service import ImageService
 
-        logger.debug("Serving S3 image", image_id=image_id)
+        logger.debug("Serving S3 image", image_id=image_id, size=size)
 
         # Get image from DB
         image = ImageService.get_image_by_id(image_id)
@@ -114,8 +132,15 @@ def serve_s3_image(image_id):
         if image.storage_backend != "s3" or not image.s3_key:
             return jsonify({"error": "Not an S3 image"}), 400
 
-        # Stream from S3 using generic proxy service
-        return s3_proxy_service.serve_resource(bucket=S3_IMAGES_BUCKET, s3_key=image.s3_key, filename=image.filename)
+        # Stream from S3 using generic proxy service (original while the derivative is missing)
+        s3_key, filename = image_derivative_orchestrator.get_serving_variant(image.s3_key, image.filename, size)
+        return s3_proxy_service.serve_resource(
+            bucket=S3_IMAGES_BUCKET,
+            s3_key=s3_key,
+            filename=filename,
+            fallback_s3_key=image.s3_key if size else None,
+            fallback_filename=image.filename,
+        )
 
     except Exception as e:
         logger.error(
@@ -217,6 +242,24 @@ def get_projects_for_image(image_id: str):
         return jsonify(error_response.dict()), 500
 
 
+def _get_overlay_params(raw_json: dict) -> dict:
+    """Extract text overlay parameters (V2 - with separate title/artist controls)"""
+    return {
+        "title": raw_json.get("title"),
+        "artist": raw_json.get("artist"),
+        "font_style": raw_json.get("font_style", "bold"),
+        "title_position": raw_json.get("title_position", "center"),
+        "title_font_size": raw_json.get("title_font_size", 0.08),
+        "title_color": raw_json.get("title_color", "#FFFFFF"),
+        "title_outline_color": raw_json.get("title_outline_color", "#000000"),
+        "artist_position": raw_json.get("artist_position"),
+        "artist_font_size": raw_json.get("artist_font_size", 0.05),
+        "artist_color": raw_json.get("artist_color"),
+        "artist_outline_color": raw_json.get("artist_outline_color"),
+        "artist_font_style": raw_json.get("artist_font_style"),
+    }
+
+
 @api_image_v1.route("/add-text-overlay", methods=["POST"])
 @jwt_required
 def add_text_overlay():
@@ -231,22 +274,8 @@ def add_text_overlay():
     if not raw_json:
         return jsonify({"error": "No JSON provided"}), 400
 
-    # Extract parameters (V2 - with separate title/artist controls)
     image_id = raw_json.get("image_id")
-    title = raw_json.get("title")
-    artist = raw_json.get("artist")
-    font_style = raw_json.get("font_style", "bold")
-
-    # V2 parameters
-    title_position = raw_json.get("title_position", "center")
-    title_font_size = raw_json.get("title_font_size", 0.08)
-    title_color = raw_json.get("title_color", "#FFFFFF")
-    title_outline_color = raw_json.get("title_outline_color", "#000000")
-    artist_position = raw_json.get("artist_position")
-    artist_font_size = raw_json.get("artist_font_size", 0.05)
-    artist_color = raw_json.get("artist_color")
-    artist_outline_color = raw_json.get("artist_outline_color")
-    artist_font_style = raw_json.get("artist_font_style")
+    overlay_params = _get_overlay_params(raw_json)
 
     # Legacy parameters (fallback for old clients)
     position = raw_json.get("position")
@@ -254,28 +283,65 @@ def add_text_overlay():
     outline_color = raw_json.get("outline_color")
 
     # Validate required fields
-    if not image_id or not title:
+    if not image_id or not overlay_params["title"]:
         return jsonify({"error": "image_id and title are required"}), 400
 
     # Call controller
     response_data, status_code = image_controller.add_text_overlay(
         image_id=image_id,
         user_id=str(user_id),
-        title=title,
-        artist=artist,
-        font_style=font_style,
-        title_position=title_position,
-        title_font_size=title_font_size,
-        title_color=title_color,
-        title_outline_color=title_outline_color,
-        artist_position=artist_position,
-        artist_font_size=artist_font_size,
-        artist_color=artist_color,
-        artist_outline_color=artist_outline_color,
-        artist_font_style=artist_font_style,
+        **overlay_params,
         position=position,
         text_color=text_color,
         outline_color=outline_color,
     )
 
     return jsonify(response_data), status_code
+
+
+@api_image_v1.route("/add-text-overlay/preview", methods=["POST"])
+@jwt_required
+def preview_text_overlay():
+    """
+    Render a low-resolution text overlay preview (live editor, nothing is stored)
+
+    Request Body: Same as /add-text-overlay, plus optional
+        - max_edge (int): Longest preview edge in pixels (128-2048, default: TEXT_OVERLAY_PREVIEW_MAX_EDGE)
+        - format (str): 'jpeg' (default) or 'webp'
+
+    Response:
+        200: Binary image data (image/jpeg or image/webp)
+        400: {'error': 'image_id and title are required' | 'Invalid preview format or size'}
+        404: {'error': 'Source image not found: ...'}
+    """
+    from config.settings import TEXT_OVERLAY_PREVIEW_MAX_EDGE
+
+    user_id = get_current_user_id()
+
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    raw_json = request.get_json(silent=True)
+
+    if not raw_json:
+        return jsonify({"error": "No JSON provided"}), 400
+
+    image_id = raw_json.get("image_id")
+    overlay_params = _get_overlay_params(raw_json)
+    if not image_id or not overlay_params["title"]:
+        return jsonify({"error": "image_id and title are required"}), 400
+
+    image_format = raw_json.get("format", "jpeg")
+    max_edge = raw_json.get("max_edge", TEXT_OVERLAY_PREVIEW_MAX_EDGE)
+    if image_format not in ("jpeg", "webp") or not isinstance(max_edge, int) or not 128 <= max_edge <= 2048:
+        return jsonify({"error": "Invalid preview format or size"}), 400
+
+    response_data, status_code = image_controller.preview_text_overlay(
+        image_id=image_id, max_edge=max_edge, image_format=image_format, **overlay_params
+    )
+    if status_code != 200:
+        return jsonify(response_data), status_code
+
+    response = Response(response_data["data"], mimetype=response_data["mimetype"])
+    response.headers["Cache-Control"] = "no-store"
+    return response
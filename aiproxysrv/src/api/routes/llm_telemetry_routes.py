@@ -0,0 +1,42 @@
+"""
+LLM Telemetry API Routes - p50/p95 latency, TTFT and tokens/s per model
+"""
+
+from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import Session
+
+from api.auth_middleware import jwt_required
+from api.controllers.llm_telemetry_controller import LlmTelemetryController
+from db.database import get_db
+
+
+api_llm_telemetry_v1 = Blueprint("api_llm_telemetry_v1", __name__, url_prefix="/api/v1/llm-telemetry")
+
+
+def _get_rollup(per_day: bool):
+    db: Session = next(get_db())
+    try:
+        result, status_code = LlmTelemetryController.get_rollup(
+            db,
+            days=request.args.get("days"),
+            per_day=per_day,
+            provider=request.args.get("provider"),
+            model=request.args.get("model"),
+        )
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_llm_telemetry_v1.route("/rollup/models", methods=["GET"])
+@jwt_required
+def get_model_rollup():
+    """Get p50/p95 per model over the last ?days= (default 7, optional ?provider= / ?model=)"""
+    return _get_rollup(per_day=False)
+
+
+@api_llm_telemetry_v1.route("/rollup/daily", methods=["GET"])
+@jwt_required
+def get_daily_rollup():
+    """Get p50/p95 per model and day over the last ?days= (default 7, optional ?provider= / ?model=)"""
+    return _get_rollup(per_day=True)
@@ -0,0 +1,66 @@
+"""
+Profiler Admin Routes - List, download and trigger per-request profiles
+
+Authenticated with "Authorization: Bearer <PROFILER_SECRET>" (not the user JWT); the
+blueprint is only registered when PROFILER_SECRET is set.
+"""
+
+import hmac
+from functools import wraps
+
+from flask import Blueprint, jsonify, request, send_file
+
+from api.controllers.profiler_controller import ProfilerController
+from config.settings import PROFILER_DIR, PROFILER_SECRET
+from utils.profiler import get_profile_path
+
+
+api_profiler_v1 = Blueprint("api_profiler_v1", __name__, url_prefix="/api/v1/admin/profiles")
+
+
+def profiler_admin_required(f):
+    """Require the profiler secret as bearer token"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        auth_header = request.headers.get("Authorization", "")
+        if not PROFILER_SECRET or not hmac.compare_digest(auth_header, f"Bearer {PROFILER_SECRET}"):
+            return jsonify({"error": "Unauthorized"}), 401
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@api_profiler_v1.route("", methods=["GET"])
+@profiler_admin_required
+def list_profiles():
+    """List stored profiles (newest first)"""
+    result, status_code = ProfilerController.list_profiles()
+    return jsonify(result), status_code
+
+
+@api_profiler_v1.route("/<name>", methods=["GET"])
+@profiler_admin_required
+def download_profile(name: str):
+    """Download one profile (speedscope JSON or pstats)"""
+    path = get_profile_path(PROFILER_DIR, name)
+    if path is None:
+        return jsonify({"error": "Profile not found"}), 404
+    return send_file(path, as_attachment=True, download_name=name)
+
+
+@api_profiler_v1.route("/sign", methods=["POST"])
+@profiler_admin_required
+def sign_trigger():
+    """
+    Create a signed trigger for one request path
+
+    Request Body:
+        {"path": "/api/v1/song-projects", "ttl_seconds": 900}
+
+    Response:
+        200: {'data': {'trigger', 'header', 'query', 'expires_at', 'path'}}
+    """
+    body = request.get_json(silent=True) or {}
+    result, status_code = ProfilerController.sign_trigger(body.get("path"), body.get("ttl_seconds"))
+    return jsonify(result), status_code
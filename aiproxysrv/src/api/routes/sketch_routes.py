@@ -56,14 +56,21 @@ def list_sketches():
     sort_by = request.args.get("sort_by", "created_at")
     sort_direction = request.args.get("sort_direction", "desc")
 
+    # Keyset pagination: cursor="" for the first page, then next_cursor from the response
+    cursor = request.args.get("cursor", None)
+    include_total = request.args.get("include_total", "false").lower() == "true"
+
     # Validate sort parameters
-    valid_sort_fields = ["created_at", "updated_at", "title"]
+    valid_sort_fields = ["created_at", "updated_at", "title", "relevance"]
     if sort_by not in valid_sort_fields:
         return jsonify({"error": f"Invalid sort_by field. Must be one of: {valid_sort_fields}"}), 400
 
     if sort_direction not in ["asc", "desc"]:
         return jsonify({"error": "Invalid sort_direction. Must be 'asc' or 'desc'"}), 400
 
+    if cursor is not None and sort_by != "created_at":
+        return jsonify({"error": "Cursor pagination only supports sort_by=created_at"}), 400
+
     # Validate workflow filter
     if workflow and workflow not in ["draft", "used", "archived"]:
         return jsonify({"error": "Invalid workflow. Must be one of: draft, used, archived"}), 400
@@ -83,6 +90,8 @@ def list_sketches():
             sketch_type=sketch_type,
             sort_by=sort_by,
             sort_direction=sort_direction,
+            cursor=cursor,
+            include_total=include_total,
         )
         return jsonify(result), status_code
     finally:
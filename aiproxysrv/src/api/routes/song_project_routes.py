@@ -14,18 +14,30 @@ Endpoints:
 - PUT    /api/v1/song-projects/{id}         Update project
 - DELETE /api/v1/song-projects/{id}         Delete project (with S3 cleanup)
 - POST   /api/v1/song-projects/{id}/files   Upload file to project folder
+- GET    /api/v1/song-projects/{id}/archive Download project/folder/selection as streaming ZIP
 """
 
+from urllib.parse import quote
 from uuid import UUID
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from api.auth_middleware import get_current_user_id, jwt_required
 from api.controllers.song_project_controller import song_project_controller
 from db.database import get_db
-from schemas.song_project_schemas import BatchDeleteRequest, MirrorRequest, ProjectCreateRequest, ProjectUpdateRequest
+from schemas.song_project_schemas import (
+    BatchDeleteRequest,
+    FileClaimRequest,
+    FolderFileListRequest,
+    FolderManifestRequest,
+    MirrorRequest,
+    ProjectArchiveRequest,
+    ProjectCreateRequest,
+    ProjectUpdateRequest,
+    UploadSessionCreateRequest,
+)
 from utils.logger import logger
 
 
@@ -85,13 +97,17 @@ def list_projects():
         - search (str): Search term (project_name, description)
         - tags (str): Comma-separated tags filter
         - project_status (str): Status filter ('new', 'progress', 'archived', or None for all non-archived)
+        - cursor (str): Keyset cursor ('' for the first page, then pagination.next_cursor); replaces offset
+        - include_total (bool): Include total count in cursor mode (default: false)
 
     Response:
         200: {'data': [...], 'pagination': {...}}
+        400: {'error': 'Malformed cursor'}
         401: {'error': 'Unauthorized'}
 
     Example:
         GET /api/v1/song-projects?limit=10&offset=0&search=rock&tags=demo,wip&project_status=new
+        GET /api/v1/song-projects?limit=10&cursor=
     """
     user_id = get_current_user_id()
     if not user_id:
@@ -115,6 +131,8 @@ def list_projects():
     search = request.args.get("search", "").strip()
     tags = request.args.get("tags", None)
     project_status = request.args.get("project_status", None)
+    cursor = request.args.get("cursor", None)
+    include_total = request.args.get("include_total", "false").lower() == "true"
 
     db: Session = next(get_db())
     try:
@@ -126,6 +144,8 @@ def list_projects():
             search=search,
             tags=tags,
             project_status=project_status,
+            cursor=cursor,
+            include_total=include_total,
         )
         return jsonify(result), status_code
     finally:
@@ -141,22 +161,30 @@ def get_project(project_id: str):
     Path Parameters:
         - project_id (UUID): Project ID
 
+    Query Parameters:
+        - include_files (bool): Default true. 'false' returns folders with file statistics
+          (file_count, total_size_bytes, files_modified_at) but without file lists;
+          load files per folder via GET /<project_id>/folders/<folder_id>/files
+
     Response:
         200: {'data': {'folders': [...], ...}}
         404: {'error': 'Project not found with ID: ...'}
         401: {'error': 'Unauthorized'}
 
     Example:
-        GET /api/v1/song-projects/550e8400-e29b-41d4-a716-446655440000
+        GET /api/v1/song-projects/550e8400-e29b-41d4-a716-446655440000?include_files=false
     """
     user_id = get_current_user_id()
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
+    include_files = request.args.get("include_files", "true").lower() != "false"
+
     db: Session = next(get_db())
     try:
-        # Always return project with details (folders and files)
-        result, status_code = song_project_controller.get_project_with_details(db, UUID(user_id), project_id)
+        result, status_code = song_project_controller.get_project_with_details(
+            db, UUID(user_id), project_id, include_files=include_files
+        )
         return jsonify(result), status_code
     finally:
         db.close()
@@ -290,28 +318,48 @@ def upload_file(project_id: str):
 @jwt_required
 def get_folder_files(project_id: str, folder_id: str):
     """
-    Get all files in a project folder with download URLs (CLI download endpoint).
+    Get files in a project folder with download URLs (CLI download endpoint, folder browsing).
+
+    Without 'limit' all files are returned. With 'limit' the listing is paged
+    (keyset on the sort field); follow pagination.next_cursor until has_more is false.
 
     Path Parameters:
         - project_id (UUID): Project ID
         - folder_id (UUID): Folder ID
 
+    Query Parameters:
+        - limit (int, 1-1000): Page size (optional)
+        - cursor (str): pagination.next_cursor of the previous page
+        - prefix (str): Subdirectory inside the folder, e.g. 'Samples/Drums'
+        - recursive (bool): Default true. 'false' returns only files directly in prefix
+          plus 'subdirectories' (like an S3 listing with delimiter '/')
+        - sort_by (str): relative_path (default), filename, file_size_bytes, updated_at
+        - sort_direction (str): asc (default), desc
+
     Response:
-        200: {'data': [{'id': '...', 'filename': '...', 'relative_path': '...', 'download_url': '...', 'file_size_bytes': 123}]}
-        404: {'error': 'Project not found or unauthorized' | 'Folder not found'}
+        200: {'data': [{'id': '...', 'filename': '...', 'relative_path': '...', 'download_url': '...', 'file_size_bytes': 123}],
+              'pagination': {'limit': 500, 'next_cursor': '...', 'has_more': true, 'total': 12000},
+              'subdirectories': ['Drums', 'Keys']}
+        400: {'error': 'Invalid ID format' | 'Malformed cursor' | validation error}
+        404: {'error': 'Project or folder not found or unauthorized'}
         401: {'error': 'Unauthorized'}
 
     Example:
-        GET /api/v1/song-projects/550e8400-e29b-41d4-a716-446655440000/folders/123e4567-e89b-12d3-a456-426614174000/files
+        GET /api/v1/song-projects/550e8400-e29b-41d4-a716-446655440000/folders/123e4567-e89b-12d3-a456-426614174000/files?limit=500&prefix=Samples&recursive=false
         Headers: Authorization: Bearer <JWT_TOKEN>
     """
     user_id = get_current_user_id()
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
+    try:
+        query = FolderFileListRequest.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": f"Validation error: {e}"}), 400
+
     db: Session = next(get_db())
     try:
-        result, status_code = song_project_controller.get_folder_files(db, UUID(user_id), project_id, folder_id)
+        result, status_code = song_project_controller.get_folder_files(db, UUID(user_id), project_id, folder_id, query)
         return jsonify(result), status_code
     finally:
         db.close()
@@ -365,6 +413,161 @@ def batch_upload_files(project_id: str, folder_id: str):
         db.close()
 
 
+@api_song_projects_v1.route("/<project_id>/folders/<folder_id>/upload-sessions", methods=["POST"])
+@jwt_required
+def create_upload_session(project_id: str, folder_id: str):
+    """
+    Start (or resume) a resumable chunked upload of one large file (CLI endpoint).
+
+    Chunks are stored as S3 multipart parts. Creating a session again for the same
+    path, hash and size returns the open session with its missing parts (resume).
+
+    Request Body:
+        UploadSessionCreateRequest (JSON): {relative_path, file_hash, file_size_bytes}
+
+    Response:
+        201: {
+            'data': {
+                'id': '...', 'relative_path': 'Stems/drums.wav', 'chunk_size': 16777216,
+                'part_count': 256, 'received_parts': [1, 2], 'missing_parts': [3, ...],
+                'status': 'open', 'expires_at': '...'
+            }
+        }
+        400: {'error': 'Validation error: ...'}
+        401: {'error': 'Unauthorized'}
+        403: {'error': 'Cannot upload to archived project. Unarchive it first.'}
+        404: {'error': 'Project not found or unauthorized' | 'Folder not found'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        session_data = UploadSessionCreateRequest.model_validate(request.json)
+    except ValidationError as e:
+        return jsonify({"error": f"Validation error: {e}"}), 400
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.create_upload_session(
+            db, UUID(user_id), project_id, folder_id, session_data
+        )
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_song_projects_v1.route("/<project_id>/upload-sessions/<session_id>", methods=["GET"])
+@jwt_required
+def get_upload_session(project_id: str, session_id: str):
+    """
+    Get upload session state (received_parts / missing_parts).
+
+    Response:
+        200: {'data': {...session...}}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Upload session not found'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.get_upload_session(db, UUID(user_id), project_id, session_id)
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_song_projects_v1.route("/<project_id>/upload-sessions/<session_id>/parts/<int:part_number>", methods=["PUT"])
+@jwt_required
+def upload_session_part(project_id: str, session_id: str, part_number: int):
+    """
+    Upload one chunk (raw request body, application/octet-stream).
+
+    Every chunk except the last must be exactly chunk_size bytes. Re-sending a part
+    replaces it, so retries after a dropped connection are safe.
+
+    Headers:
+        X-Chunk-SHA256 (optional): SHA256 of the chunk, corrupted chunks are rejected
+
+    Response:
+        200: {'data': {'part_number': 3, 'size': 16777216}}
+        400: {'error': 'Part 3 must be 16777216 bytes, got ...' | 'Checksum mismatch for part 3'}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Upload session not found'}
+        409: {'error': 'Upload session is completed'}
+        410: {'error': 'Upload session expired'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.upload_session_part(
+            db,
+            UUID(user_id),
+            project_id,
+            session_id,
+            part_number,
+            request.get_data(cache=False),
+            request.headers.get("X-Chunk-SHA256"),
+        )
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_song_projects_v1.route("/<project_id>/upload-sessions/<session_id>/complete", methods=["POST"])
+@jwt_required
+def complete_upload_session(project_id: str, session_id: str):
+    """
+    Complete an upload session: assemble the parts, verify the SHA256, create/update the file.
+
+    Response:
+        200: {'data': {'session': {...}, 'file': {...}}, 'message': 'Upload completed'}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Upload session not found'}
+        409: {'error': '3 of 256 parts missing (first: 17)'}
+        422: {'error': 'Uploaded content does not match file_hash (session aborted)'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.complete_upload_session(db, UUID(user_id), project_id, session_id)
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_song_projects_v1.route("/<project_id>/upload-sessions/<session_id>", methods=["DELETE"])
+@jwt_required
+def abort_upload_session(project_id: str, session_id: str):
+    """
+    Abort an upload session (stored parts are discarded).
+
+    Response:
+        200: {'data': {...session with status 'aborted'...}}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Upload session not found'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.abort_upload_session(db, UUID(user_id), project_id, session_id)
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
 @api_song_projects_v1.route("/<project_id>/folders/<folder_id>/mirror", methods=["POST"])
 @jwt_required
 def mirror_compare(project_id: str, folder_id: str):
@@ -372,7 +575,10 @@ def mirror_compare(project_id: str, folder_id: str):
     Compare local files vs remote files (for Mirror sync).
 
     Request Body:
-        MirrorRequest (JSON): {files: [{relative_path, file_hash, file_size_bytes}]}
+        MirrorRequest (JSON): {files: [{relative_path, file_hash, file_size_bytes}], scopes: [...] (optional)}
+
+        scopes limits the compare to the given folder-relative directories (the subtrees
+        found to differ via the manifest endpoint); files outside them are left alone.
 
     Response:
         200: {
@@ -416,6 +622,105 @@ def mirror_compare(project_id: str, folder_id: str):
         db.close()
 
 
+@api_song_projects_v1.route("/<project_id>/folders/<folder_id>/files/claim", methods=["POST"])
+@jwt_required
+def claim_files(project_id: str, folder_id: str):
+    """
+    Create/update files from content that is already stored (deduplicated upload).
+
+    With SONG_PROJECT_DEDUP_ENABLED every content is stored once per SHA256. Clients
+    announce new/changed files first and only upload the ones reported as missing.
+    Only content the user already stores in own projects is claimable. Without
+    deduplication all files are reported as missing.
+
+    Request Body:
+        FileClaimRequest (JSON): {files: [{relative_path, file_hash, file_size_bytes}]} (max 1000)
+
+    Response:
+        200: {
+            'data': {
+                'claimed': [{'relative_path': 'Samples/kick.wav', 'file_hash': '...', 'file_size_bytes': 123}],
+                'missing': [{'relative_path': 'mix.wav', 'file_hash': '...', 'file_size_bytes': 456}]
+            }
+        }
+        400: {'error': 'Validation error: ...'}
+        401: {'error': 'Unauthorized'}
+        403: {'error': 'Cannot upload to archived project. Unarchive it first.'}
+        404: {'error': 'Project or folder not found or unauthorized'}
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        claim_data = FileClaimRequest.model_validate(request.json)
+    except ValidationError as e:
+        return jsonify({"error": f"Validation error: {e}"}), 400
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.claim_files(db, UUID(user_id), project_id, folder_id, claim_data)
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
+@api_song_projects_v1.route("/<project_id>/folders/<folder_id>/manifest", methods=["GET"])
+@jwt_required
+def get_folder_manifest(project_id: str, folder_id: str):
+    """
+    Get folder manifest nodes (Merkle tree hashes) for incremental Mirror sync.
+
+    A directory hash is the sum (mod 2^256) of SHA256(path + newline + file_hash) of all files
+    below it (see business/song_project_manifest_transformer.py). Clients compare the root first and only
+    descend into subdirectories whose hashes differ.
+
+    Query Parameters:
+        path (str, repeatable): Folder-relative directory path, default "" (folder root), max 100
+        children (bool): Include direct subdirectories and files of each path (default: true)
+
+    Response:
+        200: {
+            'data': {
+                'nodes': [{
+                    'path': 'Samples',
+                    'hash': '3f2a...',
+                    'file_count': 120,
+                    'directories': [{'name': 'Drums', 'hash': '...', 'file_count': 80}],
+                    'files': [{'name': 'pad.wav', 'file_hash': '...', 'file_size_bytes': 123}]
+                }]
+            }
+        }
+        400: {'error': 'Invalid query parameters: ...'}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Project or folder not found or unauthorized'}
+
+    Example:
+        GET /api/v1/song-projects/{id}/folders/{folder_id}/manifest?path=&children=false
+        GET /api/v1/song-projects/{id}/folders/{folder_id}/manifest?path=Samples&path=Bounces
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    params: dict = {"paths": request.args.getlist("path") or [""]}
+    if "children" in request.args:
+        params["children"] = request.args["children"]
+    try:
+        query = FolderManifestRequest.model_validate(params)
+    except ValidationError as e:
+        return jsonify({"error": f"Invalid query parameters: {e}"}), 400
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.get_folder_manifest(
+            db, UUID(user_id), project_id, folder_id, query
+        )
+        return jsonify(result), status_code
+    finally:
+        db.close()
+
+
 @api_song_projects_v1.route("/<project_id>/files/batch-delete", methods=["DELETE"])
 @jwt_required
 def batch_delete_files(project_id: str):
@@ -639,6 +944,76 @@ def get_all_project_files(project_id: str):
         db.close()
 
 
+@api_song_projects_v1.route("/<project_id>/archive", methods=["GET", "POST"])
+@jwt_required
+def download_project_archive(project_id: str):
+    """
+    Download a project, folder or file selection as one streaming ZIP.
+
+    Entries are read from S3 and written on the fly (no temp files, constant memory).
+    Audio/images/video are stored without compression, text files are deflated; ZIP64 is
+    used for large files and archives. Project archives keep the folder names as top-level
+    directories (same layout as clone), folder archives use folder-relative paths.
+
+    Path Parameters:
+        - project_id (UUID): Project ID
+
+    Query Parameters (GET):
+        folder_id (UUID): Only this folder
+        file_id (UUID, repeatable): Only these files
+
+    Request Body (POST, for large selections):
+        {'folder_id': 'uuid' | null, 'file_ids': ['uuid', ...] | null}
+
+    Response:
+        200: application/zip stream (Content-Disposition: attachment)
+        400: {'error': 'Invalid ID format' | 'Validation error: ...'}
+        401: {'error': 'Unauthorized'}
+        404: {'error': 'Project or folder not found or unauthorized'}
+
+    Example:
+        GET /api/v1/song-projects/550e8400-e29b-41d4-a716-446655440000/archive?folder_id=abc123...
+        Headers: Authorization: Bearer <JWT_TOKEN>
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    if request.method == "POST":
+        params = request.get_json(silent=True) or {}
+    else:
+        params = {"folder_id": request.args.get("folder_id"), "file_ids": request.args.getlist("file_id") or None}
+    try:
+        archive_data = ProjectArchiveRequest.model_validate(params)
+    except ValidationError as e:
+        return jsonify({"error": f"Validation error: {e}"}), 400
+
+    db: Session = next(get_db())
+    try:
+        result, status_code = song_project_controller.download_project_archive(
+            db, UUID(user_id), project_id, archive_data
+        )
+    finally:
+        # The stream only reads S3 - release the DB connection before the download starts
+        db.close()
+
+    if status_code != 200:
+        return jsonify(result), status_code
+
+    filename = result["filename"]
+    ascii_filename = filename.encode("ascii", "replace").decode().replace("?", "_").replace('"', "_")
+    return Response(
+        result["stream"],
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename=\"{ascii_filename}\"; filename*=UTF-8''{quote(filename)}",
+            "X-Accel-Buffering": "no",  # Nginx: pass chunks through instead of buffering the archive
+            "X-Archive-File-Count": str(result["file_count"]),
+            "X-Archive-Total-Size": str(result["total_size_bytes"]),
+        },
+    )
+
+
 @api_song_projects_v1.route("/<project_id>/folders/<folder_id>/clear", methods=["DELETE"])
 @jwt_required
 def clear_folder_files(project_id: str, folder_id: str):
@@ -714,14 +1089,11 @@ def download_file(project_id: str, file_id: str):
         # Get file from DB
         db: Session = next(get_db())
         try:
-            file = song_project_service.get_file_by_id(db, file_uuid)
+            # Security: file must belong to user's project (checked in the same query)
+            file = song_project_service.get_file_for_user(db, project_uuid, file_uuid, UUID(user_id))
             if not file:
                 return jsonify({"error": "File not found"}), 404
 
-            # Security: Verify file belongs to user's project
-            if str(file.project_id) != str(project_uuid) or str(file.project.user_id) != str(user_id):
-                return jsonify({"error": "File not found"}), 404
-
             # Verify file has S3 key
             if not file.s3_key:
                 return jsonify({"error": "File not available"}), 404
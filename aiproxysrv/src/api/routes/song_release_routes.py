@@ -19,7 +19,6 @@ from io import BytesIO
 from uuid import UUID
 
 from flask import Blueprint, jsonify, request
-from PIL import Image
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
@@ -93,7 +92,9 @@ def create_release():
                 # Read file data
                 file_data = cover.read()
 
-                # Get image dimensions using PIL
+                # Get image dimensions using PIL (imported on first upload, not at app start)
+                from PIL import Image
+
                 image = Image.open(BytesIO(file_data))
                 width, height = image.size
 
@@ -123,9 +124,12 @@ def list_releases():
         - offset (int): Offset for pagination (default: 0)
         - status_filter (str): Filter by status group ('all', 'progress', 'uploaded', 'released', 'archive')
         - search (str): Search term (name, genre)
+        - cursor (str): Keyset cursor ('' for the first page, then next_cursor); replaces offset
+        - include_total (bool): Include total count in cursor mode (default: false)
 
     Response:
         200: {'data': {'items': [...], 'total': 10, 'limit': 20, 'offset': 0}}
+        400: {'error': 'Malformed cursor'}
         401: {'error': 'Unauthorized'}
 
     Example:
@@ -144,8 +148,17 @@ def list_releases():
 
     status_filter = request.args.get("status_filter")
     search = request.args.get("search")
-
-    filters = ReleaseFilterRequest(limit=limit, offset=offset, status_filter=status_filter, search=search)
+    cursor = request.args.get("cursor")
+    include_total = request.args.get("include_total", "false").lower() == "true"
+
+    filters = ReleaseFilterRequest(
+        limit=limit,
+        offset=offset,
+        status_filter=status_filter,
+        search=search,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
     db: Session = next(get_db())
     try:
@@ -252,7 +265,9 @@ def update_release(release_id: str):
                 # Read file data
                 file_data = cover.read()
 
-                # Get image dimensions using PIL
+                # Get image dimensions using PIL (imported on first upload, not at app start)
+                from PIL import Image
+
                 image = Image.open(BytesIO(file_data))
                 width, height = image.size
 
@@ -320,8 +335,12 @@ def serve_cover(release_id: str):
     Path Parameters:
         - release_id (UUID): Release ID
 
+    Query Parameters:
+        - size (str, optional): thumb (320px), preview (1024px) or original (default)
+
     Response:
-        200: Binary image data (image/jpeg, image/png, etc.)
+        200: Binary image data (image/jpeg, image/png, image/webp for derivatives)
+        400: {'error': 'Invalid image size ...'}
         401: {'error': 'Unauthorized'}
         404: {'error': 'Release not found' | 'Cover not found'}
         500: {'error': 'Failed to load cover from S3'}
@@ -334,8 +353,16 @@ def serve_cover(release_id: str):
     if not user_id:
         return jsonify({"error": "Unauthorized"}), 401
 
+    from business.image_derivative_transformer import parse_image_size
+
+    try:
+        size = parse_image_size(request.args.get("size"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     try:
         from adapters.s3.s3_proxy_service import s3_proxy_service
+        from business.image_derivative_orchestrator import image_derivative_orchestrator
         from config.settings import S3_SONG_RELEASES_BUCKET
         from db.song_release_service import song_release_service
 
@@ -355,8 +382,15 @@ def serve_cover(release_id: str):
                 return jsonify({"error": "Cover not found"}), 404
 
             # Stream from S3 using generic proxy service
+            s3_key, filename = image_derivative_orchestrator.get_serving_variant(
+                release.cover_s3_key, "cover.jpg", size
+            )
             return s3_proxy_service.serve_resource(
-                bucket=S3_SONG_RELEASES_BUCKET, s3_key=release.cover_s3_key, filename="cover.jpg"
+                bucket=S3_SONG_RELEASES_BUCKET,
+                s3_key=s3_key,
+                filename=filename,
+                fallback_s3_key=release.cover_s3_key if size else None,
+                fallback_filename="cover.jpg",
             )
 
         finally:
@@ -4,7 +4,7 @@ Song Read/Update/Delete Routes
 
 from uuid import UUID
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flask_pydantic import validate
 from sqlalchemy.orm import Session
 
@@ -51,14 +51,21 @@ def list_songs():
     sort_direction = request.args.get("sort_direction", "desc")
     workflow = request.args.get("workflow", None)  # Optional workflow filter
 
+    # Keyset pagination: cursor="" for the first page, then next_cursor from the response
+    cursor = request.args.get("cursor", None)
+    include_total = request.args.get("include_total", "false").lower() == "true"
+
     # Validate sort parameters
-    valid_sort_fields = ["created_at", "title", "lyrics"]
+    valid_sort_fields = ["created_at", "title", "lyrics", "relevance"]
     if sort_by not in valid_sort_fields:
         return jsonify({"error": f"Invalid sort_by field. Must be one of: {valid_sort_fields}"}), 400
 
     if sort_direction not in ["asc", "desc"]:
         return jsonify({"error": "Invalid sort_direction. Must be 'asc' or 'desc'"}), 400
 
+    if cursor is not None and sort_by != "created_at":
+        return jsonify({"error": "Cursor pagination only supports sort_by=created_at"}), 400
+
     response_data, status_code = song_controller.get_songs(
         limit=limit,
         offset=offset,
@@ -67,6 +74,8 @@ def list_songs():
         sort_by=sort_by,
         sort_direction=sort_direction,
         workflow=workflow,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     return jsonify(response_data), status_code
@@ -168,6 +177,30 @@ def unassign_song_from_project(song_id: str):
 # ============================================================
 
 
+def _serve_choice_file(db: Session, choice_id: str, file_type: str, filename: str):
+    """
+    Serve a choice file from S3 - or stream it from the Mureka CDN while not migrated yet
+
+    The migration to S3 runs in the background (song_migration_worker), so the first
+    playback never waits for the full transfer.
+    """
+    from adapters.s3.s3_proxy_service import s3_proxy_service
+    from business.song_orchestrator import song_orchestrator
+    from config.settings import S3_SONGS_BUCKET
+
+    source = song_orchestrator.get_choice_playback_source(db, choice_id, file_type)
+    if "s3_key" in source:
+        # Stream from S3 using generic proxy service
+        return s3_proxy_service.serve_resource(bucket=S3_SONGS_BUCKET, s3_key=source["s3_key"], filename=filename)
+
+    chunks, content_length = song_orchestrator.open_url_stream(source["url"])
+    response = Response(stream_with_context(chunks), mimetype=source["content_type"])
+    response.headers["Content-Disposition"] = f'inline; filename="{filename}"'
+    if content_length is not None:
+        response.headers["Content-Length"] = str(content_length)
+    return response
+
+
 @api_song_v1.route("/choice/<choice_id>/mp3", methods=["GET"])
 @jwt_required
 def serve_choice_mp3(choice_id: str):
@@ -192,10 +225,6 @@ def serve_choice_mp3(choice_id: str):
         return jsonify({"error": "Unauthorized"}), 401
 
     try:
-        from adapters.s3.s3_proxy_service import s3_proxy_service
-        from business.song_orchestrator import song_orchestrator
-        from config.settings import S3_SONGS_BUCKET
-
         choice_uuid = UUID(choice_id)
 
         logger.debug("Serving choice MP3", choice_id=choice_id, user_id=user_id)
@@ -203,10 +232,7 @@ def serve_choice_mp3(choice_id: str):
         # Get DB session
         db: Session = next(get_db())
         try:
-            s3_key = song_orchestrator.migrate_choice_to_s3(db, str(choice_uuid), "mp3")
-
-            # Stream from S3 using generic proxy service
-            return s3_proxy_service.serve_resource(bucket=S3_SONGS_BUCKET, s3_key=s3_key, filename="song.mp3")
+            return _serve_choice_file(db, str(choice_uuid), "mp3", "song.mp3")
 
         finally:
             db.close()
@@ -245,10 +271,6 @@ def serve_choice_flac(choice_id: str):
         return jsonify({"error": "Unauthorized"}), 401
 
     try:
-        from adapters.s3.s3_proxy_service import s3_proxy_service
-        from business.song_orchestrator import song_orchestrator
-        from config.settings import S3_SONGS_BUCKET
-
         choice_uuid = UUID(choice_id)
 
         logger.debug("Serving choice FLAC", choice_id=choice_id, user_id=user_id)
@@ -256,10 +278,7 @@ def serve_choice_flac(choice_id: str):
         # Get DB session
         db: Session = next(get_db())
         try:
-            s3_key = song_orchestrator.migrate_choice_to_s3(db, str(choice_uuid), "flac")
-
-            # Stream from S3 using generic proxy service
-            return s3_proxy_service.serve_resource(bucket=S3_SONGS_BUCKET, s3_key=s3_key, filename="song.flac")
+            return _serve_choice_file(db, str(choice_uuid), "flac", "song.flac")
 
         finally:
             db.close()
@@ -298,10 +317,6 @@ def serve_choice_wav(choice_id: str):
         return jsonify({"error": "Unauthorized"}), 401
 
     try:
-        from adapters.s3.s3_proxy_service import s3_proxy_service
-        from business.song_orchestrator import song_orchestrator
-        from config.settings import S3_SONGS_BUCKET
-
         choice_uuid = UUID(choice_id)
 
         logger.debug("Serving choice WAV", choice_id=choice_id, user_id=user_id)
@@ -309,10 +324,7 @@ def serve_choice_wav(choice_id: str):
         # Get DB session
         db: Session = next(get_db())
         try:
-            s3_key = song_orchestrator.migrate_choice_to_s3(db, str(choice_uuid), "wav")
-
-            # Stream from S3 using generic proxy service
-            return s3_proxy_service.serve_resource(bucket=S3_SONGS_BUCKET, s3_key=s3_key, filename="song.wav")
+            return _serve_choice_file(db, str(choice_uuid), "wav", "song.wav")
 
         finally:
             db.close()
@@ -351,10 +363,6 @@ def serve_choice_stems(choice_id: str):
         return jsonify({"error": "Unauthorized"}), 401
 
     try:
-        from adapters.s3.s3_proxy_service import s3_proxy_service
-        from business.song_orchestrator import song_orchestrator
-        from config.settings import S3_SONGS_BUCKET
-
         choice_uuid = UUID(choice_id)
 
         logger.debug("Serving choice stems", choice_id=choice_id, user_id=user_id)
@@ -362,10 +370,7 @@ def serve_choice_stems(choice_id: str):
         # Get DB session
         db: Session = next(get_db())
         try:
-            s3_key = song_orchestrator.migrate_choice_to_s3(db, str(choice_uuid), "stems")
-
-            # Stream from S3 using generic proxy service
-            return s3_proxy_service.serve_resource(bucket=S3_SONGS_BUCKET, s3_key=s3_key, filename="stems.zip")
+            return _serve_choice_file(db, str(choice_uuid), "stems", "stems.zip")
 
         finally:
             db.close()
@@ -0,0 +1,65 @@
+"""
+Tracing Admin Routes - Recent request traces with per-stage timing breakdown
+
+Authenticated with "Authorization: Bearer <TRACING_ADMIN_TOKEN>" (not the user JWT); the
+blueprint is only registered when TRACING_ENABLED is set. The same token in the X-Trace-Token
+header unlocks the Server-Timing header on regular API responses. Traces are kept per gunicorn
+worker, so consecutive calls may be answered by different workers (see "pid").
+"""
+
+import hmac
+from functools import wraps
+
+from flask import Blueprint, jsonify, request
+
+from api.controllers.tracing_controller import TracingController
+from config.settings import TRACING_ADMIN_TOKEN
+
+
+api_tracing_v1 = Blueprint("api_tracing_v1", __name__, url_prefix="/api/v1/admin/traces")
+
+
+def is_tracing_admin_token(token: str) -> bool:
+    """Constant-time check of the tracing admin token (always False if no token is configured)"""
+    return bool(TRACING_ADMIN_TOKEN) and hmac.compare_digest(token, TRACING_ADMIN_TOKEN)
+
+
+def tracing_admin_required(f):
+    """Require the tracing admin token as bearer token"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme != "Bearer" or not is_tracing_admin_token(token):
+            return jsonify({"error": "Unauthorized"}), 401
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@api_tracing_v1.route("", methods=["GET"])
+@tracing_admin_required
+def list_traces():
+    """
+    List recent traces (newest first)
+
+    Query Parameters:
+        - limit (int): Max traces (default 50)
+        - min_duration_ms (float): Only slower traces
+        - name (str): Substring of the trace name, e.g. "song-projects"
+
+    Response:
+        200: {'data': [{'trace_id', 'name', 'duration_ms', 'status_code', 'breakdown_ms', ...}], 'count', 'pid'}
+    """
+    result, status_code = TracingController.list_traces(
+        request.args.get("limit"), request.args.get("min_duration_ms"), request.args.get("name")
+    )
+    return jsonify(result), status_code
+
+
+@api_tracing_v1.route("/<trace_id>", methods=["GET"])
+@tracing_admin_required
+def get_trace(trace_id: str):
+    """Get one trace with all spans (also reachable via the X-Trace-Id response header)"""
+    result, status_code = TracingController.get_trace(trace_id)
+    return jsonify(result), status_code
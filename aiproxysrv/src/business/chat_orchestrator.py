@@ -1,13 +1,18 @@
 """Chat Orchestrator - Coordinates Ollama chat operations (NOT testable, orchestration only)."""
 
+import time
 import traceback
 from typing import Any
 
 from adapters.ollama.api_client import OllamaAPIClient, OllamaAPIError
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import build_ollama_telemetry
 from config.settings import CHAT_DEBUG_LOGGING
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class ChatOrchestrator:
     """Orchestrator for Ollama chat operations (coordinates services, NO business logic)."""
 
@@ -75,15 +80,22 @@ class ChatOrchestrator:
                     "Ollama chat request", category=category, action=action, model=model, prompt_length=len(prompt)
                 )
 
+            # Build template identifier for logging
+            template_id = f"{category}/{action}" if category and action else "unknown"
+
             # Call API client
+            started = time.perf_counter()
             response_data = self.api_client.generate(model, full_prompt, temperature, max_tokens)
+            wall_ms = (time.perf_counter() - started) * 1000
+
+            # Keep eval/load durations (dropped from the response below) as telemetry
+            llm_telemetry_orchestrator.record(
+                "ollama", model, build_ollama_telemetry(response_data, wall_ms), source=template_id
+            )
 
             # Clean response (remove context)
             cleaned_response = self._clean_ollama_response(response_data)
 
-            # Build template identifier for logging
-            template_id = f"{category}/{action}" if category and action else "unknown"
-
             # Log warning if response is empty (token limit exceeded by thinking, etc.)
             if not cleaned_response.get("response", "").strip():
                 eval_count = cleaned_response.get("eval_count", 0)
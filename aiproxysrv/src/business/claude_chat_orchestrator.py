@@ -1,5 +1,6 @@
 """Claude Chat Orchestrator - Coordinates Claude Messages API operations (NOT testable, orchestration only)."""
 
+import time
 from typing import Any
 
 from adapters.claude.api_client import ClaudeAPIClient, ClaudeAPIError
@@ -7,14 +8,19 @@ from business.claude_chat_transformer import (
     build_messages_payload,
     filter_models_by_whitelist,
     get_available_models,
+    parse_cache_usage,
     parse_configured_claude_models,
     parse_messages_response,
     transform_api_models_to_frontend,
 )
-from config.settings import CHAT_DEBUG_LOGGING, CLAUDE_CHAT_MODELS
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import build_claude_telemetry
+from config.settings import CHAT_DEBUG_LOGGING, CLAUDE_CHAT_MODELS, CLAUDE_PROMPT_CACHE
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class ClaudeChatOrchestrator:
     """Orchestrator for Claude Messages API integration (coordinates services, NO business logic)."""
 
@@ -23,7 +29,7 @@ class ClaudeChatOrchestrator:
 
     def send_chat_message(
         self, model: str, messages: list[dict[str, str]], max_tokens: int, temperature: float = 0.7
-    ) -> tuple[str, int, int]:
+    ) -> tuple[str, int, int, int, int]:
         """
         Send chat message to Claude Messages API (orchestrates transformer + API client).
 
@@ -34,29 +40,40 @@ class ClaudeChatOrchestrator:
             temperature: Sampling temperature (0.0-1.0)
 
         Returns:
-            Tuple of (assistant_content, input_tokens, output_tokens)
+            Tuple of (assistant_content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens)
+            input_tokens excludes cached prefix tokens (Anthropic reports them separately)
 
         Raises:
             ClaudeAPIError: If API call fails
         """
-        # Build payload using transformer
-        payload = build_messages_payload(model, messages, max_tokens, temperature)
+        # Build payload using transformer (cache breakpoints on system + history prefix)
+        payload = build_messages_payload(model, messages, max_tokens, temperature, prompt_cache=CLAUDE_PROMPT_CACHE)
 
         # Call API client
+        started = time.perf_counter()
         resp_json = self.api_client.messages_create(payload)
+        llm_telemetry_orchestrator.record(
+            "claude",
+            model,
+            build_claude_telemetry(resp_json, (time.perf_counter() - started) * 1000),
+            source="conversation",
+        )
 
         # Parse response using transformer
         content, input_tokens, output_tokens = parse_messages_response(resp_json)
+        cache_creation_tokens, cache_read_tokens = parse_cache_usage(resp_json)
 
         if CHAT_DEBUG_LOGGING:
             logger.debug(
                 "Token counts extracted",
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_creation_tokens=cache_creation_tokens,
+                cache_read_tokens=cache_read_tokens,
                 content_length=len(content),
             )
 
-        return content, input_tokens, output_tokens
+        return content, input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens
 
     def get_available_models(self) -> list[dict[str, Any]]:
         """
@@ -3,8 +3,16 @@
 from typing import Any
 
 
+# Anthropic prompt caching marker (5 minute TTL, refreshed on every cache hit)
+CACHE_CONTROL_EPHEMERAL = {"type": "ephemeral"}
+
+
 def build_messages_payload(
-    model: str, messages: list[dict[str, str]], max_tokens: int, temperature: float = 0.7
+    model: str,
+    messages: list[dict[str, str]],
+    max_tokens: int,
+    temperature: float = 0.7,
+    prompt_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Build payload for Claude Messages API request.
@@ -14,6 +22,7 @@ def build_messages_payload(
         messages: List of messages with role and content (user/assistant only)
         max_tokens: Maximum tokens to generate (REQUIRED by Claude API)
         temperature: Sampling temperature (0.0-1.0)
+        prompt_cache: Place cache breakpoints on the system block and the history prefix
 
     Returns:
         Dictionary with Claude Messages API payload
@@ -22,6 +31,7 @@ def build_messages_payload(
         - System messages must be extracted and placed in separate 'system' field
         - Claude API requires max_tokens (not optional like OpenAI)
         - Temperature range is 0.0-1.0 (not 0.0-2.0 like OpenAI)
+        - With prompt_cache, 'system' becomes a list of text blocks (see apply_prompt_cache_breakpoints)
 
     Examples:
         >>> payload = build_messages_payload(
@@ -59,9 +69,61 @@ def build_messages_payload(
     if temperature is not None:
         payload["temperature"] = max(0.0, min(1.0, temperature))  # Clamp to 0.0-1.0
 
+    if prompt_cache:
+        payload = apply_prompt_cache_breakpoints(payload)
+
     return payload
 
 
+def apply_prompt_cache_breakpoints(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add Anthropic prompt-caching breakpoints to a Messages API payload.
+
+    Pure function - returns a new payload, the input (and its messages) are not mutated.
+
+    Args:
+        payload: Payload as returned by build_messages_payload()
+
+    Returns:
+        Payload with cache_control markers on the system block and the last message
+
+    Notes:
+        - Breakpoint 1: system prompt (stable for the whole conversation)
+        - Breakpoint 2: last message of the history. The next turn re-sends the same
+          prefix plus two new messages, so Anthropic serves everything up to this
+          breakpoint from cache and only processes the new turn.
+        - Prefixes below the model's minimum cacheable length are ignored by the API
+          (no error, no extra cost), so breakpoints are always safe to set.
+
+    Examples:
+        >>> payload = {"system": "Be brief", "messages": [{"role": "user", "content": "Hi"}]}
+        >>> cached = apply_prompt_cache_breakpoints(payload)
+        >>> cached["system"]
+        [{'type': 'text', 'text': 'Be brief', 'cache_control': {'type': 'ephemeral'}}]
+        >>> cached["messages"][0]["content"][0]["cache_control"]
+        {'type': 'ephemeral'}
+    """
+    cached_payload = dict(payload)
+
+    system = payload.get("system")
+    if isinstance(system, str) and system:
+        cached_payload["system"] = [{"type": "text", "text": system, "cache_control": dict(CACHE_CONTROL_EPHEMERAL)}]
+
+    messages = payload.get("messages") or []
+    if messages:
+        last_message = messages[-1]
+        content = last_message.get("content", "")
+        if isinstance(content, str) and content:
+            cached_messages = list(messages)
+            cached_messages[-1] = {
+                **last_message,
+                "content": [{"type": "text", "text": content, "cache_control": dict(CACHE_CONTROL_EPHEMERAL)}],
+            }
+            cached_payload["messages"] = cached_messages
+
+    return cached_payload
+
+
 def parse_messages_response(response_json: dict[str, Any]) -> tuple[str, int, int]:
     """
     Parse Claude Messages API response and extract content + token counts.
@@ -112,6 +174,35 @@ def parse_messages_response(response_json: dict[str, Any]) -> tuple[str, int, in
     return content, input_tokens, output_tokens
 
 
+def parse_cache_usage(response_json: dict[str, Any]) -> tuple[int, int]:
+    """
+    Extract prompt-cache token usage from Claude Messages API response.
+
+    Args:
+        response_json: Claude Messages API response JSON
+
+    Returns:
+        Tuple of (cache_creation_input_tokens, cache_read_input_tokens)
+
+    Notes:
+        - cache_creation_input_tokens: prefix tokens written to cache (billed at 1.25x)
+        - cache_read_input_tokens: prefix tokens served from cache (billed at 0.1x)
+        - Both are reported IN ADDITION to usage.input_tokens (not included in it)
+        - Missing/null fields (caching disabled, older API versions) default to 0
+
+    Examples:
+        >>> parse_cache_usage({"usage": {"cache_creation_input_tokens": 1200, "cache_read_input_tokens": 0}})
+        (1200, 0)
+        >>> parse_cache_usage({"usage": {"input_tokens": 10}})
+        (0, 0)
+    """
+    usage = response_json.get("usage") or {}
+    cache_creation_tokens = usage.get("cache_creation_input_tokens") or 0
+    cache_read_tokens = usage.get("cache_read_input_tokens") or 0
+
+    return cache_creation_tokens, cache_read_tokens
+
+
 def get_model_context_window(_model_name: str) -> int:
     """
     Get context window size for Claude model.
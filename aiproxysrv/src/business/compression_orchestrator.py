@@ -1,5 +1,6 @@
 """Compression Orchestrator - Coordinates conversation compression (NOT testable, orchestration only)."""
 
+import time
 import traceback
 import uuid
 from typing import Any
@@ -15,14 +16,19 @@ from business.compression_transformer import (
     filter_compressible_messages,
     format_summary_message,
 )
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import build_ollama_telemetry
 from business.openai_chat_orchestrator import OpenAIChatOrchestrator
 from config.settings import OLLAMA_SUMMARY_MODEL, OLLAMA_TIMEOUT, OLLAMA_URL
 from db.conversation_compression_service import ConversationCompressionService
 from db.conversation_service import ConversationService
 from db.message_service import MessageService
 from utils.logger import logger
+from utils.metrics import track_upstream
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class CompressionOrchestrator:
     """Orchestrator for compressing conversations (coordinates services, NO business logic)."""
 
@@ -150,7 +156,7 @@ class CompressionOrchestrator:
             if provider == "external":
                 # Use OpenAI via orchestrator
                 content, prompt_tokens, completion_tokens = self.openai_orchestrator.send_chat_message(
-                    model=model, messages=summary_messages
+                    model=model, messages=summary_messages, source="compression"
                 )
                 # For OpenAI, we only care about completion tokens (the summary itself)
                 token_count = completion_tokens
@@ -164,9 +170,18 @@ class CompressionOrchestrator:
                     "stream": False,
                 }
 
-                resp = requests.post(api_url, json=payload, timeout=OLLAMA_TIMEOUT)
+                started = time.perf_counter()
+                with track_upstream("ollama", summary_model) as call:
+                    resp = requests.post(api_url, json=payload, timeout=OLLAMA_TIMEOUT)
+                    call.set_status(resp.status_code)
                 resp.raise_for_status()
                 resp_json = resp.json()
+                llm_telemetry_orchestrator.record(
+                    "ollama",
+                    summary_model,
+                    build_ollama_telemetry(resp_json, (time.perf_counter() - started) * 1000),
+                    source="compression",
+                )
 
                 if "message" in resp_json and "content" in resp_json["message"]:
                     content = resp_json["message"]["content"]
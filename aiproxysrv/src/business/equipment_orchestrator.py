@@ -23,6 +23,7 @@ from db.equipment_attachment_service import equipment_attachment_service
 from db.equipment_service import equipment_service
 from infrastructure.storage import get_storage
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 class EquipmentOrchestratorError(Exception):
@@ -31,6 +32,7 @@ class EquipmentOrchestratorError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class EquipmentOrchestrator:
     """Coordinates equipment operations with encryption and normalization"""
 
@@ -10,6 +10,8 @@ from config.settings import (
     OPENAI_TIMEOUT,
 )
 from utils.logger import logger
+from utils.metrics import track_upstream
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 class OpenAIAPIError(Exception):
@@ -18,6 +20,7 @@ class OpenAIAPIError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class OpenAIService:
     """Service for OpenAI API integration (Images)"""
 
@@ -60,7 +63,9 @@ class OpenAIService:
             logger.info("OpenAI image request", model=self.model, size=size, prompt_length=len(prompt))
 
         try:
-            response = requests.post(api_url, headers=headers, json=payload, timeout=OPENAI_TIMEOUT)
+            with track_upstream("openai", self.model) as call:
+                response = requests.post(api_url, headers=headers, json=payload, timeout=OPENAI_TIMEOUT)
+                call.set_status(response.status_code)
 
             if CHAT_DEBUG_LOGGING:
                 logger.debug("OpenAI Image API response received", status_code=response.status_code)
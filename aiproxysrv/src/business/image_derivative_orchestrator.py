@@ -0,0 +1,143 @@
+"""Image Derivative Orchestrator - Thumbnail/preview variants next to originals in S3 (no testable business logic)
+
+Derivatives are generated when an image is saved (generated images, text overlays,
+release covers) and backfilled by scripts/backfill_image_derivatives.py. Serving
+routes pick them via ?size= and fall back to the original while a derivative is
+missing, so a failed derivative never breaks an image.
+"""
+
+from business.image_derivative_transformer import (
+    IMAGE_DERIVATIVE_SIZES,
+    build_derivative_filename,
+    build_derivative_key,
+    calculate_derivative_dimensions,
+)
+from config.settings import IMAGE_DERIVATIVE_FORMAT, IMAGE_DERIVATIVE_QUALITY, IMAGE_DERIVATIVES_ENABLED
+from infrastructure.storage import get_storage
+from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
+
+
+DERIVATIVE_CONTENT_TYPES = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+}
+
+
+@trace_methods(KIND_ORCHESTRATOR)
+class ImageDerivativeOrchestrator:
+    """Generates, resolves and deletes image derivatives (calls PIL + S3)"""
+
+    def generate_derivatives(self, bucket: str, s3_key: str, image_data: bytes | None = None) -> list[str]:
+        """
+        Generate all derivative sizes of an image and store them next to the original
+
+        Never raises - a failed derivative only costs bandwidth (originals are served instead).
+
+        Args:
+            bucket: S3 bucket of the original
+            s3_key: S3 key of the original
+            image_data: Original bytes (downloaded from S3 if None)
+
+        Returns:
+            S3 keys of the stored derivatives (empty if disabled or failed)
+        """
+        if not IMAGE_DERIVATIVES_ENABLED:
+            return []
+
+        from infrastructure.image_file_service import ImageFileService
+
+        try:
+            storage = get_storage(bucket=bucket)
+            if image_data is None:
+                image_data = storage.download(s3_key)
+
+            width, height = ImageFileService.get_image_size(image_data)
+            sizes = {
+                name: calculate_derivative_dimensions(width, height, max_edge)
+                for name, max_edge in IMAGE_DERIVATIVE_SIZES.items()
+            }
+            derivatives = ImageFileService.render_derivatives(
+                image_data, sizes, image_format=IMAGE_DERIVATIVE_FORMAT, quality=IMAGE_DERIVATIVE_QUALITY
+            )
+
+            derivative_keys = []
+            for name, data in derivatives.items():
+                derivative_key = build_derivative_key(s3_key, name, IMAGE_DERIVATIVE_FORMAT)
+                storage.upload(data, derivative_key, content_type=DERIVATIVE_CONTENT_TYPES[IMAGE_DERIVATIVE_FORMAT])
+                derivative_keys.append(derivative_key)
+
+            logger.info(
+                "Image derivatives stored",
+                bucket=bucket,
+                s3_key=s3_key,
+                original_bytes=len(image_data),
+                derivative_bytes={name: len(data) for name, data in derivatives.items()},
+            )
+            return derivative_keys
+
+        except Exception as e:
+            logger.warning(
+                "Image derivative generation failed",
+                bucket=bucket,
+                s3_key=s3_key,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return []
+
+    def has_derivatives(self, bucket: str, s3_key: str) -> bool:
+        """Check if all derivative sizes of an image exist in S3"""
+        storage = get_storage(bucket=bucket)
+        return all(
+            storage.exists(build_derivative_key(s3_key, name, IMAGE_DERIVATIVE_FORMAT))
+            for name in IMAGE_DERIVATIVE_SIZES
+        )
+
+    def delete_derivatives(self, bucket: str, s3_key: str) -> None:
+        """Delete all derivatives of an image (best effort - they can be regenerated)"""
+        storage = get_storage(bucket=bucket)
+        for name in IMAGE_DERIVATIVE_SIZES:
+            derivative_key = build_derivative_key(s3_key, name, IMAGE_DERIVATIVE_FORMAT)
+            if not storage.delete(derivative_key):
+                logger.debug("Image derivative not deleted", bucket=bucket, s3_key=derivative_key)
+
+    def get_serving_variant(self, s3_key: str, filename: str, size: str | None) -> tuple[str, str]:
+        """
+        Resolve S3 key and filename to serve for a ?size= value
+
+        Args:
+            s3_key: S3 key of the original
+            filename: Filename of the original
+            size: Parsed derivative size (None = original)
+
+        Returns:
+            Tuple (s3_key, filename)
+        """
+        if size is None:
+            return s3_key, filename
+        return (
+            build_derivative_key(s3_key, size, IMAGE_DERIVATIVE_FORMAT),
+            build_derivative_filename(filename, size, IMAGE_DERIVATIVE_FORMAT),
+        )
+
+
+def backfill_image_derivatives(bucket: str, s3_key: str, force: bool = False) -> str:
+    """
+    Generate the derivatives of one image (process pool entry point, must be picklable)
+
+    Returns:
+        'generated', 'skipped' (already present) or 'failed'
+    """
+    orchestrator = ImageDerivativeOrchestrator()
+    try:
+        if not force and orchestrator.has_derivatives(bucket, s3_key):
+            return "skipped"
+    except Exception as e:
+        logger.warning("Image derivative check failed", bucket=bucket, s3_key=s3_key, error=str(e))
+        return "failed"
+    return "generated" if orchestrator.generate_derivatives(bucket, s3_key) else "failed"
+
+
+# Singleton instance
+image_derivative_orchestrator = ImageDerivativeOrchestrator()
@@ -0,0 +1,108 @@
+"""Image Derivative Transformer - Pure functions for thumbnail/preview variants
+
+IMPORTANT: This module contains ONLY pure functions (100% unit-testable).
+NO database operations, NO file system operations, NO external dependencies.
+"""
+
+# Derivative size name -> max edge in pixels (aspect ratio is kept, never upscaled)
+IMAGE_DERIVATIVE_SIZES = {
+    "thumb": 320,
+    "preview": 1024,
+}
+
+# ?size= value that serves the original file
+ORIGINAL_IMAGE_SIZE = "original"
+
+DERIVATIVE_FORMAT_EXTENSIONS = {
+    "webp": "webp",
+    "jpeg": "jpg",
+}
+
+
+def parse_image_size(size: str | None) -> str | None:
+    """
+    Parse the ?size= parameter of image serving routes
+
+    Args:
+        size: Requested size (thumb, preview, original or None)
+
+    Returns:
+        Derivative size name, None for the original
+
+    Raises:
+        ValueError: If the size is unknown
+
+    Examples:
+        >>> parse_image_size("thumb")
+        'thumb'
+        >>> parse_image_size(None) is None
+        True
+        >>> parse_image_size("original") is None
+        True
+    """
+    if not size or size == ORIGINAL_IMAGE_SIZE:
+        return None
+    if size not in IMAGE_DERIVATIVE_SIZES:
+        allowed = ", ".join([*IMAGE_DERIVATIVE_SIZES, ORIGINAL_IMAGE_SIZE])
+        raise ValueError(f"Invalid image size '{size}' (allowed: {allowed})")
+    return size
+
+
+def build_derivative_key(s3_key: str, size: str, image_format: str = "webp") -> str:
+    """
+    Build the S3 key of a derivative (stored next to the original)
+
+    Args:
+        s3_key: S3 key of the original
+        size: Derivative size name
+        image_format: Derivative format ('webp' or 'jpeg')
+
+    Returns:
+        Derivative S3 key
+
+    Examples:
+        >>> build_derivative_key("shared/abc-123.png", "thumb")
+        'shared/abc-123__thumb.webp'
+        >>> build_derivative_key("releases/u/r/cover.jpg", "preview", "jpeg")
+        'releases/u/r/cover__preview.jpg'
+    """
+    directory, _, filename = s3_key.rpartition("/")
+    stem = filename.rsplit(".", 1)[0] if "." in filename else filename
+    derivative = f"{stem}__{size}.{DERIVATIVE_FORMAT_EXTENSIONS[image_format]}"
+    return f"{directory}/{derivative}" if directory else derivative
+
+
+def build_derivative_filename(filename: str, size: str, image_format: str = "webp") -> str:
+    """
+    Build the download filename of a derivative (Content-Type is derived from it)
+
+    Examples:
+        >>> build_derivative_filename("sunset.png", "thumb")
+        'sunset__thumb.webp'
+    """
+    return build_derivative_key(filename, size, image_format)
+
+
+def calculate_derivative_dimensions(width: int, height: int, max_edge: int) -> tuple[int, int]:
+    """
+    Calculate derivative dimensions (longest edge = max_edge, aspect ratio kept)
+
+    Args:
+        width: Original width
+        height: Original height
+        max_edge: Max length of the longest edge
+
+    Returns:
+        Tuple (width, height) - original dimensions if already small enough
+
+    Examples:
+        >>> calculate_derivative_dimensions(1792, 1024, 320)
+        (320, 183)
+        >>> calculate_derivative_dimensions(200, 100, 320)
+        (200, 100)
+    """
+    longest_edge = max(width, height)
+    if longest_edge <= max_edge:
+        return width, height
+    scale = max_edge / longest_edge
+    return max(round(width * scale), 1), max(round(height * scale), 1)
@@ -1,14 +1,25 @@
 """Image Orchestrator - Coordinates image operations (no testable business logic)"""
 
+import threading
 from typing import TYPE_CHECKING, Any, Optional
 
 from business.bulk_delete_transformer import BulkDeleteTransformer, DeleteResult
+from business.image_derivative_orchestrator import image_derivative_orchestrator
 from business.image_transformer import ImageTransformer
 from business.image_validator import ImageValidator
-from config.settings import DELETE_PHYSICAL_FILES, OPENAI_MODEL, S3_IMAGES_BUCKET
+from config.settings import (
+    DELETE_PHYSICAL_FILES,
+    OPENAI_MODEL,
+    S3_IMAGES_BUCKET,
+    TEXT_OVERLAY_PREVIEW_CACHE_SIZE,
+    TEXT_OVERLAY_PREVIEW_MAX_EDGE,
+    TEXT_OVERLAY_PREVIEW_QUALITY,
+)
 from db.image_service import ImageService
+from db.pagination_helpers import InvalidCursorError
 from infrastructure.storage import get_storage
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 if TYPE_CHECKING:
@@ -21,11 +32,14 @@ class ImageGenerationError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class ImageOrchestrator:
     """Orchestrates image operations (calls services + repository)"""
 
     def __init__(self):
         self._s3_storage = None  # Lazy init to allow server startup when MinIO is down
+        self._preview_source_cache = None  # Decoded overlay preview sources (created on first preview)
+        self._preview_source_cache_lock = threading.Lock()
 
     @property
     def s3_storage(self):
@@ -34,6 +48,18 @@ class ImageOrchestrator:
             self._s3_storage = get_storage(bucket=S3_IMAGES_BUCKET)
         return self._s3_storage
 
+    @property
+    def preview_source_cache(self):
+        """Lazy-load LRU of decoded preview sources (PIL only imported when first accessed)"""
+        if self._preview_source_cache is None:
+            from infrastructure.image_file_service import DecodedImageCache
+
+            # Concurrent first previews must not each create (and fill) their own cache
+            with self._preview_source_cache_lock:
+                if self._preview_source_cache is None:
+                    self._preview_source_cache = DecodedImageCache(TEXT_OVERLAY_PREVIEW_CACHE_SIZE)
+        return self._preview_source_cache
+
     def generate_image(
         self,
         prompt: str,
@@ -155,21 +181,40 @@ class ImageOrchestrator:
         search: str = "",
         sort_by: str = "created_at",
         sort_direction: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         Get paginated list of images with search and sorting
 
         Args:
             limit: Number of images to return
-            offset: Number of images to skip
+            offset: Number of images to skip (ignored in cursor mode)
             search: Search term for filtering
             sort_by: Field to sort by
             sort_direction: Sort direction ('asc' or 'desc')
+            cursor: Keyset cursor ("" = first page); None uses offset pagination
+            include_total: Count all matches in cursor mode (extra query)
 
         Returns:
             Dict containing images and pagination info
         """
         try:
+            if cursor is not None:
+                images, next_cursor = ImageService.get_images_by_cursor(
+                    cursor=cursor, limit=limit, search=search, sort_direction=sort_direction
+                )
+                total_count = ImageService.get_total_images_count(search=search) if include_total else None
+                return {
+                    "images": [self._transform_image_to_api_format(image) for image in images],
+                    "pagination": {
+                        "total": total_count,
+                        "limit": limit,
+                        "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None,
+                    },
+                }
+
             images = ImageService.get_images_paginated(
                 limit=limit, offset=offset, search=search, sort_by=sort_by, sort_direction=sort_direction
             )
@@ -188,6 +233,8 @@ class ImageOrchestrator:
                 },
             }
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("Error retrieving images", error=str(e))
             raise ImageGenerationError(f"Failed to retrieve images: {e}") from e
@@ -260,6 +307,8 @@ class ImageOrchestrator:
                 move_success = self.s3_storage.move(image.s3_key, archive_key)
                 if move_success:
                     logger.info("S3 image archived", image_id=image_id, source=image.s3_key, archive=archive_key)
+                    # Derivatives are not archived (regenerated from the original if restored)
+                    image_derivative_orchestrator.delete_derivatives(S3_IMAGES_BUCKET, image.s3_key)
                 else:
                     logger.warning("Failed to archive S3 image", image_id=image_id, s3_key=image.s3_key)
             else:
@@ -310,7 +359,9 @@ class ImageOrchestrator:
                     # Archive S3 image: shared/{id}.png → archive/{id}.png
                     archive_key = image.s3_key.replace("shared/", "archive/", 1)
                     move_success = self.s3_storage.move(image.s3_key, archive_key)
-                    if not move_success:
+                    if move_success:
+                        image_derivative_orchestrator.delete_derivatives(S3_IMAGES_BUCKET, image.s3_key)
+                    else:
                         logger.warning(
                             "Failed to archive S3 image during bulk delete", image_id=image_id, s3_key=image.s3_key
                         )
@@ -414,11 +465,6 @@ class ImageOrchestrator:
         Raises:
             ImageGenerationError: If image not found or overlay fails
         """
-        from PIL import ImageDraw
-
-        from business.image_text_overlay_transformer import ImageTextOverlayTransformer
-        from infrastructure.image_file_service import ImageFileService
-
         try:
             # Get source image from DB
             source_image = ImageService.get_image_by_id(source_image_id)
@@ -437,114 +483,23 @@ class ImageOrchestrator:
             image_data = self.s3_storage.download(source_image.s3_key)
             img = Image.open(io.BytesIO(image_data)).convert("RGBA")
 
-            draw = ImageDraw.Draw(img)
-
-            # === BUSINESS LAYER: Calculate title parameters ===
-            title_font_size_px = ImageTextOverlayTransformer.calculate_font_size(title_font_size, img.height)
-            title_text_rgb = ImageTextOverlayTransformer.hex_to_rgb(title_color)
-            title_outline_rgb = ImageTextOverlayTransformer.hex_to_rgb(title_outline_color)
-
-            # Get font path
-            title_font_path = ImageTextOverlayTransformer.get_font_path(font_style, ImageFileService.FONTS_DIR)
-            if not title_font_path.exists():
-                logger.warning("Title font not found, using default", font_path=str(title_font_path))
-                title_font_path = None
-
-            # === INFRASTRUCTURE LAYER: Load title font ===
-            title_font = ImageFileService.load_font(title_font_path, title_font_size_px)
-
-            # === INFRASTRUCTURE LAYER: Get text dimensions ===
-            title_text = title.upper()
-            title_dims = ImageFileService.get_text_dimensions(draw, title_text, title_font)
-
-            # === BUSINESS LAYER: Calculate title position ===
-            is_custom = isinstance(title_position, dict)
-            if is_custom:
-                grid_x, grid_y = ImageTextOverlayTransformer.get_custom_coordinates(title_position)
-                title_x, title_y = ImageTextOverlayTransformer.calculate_text_position_custom(
-                    img.width, img.height, grid_x, grid_y, title_dims["bbox_left_offset"]
-                )
-                title_anchor = "lt"  # Left-top anchor for custom
-            else:
-                grid_x, grid_y = ImageTextOverlayTransformer.get_grid_coordinates(title_position)
-                title_x, title_y = ImageTextOverlayTransformer.calculate_text_position_grid(
-                    img.width, img.height, grid_x, grid_y, title_dims["width"], title_dims["height"]
-                )
-                title_anchor = None  # Default anchor for grid
-
-            # === INFRASTRUCTURE LAYER: Draw title ===
-            ImageFileService.draw_text_with_outline(
-                draw,
-                (title_x, title_y),
-                title_text,
-                title_font,
-                title_text_rgb,
-                title_outline_rgb,
-                outline_width,
-                title_anchor,
+            self._render_text_overlay(
+                img,
+                title=title,
+                artist=artist,
+                font_style=font_style,
+                title_position=title_position,
+                title_font_size=title_font_size,
+                title_color=title_color,
+                title_outline_color=title_outline_color,
+                artist_position=artist_position,
+                artist_font_size=artist_font_size,
+                artist_color=artist_color,
+                artist_outline_color=artist_outline_color,
+                artist_font_style=artist_font_style,
+                outline_width=outline_width,
             )
 
-            # === ARTIST TEXT (if provided) ===
-            if artist:
-                artist_text = f"BY {artist.upper()}"
-
-                # Business logic: Artist parameters
-                actual_artist_color = artist_color if artist_color else title_color
-                actual_artist_outline = artist_outline_color if artist_outline_color else title_outline_color
-                actual_artist_pos = artist_position if artist_position else title_position
-                actual_artist_font_style = artist_font_style if artist_font_style else font_style
-
-                artist_font_size_px = ImageTextOverlayTransformer.calculate_font_size(artist_font_size, img.height)
-                artist_text_rgb = ImageTextOverlayTransformer.hex_to_rgb(actual_artist_color)
-                artist_outline_rgb = ImageTextOverlayTransformer.hex_to_rgb(actual_artist_outline)
-
-                # Get artist font
-                artist_font_path = ImageTextOverlayTransformer.get_font_path(
-                    actual_artist_font_style, ImageFileService.FONTS_DIR
-                )
-                if not artist_font_path.exists():
-                    logger.warning("Artist font not found, using default", font_path=str(artist_font_path))
-                    artist_font_path = None
-
-                # Infrastructure: Load artist font
-                artist_font = ImageFileService.load_font(artist_font_path, artist_font_size_px)
-
-                # Infrastructure: Get artist dimensions
-                artist_dims = ImageFileService.get_text_dimensions(draw, artist_text, artist_font)
-
-                # Business: Calculate artist position
-                is_custom_artist = isinstance(actual_artist_pos, dict)
-                if is_custom_artist:
-                    grid_x_a, grid_y_a = ImageTextOverlayTransformer.get_custom_coordinates(actual_artist_pos)
-                    artist_x, artist_y = ImageTextOverlayTransformer.calculate_text_position_custom(
-                        img.width, img.height, grid_x_a, grid_y_a, artist_dims["bbox_left_offset"]
-                    )
-                    artist_anchor = "lt"
-                else:
-                    grid_x_a, grid_y_a = ImageTextOverlayTransformer.get_grid_coordinates(actual_artist_pos)
-                    artist_x, artist_y = ImageTextOverlayTransformer.calculate_text_position_grid(
-                        img.width, img.height, grid_x_a, grid_y_a, artist_dims["width"], artist_dims["height"]
-                    )
-                    artist_anchor = None
-
-                # Business: Calculate offset (if artist follows title)
-                artist_offset = ImageTextOverlayTransformer.calculate_artist_offset(
-                    title_font_size, img.height, artist_position
-                )
-                artist_y += artist_offset
-
-                # Infrastructure: Draw artist
-                ImageFileService.draw_text_with_outline(
-                    draw,
-                    (artist_x, artist_y),
-                    artist_text,
-                    artist_font,
-                    artist_text_rgb,
-                    artist_outline_rgb,
-                    outline_width,
-                    artist_anchor,
-                )
-
             # === INFRASTRUCTURE LAYER: Save image to S3 ===
             # Convert PIL Image to bytes
             img_rgb = img.convert("RGB")
@@ -560,6 +515,7 @@ class ImageOrchestrator:
             # Upload to S3
             self.s3_storage.upload(image_data, s3_key)
             logger.info("Text overlay image saved to S3", s3_key=s3_key)
+            image_derivative_orchestrator.generate_derivatives(S3_IMAGES_BUCKET, s3_key, image_data)
 
             # === REPOSITORY LAYER: Create new DB record ===
             new_image = ImageService.save_generated_image(
@@ -626,6 +582,235 @@ class ImageOrchestrator:
             )
             raise ImageGenerationError(f"Failed to add text overlay: {e}") from e
 
+    def preview_text_overlay(
+        self,
+        source_image_id: str,
+        title: str,
+        artist: str | None = None,
+        font_style: str = "bold",
+        title_position: str | dict[str, float] = "center",
+        title_font_size: float | int = 80,
+        title_color: str = "#FFFFFF",
+        title_outline_color: str = "#000000",
+        artist_position: str | dict[str, float] | None = None,
+        artist_font_size: float | int = 40,
+        artist_color: str | None = None,
+        artist_outline_color: str | None = None,
+        artist_font_style: str | None = None,
+        outline_width: int = 3,
+        max_edge: int = TEXT_OVERLAY_PREVIEW_MAX_EDGE,
+        image_format: str = "jpeg",
+    ) -> dict[str, Any]:
+        """
+        Render a low-resolution text overlay preview (nothing is stored)
+
+        The decoded, downscaled source is kept in a per-process LRU, so editor tweaks only
+        re-render text and encode a small JPEG/WebP. Pixel font sizes and outline width are
+        scaled to the preview, so it matches the full-size apply.
+
+        Args:
+            source_image_id: ID of the source image
+            (overlay parameters: see add_text_overlay_to_image)
+            max_edge: Longest preview edge in pixels
+            image_format: 'jpeg' or 'webp'
+
+        Returns:
+            {"data": bytes, "mimetype": str, "width": int, "height": int}
+
+        Raises:
+            ImageGenerationError: If image not found or rendering fails
+        """
+        from infrastructure.image_file_service import ImageFileService
+
+        source_image = ImageService.get_image_by_id(source_image_id)
+        if not source_image or not source_image.s3_key:
+            raise ImageGenerationError(f"Source image not found: {source_image_id}")
+
+        try:
+            cache_key = f"{source_image.s3_key}@{max_edge}"
+            cached = self.preview_source_cache.get(cache_key)
+            if cached is None:
+                logger.debug("Decoding preview source from S3", s3_key=source_image.s3_key, max_edge=max_edge)
+                img, original_size = ImageFileService.decode_reduced(
+                    self.s3_storage.download(source_image.s3_key), max_edge
+                )
+                self.preview_source_cache.put(cache_key, img, original_size)
+                img = img.copy()
+            else:
+                img, original_size = cached
+
+            self._render_text_overlay(
+                img,
+                title=title,
+                artist=artist,
+                font_style=font_style,
+                title_position=title_position,
+                title_font_size=title_font_size,
+                title_color=title_color,
+                title_outline_color=title_outline_color,
+                artist_position=artist_position,
+                artist_font_size=artist_font_size,
+                artist_color=artist_color,
+                artist_outline_color=artist_outline_color,
+                artist_font_style=artist_font_style,
+                outline_width=outline_width,
+                scale=img.height / original_size[1],
+            )
+
+            return {
+                "data": ImageFileService.encode_image(img, image_format, TEXT_OVERLAY_PREVIEW_QUALITY),
+                "mimetype": f"image/{image_format}",
+                "width": img.width,
+                "height": img.height,
+            }
+
+        except Exception as e:
+            logger.error(
+                "Text overlay preview failed",
+                source_image_id=source_image_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ImageGenerationError(f"Failed to render text overlay preview: {e}") from e
+
+    def _render_text_overlay(
+        self,
+        img,
+        title: str,
+        artist: str | None,
+        font_style: str,
+        title_position: str | dict[str, float],
+        title_font_size: float | int,
+        title_color: str,
+        title_outline_color: str,
+        artist_position: str | dict[str, float] | None,
+        artist_font_size: float | int,
+        artist_color: str | None,
+        artist_outline_color: str | None,
+        artist_font_style: str | None,
+        outline_width: int,
+        scale: float = 1.0,
+    ) -> None:
+        """Draw title and artist onto img (in place) - shared by apply (scale 1.0) and preview"""
+        from PIL import ImageDraw
+
+        from business.image_text_overlay_transformer import ImageTextOverlayTransformer
+        from infrastructure.image_file_service import ImageFileService
+
+        draw = ImageDraw.Draw(img)
+
+        # Preview renders on a downscaled source: pixel sizes shrink with the image
+        if scale != 1.0:
+            title_font_size = ImageTextOverlayTransformer.scale_font_size_input(title_font_size, scale)
+            artist_font_size = ImageTextOverlayTransformer.scale_font_size_input(artist_font_size, scale)
+            outline_width = ImageTextOverlayTransformer.scale_outline_width(outline_width, scale)
+
+        # === BUSINESS LAYER: Calculate title parameters ===
+        title_font_size_px = ImageTextOverlayTransformer.calculate_font_size(title_font_size, img.height)
+        title_text_rgb = ImageTextOverlayTransformer.hex_to_rgb(title_color)
+        title_outline_rgb = ImageTextOverlayTransformer.hex_to_rgb(title_outline_color)
+
+        # Get font path
+        title_font_path = ImageTextOverlayTransformer.get_font_path(font_style, ImageFileService.FONTS_DIR)
+        if not title_font_path.exists():
+            logger.warning("Title font not found, using default", font_path=str(title_font_path))
+            title_font_path = None
+
+        # === INFRASTRUCTURE LAYER: Load title font ===
+        title_font = ImageFileService.load_font(title_font_path, title_font_size_px)
+
+        # === INFRASTRUCTURE LAYER: Get text dimensions ===
+        title_text = title.upper()
+        title_dims = ImageFileService.get_text_dimensions(draw, title_text, title_font)
+
+        # === BUSINESS LAYER: Calculate title position ===
+        is_custom = isinstance(title_position, dict)
+        if is_custom:
+            grid_x, grid_y = ImageTextOverlayTransformer.get_custom_coordinates(title_position)
+            title_x, title_y = ImageTextOverlayTransformer.calculate_text_position_custom(
+                img.width, img.height, grid_x, grid_y, title_dims["bbox_left_offset"]
+            )
+            title_anchor = "lt"  # Left-top anchor for custom
+        else:
+            grid_x, grid_y = ImageTextOverlayTransformer.get_grid_coordinates(title_position)
+            title_x, title_y = ImageTextOverlayTransformer.calculate_text_position_grid(
+                img.width, img.height, grid_x, grid_y, title_dims["width"], title_dims["height"]
+            )
+            title_anchor = None  # Default anchor for grid
+
+        # === INFRASTRUCTURE LAYER: Draw title ===
+        ImageFileService.draw_text_with_outline(
+            draw,
+            (title_x, title_y),
+            title_text,
+            title_font,
+            title_text_rgb,
+            title_outline_rgb,
+            outline_width,
+            title_anchor,
+        )
+
+        # === ARTIST TEXT (if provided) ===
+        if artist:
+            artist_text = f"BY {artist.upper()}"
+
+            # Business logic: Artist parameters
+            actual_artist_color = artist_color if artist_color else title_color
+            actual_artist_outline = artist_outline_color if artist_outline_color else title_outline_color
+            actual_artist_pos = artist_position if artist_position else title_position
+            actual_artist_font_style = artist_font_style if artist_font_style else font_style
+
+            artist_font_size_px = ImageTextOverlayTransformer.calculate_font_size(artist_font_size, img.height)
+            artist_text_rgb = ImageTextOverlayTransformer.hex_to_rgb(actual_artist_color)
+            artist_outline_rgb = ImageTextOverlayTransformer.hex_to_rgb(actual_artist_outline)
+
+            # Get artist font
+            artist_font_path = ImageTextOverlayTransformer.get_font_path(
+                actual_artist_font_style, ImageFileService.FONTS_DIR
+            )
+            if not artist_font_path.exists():
+                logger.warning("Artist font not found, using default", font_path=str(artist_font_path))
+                artist_font_path = None
+
+            # Infrastructure: Load artist font
+            artist_font = ImageFileService.load_font(artist_font_path, artist_font_size_px)
+
+            # Infrastructure: Get artist dimensions
+            artist_dims = ImageFileService.get_text_dimensions(draw, artist_text, artist_font)
+
+            # Business: Calculate artist position
+            is_custom_artist = isinstance(actual_artist_pos, dict)
+            if is_custom_artist:
+                grid_x_a, grid_y_a = ImageTextOverlayTransformer.get_custom_coordinates(actual_artist_pos)
+                artist_x, artist_y = ImageTextOverlayTransformer.calculate_text_position_custom(
+                    img.width, img.height, grid_x_a, grid_y_a, artist_dims["bbox_left_offset"]
+                )
+                artist_anchor = "lt"
+            else:
+                grid_x_a, grid_y_a = ImageTextOverlayTransformer.get_grid_coordinates(actual_artist_pos)
+                artist_x, artist_y = ImageTextOverlayTransformer.calculate_text_position_grid(
+                    img.width, img.height, grid_x_a, grid_y_a, artist_dims["width"], artist_dims["height"]
+                )
+                artist_anchor = None
+
+            # Business: Calculate offset (if artist follows title)
+            artist_offset = ImageTextOverlayTransformer.calculate_artist_offset(
+                title_font_size, img.height, artist_position
+            )
+            artist_y += artist_offset
+
+            # Infrastructure: Draw artist
+            ImageFileService.draw_text_with_outline(
+                draw,
+                (artist_x, artist_y),
+                artist_text,
+                artist_font,
+                artist_text_rgb,
+                artist_outline_rgb,
+                outline_width,
+                artist_anchor,
+            )
+
     def _process_and_save_image(self, image_url: str, prompt: str) -> tuple[str, str]:
         """Download and save image to S3
 
@@ -653,6 +838,9 @@ class ImageOrchestrator:
         self.s3_storage.upload(image_data, s3_key)
 
         logger.info("Image stored in S3", s3_key=s3_key, filename=filename, bucket=S3_IMAGES_BUCKET)
+
+        # Thumbnail/preview for gallery views (served via ?size=)
+        image_derivative_orchestrator.generate_derivatives(S3_IMAGES_BUCKET, s3_key, image_data)
         return filename, s3_key
 
     def _save_image_metadata(
@@ -704,6 +892,8 @@ class ImageOrchestrator:
         backend_path = f"/api/v1/image/s3/{image.id}"
         result["url"] = backend_path
         result["display_url"] = backend_path
+        result["thumbnail_url"] = f"{backend_path}?size=thumb"
+        result["preview_url"] = f"{backend_path}?size=preview"
         logger.debug("Generated backend proxy path for image", image_id=str(image.id), s3_key=image.s3_key)
 
         return result
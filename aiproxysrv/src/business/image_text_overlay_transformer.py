@@ -55,6 +55,38 @@ class ImageTextOverlayTransformer:
             # Percentage value (legacy support)
             return int(img_height * font_size_input)
 
+    @staticmethod
+    def scale_font_size_input(font_size_input: float | int, scale: float) -> float | int:
+        """
+        Scale a font size input for rendering on a downscaled image (preview)
+
+        Args:
+            font_size_input: Either pixel value (>= 1.0) or percentage (< 1.0)
+            scale: Preview height / original height
+
+        Returns:
+            Scaled pixel value (>= 1.0), percentages unchanged (already relative)
+        """
+        if isinstance(font_size_input, int) or font_size_input >= 1.0:
+            return max(font_size_input * scale, 1.0)
+        return font_size_input
+
+    @staticmethod
+    def scale_outline_width(outline_width: int, scale: float) -> int:
+        """
+        Scale outline width for rendering on a downscaled image (preview)
+
+        Args:
+            outline_width: Outline width in pixels (original resolution)
+            scale: Preview height / original height
+
+        Returns:
+            Scaled outline width (at least 1 pixel if an outline is set)
+        """
+        if outline_width <= 0:
+            return 0
+        return max(round(outline_width * scale), 1)
+
     @staticmethod
     def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         """
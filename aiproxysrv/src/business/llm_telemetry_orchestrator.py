@@ -0,0 +1,79 @@
+"""LLM Telemetry Orchestrator - Records and aggregates per-call LLM telemetry (NOT testable, orchestration only)
+
+Chat orchestrators measure the wall time of each LLM call, build the record with
+business/llm_telemetry_transformer.py and hand it to record(). Recording never
+raises - telemetry must not break a chat response.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from business.llm_telemetry_transformer import transform_rollup_row
+from config.settings import LLM_TELEMETRY_ENABLED
+from db.database import SessionLocal
+from db.llm_telemetry_service import llm_telemetry_service
+from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+@trace_methods(KIND_ORCHESTRATOR)
+class LlmTelemetryOrchestrator:
+    """Stores LLM call telemetry and builds p50/p95 rollups"""
+
+    def record(self, provider: str, model: str, telemetry: dict[str, Any], source: str | None = None) -> None:
+        """
+        Store the telemetry of one LLM call (own session, never raises)
+
+        Args:
+            provider: 'ollama', 'openai' or 'claude'
+            model: Model name
+            telemetry: Fields built by build_<provider>_telemetry()
+            source: Calling feature (e.g. 'conversation', 'lyrics/generate')
+        """
+        if not LLM_TELEMETRY_ENABLED:
+            return
+        try:
+            db = SessionLocal()
+            try:
+                llm_telemetry_service.insert_call(db, provider, model, source, **telemetry)
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning("LLM telemetry not recorded", provider=provider, model=model, error=str(e))
+
+    def get_rollup(
+        self,
+        db: "Session",
+        days: int,
+        per_day: bool,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Aggregate the telemetry of the last days per model (and day)
+
+        Args:
+            db: Database session
+            days: Window size in days (ending now)
+            per_day: Group by UTC day in addition to provider/model
+            provider: Optional provider filter
+            model: Optional model filter
+
+        Returns:
+            Dict with window metadata and rollup rows
+        """
+        since = datetime.now(UTC) - timedelta(days=days)
+        rows = llm_telemetry_service.get_rollup(db, since, per_day=per_day, provider=provider, model=model)
+        return {
+            "since": since.isoformat(),
+            "days": days,
+            "rollups": [transform_rollup_row(row) for row in rows],
+        }
+
+
+# Singleton instance
+llm_telemetry_orchestrator = LlmTelemetryOrchestrator()
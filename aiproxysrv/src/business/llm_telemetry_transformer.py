@@ -0,0 +1,195 @@
+"""LLM Telemetry Transformer - Pure functions for per-call LLM performance telemetry
+
+IMPORTANT: This module contains ONLY pure functions (100% unit-testable).
+NO database operations, NO file system operations, NO external dependencies.
+"""
+
+from typing import Any
+
+
+NS_PER_MS = 1_000_000
+
+# Rollup window (?days=) for the telemetry endpoints
+DEFAULT_ROLLUP_DAYS = 7
+MAX_ROLLUP_DAYS = 90
+
+# Metrics reported as p50/p95 in rollups
+ROLLUP_PERCENTILE_METRICS = ("ttft_ms", "total_ms", "queue_wait_ms", "load_ms", "tokens_per_second")
+
+
+def ns_to_ms(value: Any) -> int | None:
+    """
+    Convert an Ollama duration (nanoseconds) to milliseconds
+
+    Examples:
+        >>> ns_to_ms(1_500_000_000)
+        1500
+        >>> ns_to_ms(None) is None
+        True
+    """
+    if not isinstance(value, int | float) or value < 0:
+        return None
+    return round(value / NS_PER_MS)
+
+
+def build_ollama_telemetry(response: dict[str, Any], wall_ms: float) -> dict[str, Any]:
+    """
+    Build a telemetry record from an Ollama /api/generate or /api/chat response
+
+    Ollama reports load, prompt evaluation and generation durations. The part of the
+    wall time not covered by its total_duration is queue wait (Ollama processes one
+    request per model slot) plus network. Non-streaming calls cannot observe the
+    first token, so TTFT = queue wait + load + prompt evaluation.
+
+    Args:
+        response: Ollama response JSON (eval_count, eval_duration, prompt_eval_count, ...)
+        wall_ms: Measured wall time of the API call in milliseconds
+
+    Returns:
+        Dict with LlmCallTelemetry fields (tokens and timings, NULL if not reported)
+
+    Examples:
+        >>> build_ollama_telemetry({"total_duration": 900_000_000, "load_duration": 100_000_000,
+        ...     "prompt_eval_duration": 200_000_000, "eval_duration": 600_000_000,
+        ...     "prompt_eval_count": 50, "eval_count": 120}, 1000)["ttft_ms"]
+        400
+    """
+    total_ms = round(wall_ms)
+    load_ms = ns_to_ms(response.get("load_duration"))
+    prompt_eval_ms = ns_to_ms(response.get("prompt_eval_duration"))
+    eval_ms = ns_to_ms(response.get("eval_duration"))
+    ollama_total_ms = ns_to_ms(response.get("total_duration"))
+
+    queue_wait_ms = max(total_ms - ollama_total_ms, 0) if ollama_total_ms is not None else None
+    ttft_ms = None
+    if queue_wait_ms is not None and prompt_eval_ms is not None:
+        ttft_ms = queue_wait_ms + (load_ms or 0) + prompt_eval_ms
+
+    return {
+        "prompt_tokens": response.get("prompt_eval_count"),
+        "completion_tokens": response.get("eval_count"),
+        "total_ms": total_ms,
+        "queue_wait_ms": queue_wait_ms,
+        "ttft_ms": ttft_ms,
+        "load_ms": load_ms,
+        "prompt_eval_ms": prompt_eval_ms,
+        "eval_ms": eval_ms,
+    }
+
+
+def build_openai_telemetry(response: dict[str, Any], wall_ms: float) -> dict[str, Any]:
+    """
+    Build a telemetry record from an OpenAI chat completion response
+
+    OpenAI only reports token usage - timings other than the wall time are NULL.
+
+    Examples:
+        >>> build_openai_telemetry({"usage": {"prompt_tokens": 10, "completion_tokens": 20}}, 812.4)["total_ms"]
+        812
+    """
+    usage = response.get("usage") or {}
+    return {
+        "prompt_tokens": usage.get("prompt_tokens"),
+        "completion_tokens": usage.get("completion_tokens"),
+        "total_ms": round(wall_ms),
+        "queue_wait_ms": None,
+        "ttft_ms": None,
+        "load_ms": None,
+        "prompt_eval_ms": None,
+        "eval_ms": None,
+    }
+
+
+def build_claude_telemetry(response: dict[str, Any], wall_ms: float) -> dict[str, Any]:
+    """
+    Build a telemetry record from a Claude Messages API response
+
+    Prompt tokens include cached prefix tokens (Anthropic reports them separately),
+    so prompt sizes are comparable across providers.
+
+    Examples:
+        >>> build_claude_telemetry({"usage": {"input_tokens": 10, "output_tokens": 5,
+        ...     "cache_read_input_tokens": 90}}, 1200)["prompt_tokens"]
+        100
+    """
+    usage = response.get("usage") or {}
+    input_tokens = usage.get("input_tokens")
+    prompt_tokens = None
+    if input_tokens is not None:
+        prompt_tokens = (
+            input_tokens + (usage.get("cache_creation_input_tokens") or 0) + (usage.get("cache_read_input_tokens") or 0)
+        )
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": usage.get("output_tokens"),
+        "total_ms": round(wall_ms),
+        "queue_wait_ms": None,
+        "ttft_ms": None,
+        "load_ms": None,
+        "prompt_eval_ms": None,
+        "eval_ms": None,
+    }
+
+
+def parse_rollup_days(days: str | None) -> int:
+    """
+    Parse the ?days= parameter of the telemetry rollup endpoints
+
+    Raises:
+        ValueError: If days is not an integer between 1 and MAX_ROLLUP_DAYS
+
+    Examples:
+        >>> parse_rollup_days(None)
+        7
+        >>> parse_rollup_days("30")
+        30
+    """
+    if days is None or days == "":
+        return DEFAULT_ROLLUP_DAYS
+    try:
+        value = int(days)
+    except ValueError:
+        raise ValueError(f"Invalid days '{days}' (must be an integer)") from None
+    if not 1 <= value <= MAX_ROLLUP_DAYS:
+        raise ValueError(f"Invalid days {value} (must be between 1 and {MAX_ROLLUP_DAYS})")
+    return value
+
+
+def _round_or_none(value: Any, digits: int = 1) -> float | None:
+    return round(float(value), digits) if value is not None else None
+
+
+def transform_rollup_row(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Transform one aggregated telemetry row (per model, optionally per day) for the API
+
+    Args:
+        row: Aggregate with day (optional), provider, model, calls, token sums and
+            <metric>_p50 / <metric>_p95 for every ROLLUP_PERCENTILE_METRICS entry
+
+    Returns:
+        Dict with counts, token totals and nested {"p50", "p95"} per metric
+
+    Examples:
+        >>> transform_rollup_row({"provider": "ollama", "model": "llama3", "calls": 2,
+        ...     "ttft_ms_p50": 310.25, "ttft_ms_p95": 455.0})["ttft_ms"]
+        {'p50': 310.2, 'p95': 455.0}
+    """
+    result: dict[str, Any] = {}
+    if row.get("day") is not None:
+        day = row["day"]
+        result["day"] = day.isoformat() if hasattr(day, "isoformat") else str(day)
+
+    result.update(
+        provider=row["provider"],
+        model=row["model"],
+        calls=int(row.get("calls") or 0),
+        prompt_tokens=int(row.get("prompt_tokens") or 0),
+        completion_tokens=int(row.get("completion_tokens") or 0),
+    )
+    for metric in ROLLUP_PERCENTILE_METRICS:
+        result[metric] = {
+            "p50": _round_or_none(row.get(f"{metric}_p50")),
+            "p95": _round_or_none(row.get(f"{metric}_p95")),
+        }
+    return result
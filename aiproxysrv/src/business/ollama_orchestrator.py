@@ -6,8 +6,10 @@ from adapters.ollama.api_client import OllamaAPIClient, OllamaAPIError
 from business.ollama_model_transformer import OllamaModelTransformer
 from config.settings import OLLAMA_CHAT_MODELS, OLLAMA_DEFAULT_MODEL
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class OllamaOrchestrator:
     """Orchestrator for Ollama model operations (coordinates services, NO business logic)."""
 
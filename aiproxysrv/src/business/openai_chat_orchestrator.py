@@ -1,13 +1,18 @@
 """OpenAI Chat Orchestrator - Coordinates OpenAI Chat API operations (NOT testable, orchestration only)."""
 
+import time
 from typing import Any
 
 from adapters.openai.api_client import OpenAIAPIClient
+from business.llm_telemetry_orchestrator import llm_telemetry_orchestrator
+from business.llm_telemetry_transformer import build_openai_telemetry
 from business.openai_chat_transformer import build_chat_payload, get_available_models, parse_chat_response
 from config.settings import CHAT_DEBUG_LOGGING, OPENAI_CHAT_MODELS
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class OpenAIChatOrchestrator:
     """Orchestrator for OpenAI Chat API integration (coordinates services, NO business logic)."""
 
@@ -15,7 +20,12 @@ class OpenAIChatOrchestrator:
         self.api_client = OpenAIAPIClient()
 
     def send_chat_message(
-        self, model: str, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int | None = None
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        source: str = "conversation",
     ) -> tuple[str, int, int]:
         """
         Send chat message to OpenAI API (orchestrates transformer + API client).
@@ -25,6 +35,7 @@ class OpenAIChatOrchestrator:
             messages: List of messages with role and content
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum tokens to generate (optional)
+            source: Calling feature recorded in the LLM telemetry
 
         Returns:
             Tuple of (assistant_content, prompt_tokens, completion_tokens)
@@ -36,7 +47,11 @@ class OpenAIChatOrchestrator:
         payload = build_chat_payload(model, messages, temperature, max_tokens)
 
         # Call API client
+        started = time.perf_counter()
         resp_json = self.api_client.chat_completion(payload)
+        llm_telemetry_orchestrator.record(
+            "openai", model, build_openai_telemetry(resp_json, (time.perf_counter() - started) * 1000), source=source
+        )
 
         # Parse response using transformer
         content, prompt_tokens, completion_tokens = parse_chat_response(resp_json)
@@ -14,6 +14,7 @@ from business.prompt_template_validator import (
 )
 from db.prompt_template_service import PromptTemplateService
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 class PromptTemplateOrchestratorError(Exception):
@@ -22,6 +23,7 @@ class PromptTemplateOrchestratorError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class PromptTemplateOrchestrator:
     """
     Orchestrates prompt template operations (calls validator + processor + repository)
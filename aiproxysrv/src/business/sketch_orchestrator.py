@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from business.sketch_normalizer import SketchNormalizer
 from db.sketch_service import sketch_service
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 class SketchOrchestratorError(Exception):
@@ -16,6 +17,7 @@ class SketchOrchestratorError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class SketchOrchestrator:
     """Orchestrates sketch operations (calls normalizer + repository)"""
 
@@ -0,0 +1,104 @@
+"""Song Migration Worker - Background Mureka CDN -> S3 migration of song choices
+
+Transfers run in a bounded thread pool per process (SONG_MIGRATION_CONCURRENCY), each
+transfer streams CDN -> S3 multipart with one part in memory. A DB lease on the choice
+keeps other processes (gunicorn workers, scripts/migrate_song_choices.py) from
+transferring the same choice; failures are retried with exponential backoff.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+from config.settings import SONG_MIGRATION_CONCURRENCY, SONG_MIGRATION_FILE_TYPES, SONG_MIGRATION_MAX_ATTEMPTS
+from db.database import SessionLocal
+from db.song_service import get_choice_ids_pending_migration
+from utils.logger import logger
+
+
+class SongMigrationWorker:
+    """Bounded background pool for choice migrations (deduplicated per process)"""
+
+    def __init__(self, max_workers: int = SONG_MIGRATION_CONCURRENCY):
+        self.max_workers = max(max_workers, 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created on first use - threads are never inherited across gunicorn forks
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="song-migration")
+        return self._executor
+
+    def submit(self, choice_id: str, file_types: list[str] | None = None) -> Future | None:
+        """
+        Schedule the migration of a choice (returns immediately)
+
+        Args:
+            choice_id: UUID of the song choice
+            file_types: File types to migrate (default: SONG_MIGRATION_FILE_TYPES)
+
+        Returns:
+            Future of the migration result, None if the choice is already scheduled
+        """
+        with self._lock:
+            if choice_id in self._in_flight:
+                return None
+            self._in_flight.add(choice_id)
+            executor = self._get_executor()
+
+        return executor.submit(self._run, choice_id, file_types)
+
+    def _run(self, choice_id: str, file_types: list[str] | None) -> dict[str, Any] | None:
+        from business.song_orchestrator import song_orchestrator
+
+        db = SessionLocal()
+        try:
+            return song_orchestrator.migrate_choice(db, choice_id, file_types)
+        except Exception as e:
+            logger.error(
+                "Song choice migration crashed", choice_id=choice_id, error=str(e), error_type=type(e).__name__
+            )
+            return None
+        finally:
+            db.close()
+            with self._lock:
+                self._in_flight.discard(choice_id)
+
+    def migrate_pending(self, limit: int = 100) -> dict[str, int]:
+        """
+        Migrate one batch of pending choices of successful songs (blocks until done)
+
+        Args:
+            limit: Max choices of this batch (newest songs first)
+
+        Returns:
+            Dict with choices, migrated, failed and skipped counts
+        """
+        db = SessionLocal()
+        try:
+            choice_ids = get_choice_ids_pending_migration(
+                db, SONG_MIGRATION_FILE_TYPES, SONG_MIGRATION_MAX_ATTEMPTS, datetime.now(UTC), limit
+            )
+        finally:
+            db.close()
+
+        futures = [self.submit(str(choice_id)) for choice_id in choice_ids]
+
+        stats = {"choices": len(choice_ids), "migrated": 0, "failed": 0, "skipped": 0}
+        for future in futures:
+            result = future.result() if future else None
+            if result is None:
+                stats["skipped"] += 1
+            elif result["failed"]:
+                stats["failed"] += 1
+            else:
+                stats["migrated"] += 1
+
+        logger.info("Song choice migration batch finished", **stats)
+        return stats
+
+
+song_migration_worker = SongMigrationWorker()
@@ -1,16 +1,45 @@
 """Song Orchestrator - Coordinates song operations (no testable business logic)"""
 
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import requests
 
 from business.bulk_delete_transformer import BulkDeleteTransformer, DeleteResult
-from business.song_transformer import SongTransformer, generate_s3_song_key
+from business.song_transformer import (
+    SongTransformer,
+    calculate_migration_retry_at,
+    generate_s3_song_key,
+    get_pending_migration_types,
+    is_migration_due,
+)
 from business.song_validator import SongValidator
-from config.settings import S3_SONGS_BUCKET
-from db.song_service import get_choice_by_id_with_song, song_service, update_choice_s3_key
+from config.settings import (
+    S3_SONGS_BUCKET,
+    SONG_MIGRATION_ENABLED,
+    SONG_MIGRATION_FILE_TYPES,
+    SONG_MIGRATION_MAX_ATTEMPTS,
+    SONG_MIGRATION_RETRY_BACKOFF_SECONDS,
+)
+from db.pagination_helpers import InvalidCursorError
+from db.song_service import (
+    claim_choice_for_migration,
+    get_choice_by_id_with_song,
+    record_choice_migration_result,
+    song_service,
+    update_choice_s3_key,
+)
 from infrastructure.storage import get_storage
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
+
+
+# CDN read size and S3 part size of streamed transfers (memory per running transfer)
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+TRANSFER_PART_SIZE = 8 * 1024 * 1024
+# Lease of a running choice migration (other processes skip the choice meanwhile)
+MIGRATION_LEASE_SECONDS = 30 * 60
 
 
 class SongOrchestratorError(Exception):
@@ -25,6 +54,7 @@ class SongS3MigrationError(SongOrchestratorError):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class SongOrchestrator:
     """Orchestrates song operations (calls transformers + repository)"""
 
@@ -48,23 +78,51 @@ class SongOrchestrator:
         sort_by: str = "created_at",
         sort_direction: str = "desc",
         workflow: str = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         Get paginated list of songs with search and filtering
 
         Args:
             limit: Number of songs to return
-            offset: Number of songs to skip
+            offset: Number of songs to skip (ignored in cursor mode)
             status: Optional status filter
             search: Search term for filtering
             sort_by: Field to sort by
             sort_direction: Sort direction
             workflow: Optional workflow filter
+            cursor: Keyset cursor ("" = first page); None uses offset pagination
+            include_total: Count all matches in cursor mode (extra query)
 
         Returns:
             Dict containing songs and pagination info
         """
         try:
+            if cursor is not None:
+                songs, next_cursor = song_service.get_songs_by_cursor(
+                    cursor=cursor,
+                    limit=limit,
+                    status=status,
+                    search=search,
+                    sort_direction=sort_direction,
+                    workflow=workflow,
+                )
+                total_count = (
+                    song_service.get_total_songs_count(status=status, search=search, workflow=workflow)
+                    if include_total
+                    else None
+                )
+                return {
+                    "songs": [SongTransformer.transform_song_to_list_format(song) for song in songs],
+                    "pagination": {
+                        "total": total_count,
+                        "limit": limit,
+                        "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None,
+                    },
+                }
+
             songs = song_service.get_songs_paginated(
                 limit=limit,
                 offset=offset,
@@ -89,6 +147,8 @@ class SongOrchestrator:
                 },
             }
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving songs: {e}")
             raise SongOrchestratorError(f"Failed to retrieve songs: {e}") from e
@@ -348,21 +408,21 @@ class SongOrchestrator:
 
     def migrate_choice_to_s3(self, db, choice_id: str, file_type: str) -> str:
         """
-        Lazy migration: Download file from Mureka URL to S3 if not already migrated
+        Migrate one file of a choice from the Mureka CDN to S3 if not already migrated
 
-        This is the core lazy migration logic - checks if s3_key exists,
-        if not downloads from mureka_url and uploads to S3.
+        Checks if s3_key exists, if not streams the file from mureka_url into S3
+        (multipart, only one part in memory - stems ZIPs are never fully buffered).
 
         Args:
             db: Database session
             choice_id: UUID of the song choice
-            file_type: File type to migrate ('mp3', 'flac', 'stems')
+            file_type: File type to migrate ('mp3', 'flac', 'wav', 'stems')
 
         Returns:
             S3 key of the migrated file
 
         Raises:
-            SongS3MigrationError: If migration fails (choice not found, no URL, download fails, etc.)
+            SongS3MigrationError: If migration fails (choice not found, no URL, transfer fails, etc.)
         """
         # 1. Load choice with song relationship from DB
         choice = get_choice_by_id_with_song(db, choice_id)
@@ -385,29 +445,21 @@ class SongOrchestrator:
         if not mureka_url:
             raise SongS3MigrationError(f"No Mureka URL found for choice {choice_id}, file_type={file_type}")
 
-        # 4. Download file from Mureka CDN
-        logger.info("Downloading from Mureka", choice_id=choice_id, file_type=file_type, url_preview=mureka_url[:80])
-        try:
-            file_data = self._download_from_url(mureka_url)
-        except Exception as e:
-            raise SongS3MigrationError(f"Failed to download from Mureka: {str(e)}") from e
-
-        # 5. Generate S3 key (readable format with title + song_id)
+        # 4. Generate S3 key (readable format with title + song_id)
         song_title = choice.song.title if choice.song else None
         song_id = str(choice.song.id) if choice.song else str(choice.song_id)
         choice_index = choice.choice_index if choice.choice_index is not None else 0
 
         s3_key = generate_s3_song_key(song_id, song_title, choice_index, file_type)
 
-        # 6. Upload to S3
-        logger.info("Uploading to S3", choice_id=choice_id, file_type=file_type, s3_key=s3_key)
+        # 5. Stream Mureka CDN -> S3
+        logger.info("Transferring from Mureka to S3", choice_id=choice_id, file_type=file_type, s3_key=s3_key)
         try:
-            content_type = self._get_content_type(file_type)
-            self.s3_storage.upload(file_data, s3_key, content_type=content_type)
+            file_size = self._transfer_url_to_s3(mureka_url, s3_key, self._get_content_type(file_type))
         except Exception as e:
-            raise SongS3MigrationError(f"Failed to upload to S3: {str(e)}") from e
+            raise SongS3MigrationError(f"Failed to transfer from Mureka to S3: {str(e)}") from e
 
-        # 7. Update DB with new s3_key
+        # 6. Update DB with new s3_key
         success = update_choice_s3_key(db, choice_id, file_type, s3_key)
         if not success:
             logger.warning("Failed to update DB with s3_key, but file uploaded", choice_id=choice_id, s3_key=s3_key)
@@ -417,10 +469,128 @@ class SongOrchestrator:
             choice_id=choice_id,
             file_type=file_type,
             s3_key=s3_key,
-            file_size=len(file_data),
+            file_size=file_size,
         )
         return s3_key
 
+    def migrate_choice(self, db, choice_id: str, file_types: list[str] | None = None) -> dict[str, Any] | None:
+        """
+        Migrate all pending files of a choice (background worker entry point)
+
+        Claims a DB lease first, so a choice is transferred by one process at a time.
+        Failures count as attempt and are retried with exponential backoff until
+        SONG_MIGRATION_MAX_ATTEMPTS is reached.
+
+        Args:
+            db: Database session
+            choice_id: UUID of the song choice
+            file_types: File types to migrate (default: SONG_MIGRATION_FILE_TYPES)
+
+        Returns:
+            Dict with migrated (file types) and failed (file type -> error),
+            None if the choice is leased by another process, in backoff or given up
+        """
+        now = datetime.now(UTC)
+        lease_until = now + timedelta(seconds=MIGRATION_LEASE_SECONDS)
+        if not claim_choice_for_migration(db, choice_id, now, lease_until, SONG_MIGRATION_MAX_ATTEMPTS):
+            logger.debug("Choice migration skipped (running elsewhere, in backoff or given up)", choice_id=choice_id)
+            return None
+
+        choice = get_choice_by_id_with_song(db, choice_id)
+        pending = get_pending_migration_types(choice, file_types or SONG_MIGRATION_FILE_TYPES) if choice else []
+
+        migrated = []
+        failed = {}
+        for file_type in pending:
+            try:
+                self.migrate_choice_to_s3(db, choice_id, file_type)
+                migrated.append(file_type)
+            except SongS3MigrationError as e:
+                logger.warning("Choice file migration failed", choice_id=choice_id, file_type=file_type, error=str(e))
+                failed[file_type] = str(e)
+
+        if failed:
+            attempts = (choice.s3_migration_attempts or 0) + 1
+            retry_at = calculate_migration_retry_at(datetime.now(UTC), attempts, SONG_MIGRATION_RETRY_BACKOFF_SECONDS)
+            error = "; ".join(f"{file_type}: {message}" for file_type, message in failed.items())
+            record_choice_migration_result(db, choice_id, error[:2000], retry_at)
+        else:
+            record_choice_migration_result(db, choice_id, None)
+
+        return {"migrated": migrated, "failed": failed}
+
+    def get_choice_playback_source(self, db, choice_id: str, file_type: str) -> dict[str, str]:
+        """
+        Resolve where a choice file is served from - never waits on a migration
+
+        Migrated files are served from S3. Otherwise the Mureka URL is returned for
+        a streamed pass-through and the migration runs in the background - unless the
+        choice is in backoff or has used up its attempts (same rules as the worker).
+
+        Args:
+            db: Database session
+            choice_id: UUID of the song choice
+            file_type: File type ('mp3', 'flac', 'wav', 'stems')
+
+        Returns:
+            {'s3_key': str} or {'url': str, 'content_type': str}
+
+        Raises:
+            SongS3MigrationError: If the choice does not exist or has no file of this type
+        """
+        choice = get_choice_by_id_with_song(db, choice_id)
+        if not choice:
+            raise SongS3MigrationError(f"Choice not found: {choice_id}")
+
+        s3_key = self._get_existing_s3_key(choice, file_type)
+        if s3_key:
+            return {"s3_key": s3_key}
+
+        mureka_url = self._get_mureka_url(choice, file_type)
+        if not mureka_url:
+            raise SongS3MigrationError(f"No Mureka URL found for choice {choice_id}, file_type={file_type}")
+
+        if SONG_MIGRATION_ENABLED and is_migration_due(
+            choice.s3_migration_attempts or 0,
+            choice.s3_migration_next_attempt_at,
+            SONG_MIGRATION_MAX_ATTEMPTS,
+            datetime.now(UTC),
+        ):
+            from business.song_migration_worker import song_migration_worker
+
+            song_migration_worker.submit(choice_id, sorted({*SONG_MIGRATION_FILE_TYPES, file_type}))
+
+        return {"url": mureka_url, "content_type": self._get_content_type(file_type)}
+
+    def open_url_stream(self, url: str, timeout: int = 300) -> tuple[Iterator[bytes], int | None]:
+        """
+        Open a streamed pass-through of a Mureka CDN file (bounded memory)
+
+        Args:
+            url: Mureka CDN URL
+            timeout: Read timeout in seconds (max. silence between chunks)
+
+        Returns:
+            Tuple (chunk iterator, content length or None)
+
+        Raises:
+            SongS3MigrationError: If the CDN request fails
+        """
+        try:
+            response = requests.get(url, timeout=(10, timeout), stream=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise SongS3MigrationError(f"Failed to stream from Mureka: {str(e)}") from e
+
+        def generate() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size=TRANSFER_CHUNK_SIZE)
+            finally:
+                response.close()
+
+        content_length = response.headers.get("Content-Length")
+        return generate(), int(content_length) if content_length and content_length.isdigit() else None
+
     def _get_existing_s3_key(self, choice, file_type: str) -> str | None:
         """Get existing S3 key if already migrated"""
         s3_key_map = {
@@ -441,23 +611,30 @@ class SongOrchestrator:
         }
         return url_map.get(file_type)
 
-    def _download_from_url(self, url: str, timeout: int = 300) -> bytes:
+    def _transfer_url_to_s3(self, url: str, s3_key: str, content_type: str, timeout: int = 300) -> int:
         """
-        Download file from URL (Mureka CDN)
+        Stream a file from URL (Mureka CDN) into S3
 
         Args:
             url: URL to download from
-            timeout: Request timeout in seconds (default 300s = 5min for large files)
+            s3_key: Target S3 key
+            content_type: MIME type of the object
+            timeout: Read timeout in seconds (max. silence between chunks)
 
         Returns:
-            File content as bytes
+            Number of bytes transferred
 
         Raises:
             requests.RequestException: If download fails
         """
-        response = requests.get(url, timeout=timeout, stream=True)
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx, 5xx)
-        return response.content
+        with requests.get(url, timeout=(10, timeout), stream=True) as response:
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx, 5xx)
+            return self.s3_storage.upload_stream(
+                response.iter_content(chunk_size=TRANSFER_CHUNK_SIZE),
+                s3_key,
+                content_type=content_type,
+                part_size=TRANSFER_PART_SIZE,
+            )
 
     def _get_content_type(self, file_type: str) -> str:
         """Get MIME type for file type"""
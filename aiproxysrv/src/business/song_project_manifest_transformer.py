@@ -0,0 +1,204 @@
+"""Song Project Manifest Transformer - Merkle tree hashing for incremental Mirror sync
+
+IMPORTANT: This module contains ONLY pure functions (100% unit-testable).
+NO database operations, NO file system operations, NO external dependencies.
+
+Every project folder has a tree of directory nodes (path relative to the folder,
+"" = folder root). A file contributes a leaf value SHA256("<path>\\n<file_hash>");
+a directory node hash is the sum of all leaf values below it modulo 2**256.
+
+Because the combination is additive, a node hash always equals the sum of its
+direct file leaves and its child directory hashes (Merkle property), and one
+upload/move/delete only changes the nodes on the path to the root - siblings
+never have to be read. The CLI (scripts/cli/aiproxy-cli.py) computes the same
+hashes for the local directory and only descends into subtrees that differ.
+
+The orchestrator calculates node changes here and passes them to the DB service,
+which writes them in the transaction of the file change.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+
+MANIFEST_HASH_MODULUS = 2**256
+EMPTY_MANIFEST_HASH = "0" * 64
+
+# (folder-relative path, file_hash) of a single file
+ManifestEntry = tuple[str, str | None]
+
+
+def to_folder_relative_path(relative_path: str, folder_name: str) -> str:
+    """
+    Strip the folder name from a stored relative_path (same rule as Mirror compare)
+
+    Examples:
+        >>> to_folder_relative_path("01 Arrangement/Bounces/mix.wav", "01 Arrangement")
+        'Bounces/mix.wav'
+        >>> to_folder_relative_path("/Bounces/mix.wav", "01 Arrangement")
+        'Bounces/mix.wav'
+    """
+    if relative_path.startswith(f"{folder_name}/"):
+        relative_path = relative_path[len(folder_name) + 1 :]
+    return relative_path.lstrip("/")
+
+
+def get_parent_path(path: str) -> str | None:
+    """
+    Parent directory of a manifest path (None for the folder root)
+
+    Examples:
+        >>> get_parent_path("Samples/Drums")
+        'Samples'
+        >>> get_parent_path("Samples")
+        ''
+        >>> get_parent_path("") is None
+        True
+    """
+    if not path:
+        return None
+    return path.rpartition("/")[0]
+
+
+def get_manifest_ancestors(file_path: str) -> list[str]:
+    """
+    Directory nodes containing a file, from the folder root down
+
+    Examples:
+        >>> get_manifest_ancestors("Samples/Drums/kick.wav")
+        ['', 'Samples', 'Samples/Drums']
+        >>> get_manifest_ancestors("mix.wav")
+        ['']
+    """
+    parts = file_path.split("/")[:-1]
+    return [""] + ["/".join(parts[: index + 1]) for index in range(len(parts))]
+
+
+def manifest_leaf_value(file_path: str, file_hash: str | None) -> int:
+    """Leaf value of one file (path is folder-relative, missing hash counts as empty)"""
+    digest = hashlib.sha256(f"{file_path}\n{file_hash or ''}".encode()).hexdigest()
+    return int(digest, 16)
+
+
+def combine_manifest_hash(node_hash: str, delta: int) -> str:
+    """
+    Add a (possibly negative) leaf delta to a node hash
+
+    Examples:
+        >>> combine_manifest_hash(EMPTY_MANIFEST_HASH, 255)[-4:]
+        '00ff'
+        >>> combine_manifest_hash(combine_manifest_hash(EMPTY_MANIFEST_HASH, 255), -255) == EMPTY_MANIFEST_HASH
+        True
+    """
+    return format((int(node_hash, 16) + delta) % MANIFEST_HASH_MODULUS, "064x")
+
+
+def calculate_manifest_deltas(
+    removed: ManifestEntry | None = None, added: ManifestEntry | None = None
+) -> dict[str, tuple[int, int]]:
+    """
+    Node changes caused by removing and/or adding one file
+
+    Upload = added only, delete = removed only, content update = same path in both,
+    move = different paths in both.
+
+    Args:
+        removed: (folder-relative path, file_hash) before the change
+        added: (folder-relative path, file_hash) after the change
+
+    Returns:
+        Directory path -> (hash delta, file_count delta); nodes whose hash and count
+        do not change are omitted
+    """
+    deltas: dict[str, list[int]] = {}
+    for entry, sign in ((removed, -1), (added, 1)):
+        if entry is None:
+            continue
+        leaf = manifest_leaf_value(*entry)
+        for path in get_manifest_ancestors(entry[0]):
+            delta = deltas.setdefault(path, [0, 0])
+            delta[0] += sign * leaf
+            delta[1] += sign
+
+    return {
+        path: (hash_delta, count_delta)
+        for path, (hash_delta, count_delta) in deltas.items()
+        if hash_delta % MANIFEST_HASH_MODULUS or count_delta
+    }
+
+
+def build_manifest_nodes(entries: Iterable[ManifestEntry]) -> dict[str, dict[str, Any]]:
+    """
+    Build all directory nodes of a folder from its files (full rebuild)
+
+    Args:
+        entries: (folder-relative path, file_hash) of every file in the folder
+
+    Returns:
+        Directory path -> {"node_hash", "file_count", "parent_path"}; always contains the root ""
+    """
+    sums: dict[str, int] = {"": 0}
+    counts: dict[str, int] = {"": 0}
+    for file_path, file_hash in entries:
+        leaf = manifest_leaf_value(file_path, file_hash)
+        for path in get_manifest_ancestors(file_path):
+            sums[path] = sums.get(path, 0) + leaf
+            counts[path] = counts.get(path, 0) + 1
+
+    return {
+        path: {
+            "node_hash": combine_manifest_hash(EMPTY_MANIFEST_HASH, total),
+            "file_count": counts[path],
+            "parent_path": get_parent_path(path),
+        }
+        for path, total in sums.items()
+    }
+
+
+def apply_manifest_deltas(
+    nodes: dict[str, tuple[str, int]], deltas: dict[str, tuple[int, int]]
+) -> dict[str, dict[str, Any] | None]:
+    """
+    New state of the directory nodes touched by a file change
+
+    Folders whose manifest has not been built yet (no root node) are left alone -
+    the first manifest request builds it from scratch.
+
+    Args:
+        nodes: Directory path -> (node_hash, file_count) of the stored nodes on the changed paths
+        deltas: Node changes from calculate_manifest_deltas
+
+    Returns:
+        Directory path -> {"node_hash", "file_count", "parent_path"}, None = delete the node
+        (directory without files; the root is always kept)
+
+    Examples:
+        >>> apply_manifest_deltas({}, {"": (1, 1)})
+        {}
+        >>> apply_manifest_deltas({"": (EMPTY_MANIFEST_HASH, 0)}, {"": (255, 1), "a": (255, 1)})["a"]["file_count"]
+        1
+    """
+    if "" not in nodes:
+        return {}
+
+    changes: dict[str, dict[str, Any] | None] = {}
+    for path, (hash_delta, count_delta) in deltas.items():
+        if path in nodes:
+            node_hash, file_count = nodes[path]
+        elif count_delta <= 0:
+            # Node for a removed file does not exist: tree is out of sync, nothing to subtract from
+            continue
+        else:
+            node_hash, file_count = EMPTY_MANIFEST_HASH, 0
+
+        file_count += count_delta
+        if path and file_count <= 0:
+            changes[path] = None
+            continue
+        changes[path] = {
+            "node_hash": combine_manifest_hash(node_hash, hash_delta),
+            "file_count": file_count,
+            "parent_path": get_parent_path(path),
+        }
+    return changes
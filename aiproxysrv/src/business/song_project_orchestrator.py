@@ -8,36 +8,83 @@ This orchestrator is NOT unit-tested (orchestration only).
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
-from uuid import UUID
-
-from config.settings import S3_SONG_PROJECTS_BUCKET
+from uuid import UUID, uuid4
+
+from config.settings import (
+    S3_SONG_PROJECTS_BUCKET,
+    SONG_PROJECT_BLOB_GC_GRACE_HOURS,
+    SONG_PROJECT_DEDUP_ENABLED,
+    SONG_PROJECT_UPLOAD_CHUNK_SIZE_MB,
+    SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS,
+)
 from infrastructure.storage import get_storage
 
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+from business.song_project_manifest_transformer import (
+    ManifestEntry,
+    apply_manifest_deltas,
+    build_manifest_nodes,
+    calculate_manifest_deltas,
+    to_folder_relative_path,
+)
 from business.song_project_transformer import (
+    ARCHIVE_READ_CHUNK_SIZE,
+    build_archive_entries,
+    build_archive_filename,
+    build_blob_s3_key,
+    build_folder_path_prefix,
+    build_upload_paths,
+    build_upload_staging_key,
+    calculate_cursor_pagination_meta,
     calculate_file_hash,
     calculate_pagination_meta,
+    calculate_stream_hash,
+    calculate_upload_chunk_size,
+    calculate_upload_part_count,
+    compute_mirror_diff,
     detect_file_type,
+    find_missing_upload_parts,
     generate_s3_prefix,
     get_default_folder_structure,
     get_display_cover_info,
+    get_expected_part_size,
     get_mime_type,
+    is_content_addressed,
     normalize_project_name,
+    partition_claimable_files,
+    transform_file_to_listing_item,
+    transform_file_to_response,
     transform_image_to_assigned_response,
+    transform_manifest_node_to_response,
     transform_project_detail_to_response,
     transform_project_to_response,
     transform_release_to_assigned_response,
     transform_sketch_to_assigned_response,
     transform_song_to_assigned_response,
+    transform_upload_session_to_response,
 )
+from db.pagination_helpers import InvalidCursorError
 from db.song_project_service import song_project_service
 from utils.logger import logger
+from utils.tracing import KIND_HASH, KIND_ORCHESTRATOR, span, trace_methods
+from utils.zip_stream import ZipStreamEntry, stream_zip
+
 
+class UploadSessionError(Exception):
+    """Upload session request that cannot be served (status_code = HTTP status for the client)"""
 
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@trace_methods(KIND_ORCHESTRATOR)
 class SongProjectOrchestrator:
     """Orchestrator for song project operations (coordinates services, NO business logic)"""
 
@@ -53,6 +100,83 @@ class SongProjectOrchestrator:
             self._storage = get_storage(bucket=S3_SONG_PROJECTS_BUCKET)
         return self._storage
 
+    def _store_blob(
+        self,
+        db: Session,
+        file_hash: str,
+        file_size_bytes: int,
+        mime_type: str | None,
+        put_object: Callable[[str], Any],
+    ) -> str | None:
+        """Store content once per hash (put_object(key) only runs if the blob is new), returns the blob key"""
+        blob = self.db_service.get_blobs_by_hash(db, [file_hash]).get(file_hash)
+        if blob:
+            logger.debug("Blob exists, upload skipped", file_hash=file_hash, size_bytes=file_size_bytes)
+            return blob.s3_key
+
+        s3_key = build_blob_s3_key(file_hash)
+        try:
+            put_object(s3_key)
+        except Exception as e:
+            logger.error("S3 blob store failed", s3_key=s3_key, error=str(e))
+            return None
+
+        if not self.db_service.register_blob(db, file_hash, s3_key, file_size_bytes, mime_type):
+            return None
+        return s3_key
+
+    def _delete_file_object(self, file: Any) -> None:
+        """Delete the S3 object of a file (shared blobs are left to blob GC)"""
+        if file.s3_key and not is_content_addressed(file):
+            self.storage.delete(file.s3_key)
+
+    def _lock_manifest_changes(
+        self,
+        db: Session,
+        folder_id: UUID | None,
+        removed: ManifestEntry | None = None,
+        added: ManifestEntry | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Lock the folder and calculate the manifest node changes of one file change
+
+        removed/added are (stored relative_path, file_hash). The folder row stays locked
+        until the file change (create/update/move/delete_file with manifest_changes)
+        commits, so concurrent changes in the same folder cannot lose node updates.
+
+        Returns:
+            Node changes for the DB service, empty if nothing changes or the folder has
+            no manifest yet
+        """
+        if folder_id is None:
+            return {}
+        folder = self.db_service.lock_folder(db, folder_id)
+        if folder is None:
+            return {}
+
+        deltas = calculate_manifest_deltas(
+            (to_folder_relative_path(removed[0], folder.folder_name), removed[1]) if removed else None,
+            (to_folder_relative_path(added[0], folder.folder_name), added[1]) if added else None,
+        )
+        if not deltas:
+            return {}
+
+        nodes = self.db_service.get_manifest_nodes(db, folder_id, [*deltas, ""])
+        return apply_manifest_deltas({node.path: (node.node_hash, node.file_count) for node in nodes}, deltas)
+
+    def _rebuild_folder_manifest(self, db: Session, folder_id: UUID) -> bool:
+        """Rebuild all manifest nodes of a folder from its files (folder locked while reading)"""
+        folder = self.db_service.lock_folder(db, folder_id)
+        if folder is None:
+            return False
+
+        files = self.db_service.get_files_by_folder(db, folder_id, compact=True)
+        nodes = build_manifest_nodes(
+            (to_folder_relative_path(file.relative_path, folder.folder_name), file.file_hash) for file in files
+        )
+        logger.info("Rebuilding folder manifest", folder_id=str(folder_id), files=len(files), nodes=len(nodes))
+        return self.db_service.replace_folder_manifest(db, folder_id, nodes)
+
     def create_project_with_structure(
         self,
         db: Session,
@@ -308,7 +432,9 @@ class SongProjectOrchestrator:
             response_data["all_assigned_sketches"] = []
             response_data["all_assigned_images"] = []
 
-    def get_project_with_details(self, db: Session, project_id: UUID, user_id: UUID) -> dict[str, Any] | None:
+    def get_project_with_details(
+        self, db: Session, project_id: UUID, user_id: UUID, include_files: bool = True
+    ) -> dict[str, Any] | None:
         """
         Get project with all folders, files, and assigned assets
 
@@ -316,13 +442,18 @@ class SongProjectOrchestrator:
             db: Database session
             project_id: Project UUID
             user_id: User ID (for ownership check)
+            include_files: False = lightweight mode (folders with file statistics, no file lists;
+                files are loaded per folder on demand)
 
         Returns:
             Project data with folders, files, and assigned assets, or None if not found/unauthorized
         """
         try:
-            # Get project with details from DB
-            project = self.db_service.get_project_with_details(db, project_id)
+            # Get project with details from DB (lightweight mode skips all file rows)
+            if include_files:
+                project = self.db_service.get_project_with_details(db, project_id)
+            else:
+                project = self.db_service.get_project_with_folders(db, project_id)
 
             if not project:
                 logger.debug("Project not found", project_id=str(project_id))
@@ -333,8 +464,8 @@ class SongProjectOrchestrator:
                 logger.warning("Unauthorized project access", project_id=str(project_id), user_id=str(user_id))
                 return None
 
-            # Transform to response (includes folders and files)
-            response = transform_project_detail_to_response(project)
+            # Transform to response (folders with statistics, files only if requested)
+            response = transform_project_detail_to_response(project, include_files=include_files)
 
             # Load assigned assets for all folders (coordination)
             self._load_assigned_assets_for_folders(db, project_id, response["folders"])
@@ -367,6 +498,8 @@ class SongProjectOrchestrator:
         search: str = "",
         tags: str | None = None,
         project_status: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         List projects for user (paginated)
@@ -375,10 +508,12 @@ class SongProjectOrchestrator:
             db: Database session
             user_id: User ID (from JWT)
             limit: Items per page
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored in cursor mode)
             search: Search term
             tags: Comma-separated tags
             project_status: Status filter ('new', 'progress', 'archived', or None for all non-archived)
+            cursor: Keyset cursor ("" = first page); None uses offset pagination
+            include_total: Count all matches in cursor mode (extra query)
 
         Returns:
             Dictionary with projects and pagination meta
@@ -393,28 +528,35 @@ class SongProjectOrchestrator:
                 search=search,
                 tags=tags,
                 project_status=project_status,
+                cursor=cursor,
+                include_total=include_total,
             )
 
             # Transform projects to response
             projects_data = [transform_project_to_response(p) for p in result["items"]]
 
             # Add cover_info for each project (based on assigned releases)
-            for project_data in projects_data:
-                project_id = UUID(project_data["id"])
-                # Load assigned releases
-                releases = self.db_service.get_assigned_releases_for_project(db, project_id)
+            # Releases for the whole page are loaded in one query (no per-project round trip)
+            releases_by_project = self.db_service.get_assigned_releases_for_projects(
+                db, [p.id for p in result["items"]]
+            )
+            for project, project_data in zip(result["items"], projects_data, strict=True):
                 # Determine cover display logic (business logic in transformer)
-                cover_info = get_display_cover_info(releases)
-                project_data["cover_info"] = cover_info
+                project_data["cover_info"] = get_display_cover_info(releases_by_project.get(project.id, []))
 
             # Calculate pagination metadata (business logic in transformer)
-            pagination = calculate_pagination_meta(result["total"], limit, offset)
+            if cursor is not None:
+                pagination = calculate_cursor_pagination_meta(result["total"], limit, result["next_cursor"])
+            else:
+                pagination = calculate_pagination_meta(result["total"], limit, offset)
 
             return {
                 "projects": projects_data,
                 "pagination": pagination,
             }
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("List projects failed", user_id=str(user_id), error=str(e), error_type=type(e).__name__)
             return {
@@ -575,8 +717,8 @@ class SongProjectOrchestrator:
                 logger.warning("Unauthorized file upload", project_id=str(project_id), user_id=str(user_id))
                 return None
 
-            # Get project with details to find folder
-            project_details = self.db_service.get_project_with_details(db, project_id)
+            # Get project folders to find folder (files are not needed here)
+            project_details = self.db_service.get_project_with_folders(db, project_id)
             if not project_details:
                 return None
 
@@ -586,34 +728,15 @@ class SongProjectOrchestrator:
                 logger.warning("Folder not found", folder_name=folder_name, project_id=str(project_id))
                 return None
 
-            # Extract actual filename from path (if filename contains subdirectories)
-            # Example: "Drums/Kick.wav" → filename="Kick.wav", subdir="Drums/"
-            from pathlib import Path as PathLib
-
-            file_path_obj = PathLib(filename)
-            actual_filename = file_path_obj.name  # Just the filename
-            subdir = str(file_path_obj.parent) if file_path_obj.parent != PathLib(".") else ""
-
-            # Detect file type and MIME type (business logic in transformer)
-            file_type = detect_file_type(actual_filename)
-            mime_type = get_mime_type(actual_filename)
-
             # Generate S3 key with subdirectories preserved
             # Example: folder.s3_prefix = "user_123/project_456/Audio Files/"
             # filename = "Drums/Kick.wav" → s3_key = "user_123/project_456/Audio Files/Drums/Kick.wav"
-            if subdir:
-                # Normalize subdirectory path (forward slashes)
-                subdir_normalized = subdir.replace("\\", "/")
-                if not subdir_normalized.endswith("/"):
-                    subdir_normalized += "/"
-                s3_key = f"{folder.s3_prefix}{subdir_normalized}{actual_filename}"
-                relative_path = f"{folder_name}/{subdir_normalized}{actual_filename}"
-            else:
-                s3_key = f"{folder.s3_prefix}{actual_filename}"
-                relative_path = f"{folder_name}/{actual_filename}"
+            actual_filename, s3_key, _ = build_upload_paths(folder.folder_name, folder.s3_prefix, filename)
+            mime_type = get_mime_type(actual_filename)
 
             # Calculate file hash (for Mirror sync comparison)
-            file_hash = calculate_file_hash(file_data)
+            with span("hash.sha256", KIND_HASH, bytes=len(file_data)):
+                file_hash = calculate_file_hash(file_data)
             logger.debug(
                 "File hash calculated",
                 filename=actual_filename,
@@ -621,116 +744,175 @@ class SongProjectOrchestrator:
                 hash_preview=file_hash[:16] if file_hash else "None",
             )
 
-            # Check if file already exists (Mirror update scenario)
-            existing_file = self.db_service.get_file_by_path(db, project_id, relative_path)
-
-            if existing_file:
-                logger.info(
-                    "File exists, updating (Mirror scenario)",
-                    file_id=str(existing_file.id),
-                    relative_path=relative_path,
-                    old_hash=existing_file.file_hash,
-                    new_hash=file_hash,
+            if SONG_PROJECT_DEDUP_ENABLED:
+                # Content-addressed storage: one object per hash, shared across files and projects
+                storage_backend = "blob"
+                s3_key = self._store_blob(
+                    db,
+                    file_hash,
+                    len(file_data),
+                    mime_type,
+                    lambda key: self.storage.upload(file_data, key, content_type=mime_type),
                 )
-
-                # Upload to S3 (overwrite existing)
+                if not s3_key:
+                    return None
+            else:
+                # Upload to S3 (overwrites the object of an existing file)
+                storage_backend = "s3"
                 try:
                     self.storage.upload(file_data, s3_key, content_type=mime_type)
                 except Exception as e:
                     logger.error("S3 upload failed", s3_key=s3_key, error=str(e))
                     return None
 
-                # Update existing file record
-                file_record = self.db_service.update_file(
-                    db=db,
-                    file_id=existing_file.id,
-                    s3_key=s3_key,
-                    file_size_bytes=len(file_data),
-                    file_hash=file_hash,
-                    mime_type=mime_type,
-                )
+            file_record = self._record_stored_file(
+                db, project, folder, filename, s3_key, storage_backend, file_hash, len(file_data)
+            )
+            if not file_record:
+                return None
 
-                if not file_record:
-                    logger.error("Failed to update file record in DB", file_id=str(existing_file.id))
-                    return None
+            # Generate download URL
+            download_url = self.storage.get_url(s3_key, expires_in=3600)
 
-            else:
-                # New file - upload to S3 and create DB record
-                logger.debug("New file, creating", relative_path=relative_path)
+            # Transform to response (business logic in transformer)
+            return transform_file_to_response(file_record, download_url=download_url)
 
-                # Upload to S3
-                try:
-                    self.storage.upload(file_data, s3_key, content_type=mime_type)
-                except Exception as e:
-                    logger.error("S3 upload failed", s3_key=s3_key, error=str(e))
-                    return None
+        except Exception as e:
+            logger.error(
+                "Upload file to project failed", project_id=str(project_id), error=str(e), error_type=type(e).__name__
+            )
+            return None
 
-                # Create file record in DB
-                # filename = just the filename (no subdirs)
-                # relative_path = full path including subdirs (e.g., "Audio Files/Drums/Kick.wav")
-                file_record = self.db_service.create_file(
-                    db=db,
-                    project_id=project_id,
-                    folder_id=folder.id,
-                    filename=actual_filename,  # Just the filename
-                    relative_path=relative_path,  # Full path with subdirs
-                    s3_key=s3_key,
-                    file_type=file_type,
-                    mime_type=mime_type,
-                    file_size_bytes=len(file_data),
-                    file_hash=file_hash,  # SHA256 for Mirror comparison
-                    storage_backend="s3",
-                )
+    def _record_stored_file(
+        self,
+        db: Session,
+        project: Any,
+        folder: Any,
+        filename: str,
+        s3_key: str,
+        storage_backend: str,
+        file_hash: str,
+        file_size_bytes: int,
+    ) -> Any | None:
+        """
+        Create or update the file record for content already stored in S3 (upload and upload sessions)
 
-                if not file_record:
-                    logger.error("Failed to create file record in DB", s3_key=s3_key)
-                    # Try to cleanup S3
-                    with contextlib.suppress(Exception):
-                        self.storage.delete(s3_key)
-                    return None
+        Args:
+            db: Database session
+            project: SongProject (ownership already checked)
+            folder: Target ProjectFolder
+            filename: Folder-relative path (may contain subdirectories)
+            s3_key: Object key of the stored content
+            storage_backend: 's3' (per-path object) or 'blob' (shared content-addressed object)
+            file_hash: SHA256 of the content
+            file_size_bytes: Content size
+
+        Returns:
+            ProjectFile instance or None if failed
+        """
+        # filename = just the filename (no subdirs)
+        # relative_path = full path including subdirs (e.g., "Audio Files/Drums/Kick.wav")
+        actual_filename, _, relative_path = build_upload_paths(folder.folder_name, folder.s3_prefix, filename)
+        file_type = detect_file_type(actual_filename)
+        mime_type = get_mime_type(actual_filename)
+
+        # Check if file already exists (Mirror update scenario)
+        existing_file = self.db_service.get_file_by_path(db, project.id, relative_path)
 
+        if existing_file:
             logger.info(
-                "File uploaded to project",
-                project_id=str(project_id),
-                filename=actual_filename,
+                "File exists, updating (Mirror scenario)",
+                file_id=str(existing_file.id),
                 relative_path=relative_path,
-                folder=folder_name,
+                old_hash=existing_file.file_hash,
+                new_hash=file_hash,
             )
 
-            # Auto-update project status: 'new' → 'progress' after first file upload
-            if project.project_status == "new":
-                updated_project = self.db_service.update_project(
-                    db=db,
-                    project_id=project_id,
-                    user_id=user_id,
-                    update_data={"project_status": "progress"},
-                )
-                if updated_project:
-                    logger.info(
-                        "Project status auto-updated after file upload",
-                        project_id=str(project_id),
-                        old_status="new",
-                        new_status="progress",
-                    )
-                else:
-                    logger.warning("Failed to auto-update project status", project_id=str(project_id))
+            # Update existing file record
+            old_s3_key = existing_file.s3_key
+            old_is_blob = is_content_addressed(existing_file)
+            manifest_changes = self._lock_manifest_changes(
+                db,
+                existing_file.folder_id,
+                removed=(existing_file.relative_path, existing_file.file_hash),
+                added=(existing_file.relative_path, file_hash),
+            )
+            file_record = self.db_service.update_file(
+                db=db,
+                file_id=existing_file.id,
+                s3_key=s3_key,
+                file_size_bytes=file_size_bytes,
+                file_hash=file_hash,
+                mime_type=mime_type,
+                storage_backend=storage_backend,
+                manifest_changes=manifest_changes,
+            )
 
-            # Note: Project stats (total_files, total_size_bytes) are calculated LIVE
-            # in transform_project_detail_to_response() from actual files (Single Source of Truth)
+            if not file_record:
+                logger.error("Failed to update file record in DB", file_id=str(existing_file.id))
+                return None
 
-            # Generate download URL
-            download_url = self.storage.get_url(s3_key, expires_in=3600)
+            # Per-path object replaced by a blob reference
+            if not old_is_blob and old_s3_key and old_s3_key != s3_key:
+                with contextlib.suppress(Exception):
+                    self.storage.delete(old_s3_key)
 
-            # Transform to response (business logic in transformer)
-            from business.song_project_transformer import transform_file_to_response
+        else:
+            # New file - create DB record
+            logger.debug("New file, creating", relative_path=relative_path)
 
-            return transform_file_to_response(file_record, download_url=download_url)
+            file_record = self.db_service.create_file(
+                db=db,
+                project_id=project.id,
+                folder_id=folder.id,
+                filename=actual_filename,  # Just the filename
+                relative_path=relative_path,  # Full path with subdirs
+                s3_key=s3_key,
+                file_type=file_type,
+                mime_type=mime_type,
+                file_size_bytes=file_size_bytes,
+                file_hash=file_hash,  # SHA256 for Mirror comparison
+                storage_backend=storage_backend,
+                manifest_changes=self._lock_manifest_changes(db, folder.id, added=(relative_path, file_hash)),
+            )
 
-        except Exception as e:
-            logger.error(
-                "Upload file to project failed", project_id=str(project_id), error=str(e), error_type=type(e).__name__
+            if not file_record:
+                logger.error("Failed to create file record in DB", s3_key=s3_key)
+                # Try to cleanup S3 (an unreferenced blob is removed by blob GC)
+                if storage_backend == "s3":
+                    with contextlib.suppress(Exception):
+                        self.storage.delete(s3_key)
+                return None
+
+        logger.info(
+            "File uploaded to project",
+            project_id=str(project.id),
+            filename=actual_filename,
+            relative_path=relative_path,
+            folder=folder.folder_name,
+        )
+
+        # Auto-update project status: 'new' → 'progress' after first file upload
+        if project.project_status == "new":
+            updated_project = self.db_service.update_project(
+                db=db,
+                project_id=project.id,
+                user_id=project.user_id,
+                update_data={"project_status": "progress"},
             )
-            return None
+            if updated_project:
+                logger.info(
+                    "Project status auto-updated after file upload",
+                    project_id=str(project.id),
+                    old_status="new",
+                    new_status="progress",
+                )
+            else:
+                logger.warning("Failed to auto-update project status", project_id=str(project.id))
+
+        # Note: Project/folder stats (file_count, total_size_bytes) were updated by
+        # create_file()/update_file() in the same transaction as the file record
+        return file_record
 
     def batch_upload_files_to_project(
         self,
@@ -806,6 +988,524 @@ class SongProjectOrchestrator:
 
         return {"uploaded": uploaded, "failed": failed, "errors": errors}
 
+    def _get_owned_upload_session(self, db: Session, project_id: UUID, session_id: UUID, user_id: UUID) -> Any:
+        """Load an upload session of the given project and user (UploadSessionError 404 otherwise)"""
+        upload_session = self.db_service.get_upload_session(db, session_id)
+        if not upload_session or upload_session.project_id != project_id or upload_session.user_id != user_id:
+            raise UploadSessionError("Upload session not found", 404)
+        return upload_session
+
+    def create_upload_session(
+        self,
+        db: Session,
+        project_id: UUID,
+        folder_id: UUID,
+        user_id: UUID,
+        relative_path: str,
+        file_hash: str,
+        file_size_bytes: int,
+    ) -> dict[str, Any]:
+        """
+        Start (or resume) a resumable chunked upload of one file
+
+        An unexpired open session for the same path and content is returned instead of
+        a new one, so an interrupted client resumes by simply creating the session again
+        and uploading the missing parts.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            folder_id: Folder UUID
+            user_id: User ID (for ownership check)
+            relative_path: Folder-relative target path (e.g. 'Stems/drums.wav')
+            file_hash: SHA256 of the complete file (verified on completion)
+            file_size_bytes: File size
+
+        Returns:
+            Session dictionary (chunk_size, part_count, received_parts, missing_parts, ...)
+
+        Raises:
+            UploadSessionError: Project/folder not found (404), invalid path (400), storage error (500)
+        """
+        project = self.db_service.get_project_by_id(db, project_id)
+        if not project or project.user_id != user_id:
+            raise UploadSessionError("Project not found or unauthorized", 404)
+
+        folder = self.db_service.get_folder_by_id(db, folder_id)
+        if not folder or folder.project_id != project.id:
+            raise UploadSessionError("Folder not found", 404)
+
+        try:
+            actual_filename, _, full_path = build_upload_paths(folder.folder_name, folder.s3_prefix, relative_path)
+        except ValueError as e:
+            raise UploadSessionError(str(e), 400) from e
+        relative_path = to_folder_relative_path(full_path, folder.folder_name)
+
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(hours=SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS)
+
+        existing = self.db_service.find_open_upload_session(
+            db, folder_id, user_id, relative_path, file_hash, file_size_bytes, now
+        )
+        if existing:
+            received_parts = self.storage.list_parts(existing.staging_key, existing.upload_id)
+            existing = self.db_service.update_upload_session(db, existing.id, {"expires_at": expires_at}) or existing
+            logger.info(
+                "Upload session resumed",
+                session_id=str(existing.id),
+                relative_path=relative_path,
+                received_parts=len(received_parts),
+            )
+            return transform_upload_session_to_response(existing, received_parts)
+
+        session_id = uuid4()
+        staging_key = build_upload_staging_key(str(session_id))
+        try:
+            upload_id = self.storage.create_multipart_upload(staging_key, content_type=get_mime_type(actual_filename))
+        except Exception as e:
+            logger.error("Create multipart upload failed", relative_path=relative_path, error=str(e))
+            raise UploadSessionError("Storage error", 500) from e
+
+        upload_session = self.db_service.create_upload_session(
+            db,
+            {
+                "id": session_id,
+                "project_id": project_id,
+                "folder_id": folder_id,
+                "user_id": user_id,
+                "relative_path": relative_path,
+                "file_size_bytes": file_size_bytes,
+                "file_hash": file_hash,
+                "staging_key": staging_key,
+                "upload_id": upload_id,
+                "chunk_size": calculate_upload_chunk_size(
+                    file_size_bytes, SONG_PROJECT_UPLOAD_CHUNK_SIZE_MB * 1024 * 1024
+                ),
+                "expires_at": expires_at,
+            },
+        )
+        if not upload_session:
+            self.storage.abort_multipart_upload(staging_key, upload_id)
+            raise UploadSessionError("Failed to create upload session", 500)
+
+        return transform_upload_session_to_response(upload_session, [])
+
+    def get_upload_session_status(
+        self, db: Session, project_id: UUID, session_id: UUID, user_id: UUID
+    ) -> dict[str, Any]:
+        """
+        Get an upload session with the parts received so far
+
+        Raises:
+            UploadSessionError: Session not found (404)
+        """
+        upload_session = self._get_owned_upload_session(db, project_id, session_id, user_id)
+        received_parts = None
+        if upload_session.status == "open":
+            received_parts = self.storage.list_parts(upload_session.staging_key, upload_session.upload_id)
+        return transform_upload_session_to_response(upload_session, received_parts)
+
+    def upload_session_part(
+        self,
+        db: Session,
+        project_id: UUID,
+        session_id: UUID,
+        user_id: UUID,
+        part_number: int,
+        data: bytes,
+        chunk_hash: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Store one chunk of an upload session as S3 multipart part (re-sending a part replaces it)
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            session_id: Session UUID
+            user_id: User ID (for ownership check)
+            part_number: 1-based chunk number
+            data: Chunk content (exactly chunk_size bytes, except the last chunk)
+            chunk_hash: Optional SHA256 of the chunk (rejects corrupted chunks early)
+
+        Returns:
+            {'part_number': int, 'size': int}
+
+        Raises:
+            UploadSessionError: Not found (404), not open (409), expired (410), invalid chunk (400)
+        """
+        upload_session = self._get_owned_upload_session(db, project_id, session_id, user_id)
+        if upload_session.status != "open":
+            raise UploadSessionError(f"Upload session is {upload_session.status}", 409)
+
+        now = datetime.now(UTC)
+        if upload_session.expires_at <= now:
+            raise UploadSessionError("Upload session expired", 410)
+
+        expected_size = get_expected_part_size(part_number, upload_session.file_size_bytes, upload_session.chunk_size)
+        if expected_size is None:
+            raise UploadSessionError(f"Invalid part number: {part_number}", 400)
+        if len(data) != expected_size:
+            raise UploadSessionError(f"Part {part_number} must be {expected_size} bytes, got {len(data)}", 400)
+        if chunk_hash:
+            with span("hash.sha256", KIND_HASH, bytes=len(data)):
+                part_hash = calculate_file_hash(data)
+            if part_hash != chunk_hash.lower():
+                raise UploadSessionError(f"Checksum mismatch for part {part_number}", 400)
+
+        try:
+            self.storage.upload_part(upload_session.staging_key, upload_session.upload_id, part_number, data)
+        except Exception as e:
+            raise UploadSessionError("Storage error", 500) from e
+
+        self.db_service.update_upload_session(
+            db, session_id, {"expires_at": now + timedelta(hours=SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS)}
+        )
+        logger.debug("Upload part stored", session_id=str(session_id), part_number=part_number, size=len(data))
+        return {"part_number": part_number, "size": len(data)}
+
+    def complete_upload_session(self, db: Session, project_id: UUID, session_id: UUID, user_id: UUID) -> dict[str, Any]:
+        """
+        Assemble all parts, verify the SHA256 and create/update the file record
+
+        Completing an already completed session returns the same result (safe to retry).
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            session_id: Session UUID
+            user_id: User ID (for ownership check)
+
+        Returns:
+            {'session': {...}, 'file': {...}}
+
+        Raises:
+            UploadSessionError: Not found (404), parts missing or session aborted (409),
+                content does not match file_hash (422), storage/DB error (500)
+        """
+        upload_session = self._get_owned_upload_session(db, project_id, session_id, user_id)
+        if upload_session.status == "completed":
+            file = self.db_service.get_file_by_id(db, upload_session.file_id) if upload_session.file_id else None
+            return {
+                "session": transform_upload_session_to_response(upload_session),
+                "file": transform_file_to_response(file) if file else None,
+            }
+        if upload_session.status != "open":
+            raise UploadSessionError(f"Upload session is {upload_session.status}", 409)
+
+        staging_key = upload_session.staging_key
+        parts = self.storage.list_parts(staging_key, upload_session.upload_id)
+        part_count = calculate_upload_part_count(upload_session.file_size_bytes, upload_session.chunk_size)
+        missing = find_missing_upload_parts(part_count, parts)
+        if missing:
+            raise UploadSessionError(f"{len(missing)} of {part_count} parts missing (first: {missing[0]})", 409)
+
+        try:
+            self.storage.complete_multipart_upload(staging_key, upload_session.upload_id, parts)
+        except Exception as e:
+            logger.error("Complete multipart upload failed", session_id=str(session_id), error=str(e))
+            raise UploadSessionError("Storage error", 500) from e
+
+        # The parts are assembled now - a failure from here on aborts the session (client starts over)
+        try:
+            file_record = self._store_assembled_upload(db, project_id, upload_session)
+        except UploadSessionError:
+            with contextlib.suppress(Exception):
+                self.storage.delete(staging_key)
+            self.db_service.update_upload_session(db, session_id, {"status": "aborted"})
+            raise
+
+        upload_session = (
+            self.db_service.update_upload_session(db, session_id, {"status": "completed", "file_id": file_record.id})
+            or upload_session
+        )
+        logger.info(
+            "Upload session completed",
+            session_id=str(session_id),
+            relative_path=upload_session.relative_path,
+            file_size_bytes=upload_session.file_size_bytes,
+            parts=part_count,
+        )
+        return {
+            "session": transform_upload_session_to_response(upload_session),
+            "file": transform_file_to_response(file_record),
+        }
+
+    def _store_assembled_upload(self, db: Session, project_id: UUID, upload_session: Any) -> Any:
+        """Verify the assembled staging object and move it into place (per-path object or blob)"""
+        staging_key = upload_session.staging_key
+        try:
+            # Includes reading the staging object from S3 (hashed while streaming)
+            with span("hash.sha256_stream", KIND_HASH, bytes=upload_session.file_size_bytes):
+                file_hash = calculate_stream_hash(self.storage.iter_chunks(staging_key))
+        except Exception as e:
+            raise UploadSessionError("Storage error", 500) from e
+
+        if file_hash != upload_session.file_hash:
+            logger.warning(
+                "Upload session hash mismatch",
+                session_id=str(upload_session.id),
+                relative_path=upload_session.relative_path,
+            )
+            raise UploadSessionError("Uploaded content does not match file_hash (session aborted)", 422)
+
+        project = self.db_service.get_project_by_id(db, project_id)
+        folder = self.db_service.get_folder_by_id(db, upload_session.folder_id)
+        if not project or not folder:
+            raise UploadSessionError("Project or folder not found", 404)
+
+        def move_staged_object(dest_key: str) -> None:
+            if not self.storage.move(staging_key, dest_key):
+                raise RuntimeError(f"S3 move failed: {staging_key} → {dest_key}")
+
+        actual_filename, s3_key, _ = build_upload_paths(
+            folder.folder_name, folder.s3_prefix, upload_session.relative_path
+        )
+        if SONG_PROJECT_DEDUP_ENABLED:
+            storage_backend = "blob"
+            s3_key = self._store_blob(
+                db, file_hash, upload_session.file_size_bytes, get_mime_type(actual_filename), move_staged_object
+            )
+            # Content was already stored - the staged copy is not needed
+            with contextlib.suppress(Exception):
+                self.storage.delete(staging_key)
+        else:
+            storage_backend = "s3"
+            try:
+                move_staged_object(s3_key)
+            except RuntimeError:
+                s3_key = None
+        if not s3_key:
+            raise UploadSessionError("Storage error", 500)
+
+        file_record = self._record_stored_file(
+            db,
+            project,
+            folder,
+            upload_session.relative_path,
+            s3_key,
+            storage_backend,
+            file_hash,
+            upload_session.file_size_bytes,
+        )
+        if not file_record:
+            raise UploadSessionError("Failed to store file record", 500)
+        return file_record
+
+    def abort_upload_session(self, db: Session, project_id: UUID, session_id: UUID, user_id: UUID) -> dict[str, Any]:
+        """
+        Abort an upload session and free its stored parts
+
+        Raises:
+            UploadSessionError: Session not found (404)
+        """
+        upload_session = self._get_owned_upload_session(db, project_id, session_id, user_id)
+        if upload_session.status == "open":
+            self.storage.abort_multipart_upload(upload_session.staging_key, upload_session.upload_id)
+            upload_session = (
+                self.db_service.update_upload_session(db, session_id, {"status": "aborted"}) or upload_session
+            )
+            logger.info("Upload session aborted", session_id=str(session_id))
+        return transform_upload_session_to_response(upload_session)
+
+    def cleanup_expired_upload_sessions(self, db: Session, batch_size: int = 100) -> dict[str, int]:
+        """
+        Abort the multipart uploads of expired sessions and delete expired session rows
+
+        Args:
+            db: Database session
+            batch_size: Sessions per batch
+
+        Returns:
+            {"aborted": int, "deleted": int, "failed": int}
+        """
+        now = datetime.now(UTC)
+        stats = {"aborted": 0, "deleted": 0, "failed": 0}
+
+        while True:
+            sessions = self.db_service.get_expired_upload_sessions(db, now, batch_size)
+            if not sessions:
+                break
+
+            removable = []
+            for upload_session in sessions:
+                if upload_session.status == "open":
+                    if not self.storage.abort_multipart_upload(upload_session.staging_key, upload_session.upload_id):
+                        stats["failed"] += 1
+                        continue
+                    stats["aborted"] += 1
+                removable.append(upload_session.id)
+
+            stats["deleted"] += self.db_service.delete_upload_sessions(db, removable)
+            if len(sessions) < batch_size or not removable:
+                break
+
+        logger.info("Upload session cleanup completed", **stats)
+        return stats
+
+    def claim_files_by_hash(
+        self,
+        db: Session,
+        project_id: UUID,
+        folder_id: UUID,
+        user_id: UUID,
+        files: list[dict[str, Any]],
+    ) -> dict[str, Any] | None:
+        """
+        Create/update file records for content that is already stored (no upload needed)
+
+        Mirror announces new/changed files with hash and size first and only uploads
+        the files reported as missing. Only content the user already stores in one of
+        their own projects can be claimed - content of other users has to be uploaded.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            folder_id: Folder UUID
+            user_id: User ID (for ownership check)
+            files: Dicts with relative_path (folder-relative), file_hash, file_size_bytes
+
+        Returns:
+            {"claimed": [...], "missing": [...]} or None if not found/unauthorized
+        """
+        try:
+            project = self.db_service.get_project_by_id(db, project_id)
+            if not project or project.user_id != user_id:
+                logger.warning("Unauthorized file claim", project_id=str(project_id), user_id=str(user_id))
+                return None
+
+            folder = self.db_service.get_folder_by_id(db, folder_id)
+            if not folder or folder.project_id != project.id:
+                logger.warning("Folder not found", folder_id=str(folder_id), project_id=str(project_id))
+                return None
+
+            if not SONG_PROJECT_DEDUP_ENABLED:
+                return {"claimed": [], "missing": files}
+
+            blobs = self.db_service.get_user_blobs_by_hash(db, user_id, [f["file_hash"] for f in files])
+            claimable, missing = partition_claimable_files(
+                files, {file_hash: blob.file_size_bytes for file_hash, blob in blobs.items()}
+            )
+
+            existing = {
+                to_folder_relative_path(f.relative_path, folder.folder_name): f
+                for f in self.db_service.get_files_by_folder(db, folder_id, compact=True)
+            }
+
+            claimed = []
+            for file in claimable:
+                folder_path = file["relative_path"].replace("\\", "/").lstrip("/")
+                blob = blobs[file["file_hash"]]
+                existing_file = existing.get(folder_path)
+
+                if existing_file:
+                    old_s3_key = existing_file.s3_key
+                    old_is_blob = is_content_addressed(existing_file)
+                    manifest_changes = self._lock_manifest_changes(
+                        db,
+                        folder_id,
+                        removed=(existing_file.relative_path, existing_file.file_hash),
+                        added=(existing_file.relative_path, blob.file_hash),
+                    )
+                    file_record = self.db_service.update_file(
+                        db=db,
+                        file_id=existing_file.id,
+                        s3_key=blob.s3_key,
+                        file_size_bytes=blob.file_size_bytes,
+                        file_hash=blob.file_hash,
+                        storage_backend="blob",
+                        manifest_changes=manifest_changes,
+                    )
+                    if file_record and not old_is_blob and old_s3_key and old_s3_key != blob.s3_key:
+                        with contextlib.suppress(Exception):
+                            self.storage.delete(old_s3_key)
+                else:
+                    filename = folder_path.rpartition("/")[2]
+                    relative_path = f"{folder.folder_name}/{folder_path}"
+                    file_record = self.db_service.create_file(
+                        db=db,
+                        project_id=project_id,
+                        folder_id=folder_id,
+                        filename=filename,
+                        relative_path=relative_path,
+                        s3_key=blob.s3_key,
+                        file_type=detect_file_type(filename),
+                        mime_type=get_mime_type(filename),
+                        file_size_bytes=blob.file_size_bytes,
+                        file_hash=blob.file_hash,
+                        storage_backend="blob",
+                        manifest_changes=self._lock_manifest_changes(
+                            db, folder_id, added=(relative_path, blob.file_hash)
+                        ),
+                    )
+
+                # Blob vanished (GC) between lookup and claim - client uploads it instead
+                (claimed if file_record else missing).append(file)
+
+            logger.info(
+                "Files claimed by hash",
+                project_id=str(project_id),
+                folder_id=str(folder_id),
+                claimed=len(claimed),
+                missing=len(missing),
+            )
+            return {"claimed": claimed, "missing": missing}
+
+        except Exception as e:
+            logger.error("Claim files failed", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__)
+            return None
+
+    def gc_unreferenced_blobs(
+        self,
+        db: Session,
+        grace_hours: float = SONG_PROJECT_BLOB_GC_GRACE_HOURS,
+        batch_size: int = 100,
+        dry_run: bool = False,
+    ) -> dict[str, int]:
+        """
+        Delete blobs without file references that are older than the grace period
+
+        The grace period covers uploads whose file record is not yet created and
+        clients that announced a hash and upload shortly after.
+
+        Args:
+            db: Database session
+            grace_hours: Minimum time without references before deletion
+            batch_size: Blobs locked and deleted per transaction
+            dry_run: Only count candidates (first batch), delete nothing
+
+        Returns:
+            {"deleted": int, "failed": int, "freed_bytes": int}
+        """
+        cutoff = datetime.now(UTC) - timedelta(hours=grace_hours)
+        stats = {"deleted": 0, "failed": 0, "freed_bytes": 0}
+
+        while True:
+            blobs = self.db_service.lock_unreferenced_blobs(db, cutoff, batch_size)
+            if not blobs:
+                break
+            if dry_run:
+                stats["deleted"] = len(blobs)
+                stats["freed_bytes"] = sum(blob.file_size_bytes for blob in blobs)
+                db.rollback()
+                break
+
+            removed = []
+            for blob in blobs:
+                try:
+                    self.storage.delete(blob.s3_key)
+                    removed.append(blob)
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.warning("Blob object delete failed", s3_key=blob.s3_key, error=str(e))
+
+            stats["deleted"] += self.db_service.delete_blobs(db, [blob.file_hash for blob in removed])
+            stats["freed_bytes"] += sum(blob.file_size_bytes for blob in removed)
+            if len(blobs) < batch_size or not removed:
+                break
+
+        logger.info("Blob GC completed", grace_hours=grace_hours, dry_run=dry_run, **stats)
+        return stats
+
     def mirror_compare_files(
         self,
         db: Session,
@@ -813,6 +1513,7 @@ class SongProjectOrchestrator:
         user_id: UUID,
         folder_id: UUID,
         local_files: list[dict[str, Any]],
+        scopes: list[str] | None = None,
     ) -> dict[str, Any] | None:
         """
         Compare local files vs remote files (for Mirror sync)
@@ -823,6 +1524,8 @@ class SongProjectOrchestrator:
             user_id: User ID (for ownership check)
             folder_id: Folder UUID
             local_files: List of dicts with keys: relative_path, file_hash, file_size_bytes
+            scopes: Directories (folder-relative) whose subtrees differ according to the
+                    manifest; files outside are left alone. None = compare the whole folder.
 
         Returns:
             Dictionary with diff:
@@ -846,142 +1549,19 @@ class SongProjectOrchestrator:
                 logger.warning("Folder not found", folder_id=str(folder_id))
                 return None
 
-            folder_name = folder.folder_name
-
             # Get all remote files for this folder
-            remote_files = self.db_service.get_files_by_folder(db, folder_id)
-
-            # Build lookup maps
-            # IMPORTANT: Remote files have relative_path like "01 Arrangement/Bounces/file.wav"
-            # but CLI sends "Bounces/file.wav" (without folder_name prefix).
-            # We need to strip the folder_name prefix from remote paths for comparison!
-            # CRITICAL: Normalize the relative_path IN the dictionary itself, not just the key!
-            local_map = {}
-            for f in local_files:
-                normalized_path = f["relative_path"].lstrip("/")
-                # Create new dict with normalized path
-                normalized_file = {**f, "relative_path": normalized_path}
-                local_map[normalized_path] = normalized_file
-
-            remote_map = {}
-            for f in remote_files:
-                # Strip folder_name prefix (e.g., "01 Arrangement/" → "")
-                normalized_path = f.relative_path
-                if normalized_path.startswith(f"{folder_name}/"):
-                    normalized_path = normalized_path[len(folder_name) + 1 :]  # +1 for trailing slash
-                # Also strip leading slash if present
-                normalized_path = normalized_path.lstrip("/")
-                remote_map[normalized_path] = f
-
-            # Calculate diff
-            to_upload = []
-            to_update = []
-            to_delete = []
-            unchanged = []
-
-            # Check local files vs remote
-            for rel_path, local_file in local_map.items():
-                if rel_path not in remote_map:
-                    # File exists locally but not remotely → upload
-                    to_upload.append(rel_path)
-                else:
-                    remote_file = remote_map[rel_path]
-                    # Compare hashes
-                    if local_file["file_hash"] != remote_file.file_hash:
-                        # Hash mismatch → update
-                        to_update.append(rel_path)
-                    else:
-                        # Hash match → unchanged
-                        unchanged.append(rel_path)
-
-            # Check remote files not in local (leichen!)
-            for rel_path, remote_file in remote_map.items():
-                if rel_path not in local_map:
-                    # File exists remotely but not locally → delete
-                    to_delete.append(
-                        {
-                            "file_id": str(remote_file.id),
-                            "relative_path": rel_path,
-                            "file_size_bytes": remote_file.file_size_bytes,
-                        }
-                    )
-
-            # MOVE DETECTION: Detect files with same hash but different path
-            # Build hash-to-files maps for move detection
-            local_hash_map: dict[str, list[str]] = {}
-            remote_hash_map: dict[str, list[dict]] = {}
-
-            for rel_path, local_file in local_map.items():
-                hash_val = local_file["file_hash"]
-                local_hash_map.setdefault(hash_val, []).append(rel_path)
-
-            for rel_path, remote_file in remote_map.items():
-                hash_val = remote_file.file_hash
-                remote_hash_map.setdefault(hash_val, []).append({"path": rel_path, "file": remote_file})
-
-            # Detect moves (same hash, different path)
-            to_move = []
-            moved_upload_paths = set()  # Track paths to remove from to_upload
-            moved_delete_items = []  # Track items to remove from to_delete
-
-            for hash_val in local_hash_map.keys() & remote_hash_map.keys():
-                local_paths = set(local_hash_map[hash_val])
-                remote_items = remote_hash_map[hash_val]
-                remote_paths = {item["path"] for item in remote_items}
-
-                # Files that disappeared from old location
-                disappeared = remote_paths - local_paths
-                # Files that appeared at new location
-                appeared = local_paths - remote_paths
-
-                # Only handle clear 1:1 moves to avoid ambiguity
-                if len(disappeared) == 1 and len(appeared) == 1:
-                    old_path = list(disappeared)[0]
-                    new_path = list(appeared)[0]
-                    remote_file = next(item["file"] for item in remote_items if item["path"] == old_path)
-
-                    # Construct new S3 key (must include folder_name prefix)
-                    # Strip leading slash from new_path to avoid double slashes
-                    new_s3_key = f"{project.s3_prefix.rstrip('/')}/{folder_name}/{new_path.lstrip('/')}"
-
-                    to_move.append(
-                        {
-                            "file_id": str(remote_file.id),
-                            "old_path": old_path,
-                            "new_path": new_path,
-                            "file_hash": hash_val,
-                            "file_size_bytes": remote_file.file_size_bytes,
-                            "s3_key_old": remote_file.s3_key,
-                            "s3_key_new": new_s3_key,
-                        }
-                    )
-
-                    # Mark for removal from to_upload/to_delete
-                    moved_upload_paths.add(new_path)
-                    moved_delete_items.append(str(remote_file.id))
-
-            # Remove moved files from to_upload and to_delete
-            to_upload = [p for p in to_upload if p not in moved_upload_paths]
-            to_delete = [d for d in to_delete if d["file_id"] not in moved_delete_items]
+            remote_files = self.db_service.get_files_by_folder(db, folder_id, compact=True)
+            diff = compute_mirror_diff(local_files, remote_files, folder.folder_name, project.s3_prefix, scopes)
 
             logger.info(
                 "Mirror compare completed",
                 project_id=str(project_id),
                 folder_id=str(folder_id),
-                to_upload=len(to_upload),
-                to_update=len(to_update),
-                to_move=len(to_move),
-                to_delete=len(to_delete),
-                unchanged=len(unchanged),
+                scopes=len(scopes) if scopes is not None else None,
+                **{key: len(paths) for key, paths in diff.items()},
             )
 
-            return {
-                "to_upload": to_upload,
-                "to_update": to_update,
-                "to_move": to_move,
-                "to_delete": to_delete,
-                "unchanged": unchanged,
-            }
+            return diff
 
         except Exception as e:
             logger.error(
@@ -993,6 +1573,91 @@ class SongProjectOrchestrator:
             )
             return None
 
+    def get_folder_manifest(
+        self,
+        db: Session,
+        project_id: UUID,
+        folder_id: UUID,
+        user_id: UUID,
+        paths: list[str],
+        include_children: bool = True,
+    ) -> dict[str, Any] | None:
+        """
+        Get folder manifest nodes (Merkle tree) for incremental Mirror sync
+
+        The manifest is built on first use and rebuilt whenever its root file count
+        disagrees with the maintained folder statistics.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            folder_id: Folder UUID
+            user_id: User ID (for ownership check)
+            paths: Folder-relative directory paths to return ("" = folder root)
+            include_children: Also return direct subdirectories and files of each path
+
+        Returns:
+            {"nodes": [...]} in the order of paths, or None if not found/unauthorized
+        """
+        try:
+            project = self.db_service.get_project_by_id(db, project_id)
+            if not project or project.user_id != user_id:
+                logger.warning("Unauthorized manifest request", project_id=str(project_id), user_id=str(user_id))
+                return None
+
+            folder = self.db_service.get_folder_by_id(db, folder_id)
+            if not folder or folder.project_id != project.id:
+                logger.warning("Folder not found", folder_id=str(folder_id), project_id=str(project_id))
+                return None
+
+            root = next(iter(self.db_service.get_manifest_nodes(db, folder_id, [""])), None)
+            if root is None or root.file_count != folder.file_count:
+                logger.info(
+                    "Building folder manifest",
+                    folder_id=str(folder_id),
+                    manifest_files=root.file_count if root else None,
+                    folder_files=folder.file_count,
+                )
+                if not self._rebuild_folder_manifest(db, folder_id):
+                    return None
+
+            paths = [path.strip("/") for path in paths]
+            nodes = {node.path: node for node in self.db_service.get_manifest_nodes(db, folder_id, paths)}
+
+            children: dict[str, list[Any]] = {path: [] for path in paths}
+            if include_children:
+                for child in self.db_service.get_manifest_child_nodes(db, folder_id, paths):
+                    children[child.parent_path].append(child)
+
+            response_nodes = []
+            for path in paths:
+                if not include_children:
+                    response_nodes.append(transform_manifest_node_to_response(path, nodes.get(path)))
+                    continue
+
+                files = (
+                    self.db_service.get_folder_files(
+                        db, folder_id, build_folder_path_prefix(folder.folder_name, path), recursive=False
+                    )
+                    if path in nodes
+                    else []
+                )
+                response_nodes.append(transform_manifest_node_to_response(path, nodes.get(path), children[path], files))
+
+            logger.debug(
+                "Folder manifest served",
+                folder_id=str(folder_id),
+                paths=len(paths),
+                include_children=include_children,
+            )
+            return {"nodes": response_nodes}
+
+        except Exception as e:
+            logger.error(
+                "Get folder manifest failed", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return None
+
     def batch_delete_files(
         self,
         db: Session,
@@ -1055,14 +1720,16 @@ class SongProjectOrchestrator:
 
                     # Delete from S3
                     try:
-                        if file_record.s3_key:
-                            self.storage.delete(file_record.s3_key)
+                        self._delete_file_object(file_record)
                     except Exception as e:
                         logger.warning("S3 delete failed", file_id=file_id_str, s3_key=file_record.s3_key, error=str(e))
                         # Continue with DB deletion even if S3 fails
 
                     # Delete from DB
-                    if self.db_service.delete_file(db, file_id):
+                    manifest_changes = self._lock_manifest_changes(
+                        db, file_record.folder_id, removed=(file_record.relative_path, file_record.file_hash)
+                    )
+                    if self.db_service.delete_file(db, file_id, manifest_changes):
                         deleted += 1
                         logger.debug("File deleted", file_id=file_id_str, filename=file_record.filename)
                     else:
@@ -1149,8 +1816,8 @@ class SongProjectOrchestrator:
                     s3_key_new = action["s3_key_new"]
                     new_path = action["new_path"]
 
-                    # Step 1: S3 move (server-side copy + delete)
-                    move_success = self.storage.move(s3_key_old, s3_key_new)
+                    # Step 1: S3 move (server-side copy + delete), not needed for blob references
+                    move_success = s3_key_old == s3_key_new or self.storage.move(s3_key_old, s3_key_new)
 
                     if not move_success:
                         failed += 1
@@ -1166,11 +1833,23 @@ class SongProjectOrchestrator:
                         continue
 
                     # Step 2: Update DB record
+                    file_record = self.db_service.get_file_by_id(db, file_id)
+                    manifest_changes = (
+                        self._lock_manifest_changes(
+                            db,
+                            file_record.folder_id,
+                            removed=(file_record.relative_path, file_record.file_hash),
+                            added=(new_path, file_record.file_hash),
+                        )
+                        if file_record
+                        else {}
+                    )
                     updated_file = self.db_service.move_file(
                         db=db,
                         file_id=file_id,
                         new_relative_path=new_path,
                         new_s3_key=s3_key_new,
+                        manifest_changes=manifest_changes,
                     )
 
                     if not updated_file:
@@ -1235,6 +1914,98 @@ class SongProjectOrchestrator:
                 "errors": [{"error": f"Batch move failed: {str(e)}"}],
             }
 
+    def list_folder_files(
+        self,
+        db: Session,
+        project_id: UUID,
+        folder_id: UUID,
+        user_id: UUID,
+        limit: int | None = None,
+        cursor: str | None = None,
+        prefix: str = "",
+        recursive: bool = True,
+        sort_by: str = "relative_path",
+        sort_direction: str = "asc",
+    ) -> dict[str, Any] | None:
+        """
+        List files of a folder (compact entries, optionally paged and browsed by subdirectory)
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            folder_id: Folder UUID
+            user_id: User ID (for ownership check)
+            limit: Page size; None returns all files (legacy CLI behaviour)
+            cursor: Keyset cursor of the previous page ("" or None = first page)
+            prefix: Subdirectory inside the folder (e.g. "Samples/Drums")
+            recursive: False = only files directly in prefix, plus its subdirectories
+            sort_by: relative_path, filename, file_size_bytes or updated_at (paged mode)
+            sort_direction: asc or desc (paged mode)
+
+        Returns:
+            {"files": [...], "subdirectories": [...] | None, "pagination": {...} | None},
+            or None if project/folder not found or unauthorized
+
+        Raises:
+            InvalidCursorError: Cursor is malformed or was issued for a different sort order
+        """
+        try:
+            project = self.db_service.get_project_by_id(db, project_id)
+            if not project or project.user_id != user_id:
+                logger.warning("Unauthorized folder listing", project_id=str(project_id), user_id=str(user_id))
+                return None
+
+            folder = self.db_service.get_folder_by_id(db, folder_id)
+            if not folder or folder.project_id != project.id:
+                logger.warning("Folder not found", folder_id=str(folder_id), project_id=str(project_id))
+                return None
+
+            path_prefix = build_folder_path_prefix(folder.folder_name, prefix)
+
+            if limit is None:
+                files = self.db_service.get_folder_files(db, folder_id, path_prefix, recursive=recursive)
+                pagination = None
+            else:
+                files, next_cursor = self.db_service.get_folder_files_page(
+                    db,
+                    folder_id,
+                    path_prefix,
+                    limit=limit,
+                    cursor=cursor or "",
+                    recursive=recursive,
+                    sort_by=sort_by,
+                    sort_direction=sort_direction,
+                )
+                # Whole-folder listings can report the maintained file count for free
+                total = folder.file_count if recursive and not prefix else None
+                pagination = calculate_cursor_pagination_meta(total, limit, next_cursor)
+
+            subdirectories = (
+                None if recursive else self.db_service.get_folder_subdirectories(db, folder_id, path_prefix)
+            )
+
+            logger.debug(
+                "Folder files listed",
+                folder_id=str(folder_id),
+                prefix=path_prefix,
+                count=len(files),
+                paged=limit is not None,
+            )
+
+            return {
+                "files": [transform_file_to_listing_item(f, str(project_id)) for f in files],
+                "subdirectories": subdirectories,
+                "pagination": pagination,
+            }
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(
+                "List folder files failed", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return None
+
     def get_all_project_files_with_urls(self, db: Session, project_id: UUID, user_id: UUID) -> dict[str, Any] | None:
         """
         Get all files from all folders for complete project download
@@ -1319,6 +2090,85 @@ class SongProjectOrchestrator:
             )
             return None
 
+    def prepare_project_archive(
+        self,
+        db: Session,
+        project_id: UUID,
+        user_id: UUID,
+        folder_id: UUID | None = None,
+        file_ids: list[UUID] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Prepare a streaming ZIP download of a project, folder or file selection
+
+        All DB reads happen here - the returned stream only reads S3, so the DB session
+        can be closed before the (possibly hour-long) download starts.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            user_id: User ID (for ownership check)
+            folder_id: Only this folder (folder-relative paths), None = whole project
+            file_ids: Only these files (paths incl. folder name), None = all files
+
+        Returns:
+            Dict with filename, file_count, total_size_bytes and stream (ZIP bytes iterator),
+            None if project/folder not found or unauthorized
+        """
+        project = self.db_service.get_project_with_folders(db, project_id)
+        if not project or project.user_id != user_id:
+            logger.warning(
+                "Project archive not found or unauthorized", project_id=str(project_id), user_id=str(user_id)
+            )
+            return None
+
+        folder_names = {folder.id: folder.folder_name for folder in project.folders}
+        if folder_id is not None and folder_id not in folder_names:
+            logger.warning("Archive folder not found", project_id=str(project_id), folder_id=str(folder_id))
+            return None
+
+        files = self.db_service.get_archive_files(db, project_id, folder_id=folder_id, file_ids=file_ids)
+        if folder_id is not None:
+            folder_names = {folder_id: folder_names[folder_id]}
+        elif file_ids is not None:
+            # Selections only contain the folders of the selected files
+            selected_folders = {file.folder_id for file in files}
+            folder_names = {key: name for key, name in folder_names.items() if key in selected_folders}
+
+        entries = build_archive_entries(files, folder_names, strip_folder=folder_id is not None)
+        storage = self.storage
+        zip_entries = [
+            ZipStreamEntry(
+                arcname=entry["arcname"],
+                size=entry["size"],
+                modified=entry["modified"],
+                open_chunks=(
+                    (lambda key=entry["s3_key"]: storage.iter_chunks(key, ARCHIVE_READ_CHUNK_SIZE))
+                    if entry["s3_key"]
+                    else None
+                ),
+                compress=entry["compress"],
+            )
+            for entry in entries
+        ]
+
+        total_size = sum(entry["size"] or 0 for entry in entries)
+        logger.info(
+            "Project archive prepared",
+            project_id=str(project_id),
+            folder_id=str(folder_id) if folder_id else None,
+            file_count=len(files),
+            total_size_bytes=total_size,
+        )
+        return {
+            "filename": build_archive_filename(
+                project.project_name, folder_names[folder_id] if folder_id is not None else None
+            ),
+            "file_count": len(files),
+            "total_size_bytes": total_size,
+            "stream": stream_zip(zip_entries),
+        }
+
     def clear_folder_files(
         self,
         db: Session,
@@ -1354,7 +2204,7 @@ class SongProjectOrchestrator:
                 raise ValueError("Folder not found")
 
             # Get all files in folder
-            files = self.db_service.get_files_by_folder(db, folder_id)
+            files = self.db_service.get_files_by_folder(db, folder_id, compact=True)
 
             if not files:
                 logger.info("Folder is already empty", folder_id=str(folder_id))
@@ -1367,11 +2217,14 @@ class SongProjectOrchestrator:
             for file in files:
                 try:
                     # Delete from S3
-                    if file.s3_key:
-                        self.storage.delete(file.s3_key)
+                    self._delete_file_object(file)
 
                     # Delete from DB
-                    self.db_service.delete_file(db, file.id)
+                    self.db_service.delete_file(
+                        db,
+                        file.id,
+                        self._lock_manifest_changes(db, folder_id, removed=(file.relative_path, file.file_hash)),
+                    )
                     deleted_count += 1
 
                 except Exception as e:
@@ -6,8 +6,23 @@ NO database operations, NO file system operations, NO external dependencies.
 
 import hashlib
 import re
+from collections.abc import Iterable
 from typing import Any
 
+from business.song_project_manifest_transformer import to_folder_relative_path
+
+
+# S3 multipart limits (parts except the last must be >= 5 MiB, at most 10000 parts)
+MIN_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_UPLOAD_PARTS = 10000
+
+# S3 read size per chunk in ZIP downloads (memory per running download)
+ARCHIVE_READ_CHUNK_SIZE = 1024 * 1024
+
+# Extensions deflated in ZIP downloads - audio, images, video and archives are already
+# compressed (or gain too little for the CPU cost) and are stored as-is at line speed
+ARCHIVE_DEFLATE_EXTENSIONS = {"txt", "md", "rtf", "csv", "json", "xml", "mid", "midi", "lrc", "srt"}
+
 
 def generate_s3_prefix(project_name: str, user_id: str) -> str:
     """
@@ -216,6 +231,9 @@ def transform_folder_to_response(folder: Any) -> dict[str, Any]:
         "folder_type": folder.folder_type,
         "s3_prefix": folder.s3_prefix,
         "custom_icon": folder.custom_icon,
+        "file_count": folder.file_count,
+        "total_size_bytes": folder.total_size_bytes,
+        "files_modified_at": folder.files_modified_at.isoformat() if folder.files_modified_at else None,
         "created_at": folder.created_at.isoformat() if folder.created_at else None,
     }
 
@@ -246,37 +264,248 @@ def transform_file_to_response(file: Any, download_url: str | None = None) -> di
     }
 
 
-def transform_project_detail_to_response(project: Any) -> dict[str, Any]:
+def build_folder_path_prefix(folder_name: str, prefix: str | None = None) -> str:
+    """
+    Build the relative_path prefix for browsing a folder (matches the S3 key hierarchy)
+
+    Args:
+        folder_name: Folder name (first component of every relative_path)
+        prefix: Subdirectory inside the folder as sent by clients (e.g. "Samples/Drums")
+
+    Returns:
+        Prefix ending with "/" (e.g. "01 Arrangement/Samples/Drums/")
+
+    Examples:
+        >>> build_folder_path_prefix("01 Arrangement")
+        '01 Arrangement/'
+        >>> build_folder_path_prefix("01 Arrangement", "/Samples/Drums/")
+        '01 Arrangement/Samples/Drums/'
+    """
+    parts = [part for part in (prefix or "").replace("\\", "/").split("/") if part and part != "."]
+    return "/".join([folder_name, *parts]) + "/"
+
+
+def transform_file_to_listing_item(file: Any, project_id: str) -> dict[str, Any]:
+    """
+    Transform ProjectFile (compact columns) to a folder listing entry
+
+    Args:
+        file: ProjectFile loaded with COMPACT_FILE_COLUMNS
+        project_id: Project UUID string (for the download proxy URL)
+
+    Returns:
+        Dictionary with id, filename, relative_path, download_url, file_size_bytes, s3_key, updated_at
+    """
+    download_url = f"/api/v1/song-projects/{project_id}/files/{file.id}/download" if file.s3_key else None
+    return {
+        "id": str(file.id),
+        "filename": file.filename,
+        "relative_path": file.relative_path,
+        "download_url": download_url,
+        "file_size_bytes": file.file_size_bytes,
+        "s3_key": file.s3_key,
+        "updated_at": file.updated_at.isoformat() if file.updated_at else None,
+    }
+
+
+def transform_manifest_node_to_response(
+    path: str,
+    node: Any | None,
+    child_nodes: list[Any] | None = None,
+    files: list[Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Transform a folder manifest node (and optionally its direct children) to API response
+
+    Args:
+        path: Requested folder-relative directory path ("" = folder root)
+        node: ProjectManifestNode or None if the directory does not exist remotely
+        child_nodes: Direct subdirectory nodes (None = children not requested)
+        files: Files directly in the directory (compact ProjectFile rows)
+
+    Returns:
+        Dictionary with path, hash, file_count and - if requested - directories and files
+    """
+    response: dict[str, Any] = {
+        "path": path,
+        "hash": node.node_hash if node else "0" * 64,
+        "file_count": node.file_count if node else 0,
+    }
+    if child_nodes is None:
+        return response
+
+    response["directories"] = [
+        {"name": child.path.rpartition("/")[2], "hash": child.node_hash, "file_count": child.file_count}
+        for child in child_nodes
+    ]
+    response["files"] = [
+        {"name": f.filename, "file_hash": f.file_hash, "file_size_bytes": f.file_size_bytes} for f in files or []
+    ]
+    return response
+
+
+def is_path_in_scopes(relative_path: str, scopes: list[str] | None) -> bool:
     """
-    Transform SongProject with folders and files to detailed API response
+    Check whether a folder-relative file path lies in one of the Mirror scopes
 
     Args:
-        project: SongProject DB model with loaded folders and files
+        relative_path: File path relative to the folder (e.g. "Samples/kick.wav")
+        scopes: Directory paths whose subtree is compared ("" = whole folder, None = no scoping)
 
     Returns:
-        Dictionary with complete project data including folders and files
+        True if the path is inside a scope
+
+    Examples:
+        >>> is_path_in_scopes("Samples/kick.wav", ["Samples"])
+        True
+        >>> is_path_in_scopes("SamplesOld/kick.wav", ["Samples"])
+        False
+        >>> is_path_in_scopes("mix.wav", [""])
+        True
+    """
+    if scopes is None:
+        return True
+    return any(scope == "" or relative_path.startswith(f"{scope.strip('/')}/") for scope in scopes)
+
+
+def compute_mirror_diff(
+    local_files: list[dict[str, Any]],
+    remote_files: list[Any],
+    folder_name: str,
+    project_s3_prefix: str,
+    scopes: list[str] | None = None,
+) -> dict[str, list[Any]]:
+    """
+    Diff local files against the remote files of a folder (Mirror sync)
+
+    Remote files store relative_path with the folder name ("01 Arrangement/Bounces/mix.wav"),
+    the CLI sends folder-relative paths ("Bounces/mix.wav") - both are normalized before comparing.
+    A file whose hash disappeared at exactly one remote path and appeared at exactly one local
+    path is reported as move instead of upload + delete.
+
+    Args:
+        local_files: Dicts with relative_path, file_hash, file_size_bytes
+        remote_files: ProjectFile rows (id, relative_path, file_hash, file_size_bytes, s3_key, storage_backend)
+        folder_name: Folder name (prefix of remote relative paths)
+        project_s3_prefix: Project S3 prefix (target key of moved per-file objects)
+        scopes: Folder-relative directories to compare (None = whole folder)
+
+    Returns:
+        Dict with to_upload, to_update, to_move, to_delete and unchanged
+    """
+    local_map: dict[str, dict[str, Any]] = {}
+    for f in local_files:
+        normalized_path = f["relative_path"].lstrip("/")
+        if is_path_in_scopes(normalized_path, scopes):
+            local_map[normalized_path] = {**f, "relative_path": normalized_path}
+
+    remote_map: dict[str, Any] = {}
+    for f in remote_files:
+        normalized_path = to_folder_relative_path(f.relative_path, folder_name)
+        if is_path_in_scopes(normalized_path, scopes):
+            remote_map[normalized_path] = f
+
+    to_upload = []
+    to_update = []
+    unchanged = []
+    local_hash_map: dict[str, list[str]] = {}
+    for rel_path, local_file in local_map.items():
+        local_hash_map.setdefault(local_file["file_hash"], []).append(rel_path)
+        remote_file = remote_map.get(rel_path)
+        if remote_file is None:
+            to_upload.append(rel_path)
+        elif local_file["file_hash"] != remote_file.file_hash:
+            to_update.append(rel_path)
+        else:
+            unchanged.append(rel_path)
+
+    to_delete = []
+    remote_hash_map: dict[str, list[str]] = {}
+    for rel_path, remote_file in remote_map.items():
+        remote_hash_map.setdefault(remote_file.file_hash, []).append(rel_path)
+        if rel_path not in local_map:
+            to_delete.append(
+                {
+                    "file_id": str(remote_file.id),
+                    "relative_path": rel_path,
+                    "file_size_bytes": remote_file.file_size_bytes,
+                }
+            )
+
+    # Move detection: same hash, different path (only clear 1:1 moves to avoid ambiguity)
+    to_move = []
+    moved_upload_paths = set()
+    moved_delete_ids = set()
+    for hash_val in local_hash_map.keys() & remote_hash_map.keys():
+        local_paths = set(local_hash_map[hash_val])
+        remote_paths = set(remote_hash_map[hash_val])
+        disappeared = remote_paths - local_paths
+        appeared = local_paths - remote_paths
+        if len(disappeared) != 1 or len(appeared) != 1:
+            continue
+
+        old_path = disappeared.pop()
+        new_path = appeared.pop()
+        remote_file = remote_map[old_path]
+        if is_content_addressed(remote_file):
+            new_s3_key = remote_file.s3_key  # Shared blob stays where it is
+        else:
+            new_s3_key = f"{project_s3_prefix.rstrip('/')}/{folder_name}/{new_path.lstrip('/')}"
+
+        to_move.append(
+            {
+                "file_id": str(remote_file.id),
+                "old_path": old_path,
+                "new_path": new_path,
+                "file_hash": hash_val,
+                "file_size_bytes": remote_file.file_size_bytes,
+                "s3_key_old": remote_file.s3_key,
+                "s3_key_new": new_s3_key,
+            }
+        )
+        moved_upload_paths.add(new_path)
+        moved_delete_ids.add(str(remote_file.id))
+
+    if to_move:
+        to_upload = [p for p in to_upload if p not in moved_upload_paths]
+        to_delete = [d for d in to_delete if d["file_id"] not in moved_delete_ids]
+
+    return {
+        "to_upload": to_upload,
+        "to_update": to_update,
+        "to_move": to_move,
+        "to_delete": to_delete,
+        "unchanged": unchanged,
+    }
+
+
+def transform_project_detail_to_response(project: Any, include_files: bool = True) -> dict[str, Any]:
+    """
+    Transform SongProject with folders (and files) to detailed API response
+
+    Totals come from the maintained file statistics of project and folders,
+    so the lightweight mode (include_files=False) never touches the files.
+
+    Args:
+        project: SongProject DB model with loaded folders (and folder files if include_files)
+        include_files: Add the file list to each folder
+
+    Returns:
+        Dictionary with project data, folders with statistics and optionally their files
     """
     response = transform_project_to_response(project)
 
-    # Add folders with their files
     folders_data = []
-    total_files_live = 0
-    total_size_live = 0
-
     for folder in project.folders:
         folder_data = transform_folder_to_response(folder)
-        folder_data["files"] = [transform_file_to_response(file) for file in folder.files]
+        if include_files:
+            folder_data["files"] = [transform_file_to_response(file) for file in folder.files]
         folders_data.append(folder_data)
 
-        # Calculate LIVE stats from actual files (Single Source of Truth)
-        total_files_live += len(folder.files)
-        total_size_live += sum(file.file_size_bytes for file in folder.files)
-
     response["folders"] = folders_data
-
-    # Add LIVE calculated values (always correct!)
-    response["total_files"] = total_files_live
-    response["total_size_bytes"] = total_size_live
+    response["total_files"] = project.file_count
+    response["total_size_bytes"] = project.total_size_bytes
+    response["files_modified_at"] = project.files_modified_at.isoformat() if project.files_modified_at else None
 
     return response
 
@@ -308,6 +537,32 @@ def calculate_pagination_meta(total: int, limit: int, offset: int) -> dict[str,
     }
 
 
+def calculate_cursor_pagination_meta(total: int | None, limit: int, next_cursor: str | None) -> dict[str, Any]:
+    """
+    Calculate pagination metadata for keyset (cursor) pagination
+
+    Args:
+        total: Total number of items, or None if not counted
+        limit: Items per page
+        next_cursor: Cursor of the next page, None on the last page
+
+    Returns:
+        Dictionary with pagination metadata
+
+    Examples:
+        >>> calculate_cursor_pagination_meta(None, 20, "abc")
+        {'total': None, 'limit': 20, 'next_cursor': 'abc', 'has_more': True}
+        >>> calculate_cursor_pagination_meta(15, 20, None)
+        {'total': 15, 'limit': 20, 'next_cursor': None, 'has_more': False}
+    """
+    return {
+        "total": total,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
+
+
 def normalize_project_name(project_name: str) -> str:
     """
     Normalize project name (trim whitespace)
@@ -346,6 +601,317 @@ def calculate_file_hash(file_data: bytes) -> str:
     return hashlib.sha256(file_data).hexdigest()
 
 
+def calculate_stream_hash(chunks: Iterable[bytes]) -> str:
+    """
+    Calculate SHA256 of content delivered in chunks (same result as calculate_file_hash)
+
+    Examples:
+        >>> calculate_stream_hash([b"Hello ", b"World"]) == calculate_file_hash(b"Hello World")
+        True
+    """
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_blob_s3_key(file_hash: str) -> str:
+    """
+    Build the object key of a content-addressed blob (shared by all files with this content)
+
+    Args:
+        file_hash: SHA256 hash of the content
+
+    Returns:
+        Object key in the song projects bucket
+
+    Examples:
+        >>> build_blob_s3_key("a591a6d40bf420404a011733cfb7b190d62c65bf0bcda32b57b277d9ad9f146e")
+        'blobs/sha256/a5/a591a6d40bf420404a011733cfb7b190d62c65bf0bcda32b57b277d9ad9f146e'
+    """
+    return f"blobs/sha256/{file_hash[:2]}/{file_hash}"
+
+
+def is_content_addressed(file: Any) -> bool:
+    """
+    Check if a file references a shared blob (object must not be moved or deleted per file)
+
+    Args:
+        file: ProjectFile model instance
+
+    Returns:
+        True if storage_backend is 'blob'
+    """
+    return getattr(file, "storage_backend", None) == "blob"
+
+
+def partition_claimable_files(
+    files: list[dict[str, Any]], blob_sizes: dict[str, int]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split files announced by a client into already stored (claimable) and missing ones
+
+    A file is claimable if a blob with the same hash exists and the announced size
+    matches the stored size (guards against bogus hash/size pairs).
+
+    Args:
+        files: Dicts with relative_path, file_hash, file_size_bytes
+        blob_sizes: Known blobs as file_hash -> file_size_bytes
+
+    Returns:
+        Tuple (claimable, missing), both in input order
+    """
+    claimable = []
+    missing = []
+    for file in files:
+        if blob_sizes.get(file["file_hash"]) == file["file_size_bytes"]:
+            claimable.append(file)
+        else:
+            missing.append(file)
+    return claimable, missing
+
+
+def build_upload_paths(folder_name: str, folder_s3_prefix: str, filename: str) -> tuple[str, str, str]:
+    """
+    Resolve an uploaded folder-relative filename (may contain subdirectories)
+
+    Args:
+        folder_name: Target folder name
+        folder_s3_prefix: Folder S3 prefix (ends with "/")
+        filename: Folder-relative path as sent by clients (e.g. "Drums/Kick.wav")
+
+    Returns:
+        Tuple (filename without directories, per-path S3 key, relative_path)
+
+    Raises:
+        ValueError: If filename contains no path component
+
+    Examples:
+        >>> build_upload_paths("Audio Files", "u/p/Audio Files/", "Drums/Kick.wav")
+        ('Kick.wav', 'u/p/Audio Files/Drums/Kick.wav', 'Audio Files/Drums/Kick.wav')
+        >>> build_upload_paths("Audio Files", "u/p/Audio Files/", "Kick.wav")
+        ('Kick.wav', 'u/p/Audio Files/Kick.wav', 'Audio Files/Kick.wav')
+    """
+    parts = [part for part in filename.replace("\\", "/").split("/") if part and part != "."]
+    if not parts:
+        raise ValueError(f"Invalid file path: {filename!r}")
+    folder_path = "/".join(parts)
+    return parts[-1], f"{folder_s3_prefix}{folder_path}", f"{folder_name}/{folder_path}"
+
+
+def calculate_upload_chunk_size(file_size_bytes: int, preferred_chunk_size: int) -> int:
+    """
+    Chunk size for a resumable upload (respects the S3 multipart limits)
+
+    Args:
+        file_size_bytes: Total file size
+        preferred_chunk_size: Configured chunk size
+
+    Returns:
+        Chunk size in bytes (>= 5 MiB, at most 10000 chunks, multiple of 1 MiB when enlarged)
+
+    Examples:
+        >>> calculate_upload_chunk_size(100 * 1024 * 1024, 16 * 1024 * 1024) // (1024 * 1024)
+        16
+        >>> calculate_upload_chunk_size(10, 1024)
+        5242880
+    """
+    chunk_size = max(preferred_chunk_size, MIN_UPLOAD_CHUNK_SIZE)
+    if -(-file_size_bytes // chunk_size) > MAX_UPLOAD_PARTS:
+        mib = 1024 * 1024
+        chunk_size = -(-file_size_bytes // MAX_UPLOAD_PARTS // mib) * mib
+        if chunk_size * MAX_UPLOAD_PARTS < file_size_bytes:
+            chunk_size += mib
+    return chunk_size
+
+
+def calculate_upload_part_count(file_size_bytes: int, chunk_size: int) -> int:
+    """
+    Number of chunks (S3 parts) of an upload
+
+    Examples:
+        >>> calculate_upload_part_count(10, 4)
+        3
+        >>> calculate_upload_part_count(8, 4)
+        2
+    """
+    return max(1, -(-file_size_bytes // chunk_size))
+
+
+def get_expected_part_size(part_number: int, file_size_bytes: int, chunk_size: int) -> int | None:
+    """
+    Expected size of one chunk (the last chunk holds the remainder)
+
+    Args:
+        part_number: 1-based part number
+        file_size_bytes: Total file size
+        chunk_size: Session chunk size
+
+    Returns:
+        Size in bytes, None if the part number is out of range
+
+    Examples:
+        >>> get_expected_part_size(3, 10, 4)
+        2
+        >>> get_expected_part_size(4, 10, 4) is None
+        True
+    """
+    part_count = calculate_upload_part_count(file_size_bytes, chunk_size)
+    if not 1 <= part_number <= part_count:
+        return None
+    if part_number < part_count:
+        return chunk_size
+    return file_size_bytes - (part_count - 1) * chunk_size
+
+
+def find_missing_upload_parts(part_count: int, received_parts: list[dict[str, Any]]) -> list[int]:
+    """
+    Part numbers that still have to be uploaded
+
+    Args:
+        part_count: Total number of parts
+        received_parts: Parts stored so far ({'part_number': int, ...})
+
+    Returns:
+        Sorted list of missing part numbers
+    """
+    received = {part["part_number"] for part in received_parts}
+    return [number for number in range(1, part_count + 1) if number not in received]
+
+
+def build_upload_staging_key(session_id: str) -> str:
+    """
+    Object key an upload session assembles its parts into (moved to the final key on completion)
+
+    Examples:
+        >>> build_upload_staging_key("1234")
+        'uploads/1234'
+    """
+    return f"uploads/{session_id}"
+
+
+def transform_upload_session_to_response(
+    session: Any, received_parts: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    """
+    Transform ProjectUploadSession to API response format
+
+    Args:
+        session: ProjectUploadSession DB model instance
+        received_parts: Parts stored so far (from S3), None for finished sessions
+
+    Returns:
+        Dictionary with session data, part layout and missing parts
+    """
+    part_count = calculate_upload_part_count(session.file_size_bytes, session.chunk_size)
+    received_parts = received_parts or []
+    return {
+        "id": str(session.id),
+        "relative_path": session.relative_path,
+        "file_hash": session.file_hash,
+        "file_size_bytes": session.file_size_bytes,
+        "chunk_size": session.chunk_size,
+        "part_count": part_count,
+        "received_parts": [part["part_number"] for part in received_parts],
+        "missing_parts": find_missing_upload_parts(part_count, received_parts) if session.status == "open" else [],
+        "status": session.status,
+        "file_id": str(session.file_id) if session.file_id else None,
+        "expires_at": session.expires_at.isoformat() if session.expires_at else None,
+    }
+
+
+def is_archive_compressible(filename: str) -> bool:
+    """
+    Check if a file is deflated in ZIP downloads (everything else is stored)
+
+    Examples:
+        >>> is_archive_compressible("lyrics.txt")
+        True
+        >>> is_archive_compressible("drums.wav")
+        False
+    """
+    extension = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+    return extension in ARCHIVE_DEFLATE_EXTENSIONS
+
+
+def build_archive_filename(project_name: str, folder_name: str | None = None) -> str:
+    """
+    Build the download filename of a project/folder ZIP (safe for Content-Disposition)
+
+    Examples:
+        >>> build_archive_filename("My Song", "01 Arrangement")
+        'My Song - 01 Arrangement.zip'
+        >>> build_archive_filename("AC/DC: Live?")
+        'AC_DC_ Live_.zip'
+    """
+    name = f"{project_name} - {folder_name}" if folder_name else project_name
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", name).strip(" .")
+    return f"{name or 'project'}.zip"
+
+
+def _unique_arcname(arcname: str, used: set[str]) -> str:
+    """Append " (2)", " (3)", ... before the extension if arcname is already taken"""
+    candidate = arcname
+    stem, dot, extension = arcname.rpartition(".")
+    if not stem or "/" in extension:
+        stem, dot, extension = arcname, "", ""
+    counter = 2
+    while candidate in used:
+        candidate = f"{stem} ({counter}){dot}{extension}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def build_archive_entries(
+    files: list[Any], folder_names: dict[Any, str], strip_folder: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Build ZIP entries for a project/folder download
+
+    Project downloads keep the folder name as top-level directory (same layout as
+    clone) and contain a directory entry for every folder (including empty ones).
+    Folder downloads (strip_folder=True) use folder-relative paths (same layout as download).
+
+    Args:
+        files: ProjectFile instances (compact columns are sufficient)
+        folder_names: folder_id -> folder_name (in archive order)
+        strip_folder: True = paths relative to the folder
+
+    Returns:
+        List of dicts with arcname, s3_key (None for directories), size, modified, compress
+    """
+    entries = []
+    if not strip_folder:
+        entries = [
+            {"arcname": f"{name}/", "s3_key": None, "size": 0, "modified": None, "compress": False}
+            for name in folder_names.values()
+        ]
+
+    used: set[str] = set()
+    for file in files:
+        path = file.relative_path.replace("\\", "/")
+        folder_name = folder_names.get(file.folder_id)
+        if folder_name is not None:
+            path = to_folder_relative_path(path, folder_name)
+        parts = [part for part in path.split("/") if part not in ("", ".", "..")]
+        if not parts:
+            continue
+        if folder_name is not None and not strip_folder:
+            parts.insert(0, folder_name)
+
+        entries.append(
+            {
+                "arcname": _unique_arcname("/".join(parts), used),
+                "s3_key": file.s3_key,
+                "size": file.file_size_bytes,
+                "modified": file.updated_at,
+                "compress": is_archive_compressible(file.filename),
+            }
+        )
+    return entries
+
+
 def transform_song_to_assigned_response(song: Any) -> dict[str, Any]:  # pragma: no cover
     """
     Transform Song DB model to assigned song API response format (pure function)
@@ -11,12 +11,14 @@ from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from config.settings import S3_SONG_RELEASES_BUCKET
+from db.pagination_helpers import InvalidCursorError
 from infrastructure.storage import get_storage
 
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+from business.image_derivative_orchestrator import image_derivative_orchestrator
 from business.song_release_transformer import (
     generate_s3_cover_key,
     transform_release_to_list_response,
@@ -26,8 +28,10 @@ from business.song_release_transformer import (
 )
 from db.song_release_service import song_release_service
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class SongReleaseOrchestrator:
     """Orchestrator for song release operations (coordinates services, NO business logic)"""
 
@@ -148,6 +152,7 @@ class SongReleaseOrchestrator:
                     return None, "Failed to update cover reference in database"
 
                 release.cover_s3_key = cover_s3_key
+                image_derivative_orchestrator.generate_derivatives(S3_SONG_RELEASES_BUCKET, cover_s3_key, file_data)
 
             # 6. Assign projects (CRUD in db_service)
             if project_ids:
@@ -222,6 +227,8 @@ class SongReleaseOrchestrator:
         offset: int = 0,
         status_filter: str | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         List releases with pagination and filters
@@ -230,18 +237,33 @@ class SongReleaseOrchestrator:
             db: Database session
             user_id: User ID (from JWT)
             limit: Max results per page
-            offset: Skip first N results
+            offset: Skip first N results (ignored in cursor mode)
             status_filter: Filter by status group
             search: Search in name/genre
+            cursor: Keyset cursor ("" = first page); None uses offset pagination
+            include_total: Count all matches in cursor mode (extra query)
 
         Returns:
             Dictionary with releases list and metadata
         """
         try:
             # 1. Get releases from DB (CRUD in db_service)
-            releases, total = self.db_service.get_releases_paginated(
-                db, user_id, limit=limit, offset=offset, status_filter=status_filter, search=search
-            )
+            if cursor is not None:
+                releases, total, next_cursor = self.db_service.get_releases_by_cursor(
+                    db,
+                    user_id,
+                    cursor=cursor,
+                    limit=limit,
+                    status_filter=status_filter,
+                    search=search,
+                    include_total=include_total,
+                )
+                page = {"total": total, "limit": limit, "next_cursor": next_cursor, "has_more": next_cursor is not None}
+            else:
+                releases, total = self.db_service.get_releases_paginated(
+                    db, user_id, limit=limit, offset=offset, status_filter=status_filter, search=search
+                )
+                page = {"total": total, "limit": limit, "offset": offset}
 
             # 2. Transform to list responses (business logic in transformer)
             items = [transform_release_to_list_response(release) for release in releases]
@@ -251,9 +273,12 @@ class SongReleaseOrchestrator:
             for i, release in enumerate(releases):
                 if release.cover_s3_key:
                     items[i]["cover_url"] = f"/api/v1/song-releases/{release.id}/cover"
+                    items[i]["cover_thumbnail_url"] = f"/api/v1/song-releases/{release.id}/cover?size=thumb"
 
-            return {"items": items, "total": total, "limit": limit, "offset": offset}
+            return {"items": items, **page}
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("List releases orchestration failed", error=str(e), user_id=str(user_id))
             return {"items": [], "total": 0, "limit": limit, "offset": offset}
@@ -370,6 +395,12 @@ class SongReleaseOrchestrator:
             if cover_file and old_cover_s3_key and old_cover_s3_key != update_data.get("cover_s3_key"):
                 self.storage.delete(old_cover_s3_key)
 
+            # Derivative keys don't depend on the cover extension - regenerating replaces the old ones
+            if cover_file:
+                image_derivative_orchestrator.generate_derivatives(
+                    S3_SONG_RELEASES_BUCKET, update_data["cover_s3_key"], cover_file[0]
+                )
+
             # 6. Update project assignments if provided (CRUD in db_service)
             if project_ids is not None:
                 assign_success = self.db_service.assign_projects(db, release_id, project_ids)
@@ -412,6 +443,7 @@ class SongReleaseOrchestrator:
             # 3. Delete cover from S3 if exists (infrastructure)
             if release.cover_s3_key:
                 self.storage.delete(release.cover_s3_key)
+                image_derivative_orchestrator.delete_derivatives(S3_SONG_RELEASES_BUCKET, release.cover_s3_key)
                 logger.debug("Cover deleted from S3", s3_key=release.cover_s3_key)
 
             logger.info("Release deleted with cleanup", release_id=str(release_id))
@@ -1,9 +1,22 @@
 """Song Transformer - Pure functions for song data transformations"""
 
 import re
+from datetime import datetime, timedelta
 from typing import Any
 
 
+# (Mureka URL attribute, S3 key attribute) per choice file type
+CHOICE_FILE_ATTRIBUTES = {
+    "mp3": ("mp3_url", "mp3_s3_key"),
+    "flac": ("flac_url", "flac_s3_key"),
+    "wav": ("wav_url", "wav_s3_key"),
+    "stems": ("stem_url", "stem_s3_key"),
+}
+
+# Upper bound for the exponential migration retry backoff
+MAX_MIGRATION_RETRY_DELAY_SECONDS = 6 * 3600
+
+
 class SongTransformer:
     """Transform song and choice data to various formats (pure functions)"""
 
@@ -214,3 +227,73 @@ def generate_s3_song_key(song_id: str, song_title: str | None, choice_index: int
     # Build S3 key: {title_id-short}/choice-{index}/{filename}
     # NOTE: Bucket name ('songs') is NOT part of the key!
     return f"{sanitized_title}_{song_id_short}/choice-{choice_index}/{filename}"
+
+
+def get_pending_migration_types(choice: Any, file_types: list[str]) -> list[str]:
+    """
+    Get file types of a choice that have a Mureka URL but no S3 copy yet
+
+    Pure function - no dependencies, fully unit-testable
+
+    Args:
+        choice: SongChoice model object
+        file_types: File types to consider ('mp3', 'flac', 'wav', 'stems')
+
+    Returns:
+        Pending file types (in CHOICE_FILE_ATTRIBUTES order)
+    """
+    pending = []
+    for file_type, (url_attribute, s3_key_attribute) in CHOICE_FILE_ATTRIBUTES.items():
+        if file_type in file_types and getattr(choice, url_attribute) and not getattr(choice, s3_key_attribute):
+            pending.append(file_type)
+    return pending
+
+
+def is_migration_due(attempts: int, next_attempt_at: datetime | None, max_attempts: int, now: datetime) -> bool:
+    """
+    Check if a choice may be (re)submitted for migration - same rules as the background worker
+
+    Pure function - no dependencies, fully unit-testable
+
+    Args:
+        attempts: Failed attempts so far
+        next_attempt_at: End of the backoff or lease (None = not scheduled)
+        max_attempts: Choices that failed this often are given up
+        now: Current time
+
+    Returns:
+        True if the attempt limit is not reached and no backoff/lease is running
+
+    Examples:
+        >>> is_migration_due(0, None, 5, datetime(2025, 1, 1))
+        True
+        >>> is_migration_due(5, None, 5, datetime(2025, 1, 1))
+        False
+        >>> is_migration_due(1, datetime(2025, 1, 2), 5, datetime(2025, 1, 1))
+        False
+    """
+    return attempts < max_attempts and (next_attempt_at is None or next_attempt_at <= now)
+
+
+def calculate_migration_retry_at(now: datetime, attempts: int, backoff_seconds: float) -> datetime:
+    """
+    Calculate the earliest retry of a failed migration (exponential backoff, capped at 6 hours)
+
+    Pure function - no dependencies, fully unit-testable
+
+    Args:
+        now: Time of the failure
+        attempts: Failed attempts including this one (>= 1)
+        backoff_seconds: Delay after the first failure
+
+    Returns:
+        Retry time
+
+    Examples:
+        >>> calculate_migration_retry_at(datetime(2025, 1, 1), 1, 60)
+        datetime.datetime(2025, 1, 1, 0, 1)
+        >>> calculate_migration_retry_at(datetime(2025, 1, 1), 3, 60)
+        datetime.datetime(2025, 1, 1, 0, 4)
+    """
+    delay = min(backoff_seconds * 2 ** max(attempts - 1, 0), MAX_MIGRATION_RETRY_DELAY_SECONDS)
+    return now + timedelta(seconds=delay)
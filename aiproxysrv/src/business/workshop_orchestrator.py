@@ -9,6 +9,7 @@ from business.workshop_normalizer import WorkshopNormalizer
 from db.sketch_service import sketch_service
 from db.workshop_service import workshop_service
 from utils.logger import logger
+from utils.tracing import KIND_ORCHESTRATOR, trace_methods
 
 
 class WorkshopOrchestratorError(Exception):
@@ -17,6 +18,7 @@ class WorkshopOrchestratorError(Exception):
     pass
 
 
+@trace_methods(KIND_ORCHESTRATOR)
 class WorkshopOrchestrator:
     """Orchestrates workshop operations (calls normalizer + repository)"""
 
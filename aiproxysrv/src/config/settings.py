@@ -48,6 +48,8 @@ CLAUDE_CHAT_MODELS = os.getenv(
 )
 CLAUDE_TIMEOUT = int(os.getenv("CLAUDE_TIMEOUT", "120"))
 CLAUDE_MAX_TOKENS = int(os.getenv("CLAUDE_MAX_TOKENS", "4096"))
+# Prompt caching: cache breakpoints on system prompt + conversation history prefix
+CLAUDE_PROMPT_CACHE = os.getenv("CLAUDE_PROMPT_CACHE", "true").lower() == "true"
 
 # --------------------------------------------------
 # Image URL Config
@@ -65,6 +67,12 @@ DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 # loguru
 # --------------------------------------------------
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "WARNING")
+# Output format: text (colored, human-readable) or json (one JSON object per line for log shipping)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# Write log lines from a background thread instead of the request thread (default: on for json)
+LOG_ENQUEUE = os.getenv("LOG_ENQUEUE", "true" if LOG_FORMAT == "json" else "false").lower() == "true"
+# Max serialized size per extra field (long strings / large payloads are cut before serialization)
+LOG_MAX_FIELD_CHARS = int(os.getenv("LOG_MAX_FIELD_CHARS", "2000"))
 
 
 # --------------------------------------------------
@@ -72,6 +80,44 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "WARNING")
 # --------------------------------------------------
 CHAT_DEBUG_LOGGING = os.getenv("CHAT_DEBUG_LOGGING", "false").lower() == "true"
 
+# --------------------------------------------------
+# Prometheus Metrics (/metrics)
+# --------------------------------------------------
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# Optional bearer token required to scrape /metrics (empty = no auth, restrict via network instead)
+METRICS_AUTH_TOKEN = os.getenv("METRICS_AUTH_TOKEN", "")
+# Per-call LLM telemetry (tokens, TTFT, durations) in llm_call_telemetry, rollups via /api/v1/llm-telemetry
+LLM_TELEMETRY_ENABLED = os.getenv("LLM_TELEMETRY_ENABLED", "true").lower() == "true"
+
+# --------------------------------------------------
+# Request Profiler (opt-in, see utils/profiler.py)
+# --------------------------------------------------
+# Secret for signed profile triggers and the admin routes /api/v1/admin/profiles (empty = profiler off)
+PROFILER_SECRET = os.getenv("PROFILER_SECRET", "")
+# Fraction of untriggered requests that are profiled anyway (0.0 = only signed requests)
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+# "sampling" = speedscope flame graph (low overhead), "cprofile" = pstats (exact, slower)
+PROFILER_MODE = os.getenv("PROFILER_MODE", "sampling")
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "1"))
+# On-disk ring shared by all workers, oldest profiles are deleted beyond PROFILER_MAX_PROFILES
+PROFILER_DIR = os.getenv("PROFILER_DIR", "/tmp/aiproxy-profiles")
+PROFILER_MAX_PROFILES = int(os.getenv("PROFILER_MAX_PROFILES", "50"))
+
+# --------------------------------------------------
+# Request Tracing (see utils/tracing.py)
+# --------------------------------------------------
+# Trace every request: spans for route, controller, orchestrator, DB, S3 and LLM calls + X-Trace-Id header
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+# Bearer token for the admin routes /api/v1/admin/traces (empty = routes answer 401), also unlocks the
+# Server-Timing header as X-Trace-Token request header (otherwise only sent with DEBUG)
+TRACING_ADMIN_TOKEN = os.getenv("TRACING_ADMIN_TOKEN", "")
+# Finished traces kept in memory (per worker process)
+TRACING_RING_SIZE = int(os.getenv("TRACING_RING_SIZE", "200"))
+# Spans recorded per trace; further spans are only counted (e.g. one query per file in a loop)
+TRACING_MAX_SPANS = int(os.getenv("TRACING_MAX_SPANS", "500"))
+# Append finished traces as OTLP/JSON lines (OpenTelemetry collector file format), empty = off
+TRACING_OTLP_FILE = os.getenv("TRACING_OTLP_FILE", "")
+
 
 # --------------------------------------------------
 # Image Storage Config
@@ -80,6 +126,16 @@ IMAGES_DIR = os.getenv("IMAGES_DIR", "./images" if DEBUG else "/images")
 # Control if physical files should be deleted (defaults to true if not set)
 # Only set to false in special cases where you want to keep files but delete DB records
 DELETE_PHYSICAL_FILES = os.getenv("DELETE_PHYSICAL_FILES", "true").lower() == "true"
+# Image derivatives (thumb/preview, served via ?size=) are generated on save and
+# backfilled by scripts/backfill_image_derivatives.py
+IMAGE_DERIVATIVES_ENABLED = os.getenv("IMAGE_DERIVATIVES_ENABLED", "true").lower() == "true"
+IMAGE_DERIVATIVE_FORMAT = os.getenv("IMAGE_DERIVATIVE_FORMAT", "webp").lower()  # 'webp' or 'jpeg'
+IMAGE_DERIVATIVE_QUALITY = int(os.getenv("IMAGE_DERIVATIVE_QUALITY", "80"))
+# Text overlay live preview: rendered at reduced resolution from an in-memory LRU of
+# decoded source images (per process), returned directly without storing anything
+TEXT_OVERLAY_PREVIEW_MAX_EDGE = int(os.getenv("TEXT_OVERLAY_PREVIEW_MAX_EDGE", "1024"))
+TEXT_OVERLAY_PREVIEW_CACHE_SIZE = int(os.getenv("TEXT_OVERLAY_PREVIEW_CACHE_SIZE", "16"))
+TEXT_OVERLAY_PREVIEW_QUALITY = int(os.getenv("TEXT_OVERLAY_PREVIEW_QUALITY", "80"))
 
 # --------------------------------------------------
 # S3 Storage Config (MinIO / AWS / Backblaze / Wasabi)
@@ -97,6 +153,27 @@ S3_ACCESS_KEY = os.getenv("S3_ACCESS_KEY", "minioadmin")
 S3_SECRET_KEY = os.getenv("S3_SECRET_KEY", "minioadmin")
 S3_REGION = os.getenv("S3_REGION", "us-east-1")
 
+# Content-addressed song project storage: identical file content is stored once
+# (blobs/sha256/..., reference counted) and re-uploads can be claimed by hash
+SONG_PROJECT_DEDUP_ENABLED = os.getenv("SONG_PROJECT_DEDUP_ENABLED", "false").lower() == "true"
+# Unreferenced blobs are garbage collected (scripts/gc_project_blobs.py) only after this grace period
+SONG_PROJECT_BLOB_GC_GRACE_HOURS = float(os.getenv("SONG_PROJECT_BLOB_GC_GRACE_HOURS", "24"))
+# Resumable upload sessions: preferred chunk (S3 multipart part) size, min 5 MB (S3 limit)
+SONG_PROJECT_UPLOAD_CHUNK_SIZE_MB = int(os.getenv("SONG_PROJECT_UPLOAD_CHUNK_SIZE_MB", "16"))
+# Open upload sessions expire after this much inactivity; expired parts are aborted by scripts/cleanup_upload_sessions.py
+SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS = float(os.getenv("SONG_PROJECT_UPLOAD_SESSION_TTL_HOURS", "24"))
+# Background Mureka CDN -> S3 migration of song choices (first play never waits on the transfer)
+SONG_MIGRATION_ENABLED = os.getenv("SONG_MIGRATION_ENABLED", "true").lower() == "true"
+# File types migrated proactively (scripts/migrate_song_choices.py) and after a first play
+SONG_MIGRATION_FILE_TYPES = [
+    t.strip() for t in os.getenv("SONG_MIGRATION_FILE_TYPES", "mp3,flac,wav,stems").split(",") if t.strip()
+]
+# Parallel transfers per process (each holds one multipart part in memory)
+SONG_MIGRATION_CONCURRENCY = int(os.getenv("SONG_MIGRATION_CONCURRENCY", "2"))
+# Failed choices are retried with exponential backoff (base seconds) until max attempts
+SONG_MIGRATION_MAX_ATTEMPTS = int(os.getenv("SONG_MIGRATION_MAX_ATTEMPTS", "5"))
+SONG_MIGRATION_RETRY_BACKOFF_SECONDS = float(os.getenv("SONG_MIGRATION_RETRY_BACKOFF_SECONDS", "60"))
+
 # --------------------------------------------------
 # Ollama Config
 # --------------------------------------------------
@@ -140,3 +217,7 @@ DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
 DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
 DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
 DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))  # 1 hour default
+
+# Per-request SQL instrumentation
+# Statements slower than DB_SLOW_QUERY_MS are logged as warnings
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "250"))
@@ -12,7 +12,9 @@ from config.settings import (
     DATABASE_POOL_RECYCLE,
     DATABASE_POOL_SIZE,
     DATABASE_URL,
+    DB_SLOW_QUERY_MS,
 )
+from db.query_stats import InstrumentedQueuePool, install_query_instrumentation
 from utils.logger import logger  # Direct import to avoid circular dependency with utils.__init__
 
 
@@ -49,6 +51,7 @@ def _create_engine():
             engine = create_engine(
                 DATABASE_URL,
                 echo=DATABASE_ECHO,
+                poolclass=InstrumentedQueuePool,  # QueuePool + pool wait metric
                 pool_size=DATABASE_POOL_SIZE,
                 max_overflow=DATABASE_MAX_OVERFLOW,
                 pool_pre_ping=DATABASE_POOL_PRE_PING,
@@ -62,6 +65,9 @@ def _create_engine():
                 pool_pre_ping=DATABASE_POOL_PRE_PING,
                 pool_recycle=DATABASE_POOL_RECYCLE,
             )
+
+        # Query count / DB time / connection hold time per request (see db.query_stats)
+        install_query_instrumentation(engine, slow_query_ms=DB_SLOW_QUERY_MS)
         return engine
     except Exception as e:
         logger.error("Database engine creation failed", error=str(e), error_type=type(e).__name__)
@@ -76,6 +82,23 @@ def get_engine():
     return _engine
 
 
+def reset_engine_after_fork():
+    """
+    Forget pooled connections inherited from the parent process (gunicorn preload_app)
+
+    close=False: the sockets still belong to the parent, they are dropped without
+    sending a terminate message. The worker opens its own connections on first use.
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+def close_engine():
+    """Close all pooled connections (worker shutdown) - the server sees a clean disconnect"""
+    if _engine is not None:
+        _engine.dispose()
+
+
 # For backwards compatibility (some code imports 'engine' directly)
 # This creates a property-like behavior
 class _EngineLazy:
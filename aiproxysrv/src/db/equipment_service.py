@@ -9,10 +9,11 @@ CRITICAL: This is a PURE CRUD layer (no business logic, no encryption).
 
 import uuid
 
-from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from db.models import Equipment
+from db.pagination_helpers import InvalidCursorError, apply_keyset_pagination, build_keyset_page
+from db.search_helpers import apply_fulltext_search
 from utils.logger import logger
 
 
@@ -99,6 +100,8 @@ class EquipmentService:
         type_filter: str | None = None,
         status_filter: str | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict:
         """
         Get paginated equipment list with filters.
@@ -111,10 +114,15 @@ class EquipmentService:
             type_filter: Filter by type ('Software' | 'Plugin')
             status_filter: Filter by status ('active' | 'trial' | 'expired' | 'archived')
             search: Search in name, manufacturer, tags
+            cursor: Keyset cursor ("" = first page), sorts by (name, id); None uses offset
+            include_total: Count all matches in cursor mode (offset mode always counts)
 
         Returns:
             Dict with 'data' (list of Equipment) and 'pagination' metadata
 
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another sort order
+
         Example:
             result = equipment_service.get_equipment_paginated(
                 db, user_id, limit=20, offset=0, type_filter='Software', search='Logic'
@@ -129,22 +137,44 @@ class EquipmentService:
                 query = query.filter(Equipment.type == type_filter)
             if status_filter:
                 query = query.filter(Equipment.status == status_filter)
-            if search:
-                search_pattern = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        Equipment.name.ilike(search_pattern),
-                        Equipment.manufacturer.ilike(search_pattern),
-                        Equipment.software_tags.ilike(search_pattern),
-                        Equipment.plugin_tags.ilike(search_pattern),
-                    )
+            query, search_rank = apply_fulltext_search(query, Equipment.search_vector, search)
+
+            if cursor is not None:
+                # Keyset mode: alphabetical only (relevance rank is not a stable cursor key)
+                total = query.count() if include_total else None
+                query = apply_keyset_pagination(query, Equipment.name, Equipment.id, "asc", cursor, limit)
+                equipment_list, next_cursor = build_keyset_page(query.all(), limit, Equipment.name, "asc")
+
+                logger.debug(
+                    "Equipment list retrieved by cursor",
+                    total=total,
+                    limit=limit,
+                    has_more=next_cursor is not None,
+                    user_id=user_id,
+                    type_filter=type_filter,
+                    status_filter=status_filter,
+                    search=search,
                 )
 
+                return {
+                    "data": equipment_list,
+                    "pagination": {
+                        "total": total,
+                        "limit": limit,
+                        "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None,
+                    },
+                }
+
             # Get total count
             total = query.count()
 
-            # Apply pagination (sorted alphabetically by name)
-            equipment_list = query.order_by(Equipment.name.asc()).offset(offset).limit(limit).all()
+            # Apply pagination (best matches first when searching, then alphabetically by name)
+            if search_rank is not None:
+                query = query.order_by(search_rank.desc(), Equipment.name.asc())
+            else:
+                query = query.order_by(Equipment.name.asc())
+            equipment_list = query.offset(offset).limit(limit).all()
 
             logger.debug(
                 "Equipment list retrieved",
@@ -161,6 +191,8 @@ class EquipmentService:
                 "data": equipment_list,
                 "pagination": {"total": total, "limit": limit, "offset": offset, "has_more": (offset + limit) < total},
             }
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("Failed to get equipment list", error=str(e), user_id=user_id)
             return {"data": [], "pagination": {"total": 0, "limit": limit, "offset": offset, "has_more": False}}
@@ -4,6 +4,8 @@ from sqlalchemy.orm import joinedload
 
 from db.database import SessionLocal
 from db.models import GeneratedImage
+from db.pagination_helpers import apply_keyset_pagination, build_keyset_page
+from db.search_helpers import apply_fulltext_search
 from utils.logger import logger
 
 
@@ -120,21 +122,13 @@ class ImageService:
         try:
             query = db.query(GeneratedImage).options(joinedload(GeneratedImage.project_references))
 
-            # Apply search filter if provided
-            if search:
-                search_term = f"%{search}%"
-                from sqlalchemy import or_
-
-                query = query.filter(
-                    or_(
-                        GeneratedImage.title.ilike(search_term),
-                        GeneratedImage.user_prompt.ilike(search_term),
-                        GeneratedImage.prompt.ilike(search_term),
-                    )
-                )
+            # Apply full-text search filter if provided (GIN index on search_vector)
+            query, search_rank = apply_fulltext_search(query, GeneratedImage.search_vector, search)
 
             # Apply sorting
-            if sort_by == "title":
+            if sort_by == "relevance" and search_rank is not None:
+                query = query.order_by(search_rank.desc(), GeneratedImage.created_at.desc())
+            elif sort_by == "title":
                 # Handle null titles by treating them as empty strings for sorting
                 if sort_direction == "desc":
                     query = query.order_by(GeneratedImage.title.desc().nullslast())
@@ -155,6 +149,25 @@ class ImageService:
         finally:
             db.close()
 
+    @staticmethod
+    def get_images_by_cursor(
+        cursor: str = "", limit: int = 20, search: str = "", sort_direction: str = "desc"
+    ) -> tuple[list[GeneratedImage], str | None]:
+        """Get images with keyset pagination (created_at, id), returns (images, next_cursor)"""
+        db = SessionLocal()
+        try:
+            query = db.query(GeneratedImage).options(joinedload(GeneratedImage.project_references))
+
+            # Apply full-text search filter if provided (GIN index on search_vector)
+            query, _ = apply_fulltext_search(query, GeneratedImage.search_vector, search)
+
+            query = apply_keyset_pagination(
+                query, GeneratedImage.created_at, GeneratedImage.id, sort_direction, cursor, limit
+            )
+            return build_keyset_page(query.all(), limit, GeneratedImage.created_at, sort_direction)
+        finally:
+            db.close()
+
     @staticmethod
     def get_total_images_count(search: str = "") -> int:
         """Get total count of generated images with optional search filter"""
@@ -162,18 +175,8 @@ class ImageService:
         try:
             query = db.query(GeneratedImage)
 
-            # Apply search filter if provided
-            if search:
-                search_term = f"%{search}%"
-                from sqlalchemy import or_
-
-                query = query.filter(
-                    or_(
-                        GeneratedImage.title.ilike(search_term),
-                        GeneratedImage.user_prompt.ilike(search_term),
-                        GeneratedImage.prompt.ilike(search_term),
-                    )
-                )
+            # Apply full-text search filter if provided (GIN index on search_vector)
+            query, _ = apply_fulltext_search(query, GeneratedImage.search_vector, search)
 
             return query.count()
         finally:
@@ -0,0 +1,106 @@
+"""LLM Telemetry Service - Database operations for per-call LLM telemetry (Repository Layer)
+
+Pure CRUD / aggregation, no business logic.
+Record building and response formatting are in business/llm_telemetry_transformer.py
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Date, Float, case, cast, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from db.models import LlmCallTelemetry
+from utils.logger import logger
+
+
+class LlmTelemetryService:
+    """Service for LLM telemetry database operations"""
+
+    def insert_call(self, db: Session, provider: str, model: str, source: str | None, **fields: Any) -> bool:
+        """
+        Store the telemetry of one LLM call
+
+        Args:
+            db: Database session
+            provider: 'ollama', 'openai' or 'claude'
+            model: Model name
+            source: Calling feature (e.g. 'conversation', 'lyrics/generate')
+            **fields: Token counts and timings (see LlmCallTelemetry)
+
+        Returns:
+            True if stored, False on database error
+        """
+        try:
+            db.add(LlmCallTelemetry(provider=provider, model=model[:100], source=source and source[:100], **fields))
+            db.commit()
+            return True
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning("LLM telemetry insert failed", provider=provider, model=model, error=str(e))
+            return False
+
+    def get_rollup(
+        self,
+        db: Session,
+        since: datetime,
+        per_day: bool,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate telemetry per model (and day) with p50/p95 percentiles (PostgreSQL percentile_cont)
+
+        Args:
+            db: Database session
+            since: Only calls created at or after this time
+            per_day: Group by UTC day in addition to provider/model
+            provider: Optional provider filter
+            model: Optional model filter
+
+        Returns:
+            List of aggregate dicts (day, provider, model, calls, token sums, <metric>_p50/_p95)
+        """
+        t = LlmCallTelemetry
+        # Generation speed: Ollama reports the pure generation time, other providers only wall time
+        generation_ms = cast(func.coalesce(t.eval_ms, t.total_ms), Float)
+        tokens_per_second = case(
+            (generation_ms > 0, cast(t.completion_tokens, Float) * 1000.0 / generation_ms),
+            else_=None,
+        )
+        metrics = {
+            "ttft_ms": t.ttft_ms,
+            "total_ms": t.total_ms,
+            "queue_wait_ms": t.queue_wait_ms,
+            "load_ms": t.load_ms,
+            "tokens_per_second": tokens_per_second,
+        }
+
+        group_columns = [t.provider, t.model]
+        if per_day:
+            day = cast(func.timezone("UTC", t.created_at), Date).label("day")
+            group_columns.insert(0, day)
+
+        columns = [
+            *group_columns,
+            func.count(t.id).label("calls"),
+            func.sum(t.prompt_tokens).label("prompt_tokens"),
+            func.sum(t.completion_tokens).label("completion_tokens"),
+        ]
+        for name, expression in metrics.items():
+            columns.append(func.percentile_cont(0.5).within_group(expression).label(f"{name}_p50"))
+            columns.append(func.percentile_cont(0.95).within_group(expression).label(f"{name}_p95"))
+
+        query = db.query(*columns).filter(t.created_at >= since)
+        if provider:
+            query = query.filter(t.provider == provider)
+        if model:
+            query = query.filter(t.model == model)
+
+        rows = query.group_by(*group_columns).order_by(*group_columns).all()
+        return [row._asdict() for row in rows]
+
+
+# Global service instance
+llm_telemetry_service = LlmTelemetryService()
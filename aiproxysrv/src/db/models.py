@@ -8,20 +8,24 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSON, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from db.database import Base
+from db.search_helpers import build_search_vector_sql
 
 
 class SongStatus(StrEnum):
@@ -76,6 +80,16 @@ class SongSketch(Base):
         UUID(as_uuid=True), ForeignKey("project_folders.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
+    # Full-text search (generated column, GIN index, never loaded by default)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                build_search_vector_sql({"title": "A", "tags": "B", "prompt": "C", "lyrics": "D"}), persisted=True
+            ),
+        )
+    )
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -179,6 +193,11 @@ class Song(Base):
     mureka_response = Column(Text, nullable=True)  # JSON string der kompletten MUREKA Response
     mureka_status = Column(String(100), nullable=True)
 
+    # Full-text search (generated column, GIN index, never loaded by default)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(build_search_vector_sql({"title": "A", "tags": "B", "lyrics": "C"}), persisted=True))
+    )
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -216,6 +235,11 @@ class SongChoice(Base):
     wav_s3_key = Column(String(500), nullable=True)  # S3 key for WAV audio file
     stem_s3_key = Column(String(500), nullable=True)  # S3 key for stems ZIP file
 
+    # Background CDN -> S3 migration (next_attempt_at doubles as lease while a transfer runs)
+    s3_migration_attempts = Column(Integer, nullable=False, server_default="0")
+    s3_migration_error = Column(Text, nullable=True)
+    s3_migration_next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+
     # Metadata
     duration = Column(Float, nullable=True)  # Duration in milliseconds (as returned by MUREKA)
     title = Column(String(500), nullable=True)
@@ -263,6 +287,14 @@ class GeneratedImage(Base):
     detail_level = Column(String(50), nullable=True)  # minimal, moderate, highly-detailed
     text_overlay_metadata = Column(JSON, nullable=True)  # Metadata for text overlays (title, artist, font_style, etc.)
 
+    # Full-text search (generated column, GIN index, never loaded by default)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(build_search_vector_sql({"title": "A", "user_prompt": "B", "prompt": "C"}), persisted=True),
+        )
+    )
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -400,6 +432,10 @@ class Message(Base):
     # Token tracking
     token_count = Column(Integer, nullable=True)  # Token count for this message
 
+    # Prompt cache usage (Claude only, NULL for providers without prompt caching)
+    cache_creation_tokens = Column(Integer, nullable=True)  # Prefix tokens written to cache (1.25x input price)
+    cache_read_tokens = Column(Integer, nullable=True)  # Prefix tokens served from cache (0.1x input price)
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -511,6 +547,39 @@ class ApiCostMonthly(Base):
         return f"<ApiCostMonthly(provider='{self.provider}', year={self.year}, month={self.month}, total={self.total_cost}, finalized={self.is_finalized})>"
 
 
+class LlmCallTelemetry(Base):
+    """Model for per-call LLM performance telemetry (one row per Ollama/OpenAI/Claude call)"""
+
+    __tablename__ = "llm_call_telemetry"
+    __table_args__ = (
+        Index("idx_llm_call_telemetry_created_model", "created_at", "model"),
+        {"extend_existing": True},
+    )
+
+    # Compact append-only table: integer key, durations in milliseconds
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    provider = Column(String(20), nullable=False)  # 'ollama', 'openai', 'claude'
+    model = Column(String(100), nullable=False)
+    source = Column(String(100), nullable=True)  # 'conversation', 'compression', template 'category/action'
+
+    # Token usage
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+
+    # Timings (ms) - NULL if the provider does not report them
+    total_ms = Column(Integer, nullable=False)  # Wall time of the API call
+    queue_wait_ms = Column(Integer, nullable=True)  # Wall time not spent in the model (queue + network)
+    ttft_ms = Column(Integer, nullable=True)  # Time to first token
+    load_ms = Column(Integer, nullable=True)  # Model load time (Ollama)
+    prompt_eval_ms = Column(Integer, nullable=True)  # Prompt processing (Ollama)
+    eval_ms = Column(Integer, nullable=True)  # Token generation (Ollama)
+
+    def __repr__(self):
+        return f"<LlmCallTelemetry(id={self.id}, provider='{self.provider}', model='{self.model}', total_ms={self.total_ms})>"
+
+
 class Equipment(Base):
     """Model for storing software and plugin licenses with encrypted sensitive data"""
 
@@ -558,6 +627,17 @@ class Equipment(Base):
     # User ownership (JWT-based access control)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
 
+    # Full-text search (generated column, GIN index, never loaded by default)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                build_search_vector_sql({"name": "A", "manufacturer": "B", "software_tags": "B", "plugin_tags": "B"}),
+                persisted=True,
+            ),
+        )
+    )
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -623,6 +703,16 @@ class SongProject(Base):
     tags = Column(ARRAY(String), server_default="{}")
     description = Column(Text, nullable=True)
 
+    # Full-text search (generated column, GIN index, never loaded by default)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(build_search_vector_sql({"project_name": "A", "description": "B"}), persisted=True))
+    )
+
+    # File statistics (maintained by song_project_service on every file change)
+    file_count = Column(Integer, nullable=False, server_default="0")
+    total_size_bytes = Column(BigInteger, nullable=False, server_default="0")
+    files_modified_at = Column(DateTime(timezone=True), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -657,6 +747,11 @@ class ProjectFolder(Base):
     s3_prefix = Column(String(255), nullable=True)
     custom_icon = Column(String(50), nullable=True)
 
+    # File statistics (maintained by song_project_service on every file change)
+    file_count = Column(Integer, nullable=False, server_default="0")
+    total_size_bytes = Column(BigInteger, nullable=False, server_default="0")
+    files_modified_at = Column(DateTime(timezone=True), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -693,7 +788,7 @@ class ProjectFile(Base):
     file_size_bytes = Column(BigInteger, nullable=True)  # BigInteger supports files >2GB
     file_hash = Column(String(64), nullable=True)
 
-    # Sync
+    # Sync ('s3' = object under the project prefix, 'blob' = shared ProjectFileBlob)
     storage_backend = Column(String(20), server_default="s3")
     is_synced = Column(Boolean, server_default="false")
 
@@ -708,6 +803,93 @@ class ProjectFile(Base):
         return f"<ProjectFile(id={self.id}, filename='{self.filename}', synced={self.is_synced}')>"
 
 
+class ProjectFileBlob(Base):
+    """Content-addressed song project file content (stored once, referenced by ProjectFile.file_hash)"""
+
+    __tablename__ = "project_file_blobs"
+    __table_args__ = {"extend_existing": True}
+
+    file_hash = Column(String(64), primary_key=True)  # SHA256 of the content
+    s3_key = Column(String(255), nullable=False)
+    file_size_bytes = Column(BigInteger, nullable=False)
+    mime_type = Column(String(100), nullable=True)
+
+    # Number of ProjectFile rows with storage_backend='blob' pointing here (maintained by song_project_service)
+    ref_count = Column(Integer, nullable=False, server_default="0")
+    # Set when ref_count drops to 0, garbage collected after the grace period
+    unreferenced_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ProjectFileBlob(hash={self.file_hash[:12]}, refs={self.ref_count})>"
+
+
+class ProjectUploadSession(Base):
+    """Resumable chunked upload of one song project file (S3 multipart upload to a staging key)"""
+
+    __tablename__ = "project_upload_sessions"
+    __table_args__ = (
+        Index("idx_project_upload_sessions_lookup", "folder_id", "relative_path", "status"),
+        {"extend_existing": True},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("song_projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    folder_id = Column(UUID(as_uuid=True), ForeignKey("project_folders.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+
+    # Target file (folder-relative path) and expected content
+    relative_path = Column(String(500), nullable=False)
+    file_size_bytes = Column(BigInteger, nullable=False)
+    file_hash = Column(String(64), nullable=False)  # SHA256, verified on completion
+
+    # S3 multipart upload (parts are the source of truth for received chunks)
+    staging_key = Column(String(255), nullable=False)
+    upload_id = Column(String(255), nullable=False)
+    chunk_size = Column(Integer, nullable=False)
+
+    status = Column(String(20), nullable=False, server_default="open")  # open, completed, aborted
+    file_id = Column(UUID(as_uuid=True), nullable=True)  # Resulting ProjectFile (completed sessions)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # Extended on every chunk
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ProjectUploadSession(id={self.id}, path='{self.relative_path}', status={self.status})>"
+
+
+class ProjectManifestNode(Base):
+    """Directory node of a folder manifest (Merkle tree for Mirror sync, see song_project_manifest_transformer.py)"""
+
+    __tablename__ = "project_manifest_nodes"
+    __table_args__ = (
+        UniqueConstraint("folder_id", "path", name="uq_project_manifest_nodes_folder_path"),
+        Index("idx_project_manifest_nodes_folder_parent", "folder_id", "parent_path"),
+        {"extend_existing": True},
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    folder_id = Column(
+        UUID(as_uuid=True), ForeignKey("project_folders.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # Directory path relative to the folder ("" = folder root, parent_path NULL)
+    path = Column(String(500), nullable=False)
+    parent_path = Column(String(500), nullable=True)
+
+    node_hash = Column(String(64), nullable=False)
+    file_count = Column(Integer, nullable=False, server_default="0")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ProjectManifestNode(folder_id={self.folder_id}, path='{self.path}', files={self.file_count})>"
+
+
 class ProjectImageReference(Base):
     """Model for N:M relationship between projects and images"""
 
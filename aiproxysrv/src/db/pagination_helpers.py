@@ -0,0 +1,212 @@
+"""Keyset (cursor) pagination helpers - shared by paginated list queries"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+
+KEYSET_SORT_LABEL = "keyset_sort_value"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to a different sort order"""
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert a sort key / id into a JSON-serializable value"""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_json_value(value: Any, column: ColumnElement) -> Any:
+    """Convert a decoded cursor value back into the column's Python type"""
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is object:
+        # Untyped expression: let the database coerce the literal
+        return value
+
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is uuid.UUID:
+            return uuid.UUID(value)
+        return python_type(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor value: {value!r}") from e
+
+
+def sort_column_key(sort_column: ColumnElement) -> str:
+    """
+    Stable name of a sort column for cursor signatures.
+
+    Args:
+        sort_column: Column or labeled expression
+
+    Returns:
+        Column key (e.g. "created_at"), label name, or "expr" for anonymous expressions
+    """
+    return getattr(sort_column, "key", None) or getattr(sort_column, "name", None) or "expr"
+
+
+def encode_cursor(sort_key: str, sort_value: Any, row_id: Any) -> str:
+    """
+    Encode the position after a row into an opaque cursor.
+
+    Args:
+        sort_key: Sort signature the cursor belongs to (e.g. "created_at:desc")
+        sort_value: Value of the sort column of the last returned row
+        row_id: Primary key of the last returned row (tiebreaker)
+
+    Returns:
+        URL-safe base64 string without padding
+
+    Examples:
+        >>> encode_cursor("name:asc", "Logic Pro", 7)
+        'eyJzIjoibmFtZTphc2MiLCJ2IjoiTG9naWMgUHJvIiwiaWQiOjd9'
+    """
+    payload = {"s": sort_key, "v": _to_json_value(sort_value), "id": _to_json_value(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[Any, Any]:
+    """
+    Decode an opaque cursor created by encode_cursor().
+
+    Args:
+        cursor: Cursor string from the client
+        sort_key: Sort signature of the current request
+
+    Returns:
+        Tuple of (sort_value, row_id) as JSON values
+
+    Raises:
+        InvalidCursorError: Cursor is malformed or was issued for a different sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if not isinstance(payload, dict) or "v" not in payload or payload.get("id") is None:
+        raise InvalidCursorError("Malformed cursor")
+
+    if payload.get("s") != sort_key:
+        raise InvalidCursorError(f"Cursor does not match sort order '{sort_key}'")
+
+    return payload["v"], payload["id"]
+
+
+def apply_keyset_pagination(
+    query: Query,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    sort_direction: str,
+    cursor: str,
+    limit: int,
+    nullable: bool = False,
+) -> Query:
+    """
+    Order a query by (sort_column, id) and seek past the cursor position.
+
+    Replaces OFFSET: the database seeks directly to the cursor via the
+    (sort_column, id) index, so page 50 costs the same as page 1.
+    Fetches limit + 1 rows to detect whether another page exists; the sort
+    value is added as an extra result column (see build_keyset_page()).
+
+    Args:
+        query: Filtered SQLAlchemy query (without ORDER BY/LIMIT/OFFSET)
+        sort_column: Column or expression to sort by (e.g. Song.created_at)
+        id_column: Unique tiebreaker column (primary key)
+        sort_direction: 'asc' or 'desc'
+        cursor: Cursor of the previous page, "" for the first page
+        limit: Page size
+        nullable: Sort column may be NULL (NULL rows are returned last)
+
+    Returns:
+        Query yielding (entity..., sort_value) rows
+
+    Raises:
+        InvalidCursorError: Cursor is malformed or was issued for a different sort order
+    """
+    descending = sort_direction == "desc"
+
+    if cursor:
+        raw_value, raw_id = decode_cursor(cursor, f"{sort_column_key(sort_column)}:{sort_direction}")
+        last_value = _from_json_value(raw_value, sort_column)
+        last_id = _from_json_value(raw_id, id_column)
+        id_after = id_column < last_id if descending else id_column > last_id
+
+        if last_value is None:
+            # Already in the trailing NULL block: continue by id only
+            if not nullable:
+                raise InvalidCursorError("Malformed cursor")
+            seek = and_(sort_column.is_(None), id_after)
+        else:
+            row_value = tuple_(sort_column, id_column)
+            last_row = tuple_(literal(last_value, sort_column.type), literal(last_id, id_column.type))
+            seek = row_value < last_row if descending else row_value > last_row
+            if nullable:
+                seek = or_(seek, sort_column.is_(None))
+
+        query = query.filter(seek)
+
+    if descending:
+        order = [sort_column.desc().nullslast() if nullable else sort_column.desc(), id_column.desc()]
+    else:
+        order = [sort_column.asc().nullslast() if nullable else sort_column.asc(), id_column.asc()]
+
+    return query.add_columns(sort_column.label(KEYSET_SORT_LABEL)).order_by(*order).limit(limit + 1)
+
+
+def build_keyset_page(
+    rows: list[Any],
+    limit: int,
+    sort_column: ColumnElement,
+    sort_direction: str,
+    id_attr: str = "id",
+) -> tuple[list[Any], str | None]:
+    """
+    Split limit + 1 keyset rows into the page items and the next cursor.
+
+    Args:
+        rows: Result of a query prepared by apply_keyset_pagination()
+        limit: Page size
+        sort_column: Same sort column passed to apply_keyset_pagination()
+        sort_direction: Same direction passed to apply_keyset_pagination()
+        id_attr: Attribute name of the primary key on the (first) entity
+
+    Returns:
+        Tuple of (items, next_cursor). Items are the entities, or tuples without the
+        trailing sort value for multi-column queries. next_cursor is None on the last page.
+    """
+    page_rows = rows[:limit]
+    items = [row[0] if len(row) == 2 else tuple(row[:-1]) for row in page_rows]
+
+    if len(rows) <= limit or not page_rows:
+        return items, None
+
+    last_row = page_rows[-1]
+    next_cursor = encode_cursor(
+        f"{sort_column_key(sort_column)}:{sort_direction}", last_row[-1], getattr(last_row[0], id_attr)
+    )
+    return items, next_cursor
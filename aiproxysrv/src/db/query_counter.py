@@ -0,0 +1,71 @@
+"""Query counting helpers - detect N+1 patterns by counting executed SQL statements"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a code block executes more SQL statements than its budget allows"""
+
+
+class QueryCounter:
+    """
+    Count SQL statements executed on an engine or connection.
+
+    Listens to before_cursor_execute, so every round trip is counted
+    (ORM lazy loads included). Use as a context manager:
+
+        with QueryCounter(engine) as counter:
+            controller.list_projects(db, user_id)
+        assert counter.count <= 3
+    """
+
+    def __init__(self, bind: Engine | Connection):
+        self.bind = bind
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed so far"""
+        return len(self.statements)
+
+    def _on_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.bind, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.bind, "before_cursor_execute", self._on_execute)
+
+
+@contextmanager
+def assert_query_budget(bind: Engine | Connection, max_queries: int) -> Iterator[QueryCounter]:
+    """
+    Fail if the wrapped block executes more than max_queries statements.
+
+    Args:
+        bind: Engine or connection the code under test uses
+        max_queries: Maximum number of allowed statements
+
+    Yields:
+        QueryCounter (inspect .count / .statements inside the block)
+
+    Raises:
+        QueryBudgetExceededError: Budget exceeded (message lists all statements)
+    """
+    with QueryCounter(bind) as counter:
+        yield counter
+
+    if counter.count > max_queries:
+        executed = "\n".join(f"  {i}. {stmt}" for i, stmt in enumerate(counter.statements, start=1))
+        raise QueryBudgetExceededError(
+            f"Expected at most {max_queries} queries, {counter.count} were executed:\n{executed}"
+        )
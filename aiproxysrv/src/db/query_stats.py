@@ -0,0 +1,223 @@
+"""Per-request SQL instrumentation - query count, DB time, slow statements, connection hold time"""
+
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from utils.logger import logger
+from utils.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUTS, DB_POOL_WAIT
+from utils.tracing import KIND_DB, end_span, start_span
+
+
+MAX_STATEMENT_LENGTH = 300
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL statistics collected while handling one request"""
+
+    label: str = ""
+    query_count: int = 0
+    db_time_ms: float = 0.0
+    connection_hold_ms: float = 0.0
+    connections_checked_out: int = 0
+    slow_statements: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_log_fields(self) -> dict[str, Any]:
+        """Structured fields for the request summary log line"""
+        return {
+            "db_queries": self.query_count,
+            "db_time_ms": round(self.db_time_ms, 1),
+            "db_hold_ms": round(self.connection_hold_ms, 1),
+            "db_connections": self.connections_checked_out,
+            "db_slow_queries": len(self.slow_statements),
+        }
+
+    def __str__(self) -> str:
+        # Log context value: rendered (by the cap_extra patcher) when a line is logged, so
+        # every line of the request shows the statistics collected up to that point
+        return self.to_header()
+
+    def to_header(self) -> str:
+        """
+        Compact value for the X-DB-Stats debug response header
+
+        Examples:
+            >>> RequestQueryStats(query_count=3, db_time_ms=4.21, connection_hold_ms=9.0).to_header()
+            'queries=3;db_ms=4.2;hold_ms=9.0;slow=0'
+        """
+        return (
+            f"queries={self.query_count};db_ms={self.db_time_ms:.1f};"
+            f"hold_ms={self.connection_hold_ms:.1f};slow={len(self.slow_statements)}"
+        )
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def start_request_stats(label: str = "") -> RequestQueryStats:
+    """
+    Start collecting SQL statistics for the current request (replaces any leftover stats)
+
+    Args:
+        label: Request description used in slow statement logs (e.g. "GET /api/v1/songs")
+
+    Returns:
+        New RequestQueryStats instance
+    """
+    stats = RequestQueryStats(label=label)
+    _current_stats.set(stats)
+    return stats
+
+
+def get_request_stats() -> RequestQueryStats | None:
+    """Statistics of the current request, None outside of a tracked request"""
+    return _current_stats.get()
+
+
+def finish_request_stats() -> RequestQueryStats | None:
+    """Stop collecting and return the statistics of the current request"""
+    stats = _current_stats.get()
+    _current_stats.set(None)
+    return stats
+
+
+class QueryInstrumentation:
+    """
+    SQLAlchemy event hooks feeding RequestQueryStats.
+
+    Statement timing uses before/after_cursor_execute, connection hold time
+    uses pool checkout/checkin. Slow statements are logged even outside of a
+    request (e.g. Celery tasks). Each statement is also a "db" span of the
+    current request trace.
+    """
+
+    def __init__(self, slow_query_ms: float):
+        self.slow_query_ms = slow_query_ms
+
+    def install(self, engine: Engine) -> None:
+        """Attach all event hooks to engine and its pool"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        event.listen(engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.pool, "checkin", self._on_checkin)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+        conn.info.setdefault("query_spans", []).append(
+            start_span("db.execute", KIND_DB, statement=statement[:MAX_STATEMENT_LENGTH], executemany=executemany)
+        )
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start_times = conn.info.get("query_start_time")
+        if not start_times:
+            return
+        end_span(conn.info["query_spans"].pop())
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.db_time_ms += elapsed_ms
+
+        if elapsed_ms >= self.slow_query_ms:
+            slow = {"statement": statement[:MAX_STATEMENT_LENGTH], "duration_ms": round(elapsed_ms, 1)}
+            if stats is not None:
+                stats.slow_statements.append(slow)
+            logger.warning("Slow SQL statement", request=stats.label if stats else None, **slow)
+
+    def _handle_error(self, exception_context) -> None:
+        # Failed statements never reach after_cursor_execute
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+            end_span(conn.info["query_spans"].pop(), type(exception_context.original_exception).__name__)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checkout_time"] = time.perf_counter()
+        DB_POOL_CHECKOUTS.inc()
+        DB_POOL_CHECKED_OUT.inc()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.connections_checked_out += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checkout_time = connection_record.info.pop("checkout_time", None)
+        if checkout_time is not None:
+            DB_POOL_CHECKED_OUT.dec()
+        stats = _current_stats.get()
+        if checkout_time is not None and stats is not None:
+            stats.connection_hold_ms += (time.perf_counter() - checkout_time) * 1000
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording the time a checkout waits for a connection (incl. connecting)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def install_query_instrumentation(engine: Engine, slow_query_ms: float) -> QueryInstrumentation:
+    """
+    Attach per-request SQL instrumentation to an engine
+
+    Args:
+        engine: SQLAlchemy engine
+        slow_query_ms: Statements taking at least this long are logged as slow
+
+    Returns:
+        Installed QueryInstrumentation
+    """
+    instrumentation = QueryInstrumentation(slow_query_ms)
+    instrumentation.install(engine)
+    return instrumentation
+
+
+def get_pool_status(pool: Pool) -> dict[str, Any]:
+    """
+    Connection pool utilization of this worker process
+
+    Args:
+        pool: Engine pool (QueuePool for PostgreSQL)
+
+    Returns:
+        Dict with pid, pool class, size, checked_out, overflow and utilization (0..1).
+        Size/usage fields are None for pools without fixed capacity (e.g. SQLite).
+    """
+    status: dict[str, Any] = {
+        "pid": os.getpid(),
+        "pool_class": type(pool).__name__,
+        "size": None,
+        "checked_out": None,
+        "overflow": None,
+        "max_overflow": None,
+        "utilization": None,
+    }
+
+    if not all(hasattr(pool, name) for name in ("size", "checkedout", "overflow")):
+        return status
+
+    size = pool.size()
+    checked_out = pool.checkedout()
+    max_overflow = max(getattr(pool, "_max_overflow", 0), 0)
+    capacity = size + max_overflow
+
+    status.update(
+        size=size,
+        checked_out=checked_out,
+        overflow=max(pool.overflow(), 0),
+        max_overflow=max_overflow,
+        utilization=round(checked_out / capacity, 3) if capacity else None,
+    )
+    return status
@@ -0,0 +1,97 @@
+"""Full-text search helpers - shared tsvector/tsquery builder for paginated list queries"""
+
+import re
+from typing import Any
+
+from sqlalchemy import false, func, literal_column
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+
+# 'simple' config: no stemming/stopwords (lyrics and prompts are mixed EN/DE)
+SEARCH_TS_CONFIG = "simple"
+
+# Upper bound for search terms (keeps the tsquery small, avoids pathological inputs)
+MAX_SEARCH_TERMS = 10
+
+_TERM_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def build_search_vector_sql(weighted_columns: dict[str, str]) -> str:
+    """
+    Build the SQL expression for a generated tsvector column.
+
+    Used for both the SQLAlchemy Computed() column and the Alembic migration,
+    so model and database stay identical.
+
+    Args:
+        weighted_columns: Column name -> weight ('A' highest ... 'D' lowest)
+
+    Returns:
+        SQL expression, e.g. "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || ..."
+
+    Examples:
+        >>> build_search_vector_sql({"title": "A"})
+        "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')"
+    """
+    parts = [
+        f"setweight(to_tsvector('{SEARCH_TS_CONFIG}'::regconfig, coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns.items()
+    ]
+    return " || ".join(parts)
+
+
+def build_prefix_tsquery(search: str | None) -> str | None:
+    """
+    Convert free-text user input into a safe prefix tsquery string.
+
+    Every word becomes a prefix match and all words must match (AND), which keeps
+    the search-as-you-type behaviour of the former ILIKE filters ("lov" finds "love").
+
+    Args:
+        search: Raw search input from the request
+
+    Returns:
+        tsquery text (e.g. "love:* & song:*"), "" if input has no searchable words,
+        None if there is no search at all
+
+    Examples:
+        >>> build_prefix_tsquery("Love  Song")
+        'love:* & song:*'
+        >>> build_prefix_tsquery("   ")
+        >>> build_prefix_tsquery("!!!")
+        ''
+    """
+    if search is None or not search.strip():
+        return None
+
+    terms = _TERM_PATTERN.findall(search.lower())[:MAX_SEARCH_TERMS]
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def apply_fulltext_search(query: Query, search_vector: Any, search: str | None) -> tuple[Query, ColumnElement | None]:
+    """
+    Filter a query by a tsvector column and return the rank expression.
+
+    Args:
+        query: SQLAlchemy query to filter
+        search_vector: Generated tsvector column (e.g. Song.search_vector), backed by a GIN index
+        search: Raw search input
+
+    Returns:
+        Tuple of (filtered_query, rank_expression). rank_expression is None when no search
+        was applied; use it for ORDER BY when sorting by relevance.
+    """
+    tsquery_text = build_prefix_tsquery(search)
+    if tsquery_text is None:
+        return query, None
+
+    if not tsquery_text:
+        # Only punctuation/whitespace: nothing can match
+        return query.filter(false()), None
+
+    ts_query = func.to_tsquery(literal_column(f"'{SEARCH_TS_CONFIG}'::regconfig"), tsquery_text)
+    query = query.filter(search_vector.op("@@")(ts_query))
+    rank = func.ts_rank_cd(search_vector, ts_query)
+
+    return query, rank
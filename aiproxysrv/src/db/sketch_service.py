@@ -5,11 +5,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
 
 from db.models import SongSketch
+from db.pagination_helpers import InvalidCursorError, apply_keyset_pagination, build_keyset_page
+from db.search_helpers import apply_fulltext_search
 from utils.logger import logger
 
 
@@ -118,6 +119,8 @@ class SketchService:
         sketch_type: str | None = None,
         sort_by: str = "created_at",
         sort_direction: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         Get paginated list of sketches with search and filtering
@@ -129,11 +132,17 @@ class SketchService:
             search: Search term to filter by title, lyrics, prompt, or tags
             workflow: Optional workflow filter (draft, used, archived)
             sketch_type: Optional sketch type filter (song, inspiration)
-            sort_by: Field to sort by (created_at, updated_at, title)
-            sort_direction: Sort direction (asc, desc)
+            sort_by: Field to sort by (created_at, updated_at, title, relevance)
+            sort_direction: Sort direction (asc, desc), ignored for relevance
+            cursor: Keyset cursor ("" = first page), sorts by (created_at, id); None uses offset
+            include_total: Count all matches in cursor mode (offset mode always counts)
 
         Returns:
-            Dictionary with 'items' (list of sketches) and 'total' (count)
+            Dictionary with 'items' (list of sketches), 'total' (count or None)
+            and 'next_cursor' (cursor mode only)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another sort order
         """
         try:
             query = db.query(SongSketch).options(joinedload(SongSketch.project))
@@ -150,23 +159,35 @@ class SketchService:
             if sketch_type:
                 query = query.filter(SongSketch.sketch_type == sketch_type)
 
-            # Apply search filter if provided
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        SongSketch.title.ilike(search_term),
-                        SongSketch.lyrics.ilike(search_term),
-                        SongSketch.prompt.ilike(search_term),
-                        SongSketch.tags.ilike(search_term),
-                    )
+            # Apply full-text search filter if provided (GIN index on search_vector)
+            query, search_rank = apply_fulltext_search(query, SongSketch.search_vector, search)
+
+            if cursor is not None:
+                total_count = query.count() if include_total else None
+                query = apply_keyset_pagination(
+                    query, SongSketch.created_at, SongSketch.id, sort_direction, cursor, limit
+                )
+                sketches, next_cursor = build_keyset_page(query.all(), limit, SongSketch.created_at, sort_direction)
+                logger.debug(
+                    "sketches_retrieved_by_cursor",
+                    count=len(sketches),
+                    total=total_count,
+                    limit=limit,
+                    has_more=next_cursor is not None,
+                    workflow=workflow,
+                    sketch_type=sketch_type,
+                    search=search,
+                    sort_direction=sort_direction,
                 )
+                return {"items": sketches, "total": total_count, "next_cursor": next_cursor}
 
             # Get total count before pagination
             total_count = query.count()
 
             # Apply sorting
-            if sort_by == "title":
+            if sort_by == "relevance" and search_rank is not None:
+                query = query.order_by(search_rank.desc(), SongSketch.created_at.desc())
+            elif sort_by == "title":
                 # Handle null titles by treating them as empty strings for sorting
                 if sort_direction == "desc":
                     query = query.order_by(SongSketch.title.desc().nullslast())
@@ -200,6 +221,8 @@ class SketchService:
             )
 
             return {"items": sketches, "total": total_count}
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(
                 "error_getting_paginated_sketches",
@@ -5,17 +5,127 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, or_
+from sqlalchemy import case, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
-
-from db.models import ProjectFile, ProjectFolder, SongProject
+from sqlalchemy.orm import Session, joinedload, load_only
+
+from db.models import (
+    ProjectFile,
+    ProjectFileBlob,
+    ProjectFolder,
+    ProjectManifestNode,
+    ProjectUploadSession,
+    SongProject,
+)
+from db.pagination_helpers import InvalidCursorError, apply_keyset_pagination, build_keyset_page
+from db.search_helpers import apply_fulltext_search
 from utils.logger import logger
 
 
+# Columns needed for file listings, mirror compare and folder cleanup
+COMPACT_FILE_COLUMNS = (
+    ProjectFile.id,
+    ProjectFile.project_id,
+    ProjectFile.folder_id,
+    ProjectFile.filename,
+    ProjectFile.relative_path,
+    ProjectFile.file_size_bytes,
+    ProjectFile.file_hash,
+    ProjectFile.s3_key,
+    ProjectFile.storage_backend,
+    ProjectFile.updated_at,
+)
+
+
 class SongProjectService:
     """Service for song project database operations (CRUD only, NO business logic)"""
 
+    @staticmethod
+    def _apply_file_stats_delta(
+        db: Session, project_id: UUID, folder_id: UUID | None, count_delta: int, size_delta: int
+    ) -> None:
+        """
+        Adjust maintained file statistics of project and folder (caller commits)
+
+        Uses relative UPDATEs (file_count = file_count + delta) so concurrent
+        uploads into the same project cannot overwrite each other's counts.
+        """
+        db.execute(
+            update(SongProject)
+            .where(SongProject.id == project_id)
+            .values(
+                file_count=SongProject.file_count + count_delta,
+                total_size_bytes=SongProject.total_size_bytes + size_delta,
+                files_modified_at=func.now(),
+                # Keep project updated_at (list sort order) independent of file changes
+                updated_at=SongProject.updated_at,
+            )
+        )
+
+        if folder_id is not None:
+            db.execute(
+                update(ProjectFolder)
+                .where(ProjectFolder.id == folder_id)
+                .values(
+                    file_count=ProjectFolder.file_count + count_delta,
+                    total_size_bytes=ProjectFolder.total_size_bytes + size_delta,
+                    files_modified_at=func.now(),
+                )
+            )
+
+    @staticmethod
+    def _write_manifest_changes(
+        db: Session, folder_id: UUID | None, changes: dict[str, dict[str, Any] | None] | None
+    ) -> None:
+        """
+        Write calculated manifest node changes of a file change (caller commits)
+
+        changes: directory path -> {"node_hash", "file_count", "parent_path"}, None = delete.
+        The caller holds the folder row lock (lock_folder) since reading the nodes, which
+        serializes concurrent changes of the same folder's nodes.
+        """
+        if folder_id is None or not changes:
+            return
+
+        nodes = {
+            node.path: node
+            for node in db.query(ProjectManifestNode).filter(
+                ProjectManifestNode.folder_id == folder_id, ProjectManifestNode.path.in_(list(changes))
+            )
+        }
+        for path, change in changes.items():
+            node = nodes.get(path)
+            if change is None:
+                if node is not None:
+                    db.delete(node)
+                continue
+            if node is None:
+                node = ProjectManifestNode(folder_id=folder_id, path=path, parent_path=change["parent_path"])
+                db.add(node)
+            node.node_hash = change["node_hash"]
+            node.file_count = change["file_count"]
+
+    @staticmethod
+    def _apply_blob_ref_delta(db: Session, file_hash: str | None, delta: int) -> bool:
+        """
+        Adjust the reference count of a content-addressed blob (caller commits)
+
+        A blob whose count drops to 0 gets unreferenced_at set and becomes a GC candidate.
+
+        Returns:
+            False if the blob does not exist (e.g. removed by GC meanwhile)
+        """
+        if not file_hash:
+            return False
+        new_count = ProjectFileBlob.ref_count + delta
+        result = db.execute(
+            update(ProjectFileBlob)
+            .where(ProjectFileBlob.file_hash == file_hash)
+            .values(ref_count=new_count, unreferenced_at=case((new_count <= 0, func.now()), else_=None))
+        )
+        return result.rowcount > 0
+
     def create_project(
         self,
         db: Session,
@@ -133,6 +243,35 @@ class SongProjectService:
             )
             return None
 
+    def get_project_with_folders(self, db: Session, project_id: UUID) -> SongProject | None:
+        """
+        Get project with folders only (no files) - lightweight detail view
+
+        Folder statistics come from the maintained file_count/total_size_bytes columns.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+
+        Returns:
+            SongProject instance with folders loaded, None if not found
+        """
+        try:
+            return (
+                db.query(SongProject)
+                .options(joinedload(SongProject.folders))
+                .filter(SongProject.id == project_id)
+                .first()
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Error getting project with folders",
+                project_id=str(project_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
     def get_projects_paginated(
         self,
         db: Session,
@@ -144,6 +283,8 @@ class SongProjectService:
         project_status: str | None = None,
         sort_by: str = "created_at",
         sort_direction: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         Get paginated list of projects for a user
@@ -156,11 +297,17 @@ class SongProjectService:
             search: Search term (project_name, description)
             tags: Comma-separated tags for filtering
             project_status: Status filter ('new', 'progress', 'archived', or None for all non-archived)
-            sort_by: Field to sort by (created_at, updated_at, project_name)
-            sort_direction: Sort direction (asc, desc)
+            sort_by: Field to sort by (created_at, updated_at, project_name, relevance)
+            sort_direction: Sort direction (asc, desc), ignored for relevance
+            cursor: Keyset cursor ("" = first page), sorts by (effective date, id); None uses offset
+            include_total: Count all matches in cursor mode (offset mode always counts)
 
         Returns:
-            Dictionary with 'items' (list of projects) and 'total' (count)
+            Dictionary with 'items' (list of projects), 'total' (count or None)
+            and 'next_cursor' (cursor mode only)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another sort order
         """
         try:
             query = db.query(SongProject).filter(SongProject.user_id == user_id)
@@ -172,15 +319,8 @@ class SongProjectService:
                 # Default: exclude archived projects (for 'all' tab)
                 query = query.filter(SongProject.project_status != "archived")
 
-            # Apply search filter
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        SongProject.project_name.ilike(search_term),
-                        SongProject.description.ilike(search_term),
-                    )
-                )
+            # Apply full-text search filter (GIN index on search_vector)
+            query, search_rank = apply_fulltext_search(query, SongProject.search_vector, search)
 
             # Apply tags filter (if provided)
             if tags:
@@ -188,15 +328,36 @@ class SongProjectService:
                 # PostgreSQL ARRAY overlap operator
                 query = query.filter(SongProject.tags.overlap(tag_list))
 
-            # Get total count before pagination
-            total_count = query.count()
-
-            # Apply sorting (COALESCE: updated_at if exists, else created_at)
+            # Sorting key (COALESCE: updated_at if exists, else created_at)
             effective_date = case(
                 (SongProject.updated_at.is_(None), SongProject.created_at), else_=SongProject.updated_at
             )
 
-            if sort_by == "project_name":
+            if cursor is not None:
+                total_count = query.count() if include_total else None
+                query = apply_keyset_pagination(query, effective_date, SongProject.id, sort_direction, cursor, limit)
+                projects, next_cursor = build_keyset_page(query.all(), limit, effective_date, sort_direction)
+                logger.debug(
+                    "Projects retrieved by cursor",
+                    count=len(projects),
+                    total=total_count,
+                    limit=limit,
+                    has_more=next_cursor is not None,
+                    user_id=str(user_id),
+                    search=search,
+                    tags=tags,
+                    project_status=project_status,
+                )
+                return {"items": projects, "total": total_count, "next_cursor": next_cursor}
+
+            # Get total count before pagination
+            total_count = query.count()
+
+            # Apply sorting
+
+            if sort_by == "relevance" and search_rank is not None:
+                query = query.order_by(search_rank.desc(), effective_date.desc())
+            elif sort_by == "project_name":
                 if sort_direction == "desc":
                     query = query.order_by(SongProject.project_name.desc())
                 else:
@@ -228,6 +389,8 @@ class SongProjectService:
             )
 
             return {"items": projects, "total": total_count}
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(
                 "Error getting paginated projects",
@@ -326,6 +489,16 @@ class SongProjectService:
         try:
             project = db.query(SongProject).filter(SongProject.id == project_id).first()
             if project:
+                # Cascade removes the file rows - release their blob references in the same transaction
+                blob_refs = (
+                    db.query(ProjectFile.file_hash, func.count(ProjectFile.id))
+                    .filter(ProjectFile.project_id == project_id, ProjectFile.storage_backend == "blob")
+                    .group_by(ProjectFile.file_hash)
+                    .all()
+                )
+                for file_hash, ref_count in blob_refs:
+                    self._apply_blob_ref_delta(db, file_hash, -ref_count)
+
                 db.delete(project)
                 db.commit()
                 logger.info("Project deleted", project_id=str(project_id))
@@ -408,6 +581,7 @@ class SongProjectService:
         file_size_bytes: int | None = None,
         file_hash: str | None = None,
         storage_backend: str = "s3",
+        manifest_changes: dict[str, dict[str, Any] | None] | None = None,
     ) -> ProjectFile | None:
         """
         Create a project file record
@@ -424,6 +598,7 @@ class SongProjectService:
             file_size_bytes: File size in bytes
             file_hash: File hash (SHA256)
             storage_backend: Storage backend (s3, local)
+            manifest_changes: Folder manifest node changes to write (see lock_folder)
 
         Returns:
             ProjectFile instance if successful, None otherwise
@@ -451,6 +626,12 @@ class SongProjectService:
             )
 
             db.add(file)
+            self._apply_file_stats_delta(db, project_id, folder_id, 1, file_size_bytes or 0)
+            self._write_manifest_changes(db, folder_id, manifest_changes)
+            if storage_backend == "blob" and not self._apply_blob_ref_delta(db, file_hash, 1):
+                db.rollback()
+                logger.warning("Blob to reference does not exist", file_hash=file_hash, filename=filename)
+                return None
             db.commit()
             db.refresh(file)
 
@@ -471,19 +652,23 @@ class SongProjectService:
             logger.error("File creation failed", error=str(e), error_type=type(e).__name__)
             return None
 
-    def get_files_by_folder(self, db: Session, folder_id: UUID) -> list[ProjectFile]:
+    def get_files_by_folder(self, db: Session, folder_id: UUID, compact: bool = False) -> list[ProjectFile]:
         """
         Get all files in a specific folder (for Mirror compare)
 
         Args:
             db: Database session
             folder_id: Folder UUID
+            compact: Only load the columns needed for compare/cleanup (COMPACT_FILE_COLUMNS)
 
         Returns:
             List of ProjectFile instances
         """
         try:
-            files = db.query(ProjectFile).filter(ProjectFile.folder_id == folder_id).all()
+            query = db.query(ProjectFile).filter(ProjectFile.folder_id == folder_id)
+            if compact:
+                query = query.options(load_only(*COMPACT_FILE_COLUMNS))
+            files = query.all()
             return files or []
 
         except SQLAlchemyError as e:
@@ -497,6 +682,174 @@ class SongProjectService:
             )
             return []
 
+    def get_archive_files(
+        self, db: Session, project_id: UUID, folder_id: UUID | None = None, file_ids: list[UUID] | None = None
+    ) -> list[ProjectFile]:
+        """
+        Get the files of a ZIP download (compact columns, ordered by relative_path)
+
+        Args:
+            db: Database session
+            project_id: Project UUID (files of other projects are never returned)
+            folder_id: Only files of this folder (None = whole project)
+            file_ids: Only these files (None = all files)
+
+        Returns:
+            List of ProjectFile instances
+        """
+        try:
+            query = (
+                db.query(ProjectFile)
+                .options(load_only(*COMPACT_FILE_COLUMNS))
+                .filter(ProjectFile.project_id == project_id)
+            )
+            if folder_id is not None:
+                query = query.filter(ProjectFile.folder_id == folder_id)
+            if file_ids is not None:
+                query = query.filter(ProjectFile.id.in_(file_ids))
+            return query.order_by(ProjectFile.relative_path, ProjectFile.id).all()
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get archive files DB error", project_id=str(project_id), error=str(e), error_type=type(e).__name__
+            )
+            return []
+
+    @staticmethod
+    def _folder_files_query(db: Session, folder_id: UUID, path_prefix: str, recursive: bool):
+        """Files of a folder below path_prefix (recursive=False: direct children only)"""
+        query = (
+            db.query(ProjectFile)
+            .options(load_only(*COMPACT_FILE_COLUMNS))
+            .filter(
+                ProjectFile.folder_id == folder_id, ProjectFile.relative_path.startswith(path_prefix, autoescape=True)
+            )
+        )
+        if not recursive:
+            remainder = func.substr(ProjectFile.relative_path, len(path_prefix) + 1)
+            query = query.filter(func.strpos(remainder, "/") == 0)
+        return query
+
+    def get_folder_files(
+        self, db: Session, folder_id: UUID, path_prefix: str, recursive: bool = True
+    ) -> list[ProjectFile]:
+        """
+        Get all folder files below path_prefix (compact columns, ordered by relative_path)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            path_prefix: relative_path prefix incl. folder name (e.g. "01 Arrangement/")
+            recursive: False = only files directly below path_prefix
+
+        Returns:
+            List of ProjectFile instances
+        """
+        try:
+            query = self._folder_files_query(db, folder_id, path_prefix, recursive)
+            return query.order_by(ProjectFile.relative_path, ProjectFile.id).all()
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get folder files DB error", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return []
+
+    def get_folder_files_page(
+        self,
+        db: Session,
+        folder_id: UUID,
+        path_prefix: str,
+        limit: int,
+        cursor: str = "",
+        recursive: bool = True,
+        sort_by: str = "relative_path",
+        sort_direction: str = "asc",
+    ) -> tuple[list[ProjectFile], str | None]:
+        """
+        Get one page of folder files (keyset pagination, compact columns)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            path_prefix: relative_path prefix incl. folder name (e.g. "01 Arrangement/Samples/")
+            limit: Page size
+            cursor: Cursor of the previous page ("" = first page)
+            recursive: False = only files directly below path_prefix
+            sort_by: relative_path, filename, file_size_bytes or updated_at
+            sort_direction: asc or desc
+
+        Returns:
+            Tuple of (files, next_cursor)
+
+        Raises:
+            InvalidCursorError: Cursor is malformed or was issued for a different sort order
+        """
+        sort_column = {
+            "relative_path": ProjectFile.relative_path,
+            "filename": ProjectFile.filename,
+            "file_size_bytes": ProjectFile.file_size_bytes,
+            "updated_at": ProjectFile.updated_at,
+        }.get(sort_by, ProjectFile.relative_path)
+
+        try:
+            query = self._folder_files_query(db, folder_id, path_prefix, recursive)
+            query = apply_keyset_pagination(
+                query,
+                sort_column,
+                ProjectFile.id,
+                sort_direction,
+                cursor,
+                limit,
+                nullable=bool(sort_column.nullable),
+            )
+            return build_keyset_page(query.all(), limit, sort_column, sort_direction)
+
+        except InvalidCursorError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get folder files page DB error", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return [], None
+
+    def get_folder_subdirectories(self, db: Session, folder_id: UUID, path_prefix: str) -> list[str]:
+        """
+        Get names of the subdirectories directly below path_prefix (like S3 CommonPrefixes)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            path_prefix: relative_path prefix incl. folder name, ending with "/"
+
+        Returns:
+            Sorted list of subdirectory names
+        """
+        try:
+            remainder = func.substr(ProjectFile.relative_path, len(path_prefix) + 1)
+            name = func.split_part(remainder, "/", 1).label("name")
+            rows = (
+                db.query(name)
+                .filter(
+                    ProjectFile.folder_id == folder_id,
+                    ProjectFile.relative_path.startswith(path_prefix, autoescape=True),
+                    func.strpos(remainder, "/") > 0,
+                )
+                .distinct()
+                .order_by(name)
+                .all()
+            )
+            return [row.name for row in rows]
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get folder subdirectories DB error",
+                folder_id=str(folder_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return []
+
     def get_file_by_id(self, db: Session, file_id: UUID) -> ProjectFile | None:
         """
         Get a file by its ID
@@ -519,6 +872,44 @@ class SongProjectService:
             logger.error("Get file by ID failed", file_id=str(file_id), error=str(e), error_type=type(e).__name__)
             return None
 
+    def get_file_for_user(self, db: Session, project_id: UUID, file_id: UUID, user_id: UUID) -> ProjectFile | None:
+        """
+        Get a file only if it belongs to the given project of the given user
+
+        Ownership is checked in the same query (join on song_projects) instead of
+        lazy-loading file.project afterwards.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            file_id: File UUID
+            user_id: Owner user UUID
+
+        Returns:
+            ProjectFile instance if found and owned by user, None otherwise
+        """
+        try:
+            return (
+                db.query(ProjectFile)
+                .join(SongProject, ProjectFile.project_id == SongProject.id)
+                .filter(
+                    ProjectFile.id == file_id,
+                    ProjectFile.project_id == project_id,
+                    SongProject.user_id == user_id,
+                )
+                .first()
+            )
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get file for user DB error",
+                file_id=str(file_id),
+                project_id=str(project_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
     def get_file_by_path(self, db: Session, project_id: UUID, relative_path: str) -> ProjectFile | None:
         """
         Get a file by its relative path (for Mirror update detection)
@@ -566,6 +957,8 @@ class SongProjectService:
         file_size_bytes: int | None = None,
         file_hash: str | None = None,
         mime_type: str | None = None,
+        storage_backend: str | None = None,
+        manifest_changes: dict[str, dict[str, Any] | None] | None = None,
     ) -> ProjectFile | None:
         """
         Update file record (for Mirror sync updates)
@@ -577,6 +970,8 @@ class SongProjectService:
             file_size_bytes: New file size (optional)
             file_hash: New file hash (optional)
             mime_type: New MIME type (optional)
+            storage_backend: New storage backend, 's3' or 'blob' (optional)
+            manifest_changes: Folder manifest node changes to write (see lock_folder)
 
         Returns:
             Updated ProjectFile instance if successful, None otherwise
@@ -589,18 +984,33 @@ class SongProjectService:
                 return None
 
             # Update fields if provided
+            size_delta = 0
+            old_hash = file.file_hash
+            old_backend = file.storage_backend
             if s3_key is not None:
                 file.s3_key = s3_key
             if file_size_bytes is not None:
+                size_delta = file_size_bytes - (file.file_size_bytes or 0)
                 file.file_size_bytes = file_size_bytes
             if file_hash is not None:
                 file.file_hash = file_hash
             if mime_type is not None:
                 file.mime_type = mime_type
+            if storage_backend is not None:
+                file.storage_backend = storage_backend
 
             # Update timestamp
             file.updated_at = datetime.now(UTC)
 
+            self._apply_file_stats_delta(db, file.project_id, file.folder_id, 0, size_delta)
+            self._write_manifest_changes(db, file.folder_id, manifest_changes)
+            if (old_backend, old_hash) != (file.storage_backend, file.file_hash):
+                if old_backend == "blob":
+                    self._apply_blob_ref_delta(db, old_hash, -1)
+                if file.storage_backend == "blob" and not self._apply_blob_ref_delta(db, file.file_hash, 1):
+                    db.rollback()
+                    logger.warning("Blob to reference does not exist", file_hash=file.file_hash, file_id=str(file_id))
+                    return None
             db.commit()
             db.refresh(file)
 
@@ -615,13 +1025,16 @@ class SongProjectService:
             logger.error("File update failed", file_id=str(file_id), error=str(e), error_type=type(e).__name__)
             return None
 
-    def delete_file(self, db: Session, file_id: UUID) -> bool:
+    def delete_file(
+        self, db: Session, file_id: UUID, manifest_changes: dict[str, dict[str, Any] | None] | None = None
+    ) -> bool:
         """
         Delete a file record from database
 
         Args:
             db: Database session
             file_id: File UUID
+            manifest_changes: Folder manifest node changes to write (see lock_folder)
 
         Returns:
             True if successful, False otherwise
@@ -634,6 +1047,10 @@ class SongProjectService:
                 return False
 
             db.delete(file)
+            self._apply_file_stats_delta(db, file.project_id, file.folder_id, -1, -(file.file_size_bytes or 0))
+            self._write_manifest_changes(db, file.folder_id, manifest_changes)
+            if file.storage_backend == "blob":
+                self._apply_blob_ref_delta(db, file.file_hash, -1)
             db.commit()
 
             logger.info("File deleted", file_id=str(file_id), filename=file.filename)
@@ -653,6 +1070,7 @@ class SongProjectService:
         file_id: UUID,
         new_relative_path: str,
         new_s3_key: str,
+        manifest_changes: dict[str, dict[str, Any] | None] | None = None,
     ) -> ProjectFile | None:
         """
         Move file to new path (update DB record only)
@@ -662,6 +1080,7 @@ class SongProjectService:
             file_id: File UUID
             new_relative_path: New relative path (e.g., "Audio/file.flac")
             new_s3_key: New S3 key (e.g., "projects/{uuid}/01 Arrangement/Audio/file.flac")
+            manifest_changes: Folder manifest node changes to write (see lock_folder)
 
         Returns:
             Updated ProjectFile instance if successful, None otherwise
@@ -688,6 +1107,9 @@ class SongProjectService:
             file.filename = new_filename
             file.updated_at = datetime.now(UTC)
 
+            # Same folder, same size: only the last-modified timestamp changes
+            self._apply_file_stats_delta(db, file.project_id, file.folder_id, 0, 0)
+            self._write_manifest_changes(db, file.folder_id, manifest_changes)
             db.commit()
             db.refresh(file)
 
@@ -721,6 +1143,438 @@ class SongProjectService:
             )
             return None
 
+    def get_manifest_nodes(self, db: Session, folder_id: UUID, paths: list[str]) -> list[ProjectManifestNode]:
+        """
+        Get manifest nodes of a folder by directory path
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            paths: Folder-relative directory paths ("" = folder root)
+
+        Returns:
+            List of existing ProjectManifestNode instances (missing paths are omitted)
+        """
+        try:
+            return (
+                db.query(ProjectManifestNode)
+                .filter(ProjectManifestNode.folder_id == folder_id, ProjectManifestNode.path.in_(paths))
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get manifest nodes DB error", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return []
+
+    def get_manifest_child_nodes(
+        self, db: Session, folder_id: UUID, parent_paths: list[str]
+    ) -> list[ProjectManifestNode]:
+        """
+        Get the direct subdirectory nodes of several manifest paths (one query)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            parent_paths: Folder-relative directory paths
+
+        Returns:
+            List of ProjectManifestNode instances ordered by path
+        """
+        try:
+            return (
+                db.query(ProjectManifestNode)
+                .filter(ProjectManifestNode.folder_id == folder_id, ProjectManifestNode.parent_path.in_(parent_paths))
+                .order_by(ProjectManifestNode.path)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Get manifest child nodes DB error",
+                folder_id=str(folder_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return []
+
+    def lock_folder(self, db: Session, folder_id: UUID) -> ProjectFolder | None:
+        """
+        Get a folder and lock its row until the caller commits (SELECT ... FOR UPDATE)
+
+        Taken before reading manifest nodes for a file change or rebuild - file changes
+        update the folder statistics row anyway, so the lock serializes node updates of
+        the same folder without blocking other folders.
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+
+        Returns:
+            ProjectFolder instance if found, None otherwise
+        """
+        try:
+            return db.query(ProjectFolder).filter(ProjectFolder.id == folder_id).with_for_update().first()
+        except SQLAlchemyError as e:
+            logger.error("Lock folder DB error", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__)
+            return None
+
+    def replace_folder_manifest(self, db: Session, folder_id: UUID, nodes: dict[str, dict[str, Any]]) -> bool:
+        """
+        Replace all manifest nodes of a folder (full rebuild, caller holds lock_folder)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            nodes: Directory path -> {"node_hash", "file_count", "parent_path"}
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            db.query(ProjectManifestNode).filter(ProjectManifestNode.folder_id == folder_id).delete(
+                synchronize_session=False
+            )
+            db.add_all(
+                ProjectManifestNode(
+                    folder_id=folder_id,
+                    path=path,
+                    parent_path=node["parent_path"],
+                    node_hash=node["node_hash"],
+                    file_count=node["file_count"],
+                )
+                for path, node in nodes.items()
+            )
+            db.commit()
+
+            logger.info("Folder manifest replaced", folder_id=str(folder_id), nodes=len(nodes))
+            return True
+
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(
+                "Folder manifest replace DB error", folder_id=str(folder_id), error=str(e), error_type=type(e).__name__
+            )
+            return False
+
+    def get_blobs_by_hash(self, db: Session, file_hashes: list[str]) -> dict[str, ProjectFileBlob]:
+        """
+        Get content-addressed blobs for several hashes (one query)
+
+        Args:
+            db: Database session
+            file_hashes: SHA256 hashes
+
+        Returns:
+            Dict file_hash -> ProjectFileBlob (unknown hashes are omitted)
+        """
+        if not file_hashes:
+            return {}
+        try:
+            blobs = db.query(ProjectFileBlob).filter(ProjectFileBlob.file_hash.in_(set(file_hashes))).all()
+            return {blob.file_hash: blob for blob in blobs}
+        except SQLAlchemyError as e:
+            logger.error("Get blobs DB error", error=str(e), error_type=type(e).__name__)
+            return {}
+
+    def get_user_blobs_by_hash(self, db: Session, user_id: UUID, file_hashes: list[str]) -> dict[str, ProjectFileBlob]:
+        """
+        Get the blobs a user already references from one of their own projects (one query)
+
+        Claims must not reach content of other users - knowing a hash does not prove
+        having the content. Blobs the user does not reference are omitted.
+
+        Args:
+            db: Database session
+            user_id: Owner of the projects
+            file_hashes: SHA256 hashes
+
+        Returns:
+            Dict file_hash -> ProjectFileBlob
+        """
+        if not file_hashes:
+            return {}
+        try:
+            owned = (
+                db.query(ProjectFile.id)
+                .join(SongProject, ProjectFile.project_id == SongProject.id)
+                .filter(
+                    SongProject.user_id == user_id,
+                    ProjectFile.storage_backend == "blob",
+                    ProjectFile.file_hash == ProjectFileBlob.file_hash,
+                )
+                .exists()
+            )
+            blobs = db.query(ProjectFileBlob).filter(ProjectFileBlob.file_hash.in_(set(file_hashes)), owned).all()
+            return {blob.file_hash: blob for blob in blobs}
+        except SQLAlchemyError as e:
+            logger.error("Get user blobs DB error", user_id=str(user_id), error=str(e), error_type=type(e).__name__)
+            return {}
+
+    def register_blob(
+        self, db: Session, file_hash: str, s3_key: str, file_size_bytes: int, mime_type: str | None = None
+    ) -> bool:
+        """
+        Register a stored blob (no-op if the hash is already registered)
+
+        New blobs start without references; the GC grace period protects them until
+        create_file()/update_file() adds the first reference.
+
+        Args:
+            db: Database session
+            file_hash: SHA256 of the content
+            s3_key: Object key of the stored content
+            file_size_bytes: Content size
+            mime_type: MIME type of the first upload
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            db.execute(
+                pg_insert(ProjectFileBlob)
+                .values(
+                    file_hash=file_hash,
+                    s3_key=s3_key,
+                    file_size_bytes=file_size_bytes,
+                    mime_type=mime_type,
+                    ref_count=0,
+                    unreferenced_at=func.now(),
+                )
+                .on_conflict_do_nothing(index_elements=[ProjectFileBlob.file_hash])
+            )
+            db.commit()
+            return True
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Register blob DB error", file_hash=file_hash, error=str(e), error_type=type(e).__name__)
+            return False
+
+    def lock_unreferenced_blobs(self, db: Session, unreferenced_before: datetime, limit: int) -> list[ProjectFileBlob]:
+        """
+        Lock a batch of blobs that have had no references since before the cutoff
+
+        Rows stay locked until the caller commits, so a concurrent claim of the same
+        hash waits and then finds the blob gone (the client uploads it again).
+
+        Args:
+            db: Database session
+            unreferenced_before: Cutoff (now - grace period)
+            limit: Batch size
+
+        Returns:
+            List of locked ProjectFileBlob instances
+        """
+        try:
+            return (
+                db.query(ProjectFileBlob)
+                .filter(ProjectFileBlob.ref_count <= 0, ProjectFileBlob.unreferenced_at < unreferenced_before)
+                .order_by(ProjectFileBlob.unreferenced_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Lock unreferenced blobs DB error", error=str(e), error_type=type(e).__name__)
+            return []
+
+    def delete_blobs(self, db: Session, file_hashes: list[str]) -> int:
+        """
+        Delete blob rows (after their objects were removed) and release GC locks
+
+        Rows that got referenced again meanwhile are kept.
+
+        Args:
+            db: Database session
+            file_hashes: SHA256 hashes of the blobs to delete
+
+        Returns:
+            Number of deleted rows
+        """
+        if not file_hashes:
+            db.commit()
+            return 0
+        try:
+            deleted = (
+                db.query(ProjectFileBlob)
+                .filter(ProjectFileBlob.file_hash.in_(file_hashes), ProjectFileBlob.ref_count <= 0)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Delete blobs DB error", error=str(e), error_type=type(e).__name__)
+            return 0
+
+    def create_upload_session(self, db: Session, session_data: dict[str, Any]) -> ProjectUploadSession | None:
+        """
+        Create a resumable upload session
+
+        Args:
+            db: Database session
+            session_data: ProjectUploadSession column values (id, project_id, folder_id, user_id,
+                relative_path, file_size_bytes, file_hash, staging_key, upload_id, chunk_size, expires_at)
+
+        Returns:
+            Created ProjectUploadSession instance, None on error
+        """
+        try:
+            upload_session = ProjectUploadSession(**session_data)
+            db.add(upload_session)
+            db.commit()
+            db.refresh(upload_session)
+            logger.info(
+                "Upload session created",
+                session_id=str(upload_session.id),
+                relative_path=upload_session.relative_path,
+                file_size_bytes=upload_session.file_size_bytes,
+            )
+            return upload_session
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Create upload session DB error", error=str(e), error_type=type(e).__name__)
+            return None
+
+    def get_upload_session(self, db: Session, session_id: UUID) -> ProjectUploadSession | None:
+        """
+        Get upload session by ID
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+
+        Returns:
+            ProjectUploadSession instance if found, None otherwise
+        """
+        try:
+            return db.query(ProjectUploadSession).filter(ProjectUploadSession.id == session_id).first()
+        except SQLAlchemyError as e:
+            logger.error("Get upload session DB error", session_id=str(session_id), error=str(e))
+            return None
+
+    def find_open_upload_session(
+        self,
+        db: Session,
+        folder_id: UUID,
+        user_id: UUID,
+        relative_path: str,
+        file_hash: str,
+        file_size_bytes: int,
+        now: datetime,
+    ) -> ProjectUploadSession | None:
+        """
+        Find an unexpired open session for the same file content (resume after interruption)
+
+        Args:
+            db: Database session
+            folder_id: Folder UUID
+            user_id: Session owner
+            relative_path: Folder-relative target path
+            file_hash: Expected SHA256
+            file_size_bytes: Expected size
+            now: Current time (expired sessions are ignored)
+
+        Returns:
+            Most recent matching ProjectUploadSession, None if there is none
+        """
+        try:
+            return (
+                db.query(ProjectUploadSession)
+                .filter(
+                    ProjectUploadSession.folder_id == folder_id,
+                    ProjectUploadSession.relative_path == relative_path,
+                    ProjectUploadSession.status == "open",
+                    ProjectUploadSession.user_id == user_id,
+                    ProjectUploadSession.file_hash == file_hash,
+                    ProjectUploadSession.file_size_bytes == file_size_bytes,
+                    ProjectUploadSession.expires_at > now,
+                )
+                .order_by(ProjectUploadSession.created_at.desc())
+                .first()
+            )
+        except SQLAlchemyError as e:
+            logger.error("Find upload session DB error", relative_path=relative_path, error=str(e))
+            return None
+
+    def update_upload_session(
+        self, db: Session, session_id: UUID, update_data: dict[str, Any]
+    ) -> ProjectUploadSession | None:
+        """
+        Update upload session fields (expires_at, status, file_id)
+
+        Args:
+            db: Database session
+            session_id: Session UUID
+            update_data: Column values to set
+
+        Returns:
+            Updated ProjectUploadSession instance, None if not found or on error
+        """
+        try:
+            upload_session = db.query(ProjectUploadSession).filter(ProjectUploadSession.id == session_id).first()
+            if not upload_session:
+                return None
+            for field, value in update_data.items():
+                setattr(upload_session, field, value)
+            db.commit()
+            db.refresh(upload_session)
+            return upload_session
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Update upload session DB error", session_id=str(session_id), error=str(e))
+            return None
+
+    def get_expired_upload_sessions(self, db: Session, now: datetime, limit: int) -> list[ProjectUploadSession]:
+        """
+        Get expired upload sessions (any status) for cleanup
+
+        Args:
+            db: Database session
+            now: Current time
+            limit: Batch size
+
+        Returns:
+            List of ProjectUploadSession instances, oldest first
+        """
+        try:
+            return (
+                db.query(ProjectUploadSession)
+                .filter(ProjectUploadSession.expires_at <= now)
+                .order_by(ProjectUploadSession.expires_at)
+                .limit(limit)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.error("Get expired upload sessions DB error", error=str(e), error_type=type(e).__name__)
+            return []
+
+    def delete_upload_sessions(self, db: Session, session_ids: list[UUID]) -> int:
+        """
+        Delete upload sessions
+
+        Args:
+            db: Database session
+            session_ids: Session UUIDs
+
+        Returns:
+            Number of deleted rows
+        """
+        if not session_ids:
+            return 0
+        try:
+            deleted = (
+                db.query(ProjectUploadSession)
+                .filter(ProjectUploadSession.id.in_(session_ids))
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Delete upload sessions DB error", error=str(e), error_type=type(e).__name__)
+            return 0
+
     def get_assigned_songs_for_folder(self, db: Session, project_id: UUID, folder_id: UUID) -> list[Any]:
         """
         Get all assigned songs for a project folder (CRUD only)
@@ -950,6 +1804,48 @@ class SongProjectService:
             )
             return []
 
+    def get_assigned_releases_for_projects(self, db: Session, project_ids: list[UUID]) -> dict[UUID, list[Any]]:
+        """
+        Get releases assigned to several projects in one query (list views)
+
+        Args:
+            db: Database session
+            project_ids: Project UUIDs
+
+        Returns:
+            Dict of project UUID -> list of SongRelease instances (ordered by name).
+            Every requested project is present, projects without releases map to [].
+        """
+        releases_by_project: dict[UUID, list[Any]] = {project_id: [] for project_id in project_ids}
+        if not project_ids:
+            return releases_by_project
+
+        try:
+            from db.models import ReleaseProjectReference, SongRelease
+
+            rows = (
+                db.query(ReleaseProjectReference.project_id, SongRelease)
+                .join(SongRelease, ReleaseProjectReference.release_id == SongRelease.id)
+                .filter(ReleaseProjectReference.project_id.in_(project_ids))
+                .order_by(SongRelease.name)
+                .all()
+            )
+
+            for project_id, release in rows:
+                releases_by_project.setdefault(project_id, []).append(release)
+
+            logger.debug("Assigned releases retrieved for projects", project_count=len(project_ids), count=len(rows))
+            return releases_by_project
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to get assigned releases for projects",
+                error=str(e),
+                error_type=type(e).__name__,
+                project_count=len(project_ids),
+            )
+            return releases_by_project
+
 
 # Global service instance
 song_project_service = SongProjectService()
@@ -4,14 +4,37 @@ from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, desc, nullslast, or_
+from sqlalchemy import DateTime, case, desc, nullslast, or_, type_coerce
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
 
 from db.models import ReleaseProjectReference, SongProject, SongRelease
+from db.pagination_helpers import apply_keyset_pagination, build_keyset_page
 from utils.logger import logger
 
 
+def _release_sort_field():
+    """
+    Status-based smart sort date
+
+    - released: sort by release_date (not created_at!)
+    - uploaded: sort by upload_date
+    - downtaken: sort by downtaken_date
+    - archived/rejected: sort by updated_at
+    - draft/arranging/mixing/mastering: sort by created_at (newest first)
+
+    PostgreSQL promotes the mixed DATE/TIMESTAMPTZ branches to timestamptz.
+    """
+    sort_field = case(
+        (SongRelease.status == "released", SongRelease.release_date),
+        (SongRelease.status == "uploaded", SongRelease.upload_date),
+        (SongRelease.status == "downtaken", SongRelease.downtaken_date),
+        (SongRelease.status.in_(["archived", "rejected"]), SongRelease.updated_at),
+        else_=SongRelease.created_at,  # draft, arranging, mixing, mastering
+    )
+    return type_coerce(sort_field, DateTime(timezone=True))
+
+
 class SongReleaseService:
     """Service for song release database operations (CRUD only, NO business logic)"""
 
@@ -136,6 +159,32 @@ class SongReleaseService:
             logger.error("Get release DB error", error=str(e), release_id=str(release_id))
             return None
 
+    @staticmethod
+    def _filter_releases(db: Session, user_id: UUID, status_filter: str | None, search: str | None):
+        """Build the user-scoped release query with status group and search filters"""
+        query = db.query(SongRelease).filter(SongRelease.user_id == user_id)
+
+        # Apply status filter
+        if status_filter:
+            if status_filter == "all":
+                # Exclude rejected, downtaken, archived
+                query = query.filter(SongRelease.status.notin_(["rejected", "downtaken", "archived"]))
+            elif status_filter == "progress":
+                query = query.filter(SongRelease.status.in_(["arranging", "mixing", "mastering"]))
+            elif status_filter == "uploaded":
+                query = query.filter(SongRelease.status == "uploaded")
+            elif status_filter == "released":
+                query = query.filter(SongRelease.status == "released")
+            elif status_filter == "archive":
+                query = query.filter(SongRelease.status.in_(["rejected", "downtaken", "archived"]))
+
+        # Apply search filter
+        if search:
+            search_term = f"%{search}%"
+            query = query.filter(or_(SongRelease.name.ilike(search_term), SongRelease.genre.ilike(search_term)))
+
+        return query
+
     def get_releases_paginated(
         self,
         db: Session,
@@ -160,48 +209,15 @@ class SongReleaseService:
             Tuple of (releases list, total count)
         """
         try:
-            query = db.query(SongRelease).filter(SongRelease.user_id == user_id)
-
-            # Apply status filter
-            if status_filter:
-                if status_filter == "all":
-                    # Exclude rejected, downtaken, archived
-                    query = query.filter(SongRelease.status.notin_(["rejected", "downtaken", "archived"]))
-                elif status_filter == "progress":
-                    query = query.filter(SongRelease.status.in_(["arranging", "mixing", "mastering"]))
-                elif status_filter == "uploaded":
-                    query = query.filter(SongRelease.status == "uploaded")
-                elif status_filter == "released":
-                    query = query.filter(SongRelease.status == "released")
-                elif status_filter == "archive":
-                    query = query.filter(SongRelease.status.in_(["rejected", "downtaken", "archived"]))
-
-            # Apply search filter
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(or_(SongRelease.name.ilike(search_term), SongRelease.genre.ilike(search_term)))
+            query = self._filter_releases(db, user_id, status_filter, search)
 
             # Get total count
             total = query.count()
 
-            # Apply status-based smart sorting
-            # - released: sort by release_date (not created_at!)
-            # - uploaded: sort by upload_date
-            # - downtaken: sort by downtaken_date
-            # - archived/rejected: sort by updated_at
-            # - draft/arranging/mixing/mastering: sort by created_at (newest first)
-            sort_field = case(
-                (SongRelease.status == "released", SongRelease.release_date),
-                (SongRelease.status == "uploaded", SongRelease.upload_date),
-                (SongRelease.status == "downtaken", SongRelease.downtaken_date),
-                (SongRelease.status.in_(["archived", "rejected"]), SongRelease.updated_at),
-                else_=SongRelease.created_at,  # draft, arranging, mixing, mastering
-            )
-
             # Apply pagination and sorting (NULL dates go to end)
             releases = (
                 query.order_by(
-                    nullslast(desc(sort_field)),  # Primary: status-based date field
+                    nullslast(desc(_release_sort_field())),  # Primary: status-based date field
                     desc(SongRelease.created_at),  # Secondary: created_at as tiebreaker
                 )
                 .limit(limit)
@@ -224,6 +240,60 @@ class SongReleaseService:
             logger.error("Get releases paginated DB error", error=str(e), user_id=str(user_id))
             return [], 0
 
+    def get_releases_by_cursor(
+        self,
+        db: Session,
+        user_id: UUID,
+        cursor: str = "",
+        limit: int = 20,
+        status_filter: str | None = None,
+        search: str | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[SongRelease], int | None, str | None]:
+        """
+        Get releases with keyset pagination
+
+        Same status-based date ordering as get_releases_paginated(), with id instead of
+        created_at as tiebreaker (a cursor needs a unique key).
+
+        Args:
+            db: Database session
+            user_id: User ID (from JWT)
+            cursor: Cursor from the previous page ("" for the first page)
+            limit: Max number of results
+            status_filter: Filter by status group ('all', 'progress', 'uploaded', 'released', 'archive')
+            search: Search in name/genre
+            include_total: Also count all matching releases (extra query)
+
+        Returns:
+            Tuple of (releases list, total count or None, next_cursor or None)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another sort order
+        """
+        try:
+            query = self._filter_releases(db, user_id, status_filter, search)
+            total = query.count() if include_total else None
+
+            sort_field = _release_sort_field()
+            query = apply_keyset_pagination(query, sort_field, SongRelease.id, "desc", cursor, limit, nullable=True)
+            releases, next_cursor = build_keyset_page(query.all(), limit, sort_field, "desc")
+
+            logger.debug(
+                "Releases retrieved by cursor",
+                user_id=str(user_id),
+                total=total,
+                limit=limit,
+                has_more=next_cursor is not None,
+                filter=status_filter,
+                search=search,
+            )
+            return releases, total, next_cursor
+
+        except SQLAlchemyError as e:
+            logger.error("Get releases by cursor DB error", error=str(e), user_id=str(user_id))
+            return [], 0 if include_total else None, None
+
     def update_release(
         self, db: Session, release_id: UUID, user_id: UUID, update_data: dict[str, Any]
     ) -> SongRelease | None:
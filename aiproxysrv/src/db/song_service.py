@@ -4,14 +4,26 @@ import traceback
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import and_, or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from db.database import get_db
-from db.models import Song, SongChoice
+from db.models import Song, SongChoice, SongStatus
+from db.pagination_helpers import InvalidCursorError, apply_keyset_pagination, build_keyset_page
+from db.search_helpers import apply_fulltext_search
 from utils.logger import logger
 
 
+# (Mureka URL column, S3 key column) per choice file type
+CHOICE_FILE_COLUMNS = {
+    "mp3": (SongChoice.mp3_url, SongChoice.mp3_s3_key),
+    "flac": (SongChoice.flac_url, SongChoice.flac_s3_key),
+    "wav": (SongChoice.wav_url, SongChoice.wav_s3_key),
+    "stems": (SongChoice.stem_url, SongChoice.stem_s3_key),
+}
+
+
 class SongService:
     """Service for song database operations"""
 
@@ -96,6 +108,25 @@ class SongService:
             )
             return None
 
+    @staticmethod
+    def _filter_songs(query, status: str = None, search: str = "", workflow: str = None):
+        """Apply status, workflow and full-text search filters, returns (query, search_rank)"""
+        # Apply status filter if provided
+        if status:
+            query = query.filter(Song.status == status)
+
+        # Apply workflow filter if provided
+        if workflow:
+            if workflow == "all":
+                # "all" excludes only notUsed and fail workflows (NULL is allowed)
+                query = query.filter((Song.workflow.is_(None)) | (Song.workflow.notin_(["notUsed", "fail"])))
+            else:
+                # Specific workflow filter
+                query = query.filter(Song.workflow == workflow)
+
+        # Apply full-text search filter if provided (GIN index on search_vector)
+        return apply_fulltext_search(query, Song.search_vector, search)
+
     def get_songs_paginated(
         self,
         limit: int = 20,
@@ -114,8 +145,8 @@ class SongService:
             offset: Number of songs to skip (default 0)
             status: Optional status filter (SUCCESS, PENDING, FAILURE, etc.)
             search: Search term to filter by title, lyrics, or tags
-            sort_by: Field to sort by (created_at, title, lyrics)
-            sort_direction: Sort direction (asc, desc)
+            sort_by: Field to sort by (created_at, title, lyrics, relevance)
+            sort_direction: Sort direction (asc, desc), ignored for relevance
             workflow: Optional workflow filter (onWork, inUse, notUsed)
 
         Returns:
@@ -126,30 +157,12 @@ class SongService:
             try:
                 query = db.query(Song).options(joinedload(Song.choices), joinedload(Song.project))
 
-                # Apply status filter if provided
-                if status:
-                    query = query.filter(Song.status == status)
-
-                # Apply workflow filter if provided
-                if workflow:
-                    if workflow == "all":
-                        # "all" excludes only notUsed and fail workflows (NULL is allowed)
-                        query = query.filter((Song.workflow.is_(None)) | (Song.workflow.notin_(["notUsed", "fail"])))
-                    else:
-                        # Specific workflow filter
-                        query = query.filter(Song.workflow == workflow)
-
-                # Apply search filter if provided
-                if search:
-                    search_term = f"%{search}%"
-                    from sqlalchemy import or_
-
-                    query = query.filter(
-                        or_(Song.title.ilike(search_term), Song.lyrics.ilike(search_term), Song.tags.ilike(search_term))
-                    )
+                query, search_rank = self._filter_songs(query, status, search, workflow)
 
                 # Apply sorting
-                if sort_by == "title":
+                if sort_by == "relevance" and search_rank is not None:
+                    query = query.order_by(search_rank.desc(), Song.created_at.desc())
+                elif sort_by == "title":
                     # Handle null titles by treating them as empty strings for sorting
                     if sort_direction == "desc":
                         query = query.order_by(Song.title.desc().nullslast())
@@ -190,43 +203,80 @@ class SongService:
             )
             return []
 
-    def get_total_songs_count(self, status: str = None, search: str = "", workflow: str = None) -> int:
+    def get_songs_by_cursor(
+        self,
+        cursor: str = "",
+        limit: int = 20,
+        status: str = None,
+        search: str = "",
+        sort_direction: str = "desc",
+        workflow: str = None,
+    ) -> tuple[list[Song], str | None]:
         """
-        Get total count of songs with optional search and workflow filter
+        Get songs with keyset pagination (sorted by created_at, id)
 
         Args:
-            status: Optional status filter
+            cursor: Cursor from the previous page ("" for the first page)
+            limit: Number of songs to return (default 20)
+            status: Optional status filter (SUCCESS, PENDING, FAILURE, etc.)
             search: Search term to filter by title, lyrics, or tags
+            sort_direction: Sort direction (asc, desc)
             workflow: Optional workflow filter (onWork, inUse, notUsed)
 
         Returns:
-            Total number of songs matching the criteria
+            Tuple of (songs with loaded choices, next_cursor or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or belongs to another sort order
         """
         try:
             db = next(get_db())
             try:
-                query = db.query(Song)
+                query = db.query(Song).options(joinedload(Song.choices), joinedload(Song.project))
+                query, _ = self._filter_songs(query, status, search, workflow)
 
-                if status:
-                    query = query.filter(Song.status == status)
+                query = apply_keyset_pagination(query, Song.created_at, Song.id, sort_direction, cursor, limit)
+                songs, next_cursor = build_keyset_page(query.all(), limit, Song.created_at, sort_direction)
+                logger.debug(
+                    "songs_retrieved_by_cursor",
+                    count=len(songs),
+                    limit=limit,
+                    has_more=next_cursor is not None,
+                    status=status,
+                    search=search,
+                    workflow=workflow,
+                    sort_direction=sort_direction,
+                )
+                return songs, next_cursor
+            finally:
+                db.close()
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(
+                "error_getting_songs_by_cursor",
+                error=str(e),
+                error_type=type(e).__name__,
+                stacktrace=traceback.format_exc(),
+            )
+            return [], None
 
-                # Apply workflow filter if provided
-                if workflow:
-                    if workflow == "all":
-                        # "all" excludes only notUsed and fail workflows (NULL is allowed)
-                        query = query.filter((Song.workflow.is_(None)) | (Song.workflow.notin_(["notUsed", "fail"])))
-                    else:
-                        # Specific workflow filter
-                        query = query.filter(Song.workflow == workflow)
+    def get_total_songs_count(self, status: str = None, search: str = "", workflow: str = None) -> int:
+        """
+        Get total count of songs with optional search and workflow filter
 
-                # Apply search filter if provided
-                if search:
-                    search_term = f"%{search}%"
-                    from sqlalchemy import or_
+        Args:
+            status: Optional status filter
+            search: Search term to filter by title, lyrics, or tags
+            workflow: Optional workflow filter (onWork, inUse, notUsed)
 
-                    query = query.filter(
-                        or_(Song.title.ilike(search_term), Song.lyrics.ilike(search_term), Song.tags.ilike(search_term))
-                    )
+        Returns:
+            Total number of songs matching the criteria
+        """
+        try:
+            db = next(get_db())
+            try:
+                query, _ = self._filter_songs(db.query(Song), status, search, workflow)
 
                 count = query.count()
                 logger.debug(
@@ -564,6 +614,131 @@ class SongService:
             db.rollback()
             return False
 
+    def get_choice_ids_pending_migration(
+        self, db, file_types: list[str], max_attempts: int, now: datetime, limit: int
+    ) -> list[Any]:
+        """
+        Get choices of successful songs with CDN files not yet stored in S3 (newest songs first)
+
+        CRUD ONLY - No business logic!
+
+        Args:
+            db: Database session
+            file_types: File types to check ('mp3', 'flac', 'wav', 'stems')
+            max_attempts: Skip choices that failed this often
+            now: Current time (choices in backoff or leased are skipped)
+            limit: Batch size
+
+        Returns:
+            List of choice UUIDs
+        """
+        pending = [
+            and_(url_column.isnot(None), s3_key_column.is_(None))
+            for file_type, (url_column, s3_key_column) in CHOICE_FILE_COLUMNS.items()
+            if file_type in file_types
+        ]
+        if not pending:
+            return []
+        try:
+            rows = (
+                db.query(SongChoice.id)
+                .join(Song, Song.id == SongChoice.song_id)
+                .filter(
+                    Song.status == SongStatus.SUCCESS.value,
+                    or_(*pending),
+                    SongChoice.s3_migration_attempts < max_attempts,
+                    or_(
+                        SongChoice.s3_migration_next_attempt_at.is_(None),
+                        SongChoice.s3_migration_next_attempt_at <= now,
+                    ),
+                )
+                .order_by(Song.created_at.desc(), SongChoice.choice_index)
+                .limit(limit)
+                .all()
+            )
+            return [row.id for row in rows]
+        except SQLAlchemyError as e:
+            logger.error("Get choices pending migration DB error", error=str(e), error_type=type(e).__name__)
+            return []
+
+    def claim_choice_for_migration(
+        self, db, choice_id, now: datetime, lease_until: datetime, max_attempts: int | None = None
+    ) -> bool:
+        """
+        Claim a choice for migration (atomic - only one process transfers a choice at a time)
+
+        CRUD ONLY - No business logic!
+
+        Args:
+            db: Database session
+            choice_id: UUID of the choice
+            now: Current time (an unexpired lease of another process blocks the claim)
+            lease_until: Lease expiry (claim is retried by others after this)
+            max_attempts: Do not claim choices that failed this often (None = no limit)
+
+        Returns:
+            True if claimed, False if leased elsewhere, in backoff, given up or not found
+        """
+        try:
+            query = db.query(SongChoice).filter(
+                SongChoice.id == choice_id,
+                or_(
+                    SongChoice.s3_migration_next_attempt_at.is_(None),
+                    SongChoice.s3_migration_next_attempt_at <= now,
+                ),
+            )
+            if max_attempts is not None:
+                query = query.filter(SongChoice.s3_migration_attempts < max_attempts)
+            claimed = query.update({SongChoice.s3_migration_next_attempt_at: lease_until}, synchronize_session=False)
+            db.commit()
+            return claimed == 1
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(
+                "Claim choice for migration DB error",
+                choice_id=str(choice_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
+    def record_choice_migration_result(
+        self, db, choice_id, error: str | None, next_attempt_at: datetime | None = None
+    ) -> bool:
+        """
+        Store the outcome of a migration run (releases the lease)
+
+        CRUD ONLY - No business logic!
+
+        Args:
+            db: Database session
+            choice_id: UUID of the choice
+            error: None on success, error message on failure (counts as attempt)
+            next_attempt_at: Earliest retry after a failure
+
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        update_data: dict[Any, Any] = {
+            SongChoice.s3_migration_error: error,
+            SongChoice.s3_migration_next_attempt_at: next_attempt_at if error else None,
+        }
+        if error:
+            update_data[SongChoice.s3_migration_attempts] = SongChoice.s3_migration_attempts + 1
+        try:
+            db.query(SongChoice).filter(SongChoice.id == choice_id).update(update_data, synchronize_session=False)
+            db.commit()
+            return True
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(
+                "Record choice migration result DB error",
+                choice_id=str(choice_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
 
 # Global service instance
 song_service = SongService()
@@ -588,3 +763,18 @@ def get_choice_by_id_with_song(db, choice_id):
 def update_choice_s3_key(db, choice_id, file_type, s3_key):
     """Wrapper function for service method"""
     return song_service.update_choice_s3_key(db, choice_id, file_type, s3_key)
+
+
+def get_choice_ids_pending_migration(db, file_types, max_attempts, now, limit):
+    """Wrapper function for service method"""
+    return song_service.get_choice_ids_pending_migration(db, file_types, max_attempts, now, limit)
+
+
+def claim_choice_for_migration(db, choice_id, now, lease_until, max_attempts=None):
+    """Wrapper function for service method"""
+    return song_service.claim_choice_for_migration(db, choice_id, now, lease_until, max_attempts)
+
+
+def record_choice_migration_result(db, choice_id, error, next_attempt_at=None):
+    """Wrapper function for service method"""
+    return song_service.record_choice_migration_result(db, choice_id, error, next_attempt_at)
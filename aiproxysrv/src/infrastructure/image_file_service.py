@@ -1,6 +1,10 @@
 """Image File Service - Handles PIL/Pillow operations and file I/O"""
 
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +13,56 @@ from PIL import Image, ImageDraw, ImageFont
 from utils.logger import logger
 
 
+# Parsed TrueType fonts kept in memory per thread (font styles x typical sizes of the overlay editor)
+FONT_CACHE_SIZE = 64
+
+# A FreeTypeFont wraps one FT_Face, which FreeType does not allow to be used by two
+# threads at once - every gthread thread keeps its own fonts instead of sharing them
+_thread_fonts = threading.local()
+
+
+def _load_truetype_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    load = getattr(_thread_fonts, "load", None)
+    if load is None:
+        load = _thread_fonts.load = lru_cache(maxsize=FONT_CACHE_SIZE)(ImageFont.truetype)
+    return load(font_path, font_size)
+
+
+class DecodedImageCache:
+    """
+    Thread-safe LRU of decoded images (returns copies - callers may draw on them)
+
+    Cached images are never modified, so copies are taken outside the lock.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Image.Image, tuple[int, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[Image.Image, tuple[int, int]] | None:
+        """Get (copy of decoded image, original size) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        img, original_size = entry
+        return img.copy(), original_size
+
+    def put(self, key: str, img: Image.Image, original_size: tuple[int, int]) -> None:
+        """Store a decoded image (evicts the least recently used entry when full)"""
+        if self.max_entries <= 0:
+            return
+        # Lazily decoded images would be loaded by the first copy() - possibly in two threads at once
+        img.load()
+        with self._lock:
+            self._entries[key] = (img, original_size)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class ImageFileService:
     """Infrastructure service for image file operations (PIL + File System)"""
 
@@ -66,6 +120,9 @@ class ImageFileService:
         """
         Load TrueType font or fallback to default
 
+        TrueType fonts are cached per (path, size) and thread - overlay requests reuse the
+        parsed font instead of re-opening the TTF file.
+
         Args:
             font_path: Path to .ttf file (or None for default font)
             font_size: Font size in pixels
@@ -75,7 +132,7 @@ class ImageFileService:
         """
         if font_path and font_path.exists():
             try:
-                font = ImageFont.truetype(str(font_path), font_size)
+                font = _load_truetype_font(str(font_path), font_size)
                 logger.debug("Font loaded", font_path=str(font_path), font_size=font_size)
                 return font
             except Exception as e:
@@ -123,6 +180,8 @@ class ImageFileService:
         """
         Draw text with outline on image
 
+        Single pass with FreeType's native stroke (instead of (2w+1)^2 offset copies).
+
         Args:
             draw: PIL ImageDraw object
             position: (x, y) coordinates
@@ -133,16 +192,15 @@ class ImageFileService:
             outline_width: Pixel width of outline
             anchor: PIL text anchor (e.g., 'lt' for left-top)
         """
-        x, y = position
-
-        # Draw outline (by drawing text multiple times with offset)
-        for adj_x in range(-outline_width, outline_width + 1):
-            for adj_y in range(-outline_width, outline_width + 1):
-                if adj_x != 0 or adj_y != 0:  # Skip center
-                    draw.text((x + adj_x, y + adj_y), text, font=font, fill=outline_color, anchor=anchor)
-
-        # Draw main text on top
-        draw.text((x, y), text, font=font, fill=text_color, anchor=anchor)
+        draw.text(
+            position,
+            text,
+            font=font,
+            fill=text_color,
+            anchor=anchor,
+            stroke_width=max(outline_width, 0),
+            stroke_fill=outline_color,
+        )
         logger.debug("Text drawn", text=text[:20], position=position, anchor=anchor)
 
     @staticmethod
@@ -168,3 +226,99 @@ class ImageFileService:
 
         logger.debug("Unique filename generated", original=base_path, generated=output_path)
         return output_path
+
+    @staticmethod
+    def get_image_size(image_data: bytes) -> tuple[int, int]:
+        """Get (width, height) of encoded image bytes (reads the header only)"""
+        with Image.open(BytesIO(image_data)) as img:
+            return img.size
+
+    @staticmethod
+    def _to_derivative_mode(img: Image.Image, image_format: str) -> Image.Image:
+        """RGB(A) copy for the encoder - WebP keeps transparency, JPEG gets a white background"""
+        if not img.has_transparency_data:
+            return img.convert("RGB")
+        rgba = img.convert("RGBA")
+        if image_format == "webp":
+            return rgba
+        flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+        flattened.paste(rgba, mask=rgba.getchannel("A"))
+        return flattened
+
+    @staticmethod
+    def render_derivatives(
+        image_data: bytes, sizes: dict[str, tuple[int, int]], image_format: str = "webp", quality: int = 80
+    ) -> dict[str, bytes]:
+        """
+        Render downscaled variants of an image (decoded once, resized per size)
+
+        Args:
+            image_data: Original image bytes
+            sizes: Derivative size name -> target (width, height)
+            image_format: Output format ('webp' or 'jpeg')
+            quality: Encoder quality (1-100)
+
+        Returns:
+            Derivative size name -> encoded bytes
+
+        Raises:
+            IOError: If image can't be decoded or encoded
+        """
+        with Image.open(BytesIO(image_data)) as img:
+            # draft() lets the JPEG decoder skip pixels (DCT scaling) - no-op for PNG
+            largest = max(sizes.values(), key=lambda dimensions: dimensions[0] * dimensions[1])
+            img.draft("RGB", largest)
+            source = ImageFileService._to_derivative_mode(img, image_format)
+
+        save_options = (
+            {"quality": quality, "method": 4} if image_format == "webp" else {"quality": quality, "optimize": True}
+        )
+        derivatives = {}
+        # Largest first, every smaller size is resized from the previous result (cheaper)
+        for name, dimensions in sorted(sizes.items(), key=lambda item: -item[1][0] * item[1][1]):
+            if source.size != dimensions:
+                source = source.resize(dimensions, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            output = BytesIO()
+            source.save(output, format=image_format.upper(), **save_options)
+            derivatives[name] = output.getvalue()
+
+        logger.debug("Image derivatives rendered", sizes=list(sizes), image_format=image_format)
+        return derivatives
+
+    @staticmethod
+    def decode_reduced(image_data: bytes, max_edge: int) -> tuple[Image.Image, tuple[int, int]]:
+        """
+        Decode an image at reduced resolution (fast path for previews)
+
+        thumbnail() decodes JPEG sources at 1/2, 1/4 or 1/8 scale (draft) and shrinks by an
+        integer box reduce before the final resampling (reducing_gap) - much cheaper than a
+        full decode + resize.
+
+        Args:
+            image_data: Encoded image bytes
+            max_edge: Longest edge in pixels (smaller images keep their size)
+
+        Returns:
+            Tuple (RGBA image, original (width, height))
+        """
+        with Image.open(BytesIO(image_data)) as img:
+            original_size = img.size
+            img.thumbnail((max_edge, max_edge), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            return img.convert("RGBA"), original_size
+
+    @staticmethod
+    def encode_image(img: Image.Image, image_format: str = "jpeg", quality: int = 80) -> bytes:
+        """
+        Encode an image to JPEG/WebP bytes (alpha is dropped)
+
+        Args:
+            img: PIL Image object
+            image_format: 'jpeg' or 'webp'
+            quality: Encoder quality (1-100)
+
+        Returns:
+            Encoded bytes
+        """
+        output = BytesIO()
+        img.convert("RGB").save(output, format=image_format.upper(), quality=quality)
+        return output.getvalue()
@@ -1,15 +1,23 @@
 """S3 Storage - S3-compatible storage implementation (MinIO, AWS, Backblaze, Wasabi)"""
 
+import weakref
+from collections.abc import Iterable, Iterator
 from io import BytesIO
 
-import boto3
 from botocore.exceptions import ClientError
 
 from config.settings import S3_ACCESS_KEY, S3_BUCKET, S3_ENDPOINT, S3_REGION, S3_SECRET_KEY
 from infrastructure.storage.storage_interface import StorageInterface
 from utils.logger import logger
+from utils.metrics import record_s3_bytes
+from utils.tracing import KIND_S3, trace_methods
 
 
+# Live storage instances - their clients are replaced after a fork (see reset_clients_after_fork)
+_instances: "weakref.WeakSet[S3Storage]" = weakref.WeakSet()
+
+
+@trace_methods(KIND_S3)
 class S3Storage(StorageInterface):
     """S3-compatible storage implementation (works with MinIO, AWS S3, Backblaze B2, Wasabi)"""
 
@@ -21,18 +29,28 @@ class S3Storage(StorageInterface):
             bucket: Bucket name (optional). If None, uses S3_BUCKET from config.
             skip_bucket_check: If True, skip bucket existence check (for health checks or when MinIO might be down)
         """
-        self.s3_client = boto3.client(
+        self.s3_client = self._create_client()
+        self.bucket = bucket or S3_BUCKET
+        _instances.add(self)
+
+        # Ensure bucket exists (skip if explicitly disabled for graceful degradation)
+        if not skip_bucket_check:
+            self._ensure_bucket_exists()
+
+    @staticmethod
+    def _create_client(config=None):
+        """boto3 S3 client for the configured endpoint"""
+        # Imported on first use: boto3 costs ~100 ms at import and most workers never touch S3 right away
+        import boto3
+
+        return boto3.client(
             "s3",
             endpoint_url=S3_ENDPOINT,
             aws_access_key_id=S3_ACCESS_KEY,
             aws_secret_access_key=S3_SECRET_KEY,
             region_name=S3_REGION,
+            config=config,
         )
-        self.bucket = bucket or S3_BUCKET
-
-        # Ensure bucket exists (skip if explicitly disabled for graceful degradation)
-        if not skip_bucket_check:
-            self._ensure_bucket_exists()
 
     def _ensure_bucket_exists(self):
         """Create bucket if it doesn't exist"""
@@ -65,6 +83,7 @@ class S3Storage(StorageInterface):
                 file_data = BytesIO(file_data)
 
             self.s3_client.upload_fileobj(file_data, self.bucket, key, ExtraArgs=extra_args)
+            record_s3_bytes(self.bucket, "in", file_data.getbuffer().nbytes)
             logger.info("File uploaded to S3", key=key, bucket=self.bucket)
             return key
 
@@ -78,6 +97,7 @@ class S3Storage(StorageInterface):
             buffer = BytesIO()
             self.s3_client.download_fileobj(self.bucket, key, buffer)
             buffer.seek(0)
+            record_s3_bytes(self.bucket, "out", buffer.getbuffer().nbytes)
             logger.debug("File downloaded from S3", key=key)
             return buffer.read()
 
@@ -136,9 +156,9 @@ class S3Storage(StorageInterface):
     def move(self, source_key: str, dest_key: str) -> bool:
         """Move file in S3 (copy + delete)"""
         try:
-            # Copy to new location
+            # Copy to new location (managed copy switches to multipart copy for objects > 5 GB)
             copy_source = {"Bucket": self.bucket, "Key": source_key}
-            self.s3_client.copy_object(CopySource=copy_source, Bucket=self.bucket, Key=dest_key)
+            self.s3_client.copy(copy_source, self.bucket, dest_key)
             logger.debug("File copied in S3", source=source_key, dest=dest_key)
 
             # Delete original
@@ -150,6 +170,129 @@ class S3Storage(StorageInterface):
             logger.error("S3 move failed", source=source_key, dest=dest_key, error=str(e))
             return False
 
+    def iter_chunks(self, key: str, chunk_size: int = 8 * 1024 * 1024) -> Iterator[bytes]:
+        """Stream file content from S3"""
+        try:
+            body = self.s3_client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        except ClientError as e:
+            logger.error("S3 stream failed", key=key, error=str(e))
+            raise
+        try:
+            for chunk in body.iter_chunks(chunk_size):
+                record_s3_bytes(self.bucket, "out", len(chunk))
+                yield chunk
+        finally:
+            body.close()
+
+    def upload_stream(
+        self, chunks: Iterable[bytes], key: str, content_type: str = None, part_size: int = 8 * 1024 * 1024
+    ) -> int:
+        """Upload chunked content to S3 (one buffered part in memory, single PUT for small content)"""
+        buffer = bytearray()
+        parts = []
+        upload_id = None
+        total = 0
+        try:
+            for chunk in chunks:
+                buffer += chunk
+                total += len(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        upload_id = self.create_multipart_upload(key, content_type)
+                    part_number = len(parts) + 1
+                    etag = self.upload_part(key, upload_id, part_number, bytes(buffer[:part_size]))
+                    parts.append({"part_number": part_number, "etag": etag})
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                self.upload(bytes(buffer), key, content_type=content_type)
+                return total
+
+            if buffer:
+                part_number = len(parts) + 1
+                parts.append(
+                    {"part_number": part_number, "etag": self.upload_part(key, upload_id, part_number, bytes(buffer))}
+                )
+            self.complete_multipart_upload(key, upload_id, parts)
+            logger.info("File streamed to S3", key=key, bucket=self.bucket, size_bytes=total, parts=len(parts))
+            return total
+
+        except Exception:
+            if upload_id is not None:
+                self.abort_multipart_upload(key, upload_id)
+            raise
+
+    def create_multipart_upload(self, key: str, content_type: str = None) -> str:
+        """Start multipart upload in S3"""
+        try:
+            extra_args = {"ContentType": content_type} if content_type else {}
+            response = self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=key, **extra_args)
+            logger.debug("S3 multipart upload created", key=key)
+            return response["UploadId"]
+
+        except ClientError as e:
+            logger.error("S3 multipart create failed", key=key, error=str(e))
+            raise
+
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """Upload one multipart part to S3"""
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=data
+            )
+            record_s3_bytes(self.bucket, "in", len(data))
+            return response["ETag"]
+
+        except ClientError as e:
+            logger.error("S3 part upload failed", key=key, part_number=part_number, error=str(e))
+            raise
+
+    def list_parts(self, key: str, upload_id: str) -> list[dict]:
+        """List received multipart parts in S3 (all pages)"""
+        try:
+            parts = []
+            paginator = self.s3_client.get_paginator("list_parts")
+            for page in paginator.paginate(Bucket=self.bucket, Key=key, UploadId=upload_id):
+                parts.extend(
+                    {"part_number": part["PartNumber"], "etag": part["ETag"], "size": part["Size"]}
+                    for part in page.get("Parts", [])
+                )
+            return sorted(parts, key=lambda part: part["part_number"])
+
+        except ClientError as e:
+            logger.error("S3 list parts failed", key=key, error=str(e))
+            raise
+
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> None:
+        """Complete multipart upload in S3"""
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [{"PartNumber": part["part_number"], "ETag": part["etag"]} for part in parts]
+                },
+            )
+            logger.info("S3 multipart upload completed", key=key, parts=len(parts))
+
+        except ClientError as e:
+            logger.error("S3 multipart complete failed", key=key, error=str(e))
+            raise
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> bool:
+        """Abort multipart upload in S3"""
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            logger.info("S3 multipart upload aborted", key=key)
+            return True
+
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                return True
+            logger.error("S3 multipart abort failed", key=key, error=str(e))
+            return False
+
     def health_check(self, timeout: int = 2) -> tuple[bool, str]:
         """
         Quick health check for S3 storage backend (MinIO/AWS S3)
@@ -173,15 +316,7 @@ class S3Storage(StorageInterface):
             # (don't use self.s3_client to avoid affecting normal operations)
             from botocore.config import Config
 
-            config = Config(connect_timeout=timeout, read_timeout=timeout)
-            health_client = boto3.client(
-                "s3",
-                endpoint_url=S3_ENDPOINT,
-                aws_access_key_id=S3_ACCESS_KEY,
-                aws_secret_access_key=S3_SECRET_KEY,
-                region_name=S3_REGION,
-                config=config,
-            )
+            health_client = self._create_client(Config(connect_timeout=timeout, read_timeout=timeout))
 
             # Quick check: head_bucket (doesn't transfer data, just metadata)
             health_client.head_bucket(Bucket=self.bucket)
@@ -206,3 +341,23 @@ class S3Storage(StorageInterface):
                 return False, f"Storage backend timeout ({S3_ENDPOINT})"
             else:
                 return False, f"Storage backend error: {error_msg}"
+
+
+def reset_clients_after_fork() -> None:
+    """
+    Give every storage instance inherited from the parent process a new client (gunicorn post_fork)
+
+    boto3 clients keep pooled HTTP connections and are not fork-safe. The inherited
+    sockets are left alone (they belong to the parent), the new client connects lazily.
+    """
+    for storage in list(_instances):
+        storage.s3_client = storage._create_client()
+
+
+def close_clients() -> None:
+    """Close the HTTP connections of all storage clients (gunicorn worker_exit)"""
+    for storage in list(_instances):
+        try:
+            storage.s3_client.close()
+        except Exception as e:
+            logger.warning("S3 client close failed", bucket=storage.bucket, error=str(e))
@@ -1,6 +1,7 @@
 """Storage Interface - Abstract Base Class for storage backends"""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import BinaryIO
 
 
@@ -101,3 +102,105 @@ class StorageInterface(ABC):
             True if successful, False otherwise
         """
         pass
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = 8 * 1024 * 1024) -> Iterator[bytes]:
+        """
+        Stream file content without loading it into memory
+
+        Args:
+            key: Storage key
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Iterator over the content chunks
+        """
+        pass
+
+    @abstractmethod
+    def upload_stream(
+        self, chunks: Iterable[bytes], key: str, content_type: str = None, part_size: int = 8 * 1024 * 1024
+    ) -> int:
+        """
+        Upload content of unknown size from a chunk iterator (multipart, bounded memory)
+
+        Args:
+            chunks: Content chunks (any size)
+            key: Storage key
+            content_type: Optional MIME type
+            part_size: Bytes buffered per part (>= 5 MiB for S3)
+
+        Returns:
+            Number of bytes stored
+        """
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, key: str, content_type: str = None) -> str:
+        """
+        Start a multipart upload (object becomes visible on completion only)
+
+        Args:
+            key: Target storage key
+            content_type: Optional MIME type
+
+        Returns:
+            Upload ID
+        """
+        pass
+
+    @abstractmethod
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """
+        Upload one part of a multipart upload (re-uploading a part number replaces it)
+
+        Args:
+            key: Target storage key
+            upload_id: Upload ID from create_multipart_upload()
+            part_number: 1-based part number
+            data: Part content
+
+        Returns:
+            ETag of the stored part
+        """
+        pass
+
+    @abstractmethod
+    def list_parts(self, key: str, upload_id: str) -> list[dict]:
+        """
+        List the parts received so far
+
+        Args:
+            key: Target storage key
+            upload_id: Upload ID
+
+        Returns:
+            List of {'part_number': int, 'etag': str, 'size': int}, ordered by part number
+        """
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[dict]) -> None:
+        """
+        Assemble the parts into the target object
+
+        Args:
+            key: Target storage key
+            upload_id: Upload ID
+            parts: Parts as returned by list_parts()
+        """
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, key: str, upload_id: str) -> bool:
+        """
+        Abort a multipart upload and free its stored parts
+
+        Args:
+            key: Target storage key
+            upload_id: Upload ID
+
+        Returns:
+            True if successful (or already gone), False otherwise
+        """
+        pass
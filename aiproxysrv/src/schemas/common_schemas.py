@@ -32,10 +32,11 @@ class ValidationErrorResponse(BaseModel):
 class PaginationMeta(BaseModel):
     """Pagination metadata"""
 
-    total: int = Field(..., ge=0, description="Total number of items")
-    offset: int = Field(..., ge=0, description="Current offset")
+    total: int | None = Field(..., ge=0, description="Total number of items (None in cursor mode without count)")
+    offset: int | None = Field(None, ge=0, description="Current offset (offset mode only)")
     limit: int = Field(..., ge=1, le=100, description="Items per page")
     has_more: bool = Field(..., description="Whether more items are available")
+    next_cursor: str | None = Field(None, description="Cursor of the next page (cursor mode only)")
 
 
 class PaginationResponse(BaseResponse):
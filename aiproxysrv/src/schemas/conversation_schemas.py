@@ -21,6 +21,8 @@ class MessageResponse(BaseModel):
     role: str
     content: str
     token_count: int | None = None
+    cache_creation_tokens: int | None = None
+    cache_read_tokens: int | None = None
     is_summary: bool | None = None
     created_at: datetime
 
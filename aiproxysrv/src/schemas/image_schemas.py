@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from .common_schemas import BaseResponse, PaginationResponse
 
@@ -58,6 +58,8 @@ class ImageResponse(BaseModel):
     size: str | None = Field(None, description="Image dimensions")
     status: str = Field(..., description="Generation status")
     url: str | None = Field(None, description="Image URL if completed")
+    thumbnail_url: str | None = Field(None, description="Thumbnail URL (url?size=thumb, WebP 320px)")
+    preview_url: str | None = Field(None, description="Preview URL (url?size=preview, WebP 1024px)")
     created_at: datetime = Field(..., description="Creation timestamp")
     completed_at: datetime | None = Field(None, description="Completion timestamp")
     tags: list[str] | None = Field(None, description="Image tags")
@@ -108,12 +110,16 @@ class ImageListRequest(BaseModel):
     search: str | None = Field(None, max_length=100, description="Search query for title/prompt")
     sort: str | None = Field("created_at", description="Sort field")
     order: str | None = Field("desc", description="Sort order")
+    cursor: str | None = Field(
+        None, max_length=512, description="Keyset cursor ('' for the first page, then next_cursor); replaces offset"
+    )
+    include_total: bool = Field(False, description="Include total count in cursor mode (extra query)")
 
     @field_validator("sort")
     @classmethod
     def validate_sort(cls, v):
-        if v and v not in ["created_at", "completed_at", "title"]:
-            raise ValueError("sort must be one of: created_at, completed_at, title")
+        if v and v not in ["created_at", "completed_at", "title", "relevance"]:
+            raise ValueError("sort must be one of: created_at, completed_at, title, relevance")
         return v
 
     @field_validator("order")
@@ -123,6 +129,13 @@ class ImageListRequest(BaseModel):
             raise ValueError("order must be either asc or desc")
         return v
 
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, v, info: ValidationInfo):
+        if v is not None and info.data.get("sort") not in (None, "created_at"):
+            raise ValueError("cursor pagination only supports sort=created_at")
+        return v
+
 
 class ImageListResponse(PaginationResponse):
     """Schema for image list response"""
@@ -1,5 +1,7 @@
 """Pydantic schemas for Song Project API validation"""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from schemas.common_schemas import PaginationMeta
@@ -60,6 +62,9 @@ class FolderResponse(BaseModel):
     folder_type: str | None
     s3_prefix: str | None
     custom_icon: str | None
+    file_count: int = 0
+    total_size_bytes: int = 0
+    files_modified_at: str | None = None
     created_at: str | None
     files: list["FileResponse"] | None = None
     assigned_songs: list["AssignedSongResponse"] | None = None
@@ -158,6 +163,7 @@ class ProjectDetailResponse(BaseModel):
     project_status: str
     total_files: int
     total_size_bytes: int
+    files_modified_at: str | None = None
     cover_info: CoverInfo | None = Field(default=None, description="Cover display information")
     created_at: str | None
     updated_at: str | None
@@ -183,6 +189,19 @@ class ProjectListResponse(BaseModel):
         from_attributes = True
 
 
+class FolderFileListRequest(BaseModel):
+    """Query parameters for listing/browsing folder files"""
+
+    limit: int | None = Field(default=None, ge=1, le=1000, description="Page size (omit for all files)")
+    cursor: str | None = Field(default=None, description="Cursor from pagination.next_cursor of the previous page")
+    prefix: str = Field(default="", max_length=500, description="Subdirectory inside the folder (e.g. 'Samples/Drums')")
+    recursive: bool = Field(default=True, description="false = only direct files of prefix plus its subdirectories")
+    sort_by: Literal["relative_path", "filename", "file_size_bytes", "updated_at"] = Field(
+        default="relative_path", description="Sort field (paged mode)"
+    )
+    sort_direction: Literal["asc", "desc"] = Field(default="asc", description="Sort direction (paged mode)")
+
+
 class FileUploadResponse(BaseModel):
     """Response schema for file upload"""
 
@@ -208,11 +227,52 @@ class MirrorRequest(BaseModel):
     """Request schema for mirror endpoint (compare local vs remote)"""
 
     files: list[MirrorFileRequest] = Field(..., description="List of local files with hashes")
+    scopes: list[str] | None = Field(
+        default=None,
+        max_length=1000,
+        description="Folder-relative directories to compare (from the manifest descent); omit for the whole folder",
+    )
 
     class Config:
         from_attributes = True
 
 
+class FileClaimRequest(BaseModel):
+    """Request schema for claiming already stored content by hash (deduplicated upload)"""
+
+    files: list[MirrorFileRequest] = Field(
+        ..., max_length=1000, description="Files to create/update from existing content (no upload)"
+    )
+
+
+class UploadSessionCreateRequest(BaseModel):
+    """Request schema for starting (or resuming) a resumable chunked upload"""
+
+    relative_path: str = Field(
+        ..., min_length=1, max_length=500, description="Path relative to folder (e.g., 'Stems/drums.wav')"
+    )
+    file_hash: str = Field(..., min_length=64, max_length=64, description="SHA256 of the complete file")
+    file_size_bytes: int = Field(..., ge=1, description="File size in bytes")
+
+
+class ProjectArchiveRequest(BaseModel):
+    """Request schema for a streaming ZIP download (whole project, one folder or a file selection)"""
+
+    folder_id: str | None = Field(default=None, description="Only this folder (folder-relative paths)")
+    file_ids: list[str] | None = Field(
+        default=None, min_length=1, max_length=5000, description="Only these files (paths incl. folder name)"
+    )
+
+
+class FolderManifestRequest(BaseModel):
+    """Query parameters for the folder manifest (Merkle tree) endpoint"""
+
+    paths: list[str] = Field(
+        default_factory=lambda: [""], min_length=1, max_length=100, description="Directory paths ('' = folder root)"
+    )
+    children: bool = Field(default=True, description="Include direct subdirectories and files of each path")
+
+
 class MirrorFileAction(BaseModel):
     """Schema for a single file action in mirror response"""
 
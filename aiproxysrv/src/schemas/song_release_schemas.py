@@ -70,6 +70,10 @@ class ReleaseFilterRequest(BaseModel):
         default=None, description="Filter by status group: 'all', 'progress', 'uploaded', 'released', 'archive'"
     )
     search: str | None = Field(default=None, max_length=255, description="Search in name/genre")
+    cursor: str | None = Field(
+        default=None, max_length=512, description="Keyset cursor ('' for the first page, then next_cursor)"
+    )
+    include_total: bool = Field(default=False, description="Include total count in cursor mode")
 
 
 class AssignedProjectResponse(BaseModel):
@@ -130,6 +134,7 @@ class ReleaseListItemResponse(BaseModel):
     genre: str
     release_date: str | None
     cover_url: str | None
+    cover_thumbnail_url: str | None = None
 
     class Config:
         from_attributes = True
@@ -139,6 +144,8 @@ class ReleaseListResponse(BaseModel):
     """Response schema for paginated release list"""
 
     items: list[ReleaseListItemResponse]
-    total: int
+    total: int | None
     limit: int
-    offset: int
+    offset: int | None = None
+    next_cursor: str | None = None
+    has_more: bool | None = None
@@ -1,101 +1,231 @@
 """
 Centralized logging configuration using loguru.
 Replaces all print() statements with structured logging.
+
+LOG_FORMAT=text (default): colored console output, see format_record
+LOG_FORMAT=json: one JSON object per line (time, level, logger, message, extra, exception)
+
+Keep logging cheap on the request thread:
+- Extra fields are capped to LOG_MAX_FIELD_CHARS before anything is serialized (cap_extra)
+- With LOG_ENQUEUE=true, lines are serialized and written by a background thread
+- Expensive extras are only built if the level is enabled:
+  logger.opt(lazy=True).debug("Request", full_payload=lambda: build_payload())
 """
 
+import json
 import logging
 import sys
+from functools import lru_cache
+from typing import Any
 
 from loguru import logger
 
-from config.settings import LOG_LEVEL
+from config.settings import LOG_ENQUEUE, LOG_FORMAT, LOG_LEVEL, LOG_MAX_FIELD_CHARS
+
+
+# Extra fields that are never cut (needed completely for debugging)
+UNCAPPED_FIELDS = ("stacktrace",)
+
+# Inline value length for DEBUG text output
+DEBUG_INLINE_MAX_CHARS = 100
+
+ERROR_FIELDS = ("error_type", "error", "stacktrace")
 
 
 # Remove default logger
 logger.remove()
 
 
-# Custom formatter function to handle extra fields
-def format_record(record):
+# ============================================================
+# Field size caps (applied before serialization)
+# ============================================================
+
+
+def _cap(value: Any, budget: int) -> tuple[Any, int]:
+    """Capped copy of value and its approximate serialized length; work is bounded by budget"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value, 5
+    if isinstance(value, str):
+        if len(value) <= budget:
+            return value, len(value) + 2
+        return f"{value[:budget]}... (+{len(value) - budget} chars)", budget + 2
+    if isinstance(value, dict):
+        capped_dict: dict[str, Any] = {}
+        used = 2
+        for index, (key, item) in enumerate(value.items()):
+            if used >= budget:
+                capped_dict["..."] = f"+{len(value) - index} keys"
+                break
+            capped_dict[key], size = _cap(item, budget - used)
+            used += size + len(str(key)) + 4
+        return capped_dict, used
+    if isinstance(value, (list, tuple)):
+        capped_list: list[Any] = []
+        used = 2
+        for index, item in enumerate(value):
+            if used >= budget:
+                capped_list.append(f"... +{len(value) - index} items")
+                break
+            capped, size = _cap(item, budget - used)
+            capped_list.append(capped)
+            used += size + 2
+        return capped_list, used
+    return _cap(str(value), budget)
+
+
+def cap_value(value: Any, max_chars: int) -> Any:
     """
-    Custom formatter that displays extra fields based on log level:
-    - DEBUG: Shows extra fields inline (compact, single-line)
-    - INFO: Message only (clean for production)
-    - WARNING/ERROR/CRITICAL: Shows extra fields multi-line (detailed for debugging)
+    Cut a log field to roughly max_chars serialized characters
+
+    Strings are truncated, dicts/lists keep their leading entries; the rest is replaced
+    by a marker. Only the kept part is visited, so a 2k-message payload costs the same
+    as a short one.
+
+    Examples:
+        >>> cap_value("abcdef", 3)
+        'abc... (+3 chars)'
+        >>> cap_value([1, 2, 3], 100)
+        [1, 2, 3]
     """
-    # Base format
-    format_str = (
+    return _cap(value, max_chars)[0]
+
+
+def cap_extra(record: dict[str, Any]) -> None:
+    """Patcher: cap all extra fields of a record (runs on the logging thread, before any handler)"""
+    extra = record["extra"]
+    for key, value in extra.items():
+        if key not in UNCAPPED_FIELDS and not isinstance(value, (bool, int, float)) and value is not None:
+            extra[key] = cap_value(value, LOG_MAX_FIELD_CHARS)
+
+
+# ============================================================
+# Text format
+# ============================================================
+
+
+def _render_value(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+@lru_cache(maxsize=512)
+def _text_template(level_group: str, keys: tuple[str, ...]) -> str:
+    """
+    Format template for one level group and set of extra keys
+
+    Values are referenced via {extra[_fields][key]} instead of being pasted into the
+    template, so no brace escaping is needed and loguru's parsed-format cache is hit.
+    """
+    template = (
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
         "<level>{level: <8}</level> | "
         "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
         "<level>{message}</level>"
     )
+    if level_group == "detailed":
+        # WARNING/ERROR/CRITICAL: Multi-line format with special handling for error fields
+        if "error_type" in keys:
+            template += "\n  <yellow>└─ Type:</yellow> <red>{extra[_fields][error_type]}</red>"
+        if "error" in keys:
+            template += "\n  <yellow>└─ Error:</yellow> <red>{extra[_fields][error]}</red>"
+        if "stacktrace" in keys:
+            template += "\n  <yellow>└─ Stacktrace:</yellow>\n<red>{extra[_fields][stacktrace]}</red>"
+        for key in keys:
+            if key not in ERROR_FIELDS:
+                template += f"\n  <yellow>└─ {key}:</yellow> {{extra[_fields][{key}]}}"
+    elif level_group == "inline":
+        # DEBUG: Compact inline format (key=value key=value)
+        for key in keys:
+            template += f" <cyan>{key}</cyan>=<yellow>{{extra[_fields][{key}]}}</yellow>"
+    return template + "\n"
+
+
+def format_record(record):
+    """
+    Custom formatter that displays extra fields based on log level:
+    - DEBUG: Shows extra fields inline (compact, single-line)
+    - INFO: Message only (clean for production)
+    - WARNING/ERROR/CRITICAL: Shows extra fields multi-line (detailed for debugging)
+    """
+    level_name = record["level"].name
+    if level_name in ("WARNING", "ERROR", "CRITICAL"):
+        level_group = "detailed"
+    elif level_name == "DEBUG":
+        level_group = "inline"
+    else:
+        return _text_template("plain", ())
+
+    fields = {}
+    for key, value in record["extra"].items():
+        if key.startswith("_") or (key == "stacktrace" and not value):
+            continue
+        value_str = _render_value(value)
+        if level_group == "inline" and len(value_str) > DEBUG_INLINE_MAX_CHARS:
+            # Truncate long values for readability
+            value_str = value_str[: DEBUG_INLINE_MAX_CHARS - 3] + "..."
+        fields[key] = value_str
+    record["extra"]["_fields"] = fields
+    return _text_template(level_group, tuple(fields))
+
+
+# ============================================================
+# JSON lines format
+# ============================================================
 
-    # Show extra fields for DEBUG, WARNING, ERROR, and CRITICAL levels
-    if record["level"].name in ("DEBUG", "WARNING", "ERROR", "CRITICAL"):
-        extra = record["extra"]
-
-        if record["level"].name in ("WARNING", "ERROR", "CRITICAL"):
-            # WARNING/ERROR/CRITICAL: Multi-line format with special handling for error fields
-            if "error_type" in extra:
-                format_str += "\n  <yellow>└─ Type:</yellow> <red>{extra[error_type]}</red>"
-
-            if "error" in extra:
-                format_str += "\n  <yellow>└─ Error:</yellow> <red>{extra[error]}</red>"
-
-            if "stacktrace" in extra and extra["stacktrace"]:
-                format_str += "\n  <yellow>└─ Stacktrace:</yellow>\n<red>{extra[stacktrace]}</red>"
-
-            # Show other extra fields (except already handled ones)
-            other_extras = {
-                k: v
-                for k, v in extra.items()
-                if k not in ("error_type", "error", "stacktrace") and not k.startswith("_")
-            }
-            if other_extras:
-                for key, value in other_extras.items():
-                    # Serialize complex objects and escape braces
-                    if isinstance(value, (dict, list)):
-                        import json
-
-                        value_str = json.dumps(value, ensure_ascii=False)
-                    else:
-                        value_str = str(value)
-                    value_str = value_str.replace("{", "{{").replace("}", "}}")
-                    format_str += f"\n  <yellow>└─ {key}:</yellow> {value_str}"
-        else:
-            # DEBUG/WARNING: Compact inline format (key=value key=value)
-            relevant_extras = {k: v for k, v in extra.items() if not k.startswith("_")}
-            if relevant_extras:
-                for key, value in relevant_extras.items():
-                    # Serialize complex objects (dict, list) to avoid format string issues
-                    if isinstance(value, (dict, list)):
-                        import json
-
-                        value_str = json.dumps(value, ensure_ascii=False)
-                    else:
-                        value_str = str(value)
-
-                    # Truncate long values for readability
-                    if len(value_str) > 100:
-                        value_str = value_str[:97] + "..."
-
-                    # Escape curly braces to prevent format string errors
-                    value_str = value_str.replace("{", "{{").replace("}", "}}")
-
-                    format_str += f" <cyan>{key}</cyan>=<yellow>{value_str}</yellow>"
-
-    format_str += "\n"
-    return format_str
-
-
-# Console handler: INFO and above with colors
-logger.add(
-    sys.stderr,
-    level=LOG_LEVEL,
-    format=format_record,
-    colorize=True,
-)
+
+def build_json_line(record: dict[str, Any], exception_text: str = "") -> str:
+    """One JSON log line for a record (private "_" extras are left out)"""
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "process": record["process"].id,
+        "message": record["message"],
+        "extra": {key: value for key, value in record["extra"].items() if not key.startswith("_")},
+    }
+    if exception_text:
+        entry["exception"] = exception_text
+    return json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+
+
+class JsonLinesSink:
+    """
+    Sink writing one JSON object per record
+
+    Used with format="": loguru renders the traceback (if any) on the logging
+    thread, the JSON serialization runs in the sink (background thread with enqueue=True).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __call__(self, message) -> None:
+        self.stream.write(build_json_line(message.record, str(message).strip("\n")))
+        self.stream.flush()
+
+
+logger.configure(patcher=cap_extra)
+
+if LOG_FORMAT == "json":
+    logger.add(
+        JsonLinesSink(sys.stderr),
+        level=LOG_LEVEL,
+        format="",
+        colorize=False,
+        enqueue=LOG_ENQUEUE,
+    )
+else:
+    # Console handler: INFO and above with colors
+    logger.add(
+        sys.stderr,
+        level=LOG_LEVEL,
+        format=format_record,
+        colorize=True,
+        enqueue=LOG_ENQUEUE,
+    )
 
 
 # Flask-Logging auf loguru umleiten
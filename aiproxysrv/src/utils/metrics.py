@@ -0,0 +1,189 @@
+"""
+Prometheus metrics - request/upstream latency, S3 traffic, DB pool, in-flight requests.
+
+Multiprocess-safe: when PROMETHEUS_MULTIPROC_DIR is set (gunicorn.conf.py does this
+before the workers import the app), every worker writes its samples to mmap files in
+that directory and /metrics aggregates all workers. Without it (flask dev server,
+tests) the default in-process registry is used.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+from prometheus_client import generate_latest as _generate_latest
+
+from utils.tracing import KIND_LLM, span
+
+
+NAMESPACE = "aiproxy"
+
+# Upstream model label when a call has no model (e.g. listing Ollama tags)
+UNKNOWN_MODEL = "none"
+
+# Request latency buckets: API calls are fast, chat/image generation runs up to minutes
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+UPSTREAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by blueprint, endpoint, method and status",
+    ["blueprint", "endpoint", "method", "status"],
+    namespace=NAMESPACE,
+    buckets=REQUEST_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "upstream_request_duration_seconds",
+    "Upstream API call latency by provider, model and outcome",
+    ["provider", "model", "outcome"],
+    namespace=NAMESPACE,
+    buckets=UPSTREAM_BUCKETS,
+)
+UPSTREAM_ERRORS = Counter(
+    "upstream_errors",
+    "Failed upstream API calls by provider, model and error type",
+    ["provider", "model", "error_type"],
+    namespace=NAMESPACE,
+)
+UPSTREAM_REQUESTS_IN_PROGRESS = Gauge(
+    "upstream_requests_in_progress",
+    "Upstream API calls currently in flight",
+    ["provider"],
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+
+S3_BYTES = Counter(
+    "s3_bytes",
+    "Bytes transferred to (in) and from (out) S3",
+    ["bucket", "direction"],
+    namespace=NAMESPACE,
+)
+
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Connections checked out from the SQLAlchemy pool",
+    namespace=NAMESPACE,
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    namespace=NAMESPACE,
+    buckets=POOL_WAIT_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out",
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+
+
+class UpstreamCall:
+    """Outcome of one tracked upstream call (see track_upstream)"""
+
+    def __init__(self):
+        self.error_type: str | None = None
+
+    def set_status(self, status_code: int) -> None:
+        """Mark the call as failed if the upstream answered with an HTTP error status"""
+        if status_code >= 400:
+            self.error_type = f"http_{status_code}"
+
+    def set_error(self, error_type: str) -> None:
+        """Mark the call as failed (e.g. error payload with HTTP 200)"""
+        self.error_type = error_type
+
+    @property
+    def outcome(self) -> str:
+        return "error" if self.error_type else "ok"
+
+
+@contextmanager
+def track_upstream(provider: str, model: str | None) -> Iterator[UpstreamCall]:
+    """
+    Measure an upstream API call (latency histogram, error counter, in-flight gauge)
+
+    Exceptions are counted by type and re-raised; HTTP error responses are counted
+    when the caller reports the status via UpstreamCall.set_status(). The call is
+    also an "llm" span "<provider>.request" of the current request trace.
+
+    Args:
+        provider: Upstream provider ('ollama', 'openai', 'claude', ...)
+        model: Model name (None if the call is not model specific)
+
+    Example:
+        with track_upstream("ollama", model) as call:
+            response = requests.post(url, json=payload, timeout=timeout)
+            call.set_status(response.status_code)
+    """
+    model = model or UNKNOWN_MODEL
+    call = UpstreamCall()
+    in_progress = UPSTREAM_REQUESTS_IN_PROGRESS.labels(provider)
+    in_progress.inc()
+    started = time.perf_counter()
+    with span(f"{provider}.request", KIND_LLM, provider=provider, model=model) as trace_span:
+        try:
+            yield call
+        except Exception as e:
+            call.set_error(type(e).__name__)
+            raise
+        finally:
+            in_progress.dec()
+            UPSTREAM_REQUEST_DURATION.labels(provider, model, call.outcome).observe(time.perf_counter() - started)
+            if call.error_type:
+                UPSTREAM_ERRORS.labels(provider, model, call.error_type).inc()
+                trace_span.set_error(call.error_type)
+
+
+def record_s3_bytes(bucket: str, direction: str, num_bytes: int) -> None:
+    """
+    Count S3 traffic
+
+    Args:
+        bucket: S3 bucket
+        direction: 'in' (upload to S3) or 'out' (download from S3)
+        num_bytes: Transferred bytes
+    """
+    if num_bytes > 0:
+        S3_BYTES.labels(bucket, direction).inc(num_bytes)
+
+
+def observe_http_request(blueprint: str | None, endpoint: str | None, method: str, status: int, seconds: float):
+    """Record one handled HTTP request (endpoint is None for unmatched routes, e.g. 404)"""
+    HTTP_REQUEST_DURATION.labels(
+        blueprint or "app",
+        endpoint or "unmatched",
+        method,
+        str(status),
+    ).observe(seconds)
+
+
+def is_multiprocess_mode() -> bool:
+    """True if samples are shared between worker processes (PROMETHEUS_MULTIPROC_DIR set)"""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def generate_metrics() -> tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format
+
+    Returns:
+        Tuple (payload, content_type) - aggregated over all workers in multiprocess mode
+    """
+    if is_multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return _generate_latest(registry), CONTENT_TYPE_LATEST
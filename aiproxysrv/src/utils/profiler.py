@@ -0,0 +1,300 @@
+"""
+Opt-in per-request profiler - flame graphs (speedscope) or pstats for single requests.
+
+A request is profiled when it carries a valid signed trigger (header X-Profile or query
+parameter _profile, see sign_profile_trigger) or is picked by PROFILER_SAMPLE_RATE.
+Results go to PROFILER_DIR, which keeps at most PROFILER_MAX_PROFILES files (oldest are
+removed first) and is shared by all gunicorn workers.
+
+Modes:
+- sampling: background thread samples the request thread's stack every PROFILER_INTERVAL_MS,
+  written as speedscope JSON (open in https://www.speedscope.app)
+- cprofile: deterministic cProfile, written as pstats (snakeviz, python -m pstats);
+  exact call counts, but noticeably slows down the profiled request
+
+Requests without trigger only pay for a header/query lookup; with PROFILER_SECRET unset
+the Flask hooks are not registered at all.
+"""
+
+import contextlib
+import cProfile
+import hashlib
+import hmac
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "_profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+MODE_SAMPLING = "sampling"
+MODE_CPROFILE = "cprofile"
+PROFILE_EXTENSIONS = {MODE_SAMPLING: "speedscope.json", MODE_CPROFILE: "pstats"}
+
+# Upper bound for signed trigger lifetime (a leaked URL must not stay valid for long)
+MAX_TRIGGER_TTL_SECONDS = 24 * 3600
+
+# <timestamp>-<id>-<METHOD>-<path slug>-<duration>ms.<ext> - also guards downloads against path traversal
+PROFILE_NAME_PATTERN = re.compile(
+    r"^(?P<timestamp>\d{8}T\d{6})-(?P<id>[0-9a-f]{8})-(?P<method>[A-Z]+)-(?P<slug>[A-Za-z0-9_.-]*?)"
+    r"-(?P<duration_ms>\d+)ms\.(?P<ext>speedscope\.json|pstats)$"
+)
+
+
+# ============================================================
+# Trigger (signed header / query parameter)
+# ============================================================
+
+
+def _trigger_signature(secret: str, path: str, expires: int) -> str:
+    return hmac.new(secret.encode(), f"{expires}:{path}".encode(), hashlib.sha256).hexdigest()
+
+
+def sign_profile_trigger(secret: str, path: str, expires: int) -> str:
+    """
+    Build a trigger value for one request path, valid until expires (unix seconds)
+
+    Examples:
+        >>> sign_profile_trigger("s3cret", "/api/v1/song-projects", 1800000000)[:11]
+        '1800000000.'
+    """
+    return f"{expires}.{_trigger_signature(secret, path, expires)}"
+
+
+def verify_profile_trigger(secret: str, path: str, trigger: str | None, now: float) -> bool:
+    """Check a trigger value for the request path (signature and expiry)"""
+    if not secret or not trigger:
+        return False
+    expires_raw, _, signature = trigger.partition(".")
+    if not expires_raw.isdigit() or int(expires_raw) < now:
+        return False
+    return hmac.compare_digest(signature, _trigger_signature(secret, path, int(expires_raw)))
+
+
+def should_profile(
+    secret: str, path: str, trigger: str | None, sample_rate: float, now: float, random_value: float
+) -> bool:
+    """
+    Decide whether a request is profiled
+
+    Args:
+        secret: PROFILER_SECRET (empty = never)
+        path: Request path (the trigger is bound to it)
+        trigger: Value of the X-Profile header or _profile query parameter
+        sample_rate: Fraction of untriggered requests to profile
+        now: Current unix time
+        random_value: Uniform random number in [0, 1)
+    """
+    if not secret:
+        return False
+    if trigger is not None:
+        return verify_profile_trigger(secret, path, trigger, now)
+    return random_value < sample_rate
+
+
+# ============================================================
+# Profilers
+# ============================================================
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread from a background thread (no tracing overhead in the target)"""
+
+    def __init__(self, thread_id: int, interval_s: float):
+        self.thread_id = thread_id
+        self.interval_s = interval_s
+        self.frames: list[dict[str, Any]] = []
+        self.samples: list[list[int]] = []
+        self.weights: list[float] = []
+        self._frame_index: dict[tuple[str, str, int], int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._last_sample = 0.0
+        self._started = 0.0
+        self._duration_ms = 0.0
+
+    def start(self) -> None:
+        self._started = self._last_sample = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._duration_ms = (time.perf_counter() - self._started) * 1000
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self.add_sample(self._stack(frame), (now - self._last_sample) * 1000)
+            self._last_sample = now
+
+    def _stack(self, frame: Any) -> list[int]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append({"name": key[0], "file": key[1], "line": key[2]})
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()  # speedscope expects root first
+        return stack
+
+    def add_sample(self, stack: list[int], weight_ms: float) -> None:
+        """Append a sample; consecutive identical stacks are merged into one weighted sample"""
+        if self.samples and self.samples[-1] == stack:
+            self.weights[-1] += weight_ms
+        else:
+            self.samples.append(stack)
+            self.weights.append(weight_ms)
+
+    def to_speedscope(self, name: str) -> dict[str, Any]:
+        """Speedscope file format (sampled profile, milliseconds)"""
+        weights = [round(w, 3) for w in self.weights]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "aiproxysrv",
+            "name": name,
+            "shared": {"frames": self.frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(max(self._duration_ms, sum(weights)), 3),
+                    "samples": self.samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class RequestProfile:
+    """Profiles the current request thread; finish() writes the result to the profile ring"""
+
+    def __init__(self, mode: str, interval_ms: float):
+        self.mode = mode if mode in PROFILE_EXTENSIONS else MODE_SAMPLING
+        self.started_at = datetime.now(UTC)
+        self._start = time.perf_counter()
+        if self.mode == MODE_CPROFILE:
+            self._profiler: Any = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._profiler = SamplingProfiler(threading.get_ident(), max(interval_ms, 0.1) / 1000)
+            self._profiler.start()
+
+    def stop(self) -> float:
+        """Stop profiling without storing (e.g. request aborted); returns the duration in ms"""
+        if self.mode == MODE_CPROFILE:
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+        return (time.perf_counter() - self._start) * 1000
+
+    def finish(self, directory: str, max_profiles: int, method: str, path: str) -> str:
+        """
+        Stop profiling and store the result
+
+        Returns:
+            File name of the stored profile (download id)
+        """
+        duration_ms = self.stop()
+
+        name = build_profile_filename(self.started_at, method, path, duration_ms, self.mode)
+        target = Path(directory) / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{name}.tmp")
+        if self.mode == MODE_CPROFILE:
+            self._profiler.dump_stats(str(tmp))
+        else:
+            tmp.write_text(json.dumps(self._profiler.to_speedscope(f"{method} {path}")))
+        os.replace(tmp, target)
+        prune_profiles(directory, max_profiles)
+        return name
+
+
+# ============================================================
+# Profile ring (on-disk, bounded)
+# ============================================================
+
+
+def build_profile_filename(started_at: datetime, method: str, path: str, duration_ms: float, mode: str) -> str:
+    """
+    File name for a profile (sortable by start time, parseable by parse_profile_filename)
+
+    Examples:
+        >>> build_profile_filename(datetime(2026, 1, 2, 3, 4, 5), "GET", "/api/v1/image/list", 12.6, "sampling")[16:]
+        '-GET-api_v1_image_list-13ms.speedscope.json'
+    """
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", path.strip("/"))[:80].strip("_.-")
+    return (
+        f"{started_at:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}-{method.upper()}-{slug}-{round(duration_ms)}ms."
+        f"{PROFILE_EXTENSIONS[mode]}"
+    )
+
+
+def parse_profile_filename(name: str) -> dict[str, Any] | None:
+    """Metadata of a profile file name, None if it is not a profile"""
+    match = PROFILE_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return {
+        "name": name,
+        "created_at": datetime.strptime(match["timestamp"], "%Y%m%dT%H%M%S").replace(tzinfo=UTC).isoformat(),
+        "method": match["method"],
+        "path_slug": match["slug"],
+        "duration_ms": int(match["duration_ms"]),
+        "format": "speedscope" if match["ext"] == PROFILE_EXTENSIONS[MODE_SAMPLING] else "pstats",
+    }
+
+
+def _profile_names(directory: str) -> list[str]:
+    try:
+        return sorted(name for name in os.listdir(directory) if PROFILE_NAME_PATTERN.match(name))
+    except FileNotFoundError:
+        return []
+
+
+def prune_profiles(directory: str, max_profiles: int) -> int:
+    """Delete the oldest profiles beyond max_profiles; returns the number of deleted files"""
+    names = _profile_names(directory)
+    excess = names[: max(len(names) - max_profiles, 0)]
+    for name in excess:
+        with contextlib.suppress(FileNotFoundError):  # Removed concurrently by another worker
+            os.remove(os.path.join(directory, name))
+    return len(excess)
+
+
+def list_profiles(directory: str) -> list[dict[str, Any]]:
+    """Stored profiles, newest first, with size"""
+    profiles = []
+    for name in reversed(_profile_names(directory)):
+        meta = parse_profile_filename(name)
+        try:
+            meta["size_bytes"] = os.path.getsize(os.path.join(directory, name))
+        except FileNotFoundError:
+            continue
+        profiles.append(meta)
+    return profiles
+
+
+def get_profile_path(directory: str, name: str) -> Path | None:
+    """Path of a stored profile, None for unknown or invalid names"""
+    if not PROFILE_NAME_PATTERN.match(name):
+        return None
+    path = Path(directory) / name
+    return path if path.is_file() else None
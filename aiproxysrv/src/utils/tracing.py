@@ -0,0 +1,428 @@
+"""
+In-process request tracing - nested spans with attributes and a per-stage timing breakdown.
+
+Every request handled by the Flask app is one trace; its root span is the route. Nested
+spans come from trace_methods() on controllers/orchestrators/S3Storage, track_upstream()
+(LLM calls), the SQLAlchemy execute hooks (db/query_stats.py), the JSON provider and
+explicit span() blocks (e.g. hashing).
+
+Outside of a trace (Celery tasks, scripts, TRACING_ENABLED=false) a span costs one
+ContextVar lookup. Spans are not propagated into threads started by the request.
+
+Finished traces go to an in-memory ring per worker process (GET /api/v1/admin/traces)
+and optionally to TRACING_OTLP_FILE as OTLP/JSON lines (one ExportTraceServiceRequest
+per line, readable by the OpenTelemetry collector otlpjsonfile receiver).
+"""
+
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Any
+
+from config.settings import TRACING_MAX_SPANS, TRACING_OTLP_FILE, TRACING_RING_SIZE
+from utils.logger import logger
+
+
+TRACE_ID_HEADER = "X-Trace-Id"
+# Requests carrying the tracing admin token get the Server-Timing breakdown (Authorization holds the user JWT)
+TRACE_TOKEN_HEADER = "X-Trace-Token"
+
+# Span kinds = stages of the timing breakdown
+KIND_ROUTE = "route"
+KIND_CONTROLLER = "controller"
+KIND_ORCHESTRATOR = "orchestrator"
+KIND_DB = "db"
+KIND_S3 = "s3"
+KIND_LLM = "llm"
+KIND_HASH = "hash"
+KIND_JSON = "json"
+KIND_INTERNAL = "internal"
+
+# OTLP span kinds (SPAN_KIND_INTERNAL / SERVER / CLIENT)
+_OTLP_KINDS = {KIND_ROUTE: 2, KIND_DB: 3, KIND_S3: 3, KIND_LLM: 3}
+SERVICE_NAME = "aiproxysrv"
+
+
+class Span:
+    """One timed operation inside a trace"""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "span_id",
+        "parent",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+        "child_ns",
+        "dropped",
+    )
+
+    def __init__(self, name: str, kind: str, parent: "Span | None", attributes: dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent = parent
+        self.attributes = attributes
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self.error: str | None = None
+        self.child_ns = 0  # Time spent in direct child spans (for self time)
+        self.dropped = False  # Beyond max_spans: timed for the breakdown, but not stored
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: str) -> None:
+        self.error = error
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+    @property
+    def self_ns(self) -> int:
+        return max(self.duration_ns - self.child_ns, 0)
+
+
+class _NoopSpan:
+    """Returned by span() outside of a trace"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: str) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """All spans of one request; spans[0] is the root span"""
+
+    def __init__(self, name: str, kind: str, attributes: dict[str, Any], max_spans: int):
+        self.trace_id = uuid.uuid4().hex
+        self.started_at = datetime.now(UTC)
+        self.start_unix_ns = time.time_ns()
+        self.max_spans = max_spans
+        self.dropped_spans = 0
+        self.dropped_self_ns: dict[str, int] = {}
+        self.root = Span(name, kind, None, attributes)
+        self.spans = [self.root]
+
+    @property
+    def name(self) -> str:
+        return self.root.name
+
+    @property
+    def duration_ms(self) -> float:
+        return self.root.duration_ns / 1_000_000
+
+    def breakdown(self) -> dict[str, float]:
+        """
+        Self time per span kind in ms (sums up to the trace duration)
+
+        A DB query inside an orchestrator method counts as db, the rest of the method
+        as orchestrator. Spans dropped beyond max_spans are included.
+        """
+        totals: dict[str, float] = {kind: ns / 1_000_000 for kind, ns in self.dropped_self_ns.items()}
+        for span in self.spans:
+            totals[span.kind] = totals.get(span.kind, 0.0) + span.self_ns / 1_000_000
+        return {kind: round(ms, 3) for kind, ms in sorted(totals.items(), key=lambda item: -item[1])}
+
+    def to_server_timing(self) -> str:
+        """
+        Server-Timing header value (shown per request in the browser dev tools)
+
+        Examples:
+            >>> trace = Trace("GET /a", KIND_ROUTE, {}, 10)
+            >>> trace.root.end_ns = trace.root.start_ns + 2_500_000
+            >>> trace.to_server_timing()
+            'route;dur=2.5, total;dur=2.5'
+        """
+        parts = [f"{kind};dur={ms:.1f}" for kind, ms in self.breakdown().items()]
+        parts.append(f"total;dur={self.duration_ms:.1f}")
+        return ", ".join(parts)
+
+    def to_summary(self) -> dict[str, Any]:
+        """Compact view for trace lists"""
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "status_code": self.root.attributes.get("http.status_code"),
+            "error": self.root.error,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "breakdown_ms": self.breakdown(),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Full view with all spans (start offsets relative to the root span)"""
+        return {
+            **self.to_summary(),
+            "spans": [
+                {
+                    "span_id": span.span_id,
+                    "parent_id": span.parent.span_id if span.parent else None,
+                    "name": span.name,
+                    "kind": span.kind,
+                    "start_ms": round((span.start_ns - self.root.start_ns) / 1_000_000, 3),
+                    "duration_ms": round(span.duration_ns / 1_000_000, 3),
+                    "self_ms": round(span.self_ns / 1_000_000, 3),
+                    "error": span.error,
+                    "attributes": span.attributes,
+                }
+                for span in self.spans
+            ],
+        }
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+# ============================================================
+# Span API
+# ============================================================
+
+
+def start_trace(name: str, kind: str = KIND_ROUTE, max_spans: int = TRACING_MAX_SPANS, **attributes: Any) -> Trace:
+    """Start a trace for the current request (replaces any leftover trace)"""
+    trace = Trace(name, kind, attributes, max_spans)
+    _current_trace.set(trace)
+    _current_span.set(trace.root)
+    return trace
+
+
+def get_current_trace() -> Trace | None:
+    return _current_trace.get()
+
+
+def finish_trace(status_code: int | None = None, error: str | None = None) -> Trace | None:
+    """
+    End the current trace and hand it to the ring / OTLP exporter
+
+    Returns:
+        The finished trace, None if no trace was active (e.g. already finished)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    _current_trace.set(None)
+    _current_span.set(None)
+    trace.root.end_ns = time.perf_counter_ns()
+    if status_code is not None:
+        trace.root.attributes["http.status_code"] = status_code
+    if error:
+        trace.root.error = error
+    trace_ring.add(trace)
+    if TRACING_OTLP_FILE:
+        export_otlp_file(trace, TRACING_OTLP_FILE)
+    return trace
+
+
+def start_span(name: str, kind: str = KIND_INTERNAL, **attributes: Any) -> Span | None:
+    """
+    Open a span as child of the current span (for hooks that cannot use span(), e.g. SQLAlchemy events)
+
+    Beyond max_spans the span is still timed (breakdown stays complete) but not stored.
+
+    Returns:
+        The span (close it with end_span), None outside of a trace
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    span = Span(name, kind, _current_span.get(), attributes)
+    if len(trace.spans) < trace.max_spans:
+        trace.spans.append(span)
+    else:
+        span.dropped = True
+        trace.dropped_spans += 1
+    _current_span.set(span)
+    return span
+
+
+def end_span(span: Span | None, error: str | None = None) -> None:
+    """Close a span opened with start_span (None is ignored)"""
+    if span is None:
+        return
+    span.end_ns = time.perf_counter_ns()
+    if error:
+        span.error = error
+    if span.dropped:
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.dropped_self_ns[span.kind] = trace.dropped_self_ns.get(span.kind, 0) + span.self_ns
+    if span.parent is not None:
+        span.parent.child_ns += span.end_ns - span.start_ns
+        if _current_span.get() is span:
+            _current_span.set(span.parent)
+
+
+@contextmanager
+def span(name: str, kind: str = KIND_INTERNAL, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+    """
+    Time a block as span of the current trace
+
+    Example:
+        with span("hash.sha256", KIND_HASH, bytes=len(data)):
+            file_hash = calculate_file_hash(data)
+    """
+    current = start_span(name, kind, **attributes)
+    if current is None:
+        yield NOOP_SPAN
+        return
+    try:
+        yield current
+    except BaseException as e:
+        end_span(current, type(e).__name__)
+        raise
+    end_span(current)
+
+
+def traced(name: str | None = None, kind: str = KIND_INTERNAL) -> Callable:
+    """Decorator: run the function inside a span (name defaults to the qualified function name)"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(kind: str) -> Callable[[type], type]:
+    """
+    Class decorator: trace all public methods (incl. static/class methods) as spans "<Class>.<method>"
+
+    Generator methods are left alone - their work happens while the caller iterates.
+    """
+
+    def decorator(cls: type) -> type:
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith("_"):
+                continue
+            if isinstance(attr, (staticmethod, classmethod)):
+                func = attr.__func__
+                wrap: Callable[[Callable], Any] = type(attr)
+            elif inspect.isfunction(attr):
+                func, wrap = attr, lambda f: f
+            else:
+                continue
+            if inspect.isgeneratorfunction(func):
+                continue
+            setattr(cls, attr_name, wrap(traced(f"{cls.__name__}.{attr_name}", kind)(func)))
+        return cls
+
+    return decorator
+
+
+# ============================================================
+# Ring + OTLP export
+# ============================================================
+
+
+class TraceRing:
+    """Most recent finished traces of this worker process"""
+
+    def __init__(self, size: int):
+        self._traces: deque[Trace] = deque(maxlen=max(size, 1))
+        self._lock = threading.Lock()
+
+    def add(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def list(self) -> list[Trace]:
+        """Traces, newest first"""
+        with self._lock:
+            return list(reversed(self._traces))
+
+    def get(self, trace_id: str) -> Trace | None:
+        with self._lock:
+            return next((trace for trace in self._traces if trace.trace_id == trace_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+trace_ring = TraceRing(TRACING_RING_SIZE)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace: Trace) -> dict[str, Any]:
+    """
+    Trace as OTLP/JSON ExportTraceServiceRequest (ids hex, timestamps as unix nano strings)
+    """
+    spans = []
+    for span in trace.spans:
+        start = trace.start_unix_ns + span.start_ns - trace.root.start_ns
+        otlp_span = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "parentSpanId": span.parent.span_id if span.parent else "",
+            "name": span.name,
+            "kind": _OTLP_KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(start),
+            "endTimeUnixNano": str(start + span.duration_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in {"aiproxy.kind": span.kind, **span.attributes}.items()
+            ],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }
+        ]
+    }
+
+
+_export_lock = threading.Lock()
+
+
+def export_otlp_file(trace: Trace, path: str) -> None:
+    """Append the trace as one OTLP/JSON line (errors are logged, never raised)"""
+    line = json.dumps(to_otlp(trace), separators=(",", ":"), default=str) + "\n"
+    try:
+        with _export_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+    except OSError as e:
+        logger.warning("Writing OTLP trace file failed", path=path, error=str(e))
@@ -0,0 +1,28 @@
+"""Application version from pyproject.toml (read once per process)"""
+
+import tomllib
+from functools import cache
+from pathlib import Path
+
+from utils.logger import logger
+
+
+# Path from src/utils/version.py to aiproxysrv root (2 levels up)
+PYPROJECT_PATH = Path(__file__).parents[2] / "pyproject.toml"
+
+
+@cache
+def get_version() -> str:
+    """
+    Read version from pyproject.toml
+
+    Cached: app factory, OpenAPI spec and the entry points share one parse.
+    With gunicorn preload_app the workers inherit the value from the master.
+    """
+    try:
+        with open(PYPROJECT_PATH, "rb") as f:
+            pyproject_data = tomllib.load(f)
+        return pyproject_data.get("project", {}).get("version", "unknown")
+    except Exception as e:
+        logger.warning("Failed to read version from pyproject.toml", error=str(e))
+        return "unknown"
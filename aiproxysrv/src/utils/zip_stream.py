@@ -0,0 +1,129 @@
+"""Streaming ZIP writer - build ZIP archives on the fly (no temp files, constant memory)
+
+zipfile writes into a non-seekable sink, so every entry gets a data descriptor
+(CRC/sizes after the data) instead of a patched local header. The generator drains
+the sink after every written chunk, so memory stays at one chunk per download
+no matter how large the archive is. ZIP64 records are written automatically for
+entries > 2 GB, archives > 4 GB and more than 65535 entries.
+
+Usage:
+    entries = [ZipStreamEntry("Mix/song.wav", size, modified, lambda: storage.iter_chunks(key))]
+    return Response(stream_zip(entries), mimetype="application/zip")
+"""
+
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from utils.logger import logger
+
+
+# Listing of entries whose content could not be read (added at the end of the archive)
+MISSING_FILES_ARCNAME = "MISSING_FILES.txt"
+
+_ZIP_MIN_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class ZipStreamEntry:
+    """One archive entry (arcname ending with "/" = directory)"""
+
+    arcname: str
+    size: int | None = 0
+    modified: datetime | None = None
+    open_chunks: Callable[[], Iterable[bytes]] | None = None
+    compress: bool = False
+
+
+class _ZipSink:
+    """Write-only, non-seekable file object - zipfile writes, stream_zip() drains"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        """Yield (and clear) the bytes written since the last drain"""
+        if self._buffer:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            yield data
+
+
+def _zip_date_time(modified: datetime | None) -> tuple[int, int, int, int, int, int]:
+    """ZIP timestamps start at 1980 (DOS date)"""
+    if modified is None:
+        return _ZIP_MIN_DATE_TIME
+    return max(modified.timetuple()[:6], _ZIP_MIN_DATE_TIME)
+
+
+def _build_zip_info(entry: ZipStreamEntry) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(entry.arcname, date_time=_zip_date_time(entry.modified))
+    if info.is_dir():
+        info.external_attr = (0o40755 << 16) | 0x10
+        return info
+    info.compress_type = zipfile.ZIP_DEFLATED if entry.compress else zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    info.file_size = entry.size or 0
+    return info
+
+
+def stream_zip(entries: Iterable[ZipStreamEntry]) -> Iterator[bytes]:
+    """
+    Stream a ZIP archive (entries are read one after another, chunk by chunk)
+
+    Entries whose first chunk cannot be read (e.g. missing S3 object) are skipped and
+    listed in MISSING_FILES.txt. Errors after the first chunk abort the stream - the
+    HTTP status is already sent, so a truncated archive is the only honest signal.
+
+    Args:
+        entries: Archive entries in archive order
+
+    Yields:
+        ZIP bytes
+    """
+    sink = _ZipSink()
+    missing: list[str] = []
+
+    with zipfile.ZipFile(sink, mode="w", allowZip64=True) as archive:
+        for entry in entries:
+            info = _build_zip_info(entry)
+            if info.is_dir() or entry.open_chunks is None:
+                archive.writestr(info, b"")
+                yield from sink.drain()
+                continue
+
+            # Read the first chunk before the local header is written (skippable until here)
+            try:
+                chunks = iter(entry.open_chunks())
+                first_chunk = next(chunks, b"")
+            except Exception as e:
+                logger.warning("ZIP entry skipped", arcname=entry.arcname, error=str(e), error_type=type(e).__name__)
+                missing.append(entry.arcname)
+                continue
+
+            # force_zip64 when the size is unknown (zipfile decides from file_size otherwise)
+            with archive.open(info, mode="w", force_zip64=entry.size is None) as target:
+                target.write(first_chunk)
+                yield from sink.drain()
+                for chunk in chunks:
+                    target.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+
+        if missing:
+            archive.writestr(MISSING_FILES_ARCNAME, "\n".join(missing) + "\n")
+
+    yield from sink.drain()
@@ -3,24 +3,13 @@ WSGI Entry Point für Gunicorn (PRODUCTION)
 """
 
 import logging
-from pathlib import Path
-
-import tomli
 
 from api.app import create_app
 from config.settings import DEBUG, FLASK_SERVER_HOST, FLASK_SERVER_PORT, LOG_LEVEL
 from utils.logger import LoguruHandler, logger
+from utils.version import get_version
 
 
-# Read version from pyproject.toml
-try:
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    with open(pyproject_path, "rb") as f:
-        pyproject_data = tomli.load(f)
-    version = pyproject_data.get("project", {}).get("version", "unknown")
-except Exception:
-    version = "unknown"
-
 # Flask-App erstellen
 app = create_app()
 
@@ -30,6 +19,6 @@ if __name__ == "__main__":
     flask_logger.setLevel(LOG_LEVEL)
 
     logger.info("*** AIPROXYSRV SERVER STARTED ***")
-    logger.info(f"*** Version: {version} ***")
+    logger.info(f"*** Version: {get_version()} ***")
 
     app.run(host=FLASK_SERVER_HOST, port=FLASK_SERVER_PORT, debug=DEBUG)
@@ -0,0 +1,210 @@
+"""Benchmark harness for pure business functions (time + allocations, history, regression check)
+
+Normal test runs execute every benchmark once (smoke test, BENCHMARK_ROUNDS=1).
+`make benchmark` measures with more rounds and compares against the last entry in
+history.jsonl recorded on the same machine; `make benchmark-save` appends the run.
+
+Times are compared relative to a fixed pure-Python calibration workload run interleaved
+with the benchmark rounds, so a machine that is busy or clocked down as a whole does not
+show up as regression.
+
+Environment:
+    BENCHMARK_ROUNDS         Timed rounds per benchmark (default: 1)
+    BENCHMARK_COMPARE        "true" = fail on regression vs. history (default: false)
+    BENCHMARK_SAVE           "true" = append results to history.jsonl (default: false)
+    BENCHMARK_THRESHOLD_PCT  Allowed slowdown / allocation growth in percent (default: 50)
+    BENCHMARK_MACHINE        Machine label for history entries (default: os-arch-cpus-python)
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+HISTORY_FILE = Path(__file__).parent / "history.jsonl"
+
+BENCHMARK_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "1"))
+BENCHMARK_COMPARE = os.getenv("BENCHMARK_COMPARE", "false").lower() == "true"
+BENCHMARK_SAVE = os.getenv("BENCHMARK_SAVE", "false").lower() == "true"
+BENCHMARK_THRESHOLD_PCT = float(os.getenv("BENCHMARK_THRESHOLD_PCT", "50"))
+BENCHMARK_MACHINE = os.getenv(
+    "BENCHMARK_MACHINE",
+    f"{platform.system()}-{platform.machine()}-{os.cpu_count()}cpu-py{platform.python_version()}",
+)
+
+# Differences below these are noise, even if above the relative threshold
+MIN_TIME_DELTA_MS = 1.0
+MIN_PEAK_DELTA_KIB = 64.0
+
+# A suspected time regression is re-measured this many times before it fails the run
+CONFIRM_RETRIES = 2
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _load_previous_results() -> dict[str, dict[str, Any]]:
+    """Results of the most recent history entry recorded on this machine"""
+    if not HISTORY_FILE.exists():
+        return {}
+    previous: dict[str, dict[str, Any]] = {}
+    for line in HISTORY_FILE.read_text().splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        if entry.get("machine") == BENCHMARK_MACHINE:
+            previous = entry["results"]
+    return previous
+
+
+def _calibration_workload() -> int:
+    """Fixed mix of dict/list/str work (similar to the transformers)"""
+    total = 0
+    for i in range(20_000):
+        item = {"id": i, "path": f"dir/{i}.wav"}
+        total += len(item["path"].split("/")[-1])
+    return total
+
+
+def find_regressions(name: str, result: dict[str, Any], previous: dict[str, Any] | None) -> list[str]:
+    """
+    Compare one benchmark result with its previous result
+
+    Time uses the fastest round (least disturbed by scheduler / GC noise) relative to the
+    calibration workload, memory the tracemalloc peak (deterministic for the same input).
+    """
+    if not previous:
+        return []
+    regressions = []
+    limit = 1 + BENCHMARK_THRESHOLD_PCT / 100
+    if result["relative"] > previous["relative"] * limit and result["min_ms"] - previous["min_ms"] > MIN_TIME_DELTA_MS:
+        regressions.append(
+            f"{name}: {previous['relative']:.3f} -> {result['relative']:.3f} x calibration "
+            f"(min {previous['min_ms']:.2f} ms -> {result['min_ms']:.2f} ms)"
+        )
+    if (
+        result["peak_kib"] > previous["peak_kib"] * limit
+        and result["peak_kib"] - previous["peak_kib"] > MIN_PEAK_DELTA_KIB
+    ):
+        regressions.append(f"{name}: peak {previous['peak_kib']:.0f} KiB -> {result['peak_kib']:.0f} KiB")
+    return regressions
+
+
+class BenchmarkRecorder:
+    """Collects results of one session and compares them with the history"""
+
+    def __init__(self):
+        self.results: dict[str, dict[str, Any]] = {}
+        self.previous = _load_previous_results() if BENCHMARK_COMPARE else {}
+
+    def measure(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func with BENCHMARK_ROUNDS timed rounds plus one round under tracemalloc
+
+        Returns:
+            Return value of the last call (for correctness asserts in the benchmark)
+        """
+        if BENCHMARK_ROUNDS > 1:
+            func(*args, **kwargs)  # Warm-up (imports, caches)
+
+        timings_ms, calibration_ms = self._time_rounds(func, args, kwargs)
+        previous = self.previous.get(name)
+        for _ in range(CONFIRM_RETRIES):
+            suspect = {"min_ms": min(timings_ms), "relative": min(timings_ms) / min(calibration_ms), "peak_kib": 0.0}
+            if not find_regressions(name, suspect, previous):
+                break
+            more_timings, more_calibration = self._time_rounds(func, args, kwargs)
+            timings_ms += more_timings
+            calibration_ms += more_calibration
+
+        tracemalloc.start()
+        try:
+            baseline_bytes = tracemalloc.get_traced_memory()[0]
+            value = func(*args, **kwargs)
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "rounds": len(timings_ms),
+            "median_ms": round(statistics.median(timings_ms), 3),
+            "min_ms": round(min(timings_ms), 3),
+            "relative": round(min(timings_ms) / min(calibration_ms), 4),
+            "calibration_ms": round(min(calibration_ms), 3),
+            "peak_kib": round((peak_bytes - baseline_bytes) / 1024, 1),
+            "retained_kib": round((current_bytes - baseline_bytes) / 1024, 1),
+        }
+        self.results[name] = result
+
+        if BENCHMARK_COMPARE:
+            regressions = find_regressions(name, result, previous)
+            if regressions:
+                pytest.fail(f"Benchmark regression (> {BENCHMARK_THRESHOLD_PCT:.0f}%): " + "; ".join(regressions))
+        return value
+
+    @staticmethod
+    def _time_rounds(func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> tuple[list[float], list[float]]:
+        """Timed rounds of func, each preceded by one calibration run (both in ms)"""
+        timings_ms = []
+        calibration_ms = []
+        gc.collect()
+        for _ in range(BENCHMARK_ROUNDS):
+            start = time.perf_counter_ns()
+            _calibration_workload()
+            calibration_ms.append((time.perf_counter_ns() - start) / 1_000_000)
+            start = time.perf_counter_ns()
+            func(*args, **kwargs)
+            timings_ms.append((time.perf_counter_ns() - start) / 1_000_000)
+        return timings_ms, calibration_ms
+
+    def save(self) -> None:
+        entry = {
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "machine": BENCHMARK_MACHINE,
+            "rounds": BENCHMARK_ROUNDS,
+            "results": dict(sorted(self.results.items())),
+        }
+        with HISTORY_FILE.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder():
+    """Session-wide recorder; appends the results to history.jsonl if BENCHMARK_SAVE=true"""
+    recorder = BenchmarkRecorder()
+    yield recorder
+    if BENCHMARK_SAVE and recorder.results:
+        recorder.save()
+
+
+@pytest.fixture
+def bench(request, benchmark_recorder):
+    """
+    Measure a function under the name of the current test
+
+    Usage:
+        result = bench(build_chat_payload, "gpt-4o", messages)
+    """
+
+    def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return benchmark_recorder.measure(request.node.name, func, *args, **kwargs)
+
+    return run
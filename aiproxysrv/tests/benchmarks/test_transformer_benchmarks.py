@@ -0,0 +1,308 @@
+"""Micro-benchmarks for pure transformers on synthetic large inputs
+
+Sizes: 10k-file folders, 2k-message conversations, 500-choice songs / 500-song lists.
+Each benchmark also asserts the result, so a fast but wrong transformer still fails.
+The JSON response benchmarks serialize transformer output like jsonify does.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from api.json_provider import FastJSONProvider
+from business.claude_chat_transformer import build_messages_payload
+from business.compression_transformer import (
+    build_summary_prompt,
+    calculate_actual_token_count_estimate,
+    create_fallback_summary,
+    filter_compressible_messages,
+)
+from business.openai_chat_transformer import build_chat_payload
+from business.prompt_template_processor import PromptTemplateProcessor
+from business.song_project_transformer import (
+    build_archive_entries,
+    compute_mirror_diff,
+    transform_file_to_listing_item,
+)
+from business.song_transformer import SongTransformer
+
+
+FOLDER_FILES = 10_000
+CONVERSATION_MESSAGES = 2_000
+SONG_CHOICES = 500
+FOLDER_NAME = "01 Arrangement"
+PROJECT_ID = "3f1c2d4e-0000-4000-8000-000000000001"
+TIMESTAMP = datetime(2026, 1, 1, 12, 0, 0)
+
+
+# ===================================
+# Synthetic inputs (deterministic)
+# ===================================
+
+
+@pytest.fixture(scope="module")
+def remote_files():
+    """10k ProjectFile rows (compact columns) spread over 100 directories"""
+    return [
+        SimpleNamespace(
+            id=f"file-{i:05d}",
+            folder_id="folder-1",
+            relative_path=f"{FOLDER_NAME}/Take {i % 100:02d}/stem_{i:05d}.wav",
+            filename=f"stem_{i:05d}.wav",
+            file_hash=f"{i:064x}",
+            file_size_bytes=1_000_000 + i,
+            s3_key=f"projects/p/{FOLDER_NAME}/Take {i % 100:02d}/stem_{i:05d}.wav",
+            storage_backend="s3",
+            updated_at=TIMESTAMP,
+        )
+        for i in range(FOLDER_FILES)
+    ]
+
+
+@pytest.fixture(scope="module")
+def local_files():
+    """10k local files: 5% changed, 2% missing remotely, 2% deleted locally, 1% moved"""
+    files = []
+    for i in range(FOLDER_FILES):
+        path = f"Take {i % 100:02d}/stem_{i:05d}.wav"
+        file_hash = f"{i:064x}"
+        if i % 100 < 2:
+            continue  # deleted locally
+        if i % 100 == 2:
+            path = f"Moved/stem_{i:05d}.wav"
+        elif i % 20 == 3:
+            file_hash = f"{i + 10**9:064x}"
+        files.append({"relative_path": path, "file_hash": file_hash, "file_size_bytes": 1_000_000 + i})
+    files += [
+        {"relative_path": f"New/file_{i:05d}.wav", "file_hash": f"{i + 10**12:064x}", "file_size_bytes": 10}
+        for i in range(FOLDER_FILES // 50)
+    ]
+    return files
+
+
+@pytest.fixture(scope="module")
+def chat_messages():
+    """2k-message conversation (system + alternating user/assistant)"""
+    messages = [{"role": "system", "content": "You are a helpful songwriting assistant."}]
+    for i in range(CONVERSATION_MESSAGES - 1):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": f"Message {i}: " + "lyrics and chords " * 20})
+    return messages
+
+
+@pytest.fixture(scope="module")
+def message_rows(chat_messages):
+    """2k Message rows (attribute access like SQLAlchemy models)"""
+    return [SimpleNamespace(role=m["role"], content=m["content"]) for m in chat_messages]
+
+
+def _choice(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"choice-{index}",
+        mureka_choice_id=f"mureka-{index}",
+        choice_index=index,
+        mp3_url=f"https://cdn.example/{index}.mp3",
+        flac_url=None,
+        wav_url=None,
+        video_url=None,
+        image_url=None,
+        stem_url=None,
+        mp3_s3_key=f"songs/{index}.mp3",
+        flac_s3_key=None,
+        wav_s3_key=None,
+        stem_s3_key=None,
+        stem_generated_at=None,
+        duration=180_000 + index,
+        title=f"Choice {index}",
+        tags="pop,rock",
+        rating=index % 5,
+        created_at=TIMESTAMP,
+    )
+
+
+def _song(index: int, choices: list[SimpleNamespace]) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"song-{index}",
+        task_id=f"task-{index}",
+        job_id=f"job-{index}",
+        lyrics="[Verse]\nline one\nline two\n" * 10,
+        prompt="upbeat pop",
+        model="mureka-7.5",
+        title=f"Song {index}",
+        tags="pop",
+        workflow="onWork",
+        is_instrumental=False,
+        status="SUCCESS",
+        progress_info=None,
+        error_message=None,
+        mureka_response=None,
+        mureka_status="succeeded",
+        project_id=None,
+        choices=choices,
+        created_at=TIMESTAMP,
+        updated_at=TIMESTAMP,
+        completed_at=TIMESTAMP,
+    )
+
+
+# ===================================
+# Song projects (10k-file folders)
+# ===================================
+
+
+@pytest.mark.benchmark
+class TestSongProjectBenchmarks:
+    """Mirror compare, folder listing and ZIP layout on a 10k-file folder"""
+
+    def test_mirror_diff_10k_files(self, bench, remote_files, local_files):
+        diff = bench(compute_mirror_diff, local_files, remote_files, FOLDER_NAME, "projects/p")
+
+        assert len(diff["to_move"]) == FOLDER_FILES // 100
+        assert len(diff["to_delete"]) == 2 * FOLDER_FILES // 100
+        assert len(diff["to_upload"]) == FOLDER_FILES // 50
+
+    def test_mirror_diff_10k_files_scoped(self, bench, remote_files, local_files):
+        diff = bench(compute_mirror_diff, local_files, remote_files, FOLDER_NAME, "projects/p", ["Take 07", "New"])
+
+        assert len(diff["to_upload"]) == FOLDER_FILES // 50
+
+    def test_folder_listing_10k_files(self, bench, remote_files):
+        items = bench(lambda: [transform_file_to_listing_item(f, PROJECT_ID) for f in remote_files])
+
+        assert len(items) == FOLDER_FILES
+
+    def test_archive_entries_10k_files(self, bench, remote_files):
+        entries = bench(build_archive_entries, remote_files, {"folder-1": FOLDER_NAME})
+
+        assert len(entries) == FOLDER_FILES + 1  # + directory entry
+
+
+# ===================================
+# Chat / compression (2k-message conversations)
+# ===================================
+
+
+@pytest.mark.benchmark
+class TestChatBenchmarks:
+    """Payload building and compression helpers on a 2k-message conversation"""
+
+    def test_openai_chat_payload_2k_messages(self, bench, chat_messages):
+        payload = bench(build_chat_payload, "gpt-4o", chat_messages, max_tokens=4096)
+
+        assert len(payload["messages"]) == CONVERSATION_MESSAGES
+
+    def test_claude_payload_2k_messages_with_cache(self, bench, chat_messages):
+        payload = bench(
+            build_messages_payload, "claude-sonnet-4-5-20250929", chat_messages, max_tokens=4096, prompt_cache=True
+        )
+
+        assert len(payload["messages"]) == CONVERSATION_MESSAGES - 1
+
+    def test_filter_compressible_2k_messages(self, bench, message_rows):
+        protected, old, recent = bench(filter_compressible_messages, message_rows, 20)
+
+        assert (len(protected), len(old), len(recent)) == (1, CONVERSATION_MESSAGES - 21, 20)
+
+    def test_summary_prompt_2k_messages(self, bench, message_rows):
+        prompt = bench(build_summary_prompt, message_rows, max_messages=CONVERSATION_MESSAGES)
+
+        assert "Message 1998" in prompt
+
+    def test_fallback_summary_2k_messages(self, bench, message_rows):
+        summary, tokens = bench(create_fallback_summary, message_rows)
+
+        assert summary
+        assert tokens > 0
+
+    def test_token_estimate_2k_messages(self, bench, chat_messages):
+        assert bench(calculate_actual_token_count_estimate, chat_messages) > 0
+
+
+# ===================================
+# Prompt templates
+# ===================================
+
+
+@pytest.mark.benchmark
+class TestPromptTemplateBenchmarks:
+    """Template processing for a batch of requests with long lyrics input"""
+
+    def test_process_template_500_requests(self, bench):
+        template = SimpleNamespace(
+            id=1,
+            category="lyrics",
+            action="generate",
+            pre_condition="You are a professional lyric writer. " * 20,
+            post_condition="Format as verse-chorus structure. " * 20,
+            model="llama3.2:3b",
+            temperature=0.7,
+            max_tokens=2048,
+        )
+        inputs = [f"Request {i}: " + "write about rain and city lights " * 100 for i in range(500)]
+
+        results = bench(lambda: [PromptTemplateProcessor.process_template(template, text) for text in inputs])
+
+        assert len(results) == 500
+        assert results[-1]["model"] == "llama3.2:3b"
+
+
+# ===================================
+# Songs (500 choices / 500-song lists)
+# ===================================
+
+
+@pytest.mark.benchmark
+class TestSongBenchmarks:
+    """Song detail and list formatting"""
+
+    def test_song_detail_500_choices(self, bench):
+        song = _song(0, [_choice(i) for i in range(SONG_CHOICES)])
+
+        detail = bench(SongTransformer.transform_song_to_detail_format, song)
+
+        assert detail["choices_count"] == SONG_CHOICES
+
+    def test_song_list_500_songs(self, bench):
+        songs = [_song(i, []) for i in range(SONG_CHOICES)]
+
+        items = bench(lambda: [SongTransformer.transform_song_to_list_format(song) for song in songs])
+
+        assert len(items) == SONG_CHOICES
+
+
+# ===================================
+# JSON responses (jsonify of large lists)
+# ===================================
+
+
+@pytest.fixture(scope="module")
+def json_app():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    return app
+
+
+@pytest.mark.benchmark
+class TestJsonResponseBenchmarks:
+    """Response serialization of the largest list endpoints"""
+
+    def test_song_detail_500_choices_response(self, bench, json_app):
+        detail = SongTransformer.transform_song_to_detail_format(_song(0, [_choice(i) for i in range(SONG_CHOICES)]))
+
+        with json_app.app_context():
+            response = bench(json_app.json.response, {"data": detail})
+
+        assert response.get_json()["data"]["choices_count"] == SONG_CHOICES
+
+    def test_conversation_2k_messages_response(self, bench, json_app, chat_messages):
+        messages = [
+            {"id": f"message-{i}", "created_at": TIMESTAMP, "token_count": 40, **message}
+            for i, message in enumerate(chat_messages)
+        ]
+
+        with json_app.app_context():
+            response = bench(json_app.json.response, {"messages": messages})
+
+        assert len(response.get_json()["messages"]) == CONVERSATION_MESSAGES
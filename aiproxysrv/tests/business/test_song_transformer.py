@@ -422,3 +422,87 @@ class TestGenerateS3SongKey:
         assert result0 == "test-song_abc-123/choice-0/audio.mp3"
         assert result1 == "test-song_abc-123/choice-1/audio.mp3"
         assert result2 == "test-song_abc-123/choice-2/audio.mp3"
+
+
+class TestGetPendingMigrationTypes:
+    """Tests for get_pending_migration_types()"""
+
+    def _choice(self, **attributes):
+        choice = Mock()
+        for url_attribute, s3_key_attribute in [
+            ("mp3_url", "mp3_s3_key"),
+            ("flac_url", "flac_s3_key"),
+            ("wav_url", "wav_s3_key"),
+            ("stem_url", "stem_s3_key"),
+        ]:
+            setattr(choice, url_attribute, attributes.get(url_attribute))
+            setattr(choice, s3_key_attribute, attributes.get(s3_key_attribute))
+        return choice
+
+    def test_pending_types_have_url_but_no_s3_key(self):
+        """Test only files with Mureka URL and without S3 copy are pending"""
+        from business.song_transformer import get_pending_migration_types
+
+        choice = self._choice(
+            mp3_url="https://cdn/a.mp3",
+            mp3_s3_key="song/choice-0/audio.mp3",
+            flac_url="https://cdn/a.flac",
+            stem_url="https://cdn/stems.zip",
+        )
+
+        assert get_pending_migration_types(choice, ["mp3", "flac", "wav", "stems"]) == ["flac", "stems"]
+
+    def test_pending_types_filtered_by_file_types(self):
+        """Test file types outside the requested list are ignored"""
+        from business.song_transformer import get_pending_migration_types
+
+        choice = self._choice(mp3_url="https://cdn/a.mp3", wav_url="https://cdn/a.wav")
+
+        assert get_pending_migration_types(choice, ["mp3"]) == ["mp3"]
+        assert get_pending_migration_types(choice, ["flac"]) == []
+
+
+class TestCalculateMigrationRetryAt:
+    """Tests for calculate_migration_retry_at()"""
+
+    def test_backoff_doubles_per_attempt(self):
+        """Test retry delay doubles with every failed attempt"""
+        from business.song_transformer import calculate_migration_retry_at
+
+        now = datetime(2025, 1, 1)
+
+        assert (calculate_migration_retry_at(now, 1, 60) - now).total_seconds() == 60
+        assert (calculate_migration_retry_at(now, 2, 60) - now).total_seconds() == 120
+        assert (calculate_migration_retry_at(now, 4, 60) - now).total_seconds() == 480
+
+    def test_backoff_capped_at_six_hours(self):
+        """Test retry delay is capped"""
+        from business.song_transformer import calculate_migration_retry_at
+
+        now = datetime(2025, 1, 1)
+
+        assert (calculate_migration_retry_at(now, 30, 60) - now).total_seconds() == 6 * 3600
+
+
+class TestIsMigrationDue:
+    """Tests for is_migration_due()"""
+
+    def test_given_up_after_max_attempts(self):
+        """Test a choice that failed max_attempts times is not retried (e.g. on every playback)"""
+        from business.song_transformer import is_migration_due
+
+        now = datetime(2025, 1, 1)
+
+        assert is_migration_due(4, None, 5, now) is True
+        assert is_migration_due(5, None, 5, now) is False
+        assert is_migration_due(9, datetime(2020, 1, 1), 5, now) is False
+
+    def test_waits_for_backoff_or_lease(self):
+        """Test a running backoff/lease blocks the submit until it has expired"""
+        from business.song_transformer import is_migration_due
+
+        now = datetime(2025, 1, 1, 12, 0)
+
+        assert is_migration_due(1, datetime(2025, 1, 1, 12, 5), 5, now) is False
+        assert is_migration_due(1, now, 5, now) is True
+        assert is_migration_due(1, datetime(2025, 1, 1, 11, 0), 5, now) is True
@@ -46,6 +46,83 @@ def mock_get_db(mocker, mock_db_session):
     return mock_gen
 
 
+def _register_sqlite_ddl_fallbacks():
+    """
+    Let PostgreSQL-only column types be created on SQLite (query budget tests only)
+
+    ARRAY/TSVECTOR columns become TEXT, generated columns (search_vector) become plain
+    columns. The ORM never writes them in these tests; search/tag filters are not usable.
+    """
+    from sqlalchemy import ARRAY, Computed
+    from sqlalchemy.dialects.postgresql import TSVECTOR
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(ARRAY, "sqlite")
+    @compiles(TSVECTOR, "sqlite")
+    def _as_text(type_, compiler, **kw):  # noqa: ARG001
+        return "TEXT"
+
+    @compiles(Computed, "sqlite")
+    def _not_generated(element, compiler, **kw):  # noqa: ARG001
+        return ""
+
+
+_register_sqlite_ddl_fallbacks()
+
+
+@pytest.fixture
+def sqlite_session():
+    """
+    Real SQLAlchemy session on in-memory SQLite for query budget tests
+
+    Created tables: users, conversations, messages, messages_archive, song_projects,
+    project_folders, project_files, song_releases, release_project_references.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from db.database import Base
+    from db.models import (
+        Conversation,
+        Message,
+        MessageArchive,
+        ProjectFile,
+        ProjectFolder,
+        ReleaseProjectReference,
+        SongProject,
+        SongRelease,
+        User,
+    )
+
+    engine = create_engine("sqlite://")
+    models = (
+        User,
+        Conversation,
+        Message,
+        MessageArchive,
+        SongProject,
+        ProjectFolder,
+        ProjectFile,
+        SongRelease,
+        ReleaseProjectReference,
+    )
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in models])
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def query_budget(sqlite_session):
+    """Context manager factory: query_budget(n) fails if the block runs more than n SQL statements"""
+    from db.query_counter import assert_query_budget
+
+    return lambda max_queries: assert_query_budget(sqlite_session.get_bind(), max_queries)
+
+
 # ===================================
 # Redis Fixtures
 # ===================================
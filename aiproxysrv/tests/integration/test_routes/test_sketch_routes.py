@@ -14,6 +14,7 @@ from uuid import uuid4
 import pytest
 
 from api.controllers.sketch_controller import SketchController
+from db.pagination_helpers import InvalidCursorError
 from schemas.sketch_schemas import SketchCreateRequest, SketchListResponse, SketchResponse
 
 
@@ -136,6 +137,34 @@ class TestSketchControllerIntegration:
             # has_more should be False because 40 + 10 = 50 (no more)
             assert result["pagination"]["has_more"] is False
 
+    def test_list_sketches_cursor_mode_pagination(self, mock_db_session, mock_sketch_db_model):
+        """Cursor mode returns next_cursor, no offset and an optional total"""
+        with patch("db.sketch_service.sketch_service.get_sketches_paginated") as mock_get:
+            mock_get.return_value = {"items": [mock_sketch_db_model], "total": None, "next_cursor": "abc"}
+
+            result, status_code = SketchController.get_sketches(db=mock_db_session, limit=1, cursor="")
+
+            assert status_code == 200
+            assert mock_get.call_args.kwargs["cursor"] == ""
+            assert result["pagination"] == {
+                "total": None,
+                "offset": None,
+                "limit": 1,
+                "has_more": True,
+                "next_cursor": "abc",
+            }
+            SketchListResponse.model_validate(result)
+
+    def test_list_sketches_invalid_cursor_returns_400(self, mock_db_session):
+        """Malformed cursors are a client error, not a server error"""
+        with patch("db.sketch_service.sketch_service.get_sketches_paginated") as mock_get:
+            mock_get.side_effect = InvalidCursorError("Malformed cursor")
+
+            result, status_code = SketchController.get_sketches(db=mock_db_session, cursor="garbage")
+
+            assert status_code == 400
+            assert result == {"error": "Malformed cursor"}
+
     def test_create_sketch_pydantic_validation(self, mock_db_session, mock_sketch_db_model):
         """Test that create_sketch response passes Pydantic validation"""
         sketch_data = SketchCreateRequest(
@@ -3,11 +3,13 @@
 import pytest
 
 from business.claude_chat_transformer import (
+    apply_prompt_cache_breakpoints,
     build_messages_payload,
     filter_models_by_whitelist,
     get_available_models,
     get_model_context_window,
     get_model_context_window_from_id,
+    parse_cache_usage,
     parse_configured_claude_models,
     parse_messages_response,
     transform_api_model_to_frontend,
@@ -144,6 +146,148 @@ class TestBuildMessagesPayload:
         assert len(payload["messages"]) == 2
 
 
+@pytest.mark.unit
+class TestPromptCacheBreakpoints:
+    """Test apply_prompt_cache_breakpoints() and build_messages_payload(prompt_cache=True)"""
+
+    def test_prompt_cache_disabled_by_default(self):
+        """Default payload should stay plain strings (no cache_control)"""
+        # Arrange
+        messages = [
+            {"role": "system", "content": "You are helpful"},
+            {"role": "user", "content": "Hello"},
+        ]
+
+        # Act
+        payload = build_messages_payload("claude-sonnet-4-5-20250929", messages, 1000)
+
+        # Assert
+        assert payload["system"] == "You are helpful"
+        assert payload["messages"] == [{"role": "user", "content": "Hello"}]
+
+    def test_system_block_gets_breakpoint(self):
+        """System prompt should become a cached text block"""
+        # Arrange
+        messages = [
+            {"role": "system", "content": "You are helpful"},
+            {"role": "user", "content": "Hello"},
+        ]
+
+        # Act
+        payload = build_messages_payload("claude-sonnet-4-5-20250929", messages, 1000, prompt_cache=True)
+
+        # Assert
+        assert payload["system"] == [
+            {"type": "text", "text": "You are helpful", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_last_message_gets_breakpoint(self):
+        """Only the last history message should carry the history breakpoint"""
+        # Arrange
+        messages = [
+            {"role": "user", "content": "First"},
+            {"role": "assistant", "content": "Answer"},
+            {"role": "user", "content": "Second"},
+        ]
+
+        # Act
+        payload = build_messages_payload("claude-sonnet-4-5-20250929", messages, 1000, prompt_cache=True)
+
+        # Assert
+        assert payload["messages"][0] == {"role": "user", "content": "First"}
+        assert payload["messages"][1] == {"role": "assistant", "content": "Answer"}
+        assert payload["messages"][2] == {
+            "role": "user",
+            "content": [{"type": "text", "text": "Second", "cache_control": {"type": "ephemeral"}}],
+        }
+        assert "system" not in payload
+
+    def test_input_not_mutated(self):
+        """Breakpoint placement must not modify caller's payload or messages"""
+        # Arrange
+        messages = [{"role": "user", "content": "Hello"}]
+        payload = {"model": "m", "system": "Sys", "messages": messages}
+
+        # Act
+        cached = apply_prompt_cache_breakpoints(payload)
+
+        # Assert
+        assert payload["system"] == "Sys"
+        assert messages == [{"role": "user", "content": "Hello"}]
+        assert cached["messages"] is not messages
+
+    def test_stable_prefix_across_turns(self):
+        """Prefix of turn N+1 must be byte-identical to turn N up to the old breakpoint content"""
+        # Arrange
+        turn_1 = [{"role": "system", "content": "Sys"}, {"role": "user", "content": "Q1"}]
+        turn_2 = turn_1 + [{"role": "assistant", "content": "A1"}, {"role": "user", "content": "Q2"}]
+
+        # Act
+        payload_1 = build_messages_payload("m", turn_1, 100, prompt_cache=True)
+        payload_2 = build_messages_payload("m", turn_2, 100, prompt_cache=True)
+
+        # Assert
+        assert payload_1["system"] == payload_2["system"]
+        assert payload_2["messages"][0]["content"] == "Q1"
+        assert payload_2["messages"][-1]["content"][0]["text"] == "Q2"
+
+    def test_empty_or_block_content_left_untouched(self):
+        """Empty strings and existing block lists get no breakpoint"""
+        # Arrange
+        blocks = [{"type": "text", "text": "Already blocks"}]
+        payload = {"system": "", "messages": [{"role": "user", "content": blocks}]}
+
+        # Act
+        cached = apply_prompt_cache_breakpoints(payload)
+
+        # Assert
+        assert cached["system"] == ""
+        assert cached["messages"][0]["content"] is blocks
+
+    def test_no_messages(self):
+        """Payload without messages should not fail"""
+        # Act
+        cached = apply_prompt_cache_breakpoints({"system": "Sys", "messages": []})
+
+        # Assert
+        assert cached["messages"] == []
+        assert cached["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+@pytest.mark.unit
+class TestParseCacheUsage:
+    """Test parse_cache_usage() - Extracts prompt cache token counts"""
+
+    def test_cache_write_and_read(self):
+        """Should return cache creation and read token counts"""
+        # Arrange
+        response = {
+            "usage": {
+                "input_tokens": 12,
+                "output_tokens": 40,
+                "cache_creation_input_tokens": 300,
+                "cache_read_input_tokens": 1800,
+            }
+        }
+
+        # Act
+        creation, read = parse_cache_usage(response)
+
+        # Assert
+        assert creation == 300
+        assert read == 1800
+
+    def test_missing_cache_fields_default_to_zero(self):
+        """Responses without caching should report zero cache usage"""
+        assert parse_cache_usage({"usage": {"input_tokens": 10, "output_tokens": 5}}) == (0, 0)
+        assert parse_cache_usage({}) == (0, 0)
+
+    def test_null_cache_fields_default_to_zero(self):
+        """Null usage values should be treated as zero"""
+        response = {"usage": {"cache_creation_input_tokens": None, "cache_read_input_tokens": None}}
+        assert parse_cache_usage(response) == (0, 0)
+
+
 @pytest.mark.unit
 class TestParseMessagesResponse:
     """Test parse_messages_response() - Parses Claude Messages API response"""
@@ -1,20 +1,43 @@
 """Tests for SongProjectTransformer - Business logic unit tests (100% coverage)"""
 
+from datetime import UTC, datetime
 from unittest.mock import Mock
 
+import pytest
+
 from business.song_project_transformer import (
+    build_archive_entries,
+    build_archive_filename,
+    build_blob_s3_key,
+    build_folder_path_prefix,
+    build_upload_paths,
+    build_upload_staging_key,
+    calculate_cursor_pagination_meta,
     calculate_file_hash,
     calculate_pagination_meta,
+    calculate_stream_hash,
+    calculate_upload_chunk_size,
+    calculate_upload_part_count,
+    compute_mirror_diff,
     detect_file_type,
+    find_missing_upload_parts,
     generate_s3_prefix,
     get_default_folder_structure,
     get_display_cover_info,
+    get_expected_part_size,
     get_mime_type,
+    is_archive_compressible,
+    is_content_addressed,
+    is_path_in_scopes,
     normalize_project_name,
+    partition_claimable_files,
+    transform_file_to_listing_item,
     transform_file_to_response,
     transform_folder_to_response,
+    transform_manifest_node_to_response,
     transform_project_detail_to_response,
     transform_project_to_response,
+    transform_upload_session_to_response,
     validate_project_status,
 )
 
@@ -286,6 +309,9 @@ class TestTransformFolderToResponse:
         folder.folder_type = "arrangement"
         folder.s3_prefix = "projects/test/01 Arrangement/"
         folder.custom_icon = "fas fa-music"
+        folder.file_count = 12
+        folder.total_size_bytes = 3400
+        folder.files_modified_at = None
         folder.created_at = Mock()
         folder.created_at.isoformat.return_value = "2024-01-01T12:00:00"
 
@@ -297,6 +323,9 @@ class TestTransformFolderToResponse:
         assert result["s3_prefix"] == "projects/test/01 Arrangement/"
         assert result["custom_icon"] == "fas fa-music"
         assert result["created_at"] == "2024-01-01T12:00:00"
+        assert result["file_count"] == 12
+        assert result["total_size_bytes"] == 3400
+        assert result["files_modified_at"] is None
 
 
 class TestTransformFileToResponse:
@@ -350,11 +379,201 @@ class TestTransformFileToResponse:
         assert result["download_url"] is None
 
 
+class TestBuildFolderPathPrefix:
+    """Test build_folder_path_prefix() - relative_path prefix for folder browsing"""
+
+    def test_folder_root(self):
+        """No prefix lists the whole folder"""
+        assert build_folder_path_prefix("01 Arrangement") == "01 Arrangement/"
+        assert build_folder_path_prefix("01 Arrangement", "") == "01 Arrangement/"
+
+    def test_nested_prefix(self):
+        """Subdirectory prefix is appended with a trailing slash"""
+        assert build_folder_path_prefix("01 Arrangement", "Samples/Drums") == "01 Arrangement/Samples/Drums/"
+
+    def test_normalizes_separators(self):
+        """Leading/trailing/duplicate slashes, backslashes and '.' are dropped"""
+        assert build_folder_path_prefix("01 Arrangement", "\\Samples//./Drums\\") == "01 Arrangement/Samples/Drums/"
+
+
+class TestTransformFileToListingItem:
+    """Test transform_file_to_listing_item() - compact folder listing entry"""
+
+    def test_synced_file(self):
+        """Files in S3 get the download proxy URL"""
+        file = Mock()
+        file.id = "file-id-123"
+        file.filename = "kick.wav"
+        file.relative_path = "01 Arrangement/Samples/kick.wav"
+        file.file_size_bytes = 1200
+        file.s3_key = "projects/test/01 Arrangement/Samples/kick.wav"
+        file.updated_at = Mock()
+        file.updated_at.isoformat.return_value = "2024-01-02T12:00:00"
+
+        result = transform_file_to_listing_item(file, "project-id-1")
+
+        assert result == {
+            "id": "file-id-123",
+            "filename": "kick.wav",
+            "relative_path": "01 Arrangement/Samples/kick.wav",
+            "download_url": "/api/v1/song-projects/project-id-1/files/file-id-123/download",
+            "file_size_bytes": 1200,
+            "s3_key": "projects/test/01 Arrangement/Samples/kick.wav",
+            "updated_at": "2024-01-02T12:00:00",
+        }
+
+    def test_file_without_s3_key(self):
+        """Files not (yet) in S3 have no download URL"""
+        file = Mock()
+        file.id = "file-id-123"
+        file.s3_key = None
+        file.updated_at = None
+
+        result = transform_file_to_listing_item(file, "project-id-1")
+
+        assert result["download_url"] is None
+        assert result["updated_at"] is None
+
+
+class TestTransformManifestNodeToResponse:
+    """Test transform_manifest_node_to_response() - folder manifest node"""
+
+    def test_root_only(self):
+        """Without children only hash and count are returned (cheap root comparison)"""
+        node = Mock(node_hash="ab" * 32, file_count=20000)
+
+        result = transform_manifest_node_to_response("", node)
+
+        assert result == {"path": "", "hash": "ab" * 32, "file_count": 20000}
+
+    def test_with_children(self):
+        """Subdirectories by name, files with hash and size"""
+        node = Mock(node_hash="ab" * 32, file_count=3)
+        child = Mock(path="Samples/Drums", node_hash="cd" * 32, file_count=2)
+        file = Mock(filename="pad.wav", file_hash="ef" * 32, file_size_bytes=100)
+
+        result = transform_manifest_node_to_response("Samples", node, [child], [file])
+
+        assert result["directories"] == [{"name": "Drums", "hash": "cd" * 32, "file_count": 2}]
+        assert result["files"] == [{"name": "pad.wav", "file_hash": "ef" * 32, "file_size_bytes": 100}]
+
+    def test_missing_directory(self):
+        """Directories that do not exist remotely are reported empty"""
+        result = transform_manifest_node_to_response("New", None, [], [])
+
+        assert result == {"path": "New", "hash": "0" * 64, "file_count": 0, "directories": [], "files": []}
+
+
+class TestIsPathInScopes:
+    """Test is_path_in_scopes() - Mirror compare scoping"""
+
+    def test_no_scopes_means_everything(self):
+        assert is_path_in_scopes("any/file.wav", None) is True
+
+    def test_inside_scope(self):
+        assert is_path_in_scopes("Samples/Drums/kick.wav", ["Bounces", "Samples/Drums"]) is True
+
+    def test_outside_scope(self):
+        """Prefix match is per directory, not per character"""
+        assert is_path_in_scopes("Samples/Drums2/kick.wav", ["Samples/Drums"]) is False
+        assert is_path_in_scopes("mix.wav", ["Samples"]) is False
+
+    def test_empty_scope_list(self):
+        assert is_path_in_scopes("mix.wav", []) is False
+
+
+class TestComputeMirrorDiff:
+    """Test compute_mirror_diff() - local vs remote diff for Mirror sync"""
+
+    @staticmethod
+    def _remote(file_id, relative_path, file_hash, storage_backend="s3"):
+        file = Mock()
+        file.id = file_id
+        file.relative_path = relative_path
+        file.file_hash = file_hash
+        file.file_size_bytes = 100
+        file.s3_key = f"projects/p/{relative_path}"
+        file.storage_backend = storage_backend
+        return file
+
+    @staticmethod
+    def _local(relative_path, file_hash):
+        return {"relative_path": relative_path, "file_hash": file_hash, "file_size_bytes": 100}
+
+    def test_upload_update_delete_unchanged(self):
+        """Remote paths carry the folder name, local paths are folder-relative"""
+        remote = [
+            self._remote("f1", "01 Arrangement/mix.wav", "h1"),
+            self._remote("f2", "01 Arrangement/Bounces/old.wav", "h2"),
+            self._remote("f3", "01 Arrangement/gone.wav", "h3"),
+        ]
+        local = [
+            self._local("mix.wav", "h1"),
+            self._local("/Bounces/old.wav", "h2-changed"),
+            self._local("new.wav", "h4"),
+        ]
+
+        diff = compute_mirror_diff(local, remote, "01 Arrangement", "projects/p")
+
+        assert diff["unchanged"] == ["mix.wav"]
+        assert diff["to_update"] == ["Bounces/old.wav"]
+        assert diff["to_upload"] == ["new.wav"]
+        assert diff["to_delete"] == [{"file_id": "f3", "relative_path": "gone.wav", "file_size_bytes": 100}]
+        assert diff["to_move"] == []
+
+    def test_move_detection(self):
+        remote = [self._remote("f1", "Mix/take.wav", "h1")]
+        local = [self._local("Archive/take.wav", "h1")]
+
+        diff = compute_mirror_diff(local, remote, "Mix", "projects/p/")
+
+        assert diff["to_upload"] == []
+        assert diff["to_delete"] == []
+        assert diff["to_move"] == [
+            {
+                "file_id": "f1",
+                "old_path": "take.wav",
+                "new_path": "Archive/take.wav",
+                "file_hash": "h1",
+                "file_size_bytes": 100,
+                "s3_key_old": "projects/p/Mix/take.wav",
+                "s3_key_new": "projects/p/Mix/Archive/take.wav",
+            }
+        ]
+
+    def test_move_of_shared_blob_keeps_key(self):
+        remote = [self._remote("f1", "Mix/take.wav", "h1", storage_backend="blob")]
+
+        diff = compute_mirror_diff([self._local("take2.wav", "h1")], remote, "Mix", "projects/p")
+
+        assert diff["to_move"][0]["s3_key_new"] == diff["to_move"][0]["s3_key_old"]
+
+    def test_ambiguous_move_is_upload_and_delete(self):
+        """Two local copies of one remote hash are not a 1:1 move"""
+        remote = [self._remote("f1", "Mix/a.wav", "h1")]
+        local = [self._local("b.wav", "h1"), self._local("c.wav", "h1")]
+
+        diff = compute_mirror_diff(local, remote, "Mix", "projects/p")
+
+        assert diff["to_move"] == []
+        assert diff["to_upload"] == ["b.wav", "c.wav"]
+        assert [d["file_id"] for d in diff["to_delete"]] == ["f1"]
+
+    def test_scopes_limit_both_sides(self):
+        remote = [self._remote("f1", "Mix/Samples/kick.wav", "h1"), self._remote("f2", "Mix/other.wav", "h2")]
+        local = [self._local("Samples/snare.wav", "h3")]
+
+        diff = compute_mirror_diff(local, remote, "Mix", "projects/p", scopes=["Samples"])
+
+        assert diff["to_upload"] == ["Samples/snare.wav"]
+        assert [d["file_id"] for d in diff["to_delete"]] == ["f1"]
+
+
 class TestTransformProjectDetailToResponse:
     """Test transform_project_detail_to_response() - project with folders and files"""
 
-    def test_basic_transformation(self):
-        """Transforms project with folders and files"""
+    @staticmethod
+    def _project():
         # Create mock file
         file = Mock()
         file.id = "file-id"
@@ -376,6 +595,9 @@ class TestTransformProjectDetailToResponse:
         folder.folder_type = "arrangement"
         folder.s3_prefix = "projects/test/01 Arrangement/"
         folder.custom_icon = "fas fa-music"
+        folder.file_count = 1
+        folder.total_size_bytes = 5000000
+        folder.files_modified_at = None
         folder.created_at = None
         folder.files = [file]
 
@@ -385,18 +607,21 @@ class TestTransformProjectDetailToResponse:
         project.project_name = "Test Project"
         project.s3_prefix = "projects/test/"
         project.local_path = None
-        project.sync_status = "local"
-        project.last_sync_at = None
         project.cover_image_id = None
         project.tags = []
         project.description = None
-        project.total_files = 1
+        project.file_count = 1
         project.total_size_bytes = 5000000
+        project.files_modified_at = Mock()
+        project.files_modified_at.isoformat.return_value = "2026-01-01T12:00:00"
         project.created_at = None
         project.updated_at = None
         project.folders = [folder]
+        return project
 
-        result = transform_project_detail_to_response(project)
+    def test_basic_transformation(self):
+        """Transforms project with folders and files"""
+        result = transform_project_detail_to_response(self._project())
 
         assert result["id"] == "project-id"
         assert result["project_name"] == "Test Project"
@@ -405,6 +630,31 @@ class TestTransformProjectDetailToResponse:
         assert len(result["folders"][0]["files"]) == 1
         assert result["folders"][0]["files"][0]["filename"] == "song.mp3"
 
+    def test_totals_from_maintained_statistics(self):
+        """Totals come from project statistics, not from summing file rows"""
+        project = self._project()
+        project.file_count = 10_000
+        project.total_size_bytes = 123_456_789
+
+        result = transform_project_detail_to_response(project)
+
+        assert result["total_files"] == 10_000
+        assert result["total_size_bytes"] == 123_456_789
+        assert result["files_modified_at"] == "2026-01-01T12:00:00"
+
+    def test_lightweight_mode_skips_files(self):
+        """include_files=False: folders carry statistics, file relationship is never accessed"""
+        project = self._project()
+        del project.folders[0].files
+
+        result = transform_project_detail_to_response(project, include_files=False)
+
+        folder = result["folders"][0]
+        assert "files" not in folder
+        assert folder["file_count"] == 1
+        assert folder["total_size_bytes"] == 5000000
+        assert result["total_files"] == 1
+
 
 class TestCalculatePaginationMeta:
     """Test calculate_pagination_meta() - pagination metadata calculation"""
@@ -440,6 +690,24 @@ class TestCalculatePaginationMeta:
         assert result["has_more"] is False  # 80 + 20 = 100
 
 
+class TestCalculateCursorPaginationMeta:
+    """Test calculate_cursor_pagination_meta() - keyset pagination metadata"""
+
+    def test_has_more_with_next_cursor(self):
+        """Next cursor means another page exists"""
+        result = calculate_cursor_pagination_meta(total=None, limit=20, next_cursor="abc")
+
+        assert result == {"total": None, "limit": 20, "next_cursor": "abc", "has_more": True}
+
+    def test_last_page(self):
+        """No next cursor on the last page, optional total is passed through"""
+        result = calculate_cursor_pagination_meta(total=15, limit=20, next_cursor=None)
+
+        assert result["total"] == 15
+        assert result["has_more"] is False
+        assert "offset" not in result
+
+
 class TestNormalizeProjectName:
     """Test normalize_project_name() - string normalization"""
 
@@ -529,6 +797,206 @@ class TestCalculateFileHash:
         assert result == result2
 
 
+class TestContentAddressedStorage:
+    """Test blob key, backend check and claim partitioning for deduplicated storage"""
+
+    HASH = calculate_file_hash(b"Hello World")
+
+    def test_blob_key_is_sharded_by_hash_prefix(self):
+        """Blob key only depends on the content hash"""
+        assert build_blob_s3_key(self.HASH) == f"blobs/sha256/a5/{self.HASH}"
+
+    def test_is_content_addressed(self):
+        """Only files with storage_backend 'blob' reference shared blobs"""
+        assert is_content_addressed(Mock(storage_backend="blob")) is True
+        assert is_content_addressed(Mock(storage_backend="s3")) is False
+        assert is_content_addressed(object()) is False
+
+    def test_partition_claimable_files(self):
+        """Known hash with matching size is claimable, everything else is missing"""
+        files = [
+            {"relative_path": "a.wav", "file_hash": self.HASH, "file_size_bytes": 11},
+            {"relative_path": "b.wav", "file_hash": "f" * 64, "file_size_bytes": 11},
+            {"relative_path": "c.wav", "file_hash": self.HASH, "file_size_bytes": 12},
+        ]
+
+        claimable, missing = partition_claimable_files(files, {self.HASH: 11})
+
+        assert [f["relative_path"] for f in claimable] == ["a.wav"]
+        assert [f["relative_path"] for f in missing] == ["b.wav", "c.wav"]
+
+    def test_partition_without_blobs(self):
+        """Nothing is claimable if no blob is stored"""
+        files = [{"relative_path": "a.wav", "file_hash": self.HASH, "file_size_bytes": 11}]
+
+        assert partition_claimable_files(files, {}) == ([], files)
+
+
+class TestBuildUploadPaths:
+    """Test build_upload_paths() - filename, S3 key and relative_path of an upload"""
+
+    def test_subdirectories_are_preserved(self):
+        assert build_upload_paths("Audio", "u/p/Audio/", "Drums/Kick.wav") == (
+            "Kick.wav",
+            "u/p/Audio/Drums/Kick.wav",
+            "Audio/Drums/Kick.wav",
+        )
+
+    def test_windows_separators_and_dot_segments(self):
+        assert build_upload_paths("Audio", "u/p/Audio/", ".\\Drums\\Kick.wav")[2] == "Audio/Drums/Kick.wav"
+
+    def test_empty_path_is_rejected(self):
+        with pytest.raises(ValueError):
+            build_upload_paths("Audio", "u/p/Audio/", "/")
+
+
+class TestUploadSessionLayout:
+    """Test chunk layout of resumable upload sessions (S3 multipart limits)"""
+
+    MIB = 1024 * 1024
+
+    def test_preferred_chunk_size(self):
+        assert calculate_upload_chunk_size(1024 * self.MIB, 16 * self.MIB) == 16 * self.MIB
+
+    def test_minimum_chunk_size(self):
+        """Parts must be at least 5 MiB (except the last)"""
+        assert calculate_upload_chunk_size(1024 * self.MIB, self.MIB) == 5 * self.MIB
+
+    def test_chunk_size_grows_for_huge_files(self):
+        """At most 10000 parts"""
+        size = 200 * 1024 * self.MIB
+        chunk_size = calculate_upload_chunk_size(size, 16 * self.MIB)
+
+        assert chunk_size % self.MIB == 0
+        assert calculate_upload_part_count(size, chunk_size) <= 10000
+
+    def test_part_count(self):
+        assert calculate_upload_part_count(10, 4) == 3
+        assert calculate_upload_part_count(8, 4) == 2
+        assert calculate_upload_part_count(1, 4) == 1
+
+    def test_expected_part_size(self):
+        assert get_expected_part_size(1, 10, 4) == 4
+        assert get_expected_part_size(3, 10, 4) == 2
+        assert get_expected_part_size(2, 8, 4) == 4
+
+    def test_expected_part_size_out_of_range(self):
+        assert get_expected_part_size(0, 10, 4) is None
+        assert get_expected_part_size(4, 10, 4) is None
+
+    def test_missing_parts(self):
+        received = [{"part_number": 1}, {"part_number": 3}]
+
+        assert find_missing_upload_parts(4, received) == [2, 4]
+        assert find_missing_upload_parts(2, [{"part_number": 1}, {"part_number": 2}]) == []
+
+    def test_staging_key(self):
+        assert build_upload_staging_key("abc") == "uploads/abc"
+
+    def test_stream_hash_matches_file_hash(self):
+        assert calculate_stream_hash([b"Hello", b" ", b"World"]) == calculate_file_hash(b"Hello World")
+        assert calculate_stream_hash([]) == calculate_file_hash(b"")
+
+
+class TestTransformUploadSessionToResponse:
+    """Test transform_upload_session_to_response()"""
+
+    def _session(self, status="open"):
+        session = Mock()
+        session.id = "session-1"
+        session.relative_path = "Stems/drums.wav"
+        session.file_hash = "a" * 64
+        session.file_size_bytes = 10
+        session.chunk_size = 4
+        session.status = status
+        session.file_id = None
+        session.expires_at = datetime(2026, 1, 1, tzinfo=UTC)
+        return session
+
+    def test_open_session(self):
+        result = transform_upload_session_to_response(self._session(), [{"part_number": 2, "size": 4}])
+
+        assert result["part_count"] == 3
+        assert result["received_parts"] == [2]
+        assert result["missing_parts"] == [1, 3]
+        assert result["expires_at"] == "2026-01-01T00:00:00+00:00"
+
+    def test_finished_session_has_no_missing_parts(self):
+        session = self._session(status="completed")
+        session.file_id = "file-1"
+
+        result = transform_upload_session_to_response(session)
+
+        assert result["missing_parts"] == []
+        assert result["file_id"] == "file-1"
+
+
+class TestBuildArchiveEntries:
+    """Test ZIP download layout (build_archive_entries, build_archive_filename)"""
+
+    FOLDERS = {"f1": "01 Arrangement", "f2": "02 Mix"}
+
+    def _file(self, relative_path, folder_id="f1", s3_key="key", size=10):
+        file = Mock()
+        file.folder_id = folder_id
+        file.relative_path = relative_path
+        file.filename = relative_path.rsplit("/", 1)[-1]
+        file.s3_key = s3_key
+        file.file_size_bytes = size
+        file.updated_at = None
+        return file
+
+    def test_project_layout_keeps_folder_directories(self):
+        entries = build_archive_entries([self._file("01 Arrangement/Stems/drums.wav")], self.FOLDERS)
+
+        assert [entry["arcname"] for entry in entries] == [
+            "01 Arrangement/",
+            "02 Mix/",
+            "01 Arrangement/Stems/drums.wav",
+        ]
+        assert entries[0]["s3_key"] is None
+        assert entries[2]["s3_key"] == "key"
+        assert entries[2]["compress"] is False
+
+    def test_folder_layout_is_folder_relative(self):
+        files = [self._file("01 Arrangement/Stems/drums.wav"), self._file("notes.txt")]
+
+        entries = build_archive_entries(files, {"f1": "01 Arrangement"}, strip_folder=True)
+
+        assert [entry["arcname"] for entry in entries] == ["Stems/drums.wav", "notes.txt"]
+        assert entries[1]["compress"] is True
+
+    def test_duplicate_paths_get_suffix(self):
+        """Paths stored with and without folder name end up at the same arcname"""
+        files = [self._file("01 Arrangement/mix.wav"), self._file("mix.wav"), self._file("mix.wav")]
+
+        entries = build_archive_entries(files, {"f1": "01 Arrangement"}, strip_folder=True)
+
+        assert [entry["arcname"] for entry in entries] == ["mix.wav", "mix (2).wav", "mix (3).wav"]
+
+    def test_unsafe_path_segments_are_dropped(self):
+        files = [self._file("../../etc/passwd"), self._file("Stems\\..\\kick.wav"), self._file("/./")]
+
+        entries = build_archive_entries(files, {"f1": "01 Arrangement"}, strip_folder=True)
+
+        assert [entry["arcname"] for entry in entries] == ["etc/passwd", "Stems/kick.wav"]
+
+    def test_files_without_folder(self):
+        entries = build_archive_entries([self._file("loose.wav", folder_id=None)], {})
+
+        assert [entry["arcname"] for entry in entries] == ["loose.wav"]
+
+    def test_compressible(self):
+        assert is_archive_compressible("Lyrics.TXT") is True
+        assert is_archive_compressible("drums.flac") is False
+        assert is_archive_compressible("README") is False
+
+    def test_archive_filename(self):
+        assert build_archive_filename("My Song") == "My Song.zip"
+        assert build_archive_filename("My Song", "02 Mix") == "My Song - 02 Mix.zip"
+        assert build_archive_filename("...") == "project.zip"
+
+
 class TestValidateProjectStatus:
     """Test validate_project_status() - Enum validation for project status"""
 
@@ -0,0 +1 @@
+"""API layer unit tests"""
@@ -0,0 +1,88 @@
+"""Unit tests for the orjson-backed Flask JSON provider"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from api.json_provider import FastJSONProvider
+from utils.tracing import finish_trace, start_trace, trace_ring
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+PAYLOAD = {
+    "id": UUID("3f1c2d4e-0000-4000-8000-000000000001"),
+    "created_at": datetime(2026, 1, 1, 12, 30),
+    "day": date(2026, 1, 2),
+    "price": Decimal("1.50"),
+    "point": _Point(1, 2),
+    "title": "Über",
+    "choices": [{"b": 2, "a": 1}],
+}
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    return app
+
+
+@pytest.mark.unit
+class TestFastJSONProvider:
+    """Test FastJSONProvider against the stdlib provider"""
+
+    def test_same_document_as_stdlib(self, app):
+        expected = DefaultJSONProvider(app).dumps(PAYLOAD)
+
+        result = app.json.dumps(PAYLOAD)
+
+        assert json.loads(result) == json.loads(expected)
+        assert result.startswith('{"choices":[{"a":1,"b":2}],"created_at":"Thu, 01 Jan 2026 12:30:00 GMT"')
+        assert '"title":"Über"' in result
+
+    def test_response_is_bytes_with_newline(self, app):
+        with app.app_context():
+            response = jsonify({"count": 1})
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == b'{"count":1}\n'
+
+    def test_debug_response_is_indented(self, app):
+        app.debug = True
+        with app.app_context():
+            response = jsonify({"count": 1})
+
+        assert response.get_data() == b'{\n  "count": 1\n}\n'
+
+    def test_int_keys(self, app):
+        assert app.json.dumps({3: "x"}) == '{"3":"x"}'
+
+    def test_stdlib_fallbacks(self, app):
+        assert app.json.dumps({"big": 2**70}) == '{"big": 1180591620717411303424}'
+        assert app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+        with pytest.raises(TypeError):
+            app.json.dumps({"error": ValueError("boom")})
+
+    def test_loads(self, app):
+        assert app.json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(ValueError):
+            app.json.loads("{not json")
+
+    def test_dumps_is_json_span(self, app):
+        trace = start_trace("GET /a")
+        app.json.dumps({"a": 1})
+        finish_trace()
+        trace_ring.clear()
+
+        assert [span.kind for span in trace.spans] == ["route", "json"]
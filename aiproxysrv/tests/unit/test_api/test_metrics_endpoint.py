@@ -0,0 +1,43 @@
+"""Unit tests for the /metrics scrape endpoint (token check, warning for the unauthenticated default)"""
+
+import pytest
+
+import api.app as app_module
+from api.app import create_app
+from utils.logger import logger
+from utils.tracing import trace_ring
+
+
+TOKEN = "scrape-secret"
+
+
+@pytest.fixture
+def warnings_logged():
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record["message"]), level="WARNING")
+    yield messages
+    logger.remove(handler_id)
+    trace_ring.clear()
+
+
+@pytest.mark.unit
+class TestMetricsEndpoint:
+    """GET /metrics"""
+
+    def test_default_without_token_warns(self, monkeypatch, warnings_logged):
+        monkeypatch.setattr(app_module, "METRICS_AUTH_TOKEN", "")
+
+        client = create_app().test_client()
+
+        assert any("/metrics is served without authentication" in m for m in warnings_logged)
+        assert client.get("/metrics").status_code == 200
+
+    def test_token_required(self, monkeypatch, warnings_logged):
+        monkeypatch.setattr(app_module, "METRICS_AUTH_TOKEN", TOKEN)
+
+        client = create_app().test_client()
+
+        assert not any("/metrics" in m for m in warnings_logged)
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert client.get("/metrics", headers={"Authorization": f"Bearer {TOKEN}"}).status_code == 200
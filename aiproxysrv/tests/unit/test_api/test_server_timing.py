@@ -0,0 +1,52 @@
+"""Unit tests for the tracing response headers (Server-Timing only for debug mode and tracing admins)"""
+
+import pytest
+
+import api.app as app_module
+import api.routes.tracing_routes as tracing_routes
+from api.app import create_app
+from utils.tracing import TRACE_ID_HEADER, TRACE_TOKEN_HEADER, trace_ring
+
+
+ADMIN_TOKEN = "trace-admin-secret"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "DEBUG", False)
+    monkeypatch.setattr(tracing_routes, "TRACING_ADMIN_TOKEN", ADMIN_TOKEN)
+    yield create_app().test_client()
+    trace_ring.clear()
+
+
+@pytest.mark.unit
+class TestServerTimingHeader:
+    """Server-Timing exposes internal stages - X-Trace-Id is sent to everyone"""
+
+    def test_hidden_without_token(self, client):
+        response = client.get("/api/v1/health")
+
+        assert "Server-Timing" not in response.headers
+        assert response.headers[TRACE_ID_HEADER]
+
+    def test_hidden_with_wrong_token(self, client):
+        response = client.get("/api/v1/health", headers={TRACE_TOKEN_HEADER: "guess"})
+
+        assert "Server-Timing" not in response.headers
+
+    def test_sent_with_admin_token(self, client):
+        response = client.get("/api/v1/health", headers={TRACE_TOKEN_HEADER: ADMIN_TOKEN})
+
+        assert "route;dur=" in response.headers["Server-Timing"]
+
+    def test_hidden_if_no_admin_token_configured(self, client, monkeypatch):
+        monkeypatch.setattr(tracing_routes, "TRACING_ADMIN_TOKEN", "")
+
+        response = client.get("/api/v1/health", headers={TRACE_TOKEN_HEADER: ""})
+
+        assert "Server-Timing" not in response.headers
+
+    def test_sent_in_debug_mode(self, client, monkeypatch):
+        monkeypatch.setattr(app_module, "DEBUG", True)
+
+        assert "Server-Timing" in client.get("/api/v1/health").headers
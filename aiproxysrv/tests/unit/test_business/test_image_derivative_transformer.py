@@ -0,0 +1,83 @@
+"""Unit tests for image derivative transformer (pure functions, 100% testable)"""
+
+import pytest
+
+from business.image_derivative_transformer import (
+    IMAGE_DERIVATIVE_SIZES,
+    build_derivative_filename,
+    build_derivative_key,
+    calculate_derivative_dimensions,
+    parse_image_size,
+)
+
+
+class TestParseImageSize:
+    """Test ?size= parameter parsing"""
+
+    def test_known_sizes(self):
+        """Test all derivative sizes are accepted"""
+        for size in IMAGE_DERIVATIVE_SIZES:
+            assert parse_image_size(size) == size
+
+    def test_original_and_empty(self):
+        """Test original, empty and missing size serve the original"""
+        assert parse_image_size("original") is None
+        assert parse_image_size("") is None
+        assert parse_image_size(None) is None
+
+    def test_unknown_size(self):
+        """Test unknown size is rejected"""
+        with pytest.raises(ValueError, match="Invalid image size 'huge'"):
+            parse_image_size("huge")
+
+
+class TestBuildDerivativeKey:
+    """Test derivative S3 key generation (next to the original)"""
+
+    def test_key_in_same_directory(self):
+        """Test derivative keeps the directory of the original"""
+        assert build_derivative_key("shared/abc-123.png", "thumb") == "shared/abc-123__thumb.webp"
+        assert build_derivative_key("shared/abc-123.png", "preview") == "shared/abc-123__preview.webp"
+
+    def test_key_jpeg_format(self):
+        """Test JPEG derivatives use .jpg extension"""
+        assert build_derivative_key("releases/u/r/cover.png", "thumb", "jpeg") == "releases/u/r/cover__thumb.jpg"
+
+    def test_key_independent_of_original_extension(self):
+        """Test replaced covers with another extension map to the same derivative"""
+        assert build_derivative_key("releases/u/r/cover.png", "thumb") == build_derivative_key(
+            "releases/u/r/cover.jpg", "thumb"
+        )
+
+    def test_key_without_directory_or_extension(self):
+        """Test keys without directory and extension"""
+        assert build_derivative_key("abc", "thumb") == "abc__thumb.webp"
+
+    def test_filename(self):
+        """Test derivative filename (used for Content-Type detection)"""
+        assert build_derivative_filename("sunset.png", "preview") == "sunset__preview.webp"
+
+
+class TestCalculateDerivativeDimensions:
+    """Test derivative dimensions (longest edge, aspect ratio kept)"""
+
+    def test_landscape(self):
+        """Test landscape image is scaled by width"""
+        assert calculate_derivative_dimensions(1792, 1024, 1024) == (1024, 585)
+
+    def test_portrait(self):
+        """Test portrait image is scaled by height"""
+        assert calculate_derivative_dimensions(1024, 1792, 320) == (183, 320)
+
+    def test_square(self):
+        """Test square image"""
+        assert calculate_derivative_dimensions(1024, 1024, 320) == (320, 320)
+
+    def test_no_upscaling(self):
+        """Test small images keep their dimensions"""
+        assert calculate_derivative_dimensions(300, 200, 320) == (300, 200)
+        assert calculate_derivative_dimensions(320, 100, 320) == (320, 100)
+
+    def test_minimum_one_pixel(self):
+        """Test extreme aspect ratios keep at least one pixel"""
+        assert calculate_derivative_dimensions(10000, 10, 320) == (320, 1)
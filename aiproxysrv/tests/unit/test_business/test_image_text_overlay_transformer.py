@@ -267,3 +267,26 @@ class TestGetFontPath:
         fonts_dir = Path("/fonts")
         path = ImageTextOverlayTransformer.get_font_path("invalid-style", fonts_dir)
         assert path == fonts_dir / "Anton-Regular.ttf"  # Default is bold
+
+
+class TestScaleForPreview:
+    """Test font size / outline scaling for low-resolution previews"""
+
+    def test_scale_pixel_font_size(self):
+        """Test pixel font sizes shrink with the preview"""
+        assert ImageTextOverlayTransformer.scale_font_size_input(80, 0.5) == 40.0
+        assert ImageTextOverlayTransformer.scale_font_size_input(120.0, 0.25) == 30.0
+
+    def test_scale_pixel_font_size_stays_pixel(self):
+        """Test scaled pixel sizes never drop below 1.0 (would be read as percentage)"""
+        assert ImageTextOverlayTransformer.scale_font_size_input(1, 0.1) == 1.0
+
+    def test_percentage_font_size_unchanged(self):
+        """Test percentage font sizes are already resolution independent"""
+        assert ImageTextOverlayTransformer.scale_font_size_input(0.08, 0.5) == 0.08
+
+    def test_scale_outline_width(self):
+        """Test outline width is scaled and kept visible"""
+        assert ImageTextOverlayTransformer.scale_outline_width(6, 0.5) == 3
+        assert ImageTextOverlayTransformer.scale_outline_width(1, 0.2) == 1
+        assert ImageTextOverlayTransformer.scale_outline_width(0, 0.5) == 0
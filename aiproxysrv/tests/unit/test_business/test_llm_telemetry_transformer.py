@@ -0,0 +1,174 @@
+"""Unit tests for LLM telemetry transformer (pure functions, 100% testable)"""
+
+from datetime import date
+
+import pytest
+
+from business.llm_telemetry_transformer import (
+    DEFAULT_ROLLUP_DAYS,
+    MAX_ROLLUP_DAYS,
+    build_claude_telemetry,
+    build_ollama_telemetry,
+    build_openai_telemetry,
+    ns_to_ms,
+    parse_rollup_days,
+    transform_rollup_row,
+)
+
+
+OLLAMA_RESPONSE = {
+    "model": "llama3.2:3b",
+    "response": "...",
+    "total_duration": 2_500_000_000,
+    "load_duration": 500_000_000,
+    "prompt_eval_count": 120,
+    "prompt_eval_duration": 300_000_000,
+    "eval_count": 340,
+    "eval_duration": 1_700_000_000,
+}
+
+
+@pytest.mark.unit
+class TestNsToMs:
+    """Test Ollama nanosecond conversion"""
+
+    def test_conversion(self):
+        assert ns_to_ms(1_500_000_000) == 1500
+        assert ns_to_ms(1_499_999) == 1
+
+    def test_missing_or_invalid(self):
+        assert ns_to_ms(None) is None
+        assert ns_to_ms("100") is None
+        assert ns_to_ms(-1) is None
+
+
+@pytest.mark.unit
+class TestBuildOllamaTelemetry:
+    """Test telemetry extraction from Ollama responses"""
+
+    def test_full_response(self):
+        telemetry = build_ollama_telemetry(OLLAMA_RESPONSE, 2800.4)
+
+        assert telemetry == {
+            "prompt_tokens": 120,
+            "completion_tokens": 340,
+            "total_ms": 2800,
+            "queue_wait_ms": 300,
+            "ttft_ms": 1100,  # queue wait + load + prompt eval
+            "load_ms": 500,
+            "prompt_eval_ms": 300,
+            "eval_ms": 1700,
+        }
+
+    def test_clock_skew_never_negative(self):
+        """Test wall time below Ollama's total duration yields zero queue wait"""
+        telemetry = build_ollama_telemetry(OLLAMA_RESPONSE, 2400)
+
+        assert telemetry["queue_wait_ms"] == 0
+        assert telemetry["ttft_ms"] == 800
+
+    def test_missing_durations(self):
+        """Test responses without timing fields (e.g. error payloads) keep NULLs"""
+        telemetry = build_ollama_telemetry({"eval_count": 5}, 100)
+
+        assert telemetry["total_ms"] == 100
+        assert telemetry["completion_tokens"] == 5
+        assert telemetry["queue_wait_ms"] is None
+        assert telemetry["ttft_ms"] is None
+        assert telemetry["eval_ms"] is None
+
+
+@pytest.mark.unit
+class TestBuildProviderTelemetry:
+    """Test telemetry extraction from OpenAI and Claude responses"""
+
+    def test_openai_usage(self):
+        telemetry = build_openai_telemetry({"usage": {"prompt_tokens": 10, "completion_tokens": 20}}, 812.6)
+
+        assert telemetry["prompt_tokens"] == 10
+        assert telemetry["completion_tokens"] == 20
+        assert telemetry["total_ms"] == 813
+        assert telemetry["ttft_ms"] is None
+
+    def test_openai_without_usage(self):
+        telemetry = build_openai_telemetry({}, 50)
+
+        assert telemetry["prompt_tokens"] is None
+        assert telemetry["completion_tokens"] is None
+
+    def test_claude_includes_cached_prompt_tokens(self):
+        telemetry = build_claude_telemetry(
+            {
+                "usage": {
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "cache_creation_input_tokens": 200,
+                    "cache_read_input_tokens": 90,
+                }
+            },
+            1200,
+        )
+
+        assert telemetry["prompt_tokens"] == 300
+        assert telemetry["completion_tokens"] == 5
+        assert telemetry["total_ms"] == 1200
+
+    def test_claude_without_usage(self):
+        assert build_claude_telemetry({}, 1)["prompt_tokens"] is None
+
+
+@pytest.mark.unit
+class TestParseRollupDays:
+    """Test ?days= parsing"""
+
+    def test_default(self):
+        assert parse_rollup_days(None) == DEFAULT_ROLLUP_DAYS
+        assert parse_rollup_days("") == DEFAULT_ROLLUP_DAYS
+
+    def test_valid(self):
+        assert parse_rollup_days("1") == 1
+        assert parse_rollup_days(str(MAX_ROLLUP_DAYS)) == MAX_ROLLUP_DAYS
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="must be an integer"):
+            parse_rollup_days("week")
+        with pytest.raises(ValueError, match="must be between"):
+            parse_rollup_days("0")
+        with pytest.raises(ValueError, match="must be between"):
+            parse_rollup_days(str(MAX_ROLLUP_DAYS + 1))
+
+
+@pytest.mark.unit
+class TestTransformRollupRow:
+    """Test rollup row formatting"""
+
+    def test_daily_row(self):
+        row = {
+            "day": date(2026, 10, 17),
+            "provider": "ollama",
+            "model": "llama3.2:3b",
+            "calls": 12,
+            "prompt_tokens": 1500,
+            "completion_tokens": 4200,
+            "ttft_ms_p50": 410.0,
+            "ttft_ms_p95": 1830.55,
+            "total_ms_p50": 2100.0,
+            "total_ms_p95": 5400.0,
+            "tokens_per_second_p50": 41.234,
+            "tokens_per_second_p95": 55.0,
+        }
+
+        result = transform_rollup_row(row)
+
+        assert result["day"] == "2026-10-17"
+        assert result["calls"] == 12
+        assert result["ttft_ms"] == {"p50": 410.0, "p95": 1830.5}
+        assert result["tokens_per_second"] == {"p50": 41.2, "p95": 55.0}
+        assert result["load_ms"] == {"p50": None, "p95": None}
+
+    def test_model_row_without_day_and_tokens(self):
+        result = transform_rollup_row({"provider": "openai", "model": "gpt-4o", "calls": 3, "prompt_tokens": None})
+
+        assert "day" not in result
+        assert result["prompt_tokens"] == 0
+        assert result["completion_tokens"] == 0
@@ -0,0 +1,194 @@
+"""Unit tests for folder manifest (Merkle tree) hashing"""
+
+import hashlib
+
+import pytest
+
+from business.song_project_manifest_transformer import (
+    EMPTY_MANIFEST_HASH,
+    MANIFEST_HASH_MODULUS,
+    apply_manifest_deltas,
+    build_manifest_nodes,
+    calculate_manifest_deltas,
+    combine_manifest_hash,
+    get_manifest_ancestors,
+    get_parent_path,
+    manifest_leaf_value,
+    to_folder_relative_path,
+)
+
+
+def _hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+FILES = [
+    ("mix.wav", _hash("mix")),
+    ("Samples/pad.wav", _hash("pad")),
+    ("Samples/Drums/kick.wav", _hash("kick")),
+    ("Samples/Drums/snare.wav", _hash("snare")),
+    ("Bounces/v1.wav", _hash("v1")),
+]
+
+
+def _apply(nodes: dict[str, str], deltas: dict[str, tuple[int, int]]) -> dict[str, str]:
+    """Apply deltas to a path -> hash map (like the service does on DB rows)"""
+    result = dict(nodes)
+    for path, (hash_delta, _) in deltas.items():
+        result[path] = combine_manifest_hash(result.get(path, EMPTY_MANIFEST_HASH), hash_delta)
+    return result
+
+
+def _hashes(entries) -> dict[str, str]:
+    return {path: node["node_hash"] for path, node in build_manifest_nodes(entries).items()}
+
+
+@pytest.mark.unit
+class TestManifestPaths:
+    """Test path helpers"""
+
+    def test_folder_relative_path(self):
+        assert to_folder_relative_path("01 Arrangement/Samples/kick.wav", "01 Arrangement") == "Samples/kick.wav"
+
+    def test_folder_relative_path_without_prefix(self):
+        """Paths stored without folder name (e.g. after Mirror moves) are kept"""
+        assert to_folder_relative_path("Samples/kick.wav", "01 Arrangement") == "Samples/kick.wav"
+
+    def test_parent_path(self):
+        assert get_parent_path("a/b/c") == "a/b"
+        assert get_parent_path("a") == ""
+        assert get_parent_path("") is None
+
+    def test_ancestors(self):
+        assert get_manifest_ancestors("a/b/c.wav") == ["", "a", "a/b"]
+
+
+@pytest.mark.unit
+class TestBuildManifestNodes:
+    """Test full manifest build"""
+
+    def test_empty_folder_has_root(self):
+        assert build_manifest_nodes([]) == {
+            "": {"node_hash": EMPTY_MANIFEST_HASH, "file_count": 0, "parent_path": None}
+        }
+
+    def test_parent_paths(self):
+        nodes = build_manifest_nodes(FILES)
+
+        assert nodes[""]["parent_path"] is None
+        assert nodes["Samples/Drums"]["parent_path"] == "Samples"
+
+    def test_file_counts(self):
+        nodes = build_manifest_nodes(FILES)
+
+        assert {path: node["file_count"] for path, node in nodes.items()} == {
+            "": 5,
+            "Samples": 3,
+            "Samples/Drums": 2,
+            "Bounces": 1,
+        }
+
+    def test_merkle_property(self):
+        """Node hash = direct file leaves + child directory hashes"""
+        nodes = build_manifest_nodes(FILES)
+
+        samples = (
+            manifest_leaf_value("Samples/pad.wav", _hash("pad")) + int(nodes["Samples/Drums"]["node_hash"], 16)
+        ) % MANIFEST_HASH_MODULUS
+        assert nodes["Samples"]["node_hash"] == format(samples, "064x")
+
+    def test_order_independent(self):
+        assert _hashes(FILES) == _hashes(reversed(FILES))
+
+    def test_path_is_part_of_hash(self):
+        """Same content under another name changes the hash (renames are detected)"""
+        renamed = [*FILES[:-1], ("Bounces/v2.wav", _hash("v1"))]
+
+        assert _hashes(renamed)["Bounces"] != _hashes(FILES)["Bounces"]
+        assert _hashes(renamed)["Samples"] == _hashes(FILES)["Samples"]
+
+
+@pytest.mark.unit
+class TestCalculateManifestDeltas:
+    """Incremental deltas must always end up at the rebuilt tree"""
+
+    def test_upload(self):
+        new_file = ("Samples/Drums/hat.wav", _hash("hat"))
+        deltas = calculate_manifest_deltas(added=new_file)
+
+        assert {path: count for path, (_, count) in deltas.items()} == {"": 1, "Samples": 1, "Samples/Drums": 1}
+        assert _apply(_hashes(FILES), deltas) == _hashes([*FILES, new_file])
+
+    def test_delete(self):
+        deltas = calculate_manifest_deltas(removed=FILES[-1])
+        result = _apply(_hashes(FILES), deltas)
+
+        assert result["Bounces"] == EMPTY_MANIFEST_HASH
+        assert result[""] == _hashes(FILES[:-1])[""]
+
+    def test_content_update(self):
+        updated = ("Samples/pad.wav", _hash("pad v2"))
+        deltas = calculate_manifest_deltas(removed=FILES[1], added=updated)
+
+        assert all(count == 0 for _, count in deltas.values())
+        assert _apply(_hashes(FILES), deltas) == _hashes([FILES[0], updated, *FILES[2:]])
+
+    def test_move_between_directories(self):
+        moved = ("Bounces/kick.wav", FILES[2][1])
+        deltas = calculate_manifest_deltas(removed=FILES[2], added=moved)
+
+        assert deltas["Samples/Drums"][1] == -1
+        assert deltas["Bounces"][1] == 1
+        expected = _hashes([FILES[0], FILES[1], moved, FILES[3], FILES[4]])
+        assert _apply(_hashes(FILES), deltas) == expected
+
+    def test_unchanged_hash_has_no_deltas(self):
+        assert calculate_manifest_deltas(removed=FILES[0], added=FILES[0]) == {}
+
+
+def _stored(entries) -> dict[str, tuple[str, int]]:
+    return {path: (node["node_hash"], node["file_count"]) for path, node in build_manifest_nodes(entries).items()}
+
+
+@pytest.mark.unit
+class TestApplyManifestDeltas:
+    """Applying deltas to stored nodes must end up at the rebuilt tree"""
+
+    def test_upload_into_new_directory(self):
+        new_file = ("Vocals/lead.wav", _hash("lead"))
+
+        changes = apply_manifest_deltas(_stored(FILES), calculate_manifest_deltas(added=new_file))
+
+        assert changes["Vocals"] == build_manifest_nodes([*FILES, new_file])["Vocals"]
+        assert changes[""]["file_count"] == 6
+
+    def test_move_matches_rebuild(self):
+        moved = ("Bounces/kick.wav", FILES[2][1])
+        files = [FILES[0], FILES[1], moved, FILES[3], FILES[4]]
+
+        changes = apply_manifest_deltas(_stored(FILES), calculate_manifest_deltas(removed=FILES[2], added=moved))
+
+        expected = build_manifest_nodes(files)
+        assert changes == {path: expected[path] for path in ("", "Samples", "Samples/Drums", "Bounces")}
+
+    def test_empty_directory_is_deleted(self):
+        changes = apply_manifest_deltas(_stored(FILES), calculate_manifest_deltas(removed=FILES[-1]))
+
+        assert changes["Bounces"] is None
+        assert changes[""]["file_count"] == 4
+
+    def test_root_is_kept_when_empty(self):
+        changes = apply_manifest_deltas(_stored(FILES[:1]), calculate_manifest_deltas(removed=FILES[0]))
+
+        assert changes == {"": {"node_hash": EMPTY_MANIFEST_HASH, "file_count": 0, "parent_path": None}}
+
+    def test_skipped_until_built(self):
+        """Folders without manifest are left alone (built on first request)"""
+        assert apply_manifest_deltas({}, calculate_manifest_deltas(added=FILES[0])) == {}
+
+    def test_missing_node_of_removed_file_is_skipped(self):
+        nodes = {"": _stored(FILES)[""]}
+
+        changes = apply_manifest_deltas(nodes, calculate_manifest_deltas(removed=FILES[2]))
+
+        assert set(changes) == {""}
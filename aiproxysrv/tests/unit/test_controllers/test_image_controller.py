@@ -324,3 +324,57 @@ class TestImageControllerUpdateMetadata:
 
         assert status_code == 404
         assert "error" in result
+
+
+@pytest.mark.unit
+class TestImageControllerPreviewTextOverlay:
+    """Test ImageController.preview_text_overlay method"""
+
+    def test_preview_text_overlay_success(self, mocker):
+        """Test preview bytes are passed through"""
+        mocker.patch.object(ImageController, "__init__", return_value=None)
+        controller = ImageController()
+        controller.orchestrator = MagicMock()
+
+        expected_result = {"data": b"jpeg", "mimetype": "image/jpeg", "width": 1024, "height": 585}
+        controller.orchestrator.preview_text_overlay.return_value = expected_result
+
+        result, status_code = controller.preview_text_overlay(
+            image_id="123", max_edge=1024, image_format="jpeg", title="Test"
+        )
+
+        assert status_code == 200
+        assert result == expected_result
+        controller.orchestrator.preview_text_overlay.assert_called_once_with(
+            source_image_id="123", max_edge=1024, image_format="jpeg", title="Test"
+        )
+
+    def test_preview_text_overlay_not_found(self, mocker):
+        """Test missing source image returns 404"""
+        mocker.patch.object(ImageController, "__init__", return_value=None)
+        controller = ImageController()
+        controller.orchestrator = MagicMock()
+
+        controller.orchestrator.preview_text_overlay.side_effect = ImageGenerationError("Source image not found: 123")
+
+        result, status_code = controller.preview_text_overlay(
+            image_id="123", max_edge=1024, image_format="jpeg", title="Test"
+        )
+
+        assert status_code == 404
+        assert "not found" in result["error"]
+
+    def test_preview_text_overlay_render_error(self, mocker):
+        """Test rendering errors return 500"""
+        mocker.patch.object(ImageController, "__init__", return_value=None)
+        controller = ImageController()
+        controller.orchestrator = MagicMock()
+
+        controller.orchestrator.preview_text_overlay.side_effect = ImageGenerationError("Failed to render")
+
+        result, status_code = controller.preview_text_overlay(
+            image_id="123", max_edge=1024, image_format="jpeg", title="Test"
+        )
+
+        assert status_code == 500
+        assert "error" in result
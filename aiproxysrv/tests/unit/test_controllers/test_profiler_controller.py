@@ -0,0 +1,52 @@
+"""Unit tests for ProfilerController"""
+
+import time
+
+import pytest
+
+from api.controllers.profiler_controller import DEFAULT_TRIGGER_TTL_SECONDS, ProfilerController
+from utils.profiler import MAX_TRIGGER_TTL_SECONDS, verify_profile_trigger
+
+
+@pytest.mark.unit
+class TestProfilerControllerSignTrigger:
+    """Test ProfilerController.sign_trigger method"""
+
+    def test_sign_default_ttl(self, mocker):
+        mocker.patch("api.controllers.profiler_controller.PROFILER_SECRET", "s3cret")
+
+        result, status_code = ProfilerController.sign_trigger("/api/v1/song-projects")
+
+        assert status_code == 200
+        data = result["data"]
+        assert data["expires_at"] - time.time() == pytest.approx(DEFAULT_TRIGGER_TTL_SECONDS, abs=5)
+        assert data["header"] == f"X-Profile: {data['trigger']}"
+        assert data["query"] == f"_profile={data['trigger']}"
+        assert verify_profile_trigger("s3cret", "/api/v1/song-projects", data["trigger"], time.time())
+
+    @pytest.mark.parametrize("path", [None, "", "api/v1/x", 42])
+    def test_invalid_path(self, path):
+        result, status_code = ProfilerController.sign_trigger(path)
+
+        assert status_code == 400
+        assert "path" in result["error"]
+
+    @pytest.mark.parametrize("ttl", [0, MAX_TRIGGER_TTL_SECONDS + 1, "60", True, 1.5])
+    def test_invalid_ttl(self, ttl):
+        result, status_code = ProfilerController.sign_trigger("/a", ttl)
+
+        assert status_code == 400
+        assert "ttl_seconds" in result["error"]
+
+
+@pytest.mark.unit
+class TestProfilerControllerList:
+    """Test ProfilerController.list_profiles method"""
+
+    def test_empty_directory(self, mocker, tmp_path):
+        mocker.patch("api.controllers.profiler_controller.PROFILER_DIR", str(tmp_path))
+
+        result, status_code = ProfilerController.list_profiles()
+
+        assert status_code == 200
+        assert result == {"data": [], "count": 0}
@@ -0,0 +1,65 @@
+"""Unit tests for TracingController"""
+
+import pytest
+
+from api.controllers.tracing_controller import TracingController
+from utils.tracing import finish_trace, start_trace, trace_ring
+
+
+@pytest.fixture
+def recorded_traces():
+    """Two finished traces in the ring: a fast listing and a slow upload"""
+    traces = []
+    for name in ("GET /api/v1/song-projects", "POST /api/v1/song-projects/<project_id>/files"):
+        trace = start_trace(name)
+        finish_trace(200)
+        traces.append(trace)
+    traces[1].root.end_ns = traces[1].root.start_ns + 900_000_000
+    yield traces
+    trace_ring.clear()
+
+
+@pytest.mark.unit
+class TestTracingControllerListTraces:
+    """Test TracingController.list_traces method"""
+
+    def test_newest_first(self, recorded_traces):
+        result, status_code = TracingController.list_traces()
+
+        assert status_code == 200
+        assert [t["trace_id"] for t in result["data"]] == [t.trace_id for t in reversed(recorded_traces)]
+        assert result["count"] == 2
+        assert "pid" in result
+
+    def test_filters(self, recorded_traces):
+        slow, _ = TracingController.list_traces(min_duration_ms="500")
+        by_name, _ = TracingController.list_traces(name="/files")
+        limited, _ = TracingController.list_traces(limit="1")
+
+        assert [t["trace_id"] for t in slow["data"]] == [recorded_traces[1].trace_id]
+        assert [t["trace_id"] for t in by_name["data"]] == [recorded_traces[1].trace_id]
+        assert limited["count"] == 1
+
+    @pytest.mark.parametrize("params", [{"limit": "x"}, {"limit": "0"}, {"min_duration_ms": "slow"}])
+    def test_invalid_params(self, params):
+        result, status_code = TracingController.list_traces(**params)
+
+        assert status_code == 400
+        assert "limit" in result["error"]
+
+
+@pytest.mark.unit
+class TestTracingControllerGetTrace:
+    """Test TracingController.get_trace method"""
+
+    def test_found(self, recorded_traces):
+        result, status_code = TracingController.get_trace(recorded_traces[0].trace_id)
+
+        assert status_code == 200
+        assert result["data"]["spans"][0]["kind"] == "route"
+
+    def test_not_found(self):
+        result, status_code = TracingController.get_trace("unknown")
+
+        assert status_code == 404
+        assert "not found" in result["error"]
@@ -0,0 +1,78 @@
+"""Unit tests for folder file listing queries (SQL shape on PostgreSQL)"""
+
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from db.pagination_helpers import encode_cursor
+from db.song_project_service import SongProjectService
+
+
+FOLDER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _compile(query: Query) -> str:
+    """Render query SQL for PostgreSQL with inlined literals"""
+    return str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+class TestFolderFilesQuery:
+    """Test SongProjectService._folder_files_query"""
+
+    def test_recursive_prefix_filter(self):
+        sql = _compile(SongProjectService._folder_files_query(Session(), FOLDER_ID, "01 Arrangement/", True))
+
+        assert "project_files.relative_path LIKE '01 Arrangement//' || '%%' ESCAPE '/'" in sql
+        assert "strpos" not in sql
+
+    def test_prefix_wildcards_are_escaped(self):
+        sql = _compile(SongProjectService._folder_files_query(Session(), FOLDER_ID, "Mix_100%/", True))
+
+        assert "'Mix/_100/%%//' || '%%' ESCAPE '/'" in sql
+
+    def test_non_recursive_excludes_nested_files(self):
+        sql = _compile(SongProjectService._folder_files_query(Session(), FOLDER_ID, "01 Arrangement/", False))
+
+        assert "strpos(substr(project_files.relative_path, 16), '/') = 0" in sql
+
+    def test_compact_columns_only(self):
+        sql = _compile(SongProjectService._folder_files_query(Session(), FOLDER_ID, "01 Arrangement/", True))
+
+        assert "project_files.relative_path" in sql
+        assert "project_files.mime_type" not in sql
+
+
+@pytest.mark.unit
+class TestGetFolderFilesPage:
+    """Test keyset page query of SongProjectService.get_folder_files_page"""
+
+    def _page_sql(self, monkeypatch, **kwargs) -> str:
+        captured = {}
+
+        def fake_all(query):
+            captured["sql"] = _compile(query)
+            return []
+
+        monkeypatch.setattr(Query, "all", fake_all)
+        files, next_cursor = SongProjectService().get_folder_files_page(
+            Session(), FOLDER_ID, "01 Arrangement/", limit=2, **kwargs
+        )
+        assert (files, next_cursor) == ([], None)
+        return captured["sql"]
+
+    def test_first_page_orders_by_path_and_id(self, monkeypatch):
+        sql = self._page_sql(monkeypatch)
+
+        assert "ORDER BY project_files.relative_path ASC, project_files.id ASC" in sql
+        assert "LIMIT 3" in sql
+
+    def test_next_page_seeks_after_cursor(self, monkeypatch):
+        cursor = encode_cursor("relative_path:asc", "01 Arrangement/b.wav", "00000000-0000-0000-0000-00000000000b")
+
+        sql = self._page_sql(monkeypatch, cursor=cursor)
+
+        assert "(project_files.relative_path, project_files.id) > ('01 Arrangement/b.wav'" in sql
+        assert "OFFSET" not in sql
@@ -0,0 +1,237 @@
+"""Unit tests for keyset (cursor) pagination helpers"""
+
+import uuid
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import case, literal_column
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from db.models import Equipment, Song, SongProject, SongRelease
+from db.pagination_helpers import (
+    InvalidCursorError,
+    apply_keyset_pagination,
+    build_keyset_page,
+    decode_cursor,
+    encode_cursor,
+    sort_column_key,
+)
+
+
+SONG_ID = uuid.UUID("11111111-2222-3333-4444-555555555555")
+CREATED_AT = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+def _compile(query: Query) -> str:
+    """Render query SQL for PostgreSQL with inlined literals"""
+    return str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Test encode_cursor / decode_cursor"""
+
+    def test_round_trip(self):
+        """Datetime and UUID survive the round trip as JSON values"""
+        cursor = encode_cursor("created_at:desc", CREATED_AT, SONG_ID)
+
+        value, row_id = decode_cursor(cursor, "created_at:desc")
+
+        assert value == CREATED_AT.isoformat()
+        assert row_id == str(SONG_ID)
+
+    def test_cursor_is_opaque_url_safe(self):
+        """No padding and no characters that need URL escaping"""
+        cursor = encode_cursor("name:asc", "Ableton Live ??? >>>", 1)
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_docstring_example(self):
+        """Encoding is deterministic"""
+        assert encode_cursor("name:asc", "Logic Pro", 7) == "eyJzIjoibmFtZTphc2MiLCJ2IjoiTG9naWMgUHJvIiwiaWQiOjd9"
+
+    def test_sort_mismatch_rejected(self):
+        """Cursor from another sort order cannot be reused"""
+        cursor = encode_cursor("created_at:desc", CREATED_AT, SONG_ID)
+
+        with pytest.raises(InvalidCursorError, match="sort order"):
+            decode_cursor(cursor, "created_at:asc")
+
+    @pytest.mark.parametrize("cursor", ["not-base64!!", "bm9uLWpzb24", "WzEsMl0", "eyJzIjoieCJ9"])
+    def test_malformed_cursor_rejected(self, cursor):
+        """Garbage, non-JSON, non-dict and incomplete payloads are rejected"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "x")
+
+    def test_invalid_cursor_is_value_error(self):
+        """Controllers can treat it like other validation errors"""
+        assert issubclass(InvalidCursorError, ValueError)
+
+
+@pytest.mark.unit
+class TestSortColumnKey:
+    """Test sort_column_key function"""
+
+    def test_column(self):
+        assert sort_column_key(Song.created_at) == "created_at"
+
+    def test_label(self):
+        assert sort_column_key(Song.created_at.label("newest")) == "newest"
+
+    def test_anonymous_expression(self):
+        assert sort_column_key(case((Song.updated_at.is_(None), Song.created_at), else_=Song.updated_at)) == "expr"
+
+
+@pytest.mark.unit
+class TestApplyKeysetPagination:
+    """Test apply_keyset_pagination function"""
+
+    def test_first_page_has_no_offset(self):
+        """First page: ORDER BY (sort, id), LIMIT n + 1, no OFFSET and no seek filter"""
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", "", 20))
+
+        assert "ORDER BY songs.created_at DESC, songs.id DESC" in sql
+        assert "LIMIT 21" in sql
+        assert "OFFSET" not in sql
+        assert "WHERE" not in sql
+
+    def test_desc_seek_uses_row_comparison(self):
+        """Descending pages continue strictly below the last (sort, id)"""
+        cursor = encode_cursor("created_at:desc", CREATED_AT, SONG_ID)
+
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", cursor, 20))
+
+        assert "(songs.created_at, songs.id) < ('2026-03-01 12:30:15.123456+00:00'" in sql
+        assert "'11111111-2222-3333-4444-555555555555'" in sql
+        assert "OFFSET" not in sql
+
+    def test_asc_seek(self):
+        """Ascending pages continue strictly above the last (sort, id)"""
+        equipment_id = uuid.uuid4()
+        cursor = encode_cursor("name:asc", "Kontakt", equipment_id)
+
+        sql = _compile(apply_keyset_pagination(Query(Equipment), Equipment.name, Equipment.id, "asc", cursor, 10))
+
+        assert "(equipment.name, equipment.id) > ('Kontakt'" in sql
+        assert "ORDER BY equipment.name ASC, equipment.id ASC" in sql
+
+    def test_sort_value_added_as_column(self):
+        """Sort value is selected so the next cursor can be built from the rows"""
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", "", 5))
+
+        assert "songs.created_at AS keyset_sort_value" in sql
+
+    def test_expression_sort_column(self):
+        """Computed sort expressions (e.g. effective date) work like columns"""
+        effective_date = case((SongProject.updated_at.is_(None), SongProject.created_at), else_=SongProject.updated_at)
+        cursor = encode_cursor("expr:desc", CREATED_AT, SONG_ID)
+
+        sql = _compile(apply_keyset_pagination(Query(SongProject), effective_date, SongProject.id, "desc", cursor, 5))
+
+        assert "(CASE WHEN (song_projects.updated_at IS NULL)" in sql
+        assert ") < ('2026-03-01 12:30:15.123456+00:00'" in sql
+
+    def test_nullable_sort_keeps_null_rows_reachable(self):
+        """Nullable sort: NULLS LAST ordering and NULL rows stay after any non-NULL cursor"""
+        cursor = encode_cursor("updated_at:desc", CREATED_AT, SONG_ID)
+
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.updated_at, Song.id, "desc", cursor, 5, nullable=True))
+
+        assert "OR songs.updated_at IS NULL" in sql
+        assert "ORDER BY songs.updated_at DESC NULLS LAST, songs.id DESC" in sql
+
+    def test_nullable_cursor_inside_null_block(self):
+        """Cursor pointing at a NULL sort value continues by id only"""
+        cursor = encode_cursor("updated_at:desc", None, SONG_ID)
+
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.updated_at, Song.id, "desc", cursor, 5, nullable=True))
+
+        assert "songs.updated_at IS NULL AND songs.id < '11111111-2222-3333-4444-555555555555'" in sql
+
+    def test_null_value_for_non_nullable_sort_rejected(self):
+        cursor = encode_cursor("created_at:desc", None, SONG_ID)
+
+        with pytest.raises(InvalidCursorError):
+            apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", cursor, 5)
+
+    def test_tampered_value_rejected(self):
+        """Values that do not fit the column type are rejected, not passed to the DB"""
+        cursor = encode_cursor("created_at:desc", "yesterday", SONG_ID)
+
+        with pytest.raises(InvalidCursorError, match="Invalid cursor value"):
+            apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", cursor, 5)
+
+    def test_date_sort_column(self):
+        """DATE columns round-trip through date.fromisoformat"""
+        cursor = encode_cursor("release_date:desc", date(2026, 5, 1), SONG_ID)
+
+        sql = _compile(
+            apply_keyset_pagination(Query(SongRelease), SongRelease.release_date, SongRelease.id, "desc", cursor, 5)
+        )
+
+        assert "(song_releases.release_date, song_releases.id) < ('2026-05-01'" in sql
+
+    def test_untyped_expression_keeps_raw_value(self):
+        """Expressions without a Python type pass the JSON value through"""
+        cursor = encode_cursor("x:asc", "raw", SONG_ID)
+
+        query = apply_keyset_pagination(Query(Song), literal_column("x"), Song.id, "asc", cursor, 5)
+        params = query.statement.compile(dialect=postgresql.dialect()).params
+
+        assert "raw" in params.values()
+
+    def test_tampered_id_rejected(self):
+        cursor = encode_cursor("created_at:desc", CREATED_AT, "not-a-uuid")
+
+        with pytest.raises(InvalidCursorError):
+            apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "desc", cursor, 5)
+
+
+@pytest.mark.unit
+class TestBuildKeysetPage:
+    """Test build_keyset_page function"""
+
+    @staticmethod
+    def _rows(count: int) -> list[tuple]:
+        return [(SimpleNamespace(id=uuid.UUID(int=i)), datetime(2026, 1, 1, 0, 0, i, tzinfo=UTC)) for i in range(count)]
+
+    def test_more_rows_than_limit(self):
+        """limit + 1 rows: page is trimmed and cursor points at the last returned row"""
+        rows = self._rows(4)
+
+        items, next_cursor = build_keyset_page(rows, 3, Song.created_at, "desc")
+
+        assert items == [row[0] for row in rows[:3]]
+        assert decode_cursor(next_cursor, "created_at:desc") == (rows[2][1].isoformat(), str(rows[2][0].id))
+
+    def test_last_page(self):
+        """Fewer rows than limit + 1: no next cursor"""
+        items, next_cursor = build_keyset_page(self._rows(3), 3, Song.created_at, "desc")
+
+        assert len(items) == 3
+        assert next_cursor is None
+
+    def test_empty(self):
+        assert build_keyset_page([], 20, Song.created_at, "desc") == ([], None)
+
+    def test_multi_column_rows_keep_extra_columns(self):
+        """(entity, message_count, sort_value) rows become (entity, message_count)"""
+        conversation = SimpleNamespace(id=uuid.UUID(int=1))
+        rows = [(conversation, 5, CREATED_AT), (SimpleNamespace(id=uuid.UUID(int=2)), 0, CREATED_AT)]
+
+        items, next_cursor = build_keyset_page(rows, 1, Song.updated_at, "desc")
+
+        assert items == [(conversation, 5)]
+        assert next_cursor is not None
+
+    def test_cursor_feeds_next_query(self):
+        """Cursor from a page is accepted by the query helper for the same sort"""
+        _, next_cursor = build_keyset_page(self._rows(3), 2, Song.created_at, "asc")
+
+        sql = _compile(apply_keyset_pagination(Query(Song), Song.created_at, Song.id, "asc", next_cursor, 2))
+
+        assert "(songs.created_at, songs.id) > ('2026-01-01 00:00:01+00:00'" in sql
@@ -0,0 +1,151 @@
+"""Unit tests for content-addressed blob reference counting and claims (SongProjectService on SQLite)"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+import business.song_project_orchestrator as orchestrator_module
+from business.song_project_orchestrator import song_project_orchestrator
+from db.models import ProjectFile, ProjectFileBlob, ProjectFolder, SongProject, User
+from db.song_project_service import SongProjectService
+
+
+HASH = "a" * 64
+
+
+@pytest.fixture
+def blob_session(sqlite_session):
+    """SQLite session with project_file_blobs and one blob without references"""
+    ProjectFileBlob.metadata.create_all(sqlite_session.get_bind(), tables=[ProjectFileBlob.__table__])
+    sqlite_session.add(
+        ProjectFileBlob(
+            file_hash=HASH,
+            s3_key=f"blobs/sha256/aa/{HASH}",
+            file_size_bytes=100,
+            ref_count=0,
+            unreferenced_at=datetime(2020, 1, 1),
+        )
+    )
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def _blob(db) -> ProjectFileBlob:
+    db.expire_all()
+    return db.query(ProjectFileBlob).filter(ProjectFileBlob.file_hash == HASH).one()
+
+
+@pytest.mark.unit
+class TestBlobReferenceCounting:
+    """Test _apply_blob_ref_delta()"""
+
+    def test_reference_clears_gc_marker(self, blob_session):
+        assert SongProjectService._apply_blob_ref_delta(blob_session, HASH, 2) is True
+        blob_session.commit()
+
+        blob = _blob(blob_session)
+        assert blob.ref_count == 2
+        assert blob.unreferenced_at is None
+
+    def test_last_release_marks_unreferenced(self, blob_session):
+        SongProjectService._apply_blob_ref_delta(blob_session, HASH, 2)
+        SongProjectService._apply_blob_ref_delta(blob_session, HASH, -1)
+        blob_session.commit()
+        assert _blob(blob_session).unreferenced_at is None
+
+        SongProjectService._apply_blob_ref_delta(blob_session, HASH, -1)
+        blob_session.commit()
+
+        blob = _blob(blob_session)
+        assert blob.ref_count == 0
+        assert blob.unreferenced_at is not None
+
+    def test_unknown_blob(self, blob_session):
+        """Missing blob (e.g. already collected) is reported, so the caller can fall back to an upload"""
+        assert SongProjectService._apply_blob_ref_delta(blob_session, "b" * 64, 1) is False
+        assert SongProjectService._apply_blob_ref_delta(blob_session, None, 1) is False
+
+
+@pytest.mark.unit
+class TestBlobGarbageCollection:
+    """Test GC candidate selection and deletion"""
+
+    def test_only_unreferenced_blobs_past_grace_period(self, blob_session):
+        service = SongProjectService()
+
+        assert [b.file_hash for b in service.lock_unreferenced_blobs(blob_session, datetime(2021, 1, 1), 10)] == [HASH]
+        assert service.lock_unreferenced_blobs(blob_session, datetime(2019, 1, 1), 10) == []
+
+        service._apply_blob_ref_delta(blob_session, HASH, 1)
+        blob_session.commit()
+        assert service.lock_unreferenced_blobs(blob_session, datetime.now(UTC) + timedelta(days=1), 10) == []
+
+    def test_delete_keeps_referenced_blobs(self, blob_session):
+        """A blob referenced again before deletion survives"""
+        service = SongProjectService()
+        service._apply_blob_ref_delta(blob_session, HASH, 1)
+        blob_session.commit()
+
+        assert service.delete_blobs(blob_session, [HASH]) == 0
+
+        service._apply_blob_ref_delta(blob_session, HASH, -1)
+        blob_session.commit()
+        assert service.delete_blobs(blob_session, [HASH]) == 1
+
+
+def _project_with_folder(db, email: str) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID]:
+    """User with one project and one folder, returns (user_id, project_id, folder_id)"""
+    user = User(id=uuid.uuid4(), email=email)
+    project = SongProject(id=uuid.uuid4(), user_id=user.id, project_name="Project", project_status="new")
+    folder = ProjectFolder(
+        id=uuid.uuid4(), project_id=project.id, folder_name="01 Arrangement", folder_type="arrangement"
+    )
+    db.add_all([user, project, folder])
+    db.commit()
+    return user.id, project.id, folder.id
+
+
+@pytest.fixture
+def claim_setup(blob_session):
+    """User A references the blob from a project file, user B has an empty project"""
+    owner_id, project_id, folder_id = _project_with_folder(blob_session, "owner@example.com")
+    blob_session.add(
+        ProjectFile(
+            project_id=project_id,
+            folder_id=folder_id,
+            filename="kick.wav",
+            relative_path="01 Arrangement/kick.wav",
+            s3_key=f"blobs/sha256/aa/{HASH}",
+            file_size_bytes=100,
+            file_hash=HASH,
+            storage_backend="blob",
+        )
+    )
+    blob_session.commit()
+    other = _project_with_folder(blob_session, "other@example.com")
+    return blob_session, owner_id, other
+
+
+@pytest.mark.unit
+class TestClaimScope:
+    """Claims only reach content the claiming user already stores"""
+
+    def test_user_blobs_by_hash(self, claim_setup):
+        db, owner_id, (other_id, _, _) = claim_setup
+        service = SongProjectService()
+
+        assert list(service.get_user_blobs_by_hash(db, owner_id, [HASH])) == [HASH]
+        assert service.get_user_blobs_by_hash(db, other_id, [HASH]) == {}
+        assert service.get_user_blobs_by_hash(db, owner_id, []) == {}
+
+    def test_claim_on_foreign_hash_falls_back_to_upload(self, claim_setup, monkeypatch):
+        """User B knowing user A's hash and size gets the file reported as missing (client uploads it)"""
+        monkeypatch.setattr(orchestrator_module, "SONG_PROJECT_DEDUP_ENABLED", True)
+        db, _, (other_id, project_id, folder_id) = claim_setup
+        files = [{"relative_path": "kick.wav", "file_hash": HASH, "file_size_bytes": 100}]
+
+        result = song_project_orchestrator.claim_files_by_hash(db, project_id, folder_id, other_id, files)
+
+        assert result == {"claimed": [], "missing": files}
+        assert db.query(ProjectFile).filter(ProjectFile.project_id == project_id).count() == 0
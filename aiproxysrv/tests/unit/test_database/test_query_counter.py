@@ -0,0 +1,225 @@
+"""Unit tests for query counting helpers and per-endpoint query budgets"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from api.controllers.conversation_controller import ConversationController
+from business.song_project_orchestrator import SongProjectOrchestrator
+from db.models import (
+    Conversation,
+    Message,
+    MessageArchive,
+    ProjectFile,
+    ReleaseProjectReference,
+    SongProject,
+    SongRelease,
+    User,
+)
+from db.query_counter import QueryBudgetExceededError, QueryCounter, assert_query_budget
+from db.song_project_service import song_project_service
+
+
+START = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestQueryCounter:
+    """Test QueryCounter / assert_query_budget"""
+
+    def test_counts_statements(self, sqlite_session):
+        engine = sqlite_session.get_bind()
+
+        with QueryCounter(engine) as counter:
+            sqlite_session.execute(text("SELECT 1"))
+            sqlite_session.execute(text("SELECT 2"))
+
+        assert counter.count == 2
+        assert counter.statements == ["SELECT 1", "SELECT 2"]
+
+    def test_listener_removed_after_block(self, sqlite_session):
+        engine = sqlite_session.get_bind()
+
+        with QueryCounter(engine) as counter:
+            sqlite_session.execute(text("SELECT 1"))
+        sqlite_session.execute(text("SELECT 2"))
+
+        assert counter.count == 1
+
+    def test_budget_respected(self, query_budget, sqlite_session):
+        with query_budget(1) as counter:
+            sqlite_session.execute(text("SELECT 1"))
+
+        assert counter.count == 1
+
+    def test_budget_exceeded_lists_statements(self, sqlite_session):
+        with (
+            pytest.raises(QueryBudgetExceededError, match="at most 1 queries, 2 were executed") as exc_info,
+            assert_query_budget(sqlite_session.get_bind(), 1),
+        ):
+            sqlite_session.execute(text("SELECT 1"))
+            sqlite_session.execute(text("SELECT 2"))
+
+        assert "1. SELECT 1" in str(exc_info.value)
+        assert "2. SELECT 2" in str(exc_info.value)
+
+    def test_budget_error_is_assertion_error(self):
+        """pytest reports budget violations as plain assertion failures"""
+        assert issubclass(QueryBudgetExceededError, AssertionError)
+
+
+@pytest.fixture
+def archived_conversation(sqlite_session):
+    """Conversation with several compressed summaries, each replacing archived messages"""
+    user = User(id=uuid.uuid4(), email="budget@example.com")
+    conversation = Conversation(
+        id=uuid.uuid4(), user_id=user.id, title="Budget", model="llama3.2:3b", provider="internal"
+    )
+    sqlite_session.add_all([user, conversation])
+
+    minute = 0
+    for summary_index in range(10):
+        summary = Message(
+            id=uuid.uuid4(),
+            conversation_id=conversation.id,
+            role="assistant",
+            content=f"summary {summary_index}",
+            is_summary=True,
+            created_at=START + timedelta(minutes=minute),
+        )
+        sqlite_session.add(summary)
+        for archive_index in range(5):
+            sqlite_session.add(
+                MessageArchive(
+                    original_message_id=uuid.uuid4(),
+                    conversation_id=conversation.id,
+                    role="user",
+                    content=f"archived {summary_index}.{archive_index}",
+                    original_created_at=START + timedelta(minutes=minute),
+                    summary_message_id=summary.id,
+                )
+            )
+            minute += 1
+
+    sqlite_session.add(
+        Message(
+            conversation_id=conversation.id,
+            role="user",
+            content="latest",
+            is_summary=False,
+            created_at=START + timedelta(minutes=minute),
+        )
+    )
+    sqlite_session.commit()
+    return user, conversation
+
+
+@pytest.mark.unit
+class TestConversationQueryBudget:
+    """Export of a conversation with archive must not scale queries with the number of summaries"""
+
+    def test_get_conversation_with_archive(self, sqlite_session, query_budget, archived_conversation):
+        user, conversation = archived_conversation
+        conversation_id, user_id = conversation.id, user.id
+        sqlite_session.expire_all()
+
+        with query_budget(3):
+            response, status = ConversationController().get_conversation_with_archive(
+                sqlite_session, conversation_id, user_id
+            )
+
+        assert status == 200
+        contents = [m["content"] for m in response["messages"]]
+        assert contents == [f"archived {s}.{a}" for s in range(10) for a in range(5)] + ["latest"]
+        assert response["has_archived"] is True
+
+
+@pytest.fixture
+def projects_with_releases(sqlite_session):
+    """Factory: user with n projects, every second project has two assigned releases"""
+
+    def create(project_count: int):
+        user = User(id=uuid.uuid4(), email=f"projects-{project_count}@example.com")
+        sqlite_session.add(user)
+        for index in range(project_count):
+            project = SongProject(
+                id=uuid.uuid4(),
+                user_id=user.id,
+                project_name=f"Project {index}",
+                project_status="new",
+                created_at=START + timedelta(minutes=index),
+            )
+            sqlite_session.add(project)
+            if index % 2:
+                continue
+            for release_index in range(2):
+                release = SongRelease(
+                    id=uuid.uuid4(),
+                    user_id=user.id,
+                    type="single",
+                    name=f"Release {index}.{release_index}",
+                    genre="Pop",
+                )
+                sqlite_session.add(release)
+                sqlite_session.add(ReleaseProjectReference(release_id=release.id, project_id=project.id))
+        sqlite_session.commit()
+        user_id = user.id
+        sqlite_session.expire_all()
+        return user_id
+
+    return create
+
+
+@pytest.mark.unit
+class TestListProjectsQueryBudget:
+    """Project list page: count + page + releases of the page, independent of the page size"""
+
+    @pytest.mark.parametrize("project_count", [2, 20])
+    def test_offset_page(self, sqlite_session, query_budget, projects_with_releases, project_count):
+        user_id = projects_with_releases(project_count)
+
+        with query_budget(3) as counter:
+            result = SongProjectOrchestrator().list_projects(sqlite_session, user_id, limit=project_count, offset=0)
+
+        assert counter.count == 3
+        assert len(result["projects"]) == project_count
+        sources = sorted(project["cover_info"]["source"] for project in result["projects"])
+        assert sources == ["placeholder"] * (project_count // 2) + ["release"] * (project_count // 2)
+
+    def test_cursor_page_without_total(self, sqlite_session, query_budget, projects_with_releases):
+        user_id = projects_with_releases(20)
+
+        with query_budget(2) as counter:
+            result = SongProjectOrchestrator().list_projects(sqlite_session, user_id, limit=10, cursor="")
+
+        assert counter.count == 2
+        assert len(result["projects"]) == 10
+
+
+@pytest.mark.unit
+class TestFileDownloadQueryBudget:
+    """File download checks ownership in the lookup query (no lazy load of file.project)"""
+
+    def test_get_file_for_user(self, sqlite_session, query_budget, projects_with_releases):
+        user_id = projects_with_releases(1)
+        project = sqlite_session.query(SongProject).one()
+        file = ProjectFile(
+            id=uuid.uuid4(),
+            project_id=project.id,
+            filename="mix.wav",
+            relative_path="Mix/mix.wav",
+            s3_key="projects/p/Mix/mix.wav",
+        )
+        sqlite_session.add(file)
+        sqlite_session.commit()
+        project_id, file_id = project.id, file.id
+        sqlite_session.expire_all()
+
+        with query_budget(1) as counter:
+            found = song_project_service.get_file_for_user(sqlite_session, project_id, file_id, user_id)
+            assert (found.s3_key, found.filename) == ("projects/p/Mix/mix.wav", "mix.wav")
+
+        assert counter.count == 1
+        assert song_project_service.get_file_for_user(sqlite_session, project_id, file_id, uuid.uuid4()) is None
@@ -0,0 +1,209 @@
+"""Unit tests for per-request SQL instrumentation"""
+
+import os
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from db.query_stats import (
+    InstrumentedQueuePool,
+    RequestQueryStats,
+    finish_request_stats,
+    get_pool_status,
+    get_request_stats,
+    install_query_instrumentation,
+    start_request_stats,
+)
+from utils.logger import logger
+from utils.tracing import finish_trace, start_trace
+
+
+@pytest.fixture
+def instrumented_engine():
+    engine = create_engine("sqlite://")
+    instrumentation = install_query_instrumentation(engine, slow_query_ms=10_000)
+    yield engine, instrumentation
+    finish_request_stats()
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestRequestStatsLifecycle:
+    """Test start/get/finish of the request-scoped stats"""
+
+    def test_no_stats_outside_request(self):
+        assert get_request_stats() is None
+
+    def test_start_and_finish(self):
+        stats = start_request_stats("GET /api/v1/songs")
+
+        assert get_request_stats() is stats
+        assert finish_request_stats() is stats
+        assert get_request_stats() is None
+
+    def test_start_replaces_leftover_stats(self):
+        start_request_stats("GET /a")
+        stats = start_request_stats("GET /b")
+
+        assert finish_request_stats() is stats
+
+    def test_to_header(self):
+        stats = RequestQueryStats(query_count=3, db_time_ms=4.21, connection_hold_ms=9.0)
+
+        assert stats.to_header() == "queries=3;db_ms=4.2;hold_ms=9.0;slow=0"
+
+    def test_to_log_fields(self):
+        stats = RequestQueryStats(query_count=2, db_time_ms=1.26, connections_checked_out=1)
+        stats.slow_statements.append({"statement": "SELECT 1", "duration_ms": 300.0})
+
+        assert stats.to_log_fields() == {
+            "db_queries": 2,
+            "db_time_ms": 1.3,
+            "db_hold_ms": 0.0,
+            "db_connections": 1,
+            "db_slow_queries": 1,
+        }
+
+    def test_log_context_shows_current_stats(self, instrumented_engine):
+        engine, _ = instrumented_engine
+        stats = start_request_stats("GET /test")
+        records = []
+        handler_id = logger.add(lambda message: records.append(message.record["extra"]), format="{message}")
+        try:
+            with logger.contextualize(request=stats.label, db=stats):
+                logger.info("before")
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                logger.info("after")
+        finally:
+            logger.remove(handler_id)
+
+        assert records[0] == {"request": "GET /test", "db": "queries=0;db_ms=0.0;hold_ms=0.0;slow=0"}
+        assert records[1]["db"].startswith("queries=1;")
+
+
+@pytest.mark.unit
+class TestQueryInstrumentation:
+    """Test event hooks on a real (SQLite) engine"""
+
+    def test_counts_queries_and_time(self, instrumented_engine):
+        engine, _ = instrumented_engine
+        stats = start_request_stats("GET /test")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        assert stats.query_count == 2
+        assert stats.db_time_ms > 0
+        assert stats.slow_statements == []
+
+    def test_connection_hold_time(self, instrumented_engine):
+        engine, _ = instrumented_engine
+        stats = start_request_stats("GET /test")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert stats.connections_checked_out == 1
+        assert stats.connection_hold_ms > 0
+
+    def test_untracked_queries_are_ignored(self, instrumented_engine):
+        """Queries outside a request (e.g. Celery) do not fail and are not counted"""
+        engine, _ = instrumented_engine
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        stats = start_request_stats("GET /test")
+        assert stats.query_count == 0
+
+    def test_slow_statements_recorded(self, instrumented_engine):
+        engine, instrumentation = instrumented_engine
+        instrumentation.slow_query_ms = 0
+        stats = start_request_stats("GET /slow")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 42"))
+
+        assert [s["statement"] for s in stats.slow_statements] == ["SELECT 42"]
+
+    def test_failed_statement_does_not_skew_timing(self, instrumented_engine):
+        engine, _ = instrumented_engine
+        stats = start_request_stats("GET /error")
+
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+
+            assert conn.info["query_start_time"] == []
+        assert stats.query_count == 1
+
+    def test_statements_are_trace_spans(self, instrumented_engine):
+        engine, _ = instrumented_engine
+        start_trace("GET /traced")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+        trace = finish_trace(200)
+
+        db_spans = [span for span in trace.spans if span.kind == "db"]
+        assert [span.attributes["statement"] for span in db_spans] == ["SELECT 1", "SELECT * FROM missing_table"]
+        assert db_spans[0].error is None
+        assert db_spans[1].error == "OperationalError"
+        assert all(span.end_ns is not None for span in db_spans)
+
+
+@pytest.mark.unit
+class TestGetPoolStatus:
+    """Test get_pool_status function"""
+
+    def test_queue_pool(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=2, max_overflow=3)
+        try:
+            with engine.connect():
+                status = get_pool_status(engine.pool)
+        finally:
+            engine.dispose()
+
+        assert status["pid"] == os.getpid()
+        assert status["pool_class"] == "QueuePool"
+        assert status["size"] == 2
+        assert status["checked_out"] == 1
+        assert status["max_overflow"] == 3
+        assert status["utilization"] == 0.2
+
+    def test_pool_without_capacity(self):
+        engine = create_engine("sqlite://")
+
+        status = get_pool_status(engine.pool)
+
+        assert status["pool_class"] == "SingletonThreadPool"
+        assert status["utilization"] is None
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test Prometheus pool metrics (checkouts, checked out gauge, wait time)"""
+
+    def test_checkout_and_wait_are_recorded(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, pool_size=1)
+        install_query_instrumentation(engine, slow_query_ms=1000)
+        checkouts_before = REGISTRY.get_sample_value("aiproxy_db_pool_checkouts_total")
+        waits_before = REGISTRY.get_sample_value("aiproxy_db_pool_wait_seconds_count")
+        checked_out_before = REGISTRY.get_sample_value("aiproxy_db_pool_checked_out")
+        try:
+            with engine.connect():
+                assert REGISTRY.get_sample_value("aiproxy_db_pool_checked_out") == checked_out_before + 1
+        finally:
+            engine.dispose()
+
+        assert REGISTRY.get_sample_value("aiproxy_db_pool_checkouts_total") == checkouts_before + 1
+        assert REGISTRY.get_sample_value("aiproxy_db_pool_wait_seconds_count") == waits_before + 1
+        assert REGISTRY.get_sample_value("aiproxy_db_pool_checked_out") == checked_out_before
@@ -0,0 +1,119 @@
+"""Unit tests for full-text search helpers"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from db.models import Song
+from db.search_helpers import MAX_SEARCH_TERMS, apply_fulltext_search, build_prefix_tsquery, build_search_vector_sql
+
+
+def _compile(query: Query) -> str:
+    """Render query SQL for PostgreSQL with inlined literals"""
+    return str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+class TestBuildPrefixTsquery:
+    """Test build_prefix_tsquery function"""
+
+    def test_single_word(self):
+        """Single word becomes prefix match"""
+        assert build_prefix_tsquery("love") == "love:*"
+
+    def test_multiple_words_are_and_combined(self):
+        """All words must match (AND), lowercased"""
+        assert build_prefix_tsquery("Summer  NIGHTS") == "summer:* & nights:*"
+
+    def test_no_search(self):
+        """Empty/whitespace/None means no search at all"""
+        assert build_prefix_tsquery(None) is None
+        assert build_prefix_tsquery("") is None
+        assert build_prefix_tsquery("   ") is None
+
+    def test_tsquery_operators_are_stripped(self):
+        """tsquery syntax in user input must not reach to_tsquery()"""
+        assert build_prefix_tsquery("rock & (roll | !pop):*") == "rock:* & roll:* & pop:*"
+        assert build_prefix_tsquery("it's") == "it:* & s:*"
+
+    def test_punctuation_only(self):
+        """Input without words yields empty tsquery"""
+        assert build_prefix_tsquery("!!! ???") == ""
+
+    def test_underscores_split_words(self):
+        """Underscores are separators (like the tsvector parser)"""
+        assert build_prefix_tsquery("my_song") == "my:* & song:*"
+
+    def test_unicode_words(self):
+        """Umlauts and accents are kept"""
+        assert build_prefix_tsquery("Grüße café") == "grüße:* & café:*"
+
+    def test_term_limit(self):
+        """Number of terms is capped"""
+        result = build_prefix_tsquery(" ".join(f"w{i}" for i in range(MAX_SEARCH_TERMS + 5)))
+        assert result.count(":*") == MAX_SEARCH_TERMS
+
+
+@pytest.mark.unit
+class TestBuildSearchVectorSql:
+    """Test build_search_vector_sql function"""
+
+    def test_weighted_columns(self):
+        """Columns are coalesced, weighted and concatenated in order"""
+        sql = build_search_vector_sql({"title": "A", "lyrics": "C"})
+
+        assert sql == (
+            "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, coalesce(lyrics, '')), 'C')"
+        )
+
+    def test_model_uses_same_expression(self):
+        """Song.search_vector is generated from the shared builder"""
+        computed = Song.__table__.c.search_vector.computed
+
+        assert computed.persisted is True
+        assert str(computed.sqltext) == build_search_vector_sql({"title": "A", "tags": "B", "lyrics": "C"})
+
+
+@pytest.mark.unit
+class TestApplyFulltextSearch:
+    """Test apply_fulltext_search function"""
+
+    def test_no_search_leaves_query_unchanged(self):
+        """Without search term no filter and no rank"""
+        query = Query(Song)
+
+        result, rank = apply_fulltext_search(query, Song.search_vector, "")
+
+        assert result is query
+        assert rank is None
+
+    def test_search_adds_tsquery_filter(self):
+        """Search filters by @@ on the tsvector column"""
+        result, rank = apply_fulltext_search(Query(Song), Song.search_vector, "love song")
+        sql = _compile(result)
+
+        assert "songs.search_vector @@ to_tsquery('simple'::regconfig, 'love:* & song:*')" in sql
+        assert "ILIKE" not in sql.upper()
+        assert rank is not None
+
+    def test_rank_expression(self):
+        """Rank uses ts_rank_cd over the same tsquery"""
+        result, rank = apply_fulltext_search(Query(Song), Song.search_vector, "love")
+        sql = _compile(result.order_by(rank.desc()))
+
+        assert "ORDER BY ts_rank_cd(songs.search_vector, to_tsquery('simple'::regconfig, 'love:*')) DESC" in sql
+
+    def test_punctuation_only_matches_nothing(self):
+        """Search without words returns an always-false filter"""
+        result, rank = apply_fulltext_search(Query(Song), Song.search_vector, "???")
+        sql = _compile(result)
+
+        assert "false" in sql.lower()
+        assert rank is None
+
+    def test_search_vector_not_loaded_by_default(self):
+        """Deferred column: list queries never select the tsvector itself"""
+        sql = _compile(Query(Song))
+
+        assert "songs.search_vector" not in sql
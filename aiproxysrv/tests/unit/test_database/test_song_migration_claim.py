@@ -0,0 +1,61 @@
+"""Unit tests for the migration claim of song choices (SongService on SQLite)"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from db.models import Song, SongChoice
+from db.song_service import SongService
+
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+LEASE_UNTIL = NOW + timedelta(minutes=15)
+
+
+@pytest.fixture
+def make_choice(sqlite_session):
+    """Factory: choice with the given migration state, returns its id"""
+    Song.metadata.create_all(sqlite_session.get_bind(), tables=[Song.__table__, SongChoice.__table__])
+
+    def create(attempts: int = 0, next_attempt_at: datetime | None = None):
+        song = Song(id=uuid.uuid4(), task_id=str(uuid.uuid4()), lyrics="La la", prompt="Pop")
+        choice = SongChoice(
+            id=uuid.uuid4(),
+            song_id=song.id,
+            choice_index=0,
+            mp3_url="https://cdn.example.com/a.mp3",
+            s3_migration_attempts=attempts,
+            s3_migration_next_attempt_at=next_attempt_at,
+        )
+        sqlite_session.add_all([song, choice])
+        sqlite_session.commit()
+        return choice.id
+
+    return create
+
+
+@pytest.mark.unit
+class TestClaimChoiceForMigration:
+    """Test claim_choice_for_migration()"""
+
+    def test_claim_sets_lease(self, sqlite_session, make_choice):
+        choice_id = make_choice()
+        service = SongService()
+
+        assert service.claim_choice_for_migration(sqlite_session, choice_id, NOW, LEASE_UNTIL, 5) is True
+        # The lease blocks a second claim until it expires
+        assert service.claim_choice_for_migration(sqlite_session, choice_id, NOW, LEASE_UNTIL, 5) is False
+
+    def test_given_up_choice_is_not_claimed(self, sqlite_session, make_choice):
+        """A playback-triggered submit of a choice that failed max_attempts times does not transfer again"""
+        choice_id = make_choice(attempts=5)
+        service = SongService()
+
+        assert service.claim_choice_for_migration(sqlite_session, choice_id, NOW, LEASE_UNTIL, 5) is False
+        assert service.claim_choice_for_migration(sqlite_session, choice_id, NOW, LEASE_UNTIL, 6) is True
+
+    def test_backoff_blocks_claim(self, sqlite_session, make_choice):
+        choice_id = make_choice(attempts=1, next_attempt_at=NOW + timedelta(minutes=1))
+
+        assert SongService().claim_choice_for_migration(sqlite_session, choice_id, NOW, LEASE_UNTIL, 5) is False
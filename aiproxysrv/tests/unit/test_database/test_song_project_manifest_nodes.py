@@ -0,0 +1,138 @@
+"""Unit tests for folder manifest node storage (SongProjectService on SQLite)"""
+
+import hashlib
+import uuid
+
+import pytest
+
+from business.song_project_manifest_transformer import (
+    apply_manifest_deltas,
+    build_manifest_nodes,
+    calculate_manifest_deltas,
+    to_folder_relative_path,
+)
+from db.models import ProjectFile, ProjectFolder, ProjectManifestNode, SongProject
+from db.song_project_service import SongProjectService
+
+
+def _hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+FILES = [
+    ("mix.wav", _hash("mix")),
+    ("Samples/pad.wav", _hash("pad")),
+    ("Samples/Drums/kick.wav", _hash("kick")),
+    ("Samples/Drums/snare.wav", _hash("snare")),
+    ("Bounces/v1.wav", _hash("v1")),
+]
+
+FOLDER_NAME = "01 Arrangement"
+
+
+@pytest.fixture
+def manifest_session(sqlite_session):
+    """SQLite session with project_manifest_nodes and one project folder containing FILES"""
+    ProjectManifestNode.__table__.create(sqlite_session.get_bind())
+    project = SongProject(id=uuid.uuid4(), user_id=uuid.uuid4(), project_name="Manifest")
+    folder = ProjectFolder(id=uuid.uuid4(), project_id=project.id, folder_name=FOLDER_NAME)
+    sqlite_session.add_all([project, folder])
+    for path, file_hash in FILES:
+        sqlite_session.add(
+            ProjectFile(
+                project_id=project.id,
+                folder_id=folder.id,
+                filename=path.rpartition("/")[2],
+                relative_path=f"{FOLDER_NAME}/{path}",
+                file_hash=file_hash,
+            )
+        )
+    sqlite_session.commit()
+    return sqlite_session, project.id, folder.id
+
+
+def _stored_tree(db, folder_id) -> dict[str, dict]:
+    return {
+        node.path: {"node_hash": node.node_hash, "file_count": node.file_count, "parent_path": node.parent_path}
+        for node in db.query(ProjectManifestNode).filter(ProjectManifestNode.folder_id == folder_id)
+    }
+
+
+def _changes(service, db, folder_id, removed=None, added=None):
+    """Node changes of one file change, calculated the way the orchestrator does"""
+    folder = service.lock_folder(db, folder_id)
+    deltas = calculate_manifest_deltas(
+        (to_folder_relative_path(removed[0], folder.folder_name), removed[1]) if removed else None,
+        (to_folder_relative_path(added[0], folder.folder_name), added[1]) if added else None,
+    )
+    nodes = service.get_manifest_nodes(db, folder_id, [*deltas, ""])
+    return apply_manifest_deltas({node.path: (node.node_hash, node.file_count) for node in nodes}, deltas)
+
+
+@pytest.mark.unit
+class TestManifestNodeStorage:
+    """Test manifest replace and incremental node writes of file changes"""
+
+    def test_replace_folder_manifest(self, manifest_session):
+        db, _, folder_id = manifest_session
+        service = SongProjectService()
+
+        assert service.replace_folder_manifest(db, folder_id, build_manifest_nodes(FILES)) is True
+        assert service.replace_folder_manifest(db, folder_id, build_manifest_nodes(FILES[:1])) is True
+
+        assert _stored_tree(db, folder_id) == build_manifest_nodes(FILES[:1])
+
+    def test_file_changes_match_rebuild(self, manifest_session):
+        db, project_id, folder_id = manifest_session
+        service = SongProjectService()
+        service.replace_folder_manifest(db, folder_id, build_manifest_nodes(FILES))
+        files = {file.relative_path: file for file in db.query(ProjectFile)}
+
+        # Move kick.wav to Bounces, delete the only file in Bounces, upload into a new directory
+        kick = files[f"{FOLDER_NAME}/Samples/Drums/kick.wav"]
+        changes = _changes(
+            service,
+            db,
+            folder_id,
+            removed=(kick.relative_path, kick.file_hash),
+            added=("Bounces/kick.wav", kick.file_hash),
+        )
+        assert service.move_file(db, kick.id, "Bounces/kick.wav", "projects/p/Bounces/kick.wav", changes)
+
+        bounce = files[f"{FOLDER_NAME}/Bounces/v1.wav"]
+        changes = _changes(service, db, folder_id, removed=(bounce.relative_path, bounce.file_hash))
+        assert service.delete_file(db, bounce.id, changes) is True
+
+        lead_path = f"{FOLDER_NAME}/Vocals/lead.wav"
+        changes = _changes(service, db, folder_id, added=(lead_path, _hash("lead")))
+        assert service.create_file(
+            db, project_id, folder_id, "lead.wav", lead_path, file_hash=_hash("lead"), manifest_changes=changes
+        )
+
+        expected = build_manifest_nodes(
+            [FILES[0], FILES[1], ("Bounces/kick.wav", _hash("kick")), FILES[3], ("Vocals/lead.wav", _hash("lead"))]
+        )
+        assert _stored_tree(db, folder_id) == expected
+
+    def test_content_update(self, manifest_session):
+        db, _, folder_id = manifest_session
+        service = SongProjectService()
+        service.replace_folder_manifest(db, folder_id, build_manifest_nodes(FILES))
+        pad = db.query(ProjectFile).filter(ProjectFile.filename == "pad.wav").one()
+
+        changes = _changes(
+            service, db, folder_id, removed=(pad.relative_path, pad.file_hash), added=(pad.relative_path, _hash("v2"))
+        )
+        assert service.update_file(db, pad.id, file_hash=_hash("v2"), manifest_changes=changes)
+
+        expected = build_manifest_nodes([FILES[0], ("Samples/pad.wav", _hash("v2")), *FILES[2:]])
+        assert _stored_tree(db, folder_id) == expected
+
+    def test_without_changes_nodes_are_untouched(self, manifest_session):
+        """File changes without manifest_changes (e.g. manifest not built yet) write no nodes"""
+        db, project_id, folder_id = manifest_session
+        service = SongProjectService()
+
+        assert service.create_file(db, project_id, folder_id, "new.wav", f"{FOLDER_NAME}/new.wav")
+
+        assert _stored_tree(db, folder_id) == {}
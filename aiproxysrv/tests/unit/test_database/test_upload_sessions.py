@@ -0,0 +1,105 @@
+"""Unit tests for resumable upload session lookups (SongProjectService)"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from db.models import ProjectUploadSession
+from db.song_project_service import SongProjectService
+
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+FILE_HASH = "a" * 64
+
+
+@pytest.fixture
+def upload_session_db(sqlite_session):
+    """SQLite session with project_upload_sessions"""
+    ProjectUploadSession.metadata.create_all(sqlite_session.get_bind(), tables=[ProjectUploadSession.__table__])
+    return sqlite_session
+
+
+def _session_data(folder_id, user_id, **overrides):
+    session_id = uuid.uuid4()
+    data = {
+        "id": session_id,
+        "project_id": uuid.uuid4(),
+        "folder_id": folder_id,
+        "user_id": user_id,
+        "relative_path": "Stems/drums.wav",
+        "file_size_bytes": 100 * 1024 * 1024,
+        "file_hash": FILE_HASH,
+        "staging_key": f"uploads/{session_id}",
+        "upload_id": "upload-1",
+        "chunk_size": 16 * 1024 * 1024,
+        "expires_at": (NOW + timedelta(hours=1)).replace(tzinfo=None),
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.unit
+class TestUploadSessionLookup:
+    """Test resume lookup and cleanup queries"""
+
+    def test_find_open_session_for_same_content(self, upload_session_db):
+        service = SongProjectService()
+        folder_id, user_id = uuid.uuid4(), uuid.uuid4()
+        created = service.create_upload_session(upload_session_db, _session_data(folder_id, user_id))
+
+        found = service.find_open_upload_session(
+            upload_session_db, folder_id, user_id, "Stems/drums.wav", FILE_HASH, 100 * 1024 * 1024, NOW
+        )
+
+        assert found is not None
+        assert found.id == created.id
+
+    def test_changed_content_does_not_resume(self, upload_session_db):
+        service = SongProjectService()
+        folder_id, user_id = uuid.uuid4(), uuid.uuid4()
+        service.create_upload_session(upload_session_db, _session_data(folder_id, user_id))
+
+        assert (
+            service.find_open_upload_session(
+                upload_session_db, folder_id, user_id, "Stems/drums.wav", "b" * 64, 100 * 1024 * 1024, NOW
+            )
+            is None
+        )
+        assert (
+            service.find_open_upload_session(
+                upload_session_db, folder_id, uuid.uuid4(), "Stems/drums.wav", FILE_HASH, 100 * 1024 * 1024, NOW
+            )
+            is None
+        )
+
+    def test_expired_and_closed_sessions_do_not_resume(self, upload_session_db):
+        service = SongProjectService()
+        folder_id, user_id = uuid.uuid4(), uuid.uuid4()
+        service.create_upload_session(
+            upload_session_db,
+            _session_data(folder_id, user_id, expires_at=(NOW - timedelta(minutes=1)).replace(tzinfo=None)),
+        )
+        service.create_upload_session(upload_session_db, _session_data(folder_id, user_id, status="aborted"))
+
+        assert (
+            service.find_open_upload_session(
+                upload_session_db, folder_id, user_id, "Stems/drums.wav", FILE_HASH, 100 * 1024 * 1024, NOW
+            )
+            is None
+        )
+
+    def test_expired_sessions_cleanup(self, upload_session_db):
+        service = SongProjectService()
+        folder_id, user_id = uuid.uuid4(), uuid.uuid4()
+        expired = service.create_upload_session(
+            upload_session_db,
+            _session_data(folder_id, user_id, expires_at=(NOW - timedelta(hours=2)).replace(tzinfo=None)),
+        )
+        service.create_upload_session(upload_session_db, _session_data(folder_id, user_id))
+
+        candidates = service.get_expired_upload_sessions(upload_session_db, NOW.replace(tzinfo=None), limit=10)
+
+        assert [session.id for session in candidates] == [expired.id]
+        assert service.delete_upload_sessions(upload_session_db, [expired.id]) == 1
+        assert upload_session_db.query(ProjectUploadSession).count() == 1
@@ -0,0 +1,114 @@
+"""Unit tests for image derivative rendering and the shared image/font caches (Pillow, in memory)"""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw
+
+from infrastructure.image_file_service import DecodedImageCache, ImageFileService
+
+
+SIZES = {"preview": (64, 64), "thumb": (16, 16)}
+
+
+def _encode(img: Image.Image, image_format: str = "PNG") -> bytes:
+    output = BytesIO()
+    img.save(output, format=image_format)
+    return output.getvalue()
+
+
+def _transparent_png() -> bytes:
+    """Fully transparent canvas with an opaque red square in the middle"""
+    img = Image.new("RGBA", (128, 128), (0, 0, 0, 0))
+    img.paste((255, 0, 0, 255), (32, 32, 96, 96))
+    return _encode(img)
+
+
+def _decode(data: bytes) -> Image.Image:
+    img = Image.open(BytesIO(data))
+    img.load()
+    return img
+
+
+@pytest.mark.unit
+class TestRenderDerivatives:
+    """Test size, format and transparency handling of derivatives"""
+
+    def test_sizes(self):
+        derivatives = ImageFileService.render_derivatives(_encode(Image.new("RGB", (128, 128), "blue")), SIZES)
+
+        assert {name: _decode(data).size for name, data in derivatives.items()} == SIZES
+
+    def test_webp_keeps_transparency(self):
+        derivatives = ImageFileService.render_derivatives(_transparent_png(), SIZES, image_format="webp")
+
+        thumb = _decode(derivatives["thumb"])
+        assert thumb.mode == "RGBA"
+        assert thumb.getpixel((0, 0))[3] == 0
+        assert thumb.getpixel((8, 8))[3] == 255
+
+    def test_jpeg_flattens_transparency_onto_white(self):
+        derivatives = ImageFileService.render_derivatives(_transparent_png(), SIZES, image_format="jpeg")
+
+        preview = _decode(derivatives["preview"])
+        assert preview.mode == "RGB"
+        assert all(channel > 245 for channel in preview.getpixel((2, 2)))
+        red, green, blue = preview.getpixel((32, 32))
+        assert red > 200 and green < 50 and blue < 50
+
+    def test_opaque_source_stays_rgb(self):
+        derivatives = ImageFileService.render_derivatives(_encode(Image.new("RGB", (128, 128), "blue")), SIZES)
+
+        assert _decode(derivatives["thumb"]).mode == "RGB"
+
+
+@pytest.mark.unit
+class TestThreadSafety:
+    """gthread workers run several requests per process - shared caches must tolerate that"""
+
+    FONT_PATH = ImageFileService.FONTS_DIR / "Inter-Regular.ttf"
+
+    def test_font_cache_is_per_thread(self):
+        font = ImageFileService.load_font(self.FONT_PATH, 24)
+        assert ImageFileService.load_font(self.FONT_PATH, 24) is font
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(ImageFileService.load_font, self.FONT_PATH, 24).result()
+
+        assert other is not font
+        assert other.getbbox("Title") == font.getbbox("Title")
+
+    def test_concurrent_font_rendering(self):
+        def render(_):
+            img = Image.new("RGB", (200, 60))
+            draw = ImageDraw.Draw(img)
+            for _ in range(20):
+                draw.text((5, 5), "Title", font=ImageFileService.load_font(self.FONT_PATH, 32), fill="white")
+            return img.tobytes()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = set(pool.map(render, range(8)))
+
+        assert len(results) == 1
+
+    def test_decoded_image_cache_under_concurrency(self):
+        cache = DecodedImageCache(max_entries=4)
+        source = Image.new("RGB", (32, 32), (10, 20, 30))
+
+        def work(i):
+            key = f"img-{i % 6}"
+            cached = cache.get(key)
+            if cached is None:
+                cache.put(key, source, (64, 64))
+                return source.getpixel((0, 0))
+            img, original_size = cached
+            assert original_size == (64, 64)
+            img.paste((255, 255, 255), (0, 0, 32, 32))  # callers draw on their copy
+            return source.getpixel((0, 0))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = set(pool.map(work, range(500)))
+
+        assert results == {(10, 20, 30)}
+        assert len(cache._entries) <= 4
@@ -0,0 +1,63 @@
+"""Unit tests for the connection reset helpers used by the gunicorn fork/exit hooks"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from db import database
+from infrastructure.storage import s3_storage
+
+
+@pytest.fixture
+def engine(mocker):
+    engine = MagicMock()
+    mocker.patch.object(database, "_engine", engine)
+    return engine
+
+
+@pytest.fixture
+def storage(mocker):
+    inherited_client = MagicMock()
+    mocker.patch.object(s3_storage.S3Storage, "_create_client", side_effect=[inherited_client, MagicMock()])
+    return s3_storage.S3Storage(bucket="test-bucket", skip_bucket_check=True)
+
+
+@pytest.mark.unit
+class TestEngineReset:
+    """Test reset_engine_after_fork and close_engine"""
+
+    def test_after_fork_keeps_parent_sockets(self, engine):
+        database.reset_engine_after_fork()
+
+        engine.dispose.assert_called_once_with(close=False)
+
+    def test_close_engine(self, engine):
+        database.close_engine()
+
+        engine.dispose.assert_called_once_with()
+
+    def test_no_engine_yet(self, mocker):
+        mocker.patch.object(database, "_engine", None)
+
+        database.reset_engine_after_fork()
+        database.close_engine()
+
+
+@pytest.mark.unit
+class TestStorageClients:
+    """Test reset_clients_after_fork and close_clients"""
+
+    def test_after_fork_replaces_client(self, storage):
+        inherited_client = storage.s3_client
+
+        s3_storage.reset_clients_after_fork()
+
+        assert storage.s3_client is not inherited_client
+        inherited_client.close.assert_not_called()
+
+    def test_close_clients_swallows_errors(self, storage):
+        storage.s3_client.close.side_effect = RuntimeError("already closed")
+
+        s3_storage.close_clients()
+
+        storage.s3_client.close.assert_called_once()
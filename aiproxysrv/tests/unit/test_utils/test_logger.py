@@ -0,0 +1,128 @@
+"""Unit tests for the logging pipeline (field caps, text templates, JSON lines)"""
+
+import io
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from utils.logger import (
+    JsonLinesSink,
+    build_json_line,
+    cap_extra,
+    cap_value,
+    format_record,
+)
+
+
+def _record(level: str = "INFO", **extra):
+    return {
+        "time": datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC),
+        "level": SimpleNamespace(name=level),
+        "name": "api.app",
+        "function": "handler",
+        "line": 42,
+        "process": SimpleNamespace(id=7),
+        "message": "Request done",
+        "extra": extra,
+    }
+
+
+@pytest.mark.unit
+class TestCapValue:
+    """Test per-field size caps"""
+
+    def test_short_values_unchanged(self):
+        value = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}], "n": 1}
+
+        assert cap_value(value, 2000) == value
+        assert cap_value(None, 10) is None
+
+    def test_long_string_is_cut(self):
+        assert cap_value("x" * 50, 10) == "xxxxxxxxxx... (+40 chars)"
+
+    def test_large_list_keeps_leading_items(self):
+        messages = [{"role": "user", "content": "lyrics " * 20} for _ in range(2000)]
+
+        capped = cap_value(messages, 2000)
+
+        assert 1 < len(capped) < 30
+        assert capped[-1].startswith("... +")
+        assert len(json.dumps(capped)) < 2500
+
+    def test_large_dict_and_unknown_types(self):
+        capped = cap_value({f"k{i}": datetime(2026, 1, 1) for i in range(1000)}, 200)
+
+        assert capped["k0"] == "2026-01-01 00:00:00"
+        assert capped["..."].endswith("keys")
+
+    def test_cap_extra_keeps_stacktrace_and_input(self):
+        payload = {"messages": ["m" * 5000]}
+        record = _record(payload=payload, stacktrace="s" * 5000, count=3)
+
+        cap_extra(record)
+
+        assert len(record["extra"]["payload"]["messages"][0]) < 5000
+        assert payload == {"messages": ["m" * 5000]}
+        assert len(record["extra"]["stacktrace"]) == 5000
+        assert record["extra"]["count"] == 3
+
+
+@pytest.mark.unit
+class TestFormatRecord:
+    """Test the text format templates"""
+
+    def test_info_shows_message_only(self):
+        template = format_record(_record("INFO", user_id=1))
+
+        assert "extra" not in template
+
+    def test_debug_inline_values_are_not_pasted_into_template(self):
+        record = _record("DEBUG", payload={"a": "{not a field}"}, text="x" * 200, _private=1)
+
+        template = format_record(record)
+
+        assert "{extra[_fields][payload]}" in template
+        assert "_private" not in template
+        assert record["extra"]["_fields"]["payload"] == '{"a": "{not a field}"}'
+        assert len(record["extra"]["_fields"]["text"]) == 100
+
+    def test_template_is_reused(self):
+        assert format_record(_record("ERROR", error="a")) is format_record(_record("ERROR", error="b"))
+
+    def test_error_fields(self):
+        template = format_record(_record("ERROR", error_type="ValueError", error="boom", stacktrace="", user_id=1))
+
+        assert "└─ Type:" in template
+        assert "└─ Error:" in template
+        assert "Stacktrace" not in template
+        assert "└─ user_id:" in template
+
+
+@pytest.mark.unit
+class TestJsonLines:
+    """Test the JSON lines format"""
+
+    def test_build_json_line(self):
+        line = build_json_line(_record("WARNING", payload={"a": [1, 2]}, at=datetime(2026, 1, 1), _fields={}))
+
+        entry = json.loads(line)
+        assert line.endswith("\n")
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "api.app"
+        assert entry["line"] == 42
+        assert entry["process"] == 7
+        assert entry["time"] == "2026-01-01T12:00:00+00:00"
+        assert entry["extra"] == {"payload": {"a": [1, 2]}, "at": "2026-01-01 00:00:00"}
+        assert "exception" not in entry
+
+    def test_sink_writes_exception_text(self):
+        stream = io.StringIO()
+        message = type("Message", (str,), {})("\nTraceback (most recent call last):\nValueError: boom\n")
+        message.record = _record("ERROR")
+
+        JsonLinesSink(stream)(message)
+
+        entry = json.loads(stream.getvalue())
+        assert entry["exception"] == "Traceback (most recent call last):\nValueError: boom"
@@ -0,0 +1,135 @@
+"""Unit tests for Prometheus metrics helpers"""
+
+import pytest
+from prometheus_client import REGISTRY
+
+from utils.metrics import (
+    UNKNOWN_MODEL,
+    generate_metrics,
+    observe_http_request,
+    record_s3_bytes,
+    track_upstream,
+)
+from utils.tracing import finish_trace, start_trace
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.unit
+class TestTrackUpstream:
+    """Test track_upstream()"""
+
+    def test_success(self):
+        before = _sample("aiproxy_upstream_request_duration_seconds_count", provider="test", model="m1", outcome="ok")
+
+        with track_upstream("test", "m1") as call:
+            call.set_status(200)
+
+        assert call.outcome == "ok"
+        assert (
+            _sample("aiproxy_upstream_request_duration_seconds_count", provider="test", model="m1", outcome="ok")
+            == before + 1
+        )
+        assert _sample("aiproxy_upstream_requests_in_progress", provider="test") == 0
+
+    def test_http_error_status(self):
+        before = _sample("aiproxy_upstream_errors_total", provider="test", model="m2", error_type="http_503")
+
+        with track_upstream("test", "m2") as call:
+            call.set_status(503)
+
+        assert call.outcome == "error"
+        assert (
+            _sample("aiproxy_upstream_errors_total", provider="test", model="m2", error_type="http_503") == before + 1
+        )
+
+    def test_exception_is_counted_and_reraised(self):
+        before = _sample("aiproxy_upstream_errors_total", provider="test", model="m3", error_type="TimeoutError")
+
+        with pytest.raises(TimeoutError), track_upstream("test", "m3"):
+            raise TimeoutError("upstream timeout")
+
+        assert (
+            _sample("aiproxy_upstream_errors_total", provider="test", model="m3", error_type="TimeoutError")
+            == before + 1
+        )
+        assert _sample("aiproxy_upstream_requests_in_progress", provider="test") == 0
+
+    def test_upstream_call_is_trace_span(self):
+        start_trace("POST /api/v1/openai/chat")
+
+        with track_upstream("test", "m5") as call:
+            call.set_status(429)
+        trace = finish_trace(200)
+
+        upstream = trace.spans[1]
+        assert (upstream.name, upstream.kind, upstream.error) == ("test.request", "llm", "http_429")
+        assert upstream.attributes == {"provider": "test", "model": "m5"}
+
+    def test_missing_model(self):
+        with track_upstream("test", None):
+            pass
+
+        assert (
+            _sample(
+                "aiproxy_upstream_request_duration_seconds_count", provider="test", model=UNKNOWN_MODEL, outcome="ok"
+            )
+            >= 1
+        )
+
+
+@pytest.mark.unit
+class TestRecordS3Bytes:
+    """Test record_s3_bytes()"""
+
+    def test_counts_bytes_per_direction(self):
+        before = _sample("aiproxy_s3_bytes_total", bucket="test-bucket", direction="in")
+
+        record_s3_bytes("test-bucket", "in", 1024)
+        record_s3_bytes("test-bucket", "in", 0)
+
+        assert _sample("aiproxy_s3_bytes_total", bucket="test-bucket", direction="in") == before + 1024
+
+
+@pytest.mark.unit
+class TestObserveHttpRequest:
+    """Test observe_http_request()"""
+
+    def test_unmatched_route_labels(self):
+        before = _sample(
+            "aiproxy_http_request_duration_seconds_count",
+            blueprint="app",
+            endpoint="unmatched",
+            method="GET",
+            status="404",
+        )
+
+        observe_http_request(None, None, "GET", 404, 0.002)
+
+        assert (
+            _sample(
+                "aiproxy_http_request_duration_seconds_count",
+                blueprint="app",
+                endpoint="unmatched",
+                method="GET",
+                status="404",
+            )
+            == before + 1
+        )
+
+
+@pytest.mark.unit
+class TestGenerateMetrics:
+    """Test generate_metrics()"""
+
+    def test_text_exposition(self, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        record_s3_bytes("test-bucket", "out", 10)
+
+        payload, content_type = generate_metrics()
+
+        assert content_type.startswith("text/plain")
+        assert b"aiproxy_s3_bytes_total" in payload
+        assert b"aiproxy_db_pool_wait_seconds_bucket" in payload
@@ -0,0 +1,214 @@
+"""Unit tests for the opt-in request profiler"""
+
+import json
+import pstats
+import time
+from datetime import datetime
+
+import pytest
+
+from utils.profiler import (
+    MODE_CPROFILE,
+    MODE_SAMPLING,
+    RequestProfile,
+    SamplingProfiler,
+    build_profile_filename,
+    get_profile_path,
+    list_profiles,
+    parse_profile_filename,
+    prune_profiles,
+    should_profile,
+    sign_profile_trigger,
+    verify_profile_trigger,
+)
+
+
+SECRET = "test-secret"
+NOW = 1_800_000_000
+
+
+def _busy(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.unit
+class TestProfileTrigger:
+    """Test signed trigger creation and verification"""
+
+    def test_valid_trigger(self):
+        trigger = sign_profile_trigger(SECRET, "/api/v1/image/list", NOW + 60)
+
+        assert verify_profile_trigger(SECRET, "/api/v1/image/list", trigger, NOW) is True
+
+    def test_trigger_is_bound_to_path(self):
+        trigger = sign_profile_trigger(SECRET, "/api/v1/image/list", NOW + 60)
+
+        assert verify_profile_trigger(SECRET, "/api/v1/song-projects", trigger, NOW) is False
+
+    def test_expired_trigger(self):
+        trigger = sign_profile_trigger(SECRET, "/a", NOW - 1)
+
+        assert verify_profile_trigger(SECRET, "/a", trigger, NOW) is False
+
+    def test_invalid_triggers(self):
+        trigger = sign_profile_trigger(SECRET, "/a", NOW + 60)
+
+        assert verify_profile_trigger("other-secret", "/a", trigger, NOW) is False
+        assert verify_profile_trigger(SECRET, "/a", f"{NOW + 120}.{trigger.split('.')[1]}", NOW) is False
+        assert verify_profile_trigger(SECRET, "/a", "1", NOW) is False
+        assert verify_profile_trigger(SECRET, "/a", "soon.abc", NOW) is False
+        assert verify_profile_trigger(SECRET, "/a", None, NOW) is False
+        assert verify_profile_trigger("", "/a", trigger, NOW) is False
+
+
+@pytest.mark.unit
+class TestShouldProfile:
+    """Test the per-request decision"""
+
+    def test_disabled_without_secret(self):
+        assert should_profile("", "/a", None, 1.0, NOW, 0.0) is False
+
+    def test_trigger_decides_when_present(self):
+        trigger = sign_profile_trigger(SECRET, "/a", NOW + 60)
+
+        assert should_profile(SECRET, "/a", trigger, 0.0, NOW, 0.99) is True
+        assert should_profile(SECRET, "/a", "bogus", 1.0, NOW, 0.0) is False
+
+    def test_sample_rate(self):
+        assert should_profile(SECRET, "/a", None, 0.1, NOW, 0.05) is True
+        assert should_profile(SECRET, "/a", None, 0.1, NOW, 0.5) is False
+        assert should_profile(SECRET, "/a", None, 0.0, NOW, 0.0) is False
+
+
+@pytest.mark.unit
+class TestProfileFilenames:
+    """Test profile file naming"""
+
+    def test_build_and_parse(self):
+        name = build_profile_filename(datetime(2026, 10, 18, 9, 30, 0), "get", "/api/v1/image/list", 12.6, "sampling")
+
+        meta = parse_profile_filename(name)
+
+        assert name.startswith("20261018T093000-")
+        assert name.endswith("-GET-api_v1_image_list-13ms.speedscope.json")
+        assert meta["method"] == "GET"
+        assert meta["path_slug"] == "api_v1_image_list"
+        assert meta["duration_ms"] == 13
+        assert meta["format"] == "speedscope"
+        assert meta["created_at"] == "2026-10-18T09:30:00+00:00"
+
+    def test_pstats_and_odd_paths(self):
+        name = build_profile_filename(datetime(2026, 1, 1), "POST", "/a b/../c?x=1", 1, "cprofile")
+
+        assert name.endswith(".pstats")
+        assert "/" not in name
+        assert parse_profile_filename(name)["format"] == "pstats"
+
+    def test_parse_rejects_foreign_names(self):
+        assert parse_profile_filename("../../etc/passwd") is None
+        assert parse_profile_filename("notes.txt") is None
+
+
+@pytest.mark.unit
+class TestProfileRing:
+    """Test the bounded on-disk ring"""
+
+    def _create(self, directory, count):
+        names = []
+        for i in range(count):
+            name = build_profile_filename(datetime(2026, 1, 1, 0, 0, i), "GET", f"/p{i}", i, "sampling")
+            (directory / name).write_text("{}")
+            names.append(name)
+        return names
+
+    def test_prune_keeps_newest(self, tmp_path):
+        names = self._create(tmp_path, 5)
+        (tmp_path / "unrelated.txt").write_text("keep")
+
+        assert prune_profiles(str(tmp_path), 3) == 2
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names[2:] + ["unrelated.txt"])
+
+    def test_list_newest_first(self, tmp_path):
+        names = self._create(tmp_path, 3)
+
+        profiles = list_profiles(str(tmp_path))
+
+        assert [p["name"] for p in profiles] == list(reversed(names))
+        assert profiles[0]["size_bytes"] == 2
+
+    def test_missing_directory(self, tmp_path):
+        assert list_profiles(str(tmp_path / "missing")) == []
+        assert prune_profiles(str(tmp_path / "missing"), 1) == 0
+
+    def test_get_profile_path(self, tmp_path):
+        name = self._create(tmp_path, 1)[0]
+
+        assert get_profile_path(str(tmp_path), name) == tmp_path / name
+        assert get_profile_path(str(tmp_path), "../secret.pstats") is None
+        assert get_profile_path(str(tmp_path), name.replace("T000000", "T000001")) is None
+
+
+@pytest.mark.unit
+class TestSamplingProfiler:
+    """Test sample aggregation and speedscope output"""
+
+    def test_consecutive_identical_stacks_are_merged(self):
+        profiler = SamplingProfiler(0, 0.001)
+        profiler.add_sample([0, 1], 1.0)
+        profiler.add_sample([0, 1], 1.5)
+        profiler.add_sample([0, 2], 1.0)
+
+        assert profiler.samples == [[0, 1], [0, 2]]
+        assert profiler.weights == [2.5, 1.0]
+
+    def test_speedscope_format(self):
+        profiler = SamplingProfiler(0, 0.001)
+        profiler.frames = [{"name": "main", "file": "app.py", "line": 1}]
+        profiler.add_sample([0], 2.0)
+
+        document = profiler.to_speedscope("GET /a")
+
+        assert document["shared"]["frames"][0]["name"] == "main"
+        profile = document["profiles"][0]
+        assert profile["type"] == "sampled"
+        assert profile["unit"] == "milliseconds"
+        assert profile["samples"] == [[0]]
+        assert profile["endValue"] == 2.0
+
+
+@pytest.mark.unit
+class TestRequestProfile:
+    """Test profiling the current thread end to end"""
+
+    def test_sampling_profile(self, tmp_path):
+        profile = RequestProfile(MODE_SAMPLING, interval_ms=1)
+        _busy(30)
+
+        name = profile.finish(str(tmp_path), 10, "GET", "/api/v1/test")
+
+        document = json.loads((tmp_path / name).read_text())
+        frame_names = {frame["name"] for frame in document["shared"]["frames"]}
+        assert "_busy" in frame_names
+        assert document["profiles"][0]["samples"]
+
+    def test_cprofile_profile(self, tmp_path):
+        try:
+            profile = RequestProfile(MODE_CPROFILE, interval_ms=1)
+        except ValueError:
+            pytest.skip("Another profiler (e.g. coverage on Python 3.12+) is active")
+        _busy(1)
+
+        name = profile.finish(str(tmp_path), 10, "POST", "/api/v1/test")
+
+        assert name.endswith(".pstats")
+        stats = pstats.Stats(str(tmp_path / name))
+        assert any(func[2] == "_busy" for func in stats.stats)
+
+    def test_unknown_mode_falls_back_to_sampling(self, tmp_path):
+        profile = RequestProfile("flamegraph", interval_ms=1)
+
+        assert profile.mode == MODE_SAMPLING
+        assert profile.stop() >= 0
@@ -0,0 +1,218 @@
+"""Unit tests for in-process request tracing"""
+
+import json
+import time
+
+import pytest
+
+from utils.tracing import (
+    KIND_DB,
+    KIND_ORCHESTRATOR,
+    KIND_S3,
+    NOOP_SPAN,
+    TraceRing,
+    end_span,
+    export_otlp_file,
+    finish_trace,
+    get_current_trace,
+    span,
+    start_span,
+    start_trace,
+    to_otlp,
+    trace_methods,
+    trace_ring,
+    traced,
+)
+
+
+def _busy(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clean_trace():
+    yield
+    finish_trace()
+    trace_ring.clear()
+
+
+@trace_methods(KIND_ORCHESTRATOR)
+class _Orchestrator:
+    def load(self, value):
+        with span("s3.get", KIND_S3, key=value):
+            _busy(2)
+        return value
+
+    @staticmethod
+    def build(value):
+        return value * 2
+
+    @classmethod
+    def create(cls):
+        return cls()
+
+    def stream(self):
+        yield 1
+
+    def _private(self):
+        return "private"
+
+
+@pytest.mark.unit
+class TestSpans:
+    """Test span nesting and the timing breakdown"""
+
+    def test_no_trace_is_noop(self):
+        with span("s3.get", KIND_S3) as current:
+            current.set_attribute("key", "a")
+
+        assert current is NOOP_SPAN
+        assert start_span("db.execute", KIND_DB) is None
+        assert get_current_trace() is None
+
+    def test_nesting_and_self_time(self):
+        start_trace("GET /api/v1/test")
+        with span("orchestrator", KIND_ORCHESTRATOR) as outer:
+            _busy(2)
+            with span("db.execute", KIND_DB, statement="SELECT 1") as inner:
+                _busy(5)
+        trace = finish_trace(200)
+
+        assert inner.parent is outer
+        assert outer.parent is trace.root
+        assert inner.attributes == {"statement": "SELECT 1"}
+        breakdown = trace.breakdown()
+        assert breakdown["db"] >= 5
+        assert 2 <= breakdown["orchestrator"] < breakdown["db"]
+        assert sum(breakdown.values()) == pytest.approx(trace.duration_ms, abs=0.01)
+        assert trace.root.attributes["http.status_code"] == 200
+        assert trace_ring.get(trace.trace_id) is trace
+
+    def test_exception_marks_span(self):
+        start_trace("GET /a")
+        with pytest.raises(KeyError), span("lookup"):
+            raise KeyError("x")
+        trace = finish_trace(500, error="KeyError")
+
+        assert trace.spans[1].error == "KeyError"
+        assert trace.root.error == "KeyError"
+        assert trace.to_summary()["error"] == "KeyError"
+
+    def test_manual_spans_restore_parent(self):
+        trace = start_trace("GET /a")
+        db_span = start_span("db.execute", KIND_DB)
+        end_span(db_span, "OperationalError")
+        end_span(None)
+
+        with span("after") as after:
+            pass
+
+        assert db_span.error == "OperationalError"
+        assert after.parent is trace.root
+
+    def test_max_spans_keeps_breakdown(self):
+        start_trace("GET /many", max_spans=3)
+        for _ in range(10):
+            with span("db.execute", KIND_DB):
+                _busy(0.2)
+        trace = finish_trace()
+
+        assert len(trace.spans) == 3
+        assert trace.dropped_spans == 8
+        assert trace.breakdown()["db"] >= 2
+        assert trace.root.child_ns > 0
+
+    def test_server_timing_header(self):
+        start_trace("GET /a")
+        with span("s3.get", KIND_S3):
+            _busy(1)
+        header = finish_trace().to_server_timing()
+
+        assert header.startswith("s3;dur=")
+        assert "route;dur=" in header
+        assert header.endswith(f"total;dur={header.rsplit('=', 1)[1]}")
+
+
+@pytest.mark.unit
+class TestDecorators:
+    """Test traced() and trace_methods()"""
+
+    def test_trace_methods(self):
+        trace = start_trace("GET /a")
+        orchestrator = _Orchestrator.create()
+
+        assert orchestrator.load("key") == "key"
+        assert _Orchestrator.build(2) == 4
+        assert list(orchestrator.stream()) == [1]
+        assert orchestrator._private() == "private"
+
+        names = [span.name for span in trace.spans]
+        assert names == ["GET /a", "_Orchestrator.create", "_Orchestrator.load", "s3.get", "_Orchestrator.build"]
+        assert trace.spans[3].parent is trace.spans[2]
+        assert trace.spans[2].kind == KIND_ORCHESTRATOR
+
+    def test_traced_without_trace(self):
+        @traced()
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.__name__ == "add"
+
+
+@pytest.mark.unit
+class TestRingAndExport:
+    """Test the trace ring and the OTLP/JSON exporter"""
+
+    def test_ring_is_bounded_and_newest_first(self):
+        ring = TraceRing(2)
+        traces = []
+        for name in ("a", "b", "c"):
+            traces.append(start_trace(name))
+            finish_trace()
+            ring.add(traces[-1])
+
+        assert [trace.name for trace in ring.list()] == ["c", "b"]
+        assert ring.get(traces[0].trace_id) is None
+
+    def test_to_otlp(self):
+        start_trace("GET /a", **{"http.method": "GET"})
+        with span("db.execute", KIND_DB, rows=3, ratio=0.5, cached=False):
+            pass
+        trace = finish_trace(404)
+
+        document = to_otlp(trace)
+
+        resource_spans = document["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "aiproxysrv"}
+        root, db_span = resource_spans["scopeSpans"][0]["spans"]
+        assert root["traceId"] == trace.trace_id
+        assert root["kind"] == 2
+        assert root["parentSpanId"] == ""
+        assert db_span["parentSpanId"] == root["spanId"]
+        assert db_span["kind"] == 3
+        assert int(db_span["startTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        attributes = {item["key"]: item["value"] for item in db_span["attributes"]}
+        assert attributes == {
+            "aiproxy.kind": {"stringValue": "db"},
+            "rows": {"intValue": "3"},
+            "ratio": {"doubleValue": 0.5},
+            "cached": {"boolValue": False},
+        }
+
+    def test_export_otlp_file_appends_lines(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        for _ in range(2):
+            start_trace("GET /a")
+            export_otlp_file(finish_trace(), str(path))
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "GET /a"
+
+    def test_export_errors_are_swallowed(self, tmp_path):
+        start_trace("GET /a")
+
+        export_otlp_file(finish_trace(), str(tmp_path / "missing" / "traces.jsonl"))
@@ -0,0 +1,35 @@
+"""Unit tests for the cached application version"""
+
+import tomllib
+
+import pytest
+
+from utils import version
+from utils.version import get_version
+
+
+@pytest.mark.unit
+class TestGetVersion:
+    """Test get_version"""
+
+    def test_reads_pyproject(self):
+        with open(version.PYPROJECT_PATH, "rb") as f:
+            expected = tomllib.load(f)["project"]["version"]
+
+        assert get_version() == expected
+
+    def test_is_read_once(self, mocker):
+        get_version.cache_clear()
+        load = mocker.spy(tomllib, "load")
+
+        get_version()
+        get_version()
+
+        assert load.call_count == 1
+
+    def test_missing_file_is_unknown(self, mocker, tmp_path):
+        mocker.patch.object(version, "PYPROJECT_PATH", tmp_path / "missing.toml")
+        get_version.cache_clear()
+
+        assert get_version() == "unknown"
+        get_version.cache_clear()
@@ -0,0 +1,76 @@
+"""Unit tests for the streaming ZIP writer"""
+
+import io
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from utils.zip_stream import MISSING_FILES_ARCNAME, ZipStreamEntry, stream_zip
+
+
+def _chunks(*chunks: bytes):
+    return lambda: iter(chunks)
+
+
+def _unreadable():
+    raise FileNotFoundError("NoSuchKey")
+
+
+def _read(parts) -> zipfile.ZipFile:
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(parts)))
+    assert archive.testzip() is None
+    return archive
+
+
+@pytest.mark.unit
+class TestStreamZip:
+    """Test stream_zip()"""
+
+    def test_entries_are_readable(self):
+        archive = _read(
+            stream_zip(
+                [
+                    ZipStreamEntry("Stems/", 0),
+                    ZipStreamEntry("Stems/drums.wav", 6, datetime(2025, 5, 1, 12, 30), _chunks(b"RIFF", b"..")),
+                    ZipStreamEntry("lyrics.txt", 1000, None, _chunks(b"la " * 333, b"!"), compress=True),
+                ]
+            )
+        )
+
+        assert archive.namelist() == ["Stems/", "Stems/drums.wav", "lyrics.txt"]
+        assert archive.read("Stems/drums.wav") == b"RIFF.."
+        assert archive.getinfo("Stems/drums.wav").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("Stems/drums.wav").date_time == (2025, 5, 1, 12, 30, 0)
+        assert archive.getinfo("lyrics.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo("Stems/").is_dir()
+
+    def test_output_is_streamed_per_chunk(self):
+        """Constant memory: no yielded piece is much larger than one chunk"""
+        chunk = b"x" * 64 * 1024
+        parts = list(stream_zip([ZipStreamEntry("big.wav", 20 * len(chunk), None, _chunks(*[chunk] * 20))]))
+
+        assert len(parts) >= 20
+        assert max(len(part) for part in parts) < 2 * len(chunk)
+        assert _read(parts).getinfo("big.wav").file_size == 20 * len(chunk)
+
+    def test_unknown_size_uses_zip64(self):
+        archive = _read(stream_zip([ZipStreamEntry("unknown.wav", None, None, _chunks(b"abc"))]))
+
+        assert archive.read("unknown.wav") == b"abc"
+
+    def test_unreadable_entries_are_listed(self):
+        archive = _read(
+            stream_zip(
+                [
+                    ZipStreamEntry("gone.wav", 3, None, _unreadable),
+                    ZipStreamEntry("ok.wav", 2, None, _chunks(b"ok")),
+                ]
+            )
+        )
+
+        assert archive.namelist() == ["ok.wav", MISSING_FILES_ARCNAME]
+        assert archive.read(MISSING_FILES_ARCNAME) == b"gone.wav\n"
+
+    def test_empty_archive(self):
+        assert _read(stream_zip([])).namelist() == []
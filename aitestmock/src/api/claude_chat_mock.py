@@ -0,0 +1,166 @@
+"""
+Mock Claude Messages API - Simulates Anthropic Messages API (incl. prompt caching usage) for testing
+"""
+
+import hashlib
+import json
+import time
+
+from flask import Blueprint, jsonify, request
+
+from utils.latency import simulate_chat_latency
+
+
+api_claude_chat_mock = Blueprint(
+    "api_claude_chat_mock", __name__, url_prefix="/api/v1/claude"
+)
+
+# Prefix fingerprints seen so far (process-local, simulates Anthropic's prompt cache)
+_prompt_cache: set[str] = set()
+
+
+def _block_text(content) -> str:
+    """Return text of a string or list-of-blocks content"""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") for block in content if block.get("type") == "text"
+    )
+
+
+def _has_breakpoint(content) -> bool:
+    """Check if a string or list-of-blocks content carries a cache_control marker"""
+    return isinstance(content, list) and any(
+        "cache_control" in block for block in content
+    )
+
+
+def _count_tokens(text: str) -> int:
+    """Rough token estimate (words), same approximation as the OpenAI chat mock"""
+    return len(text.split())
+
+
+def _simulate_cache_usage(system, messages: list[dict]) -> dict:
+    """
+    Compute usage fields like Anthropic does for cache_control breakpoints.
+
+    Everything up to the longest previously cached prefix is a cache read,
+    everything up to the last breakpoint of this request is a cache write,
+    the remainder is regular input.
+    """
+    segments = []  # (text, is_breakpoint)
+    if system:
+        segments.append((_block_text(system), _has_breakpoint(system)))
+    for msg in messages:
+        segments.append(
+            (
+                f"{msg.get('role')}:{_block_text(msg.get('content', ''))}",
+                _has_breakpoint(msg.get("content")),
+            )
+        )
+
+    total_tokens = 0
+    read_tokens = 0
+    written_tokens = 0
+    digest = hashlib.sha256()
+    for text, is_breakpoint in segments:
+        digest.update(json.dumps(text).encode())
+        total_tokens += _count_tokens(text)
+        fingerprint = digest.hexdigest()
+        # Lookback: any block boundary that matches an earlier breakpoint is a cache hit
+        if fingerprint in _prompt_cache:
+            read_tokens = total_tokens
+        elif is_breakpoint:
+            written_tokens = total_tokens
+            _prompt_cache.add(fingerprint)
+
+    cache_creation = max(written_tokens - read_tokens, 0)
+    cached_total = read_tokens + cache_creation
+    return {
+        "input_tokens": total_tokens - cached_total,
+        "cache_creation_input_tokens": cache_creation,
+        "cache_read_input_tokens": read_tokens,
+    }
+
+
+@api_claude_chat_mock.route("/models", methods=["GET"])
+def get_models():
+    """Mock GET /v1/models endpoint"""
+    response = {
+        "data": [
+            {
+                "id": "claude-sonnet-4-5-20250929",
+                "display_name": "Claude Sonnet 4.5",
+                "type": "model",
+            },
+            {
+                "id": "claude-haiku-4-5-20250929",
+                "display_name": "Claude Haiku 4.5",
+                "type": "model",
+            },
+            {
+                "id": "claude-opus-4-5-20251101",
+                "display_name": "Claude Opus 4.5",
+                "type": "model",
+            },
+        ],
+        "has_more": False,
+    }
+    return jsonify(response), 200
+
+
+@api_claude_chat_mock.route("/messages", methods=["POST"])
+def messages_create():
+    """
+    Mock Claude Messages endpoint
+    Test scenarios:
+    - "0001" in message → Success
+    - "0002" in message → Auth Error (401)
+    Usage echoes prompt caching fields (cache_creation_input_tokens, cache_read_input_tokens)
+    """
+    raw_json = request.get_json(silent=True)
+
+    if not raw_json:
+        return jsonify({"error": "No JSON provided"}), 400
+
+    simulate_chat_latency(request.get_data())
+
+    messages = raw_json.get("messages", [])
+    model = raw_json.get("model", "claude-sonnet-4-5-20250929")
+
+    if not messages:
+        return jsonify({"error": "No messages provided"}), 400
+
+    last_message = ""
+    for msg in reversed(messages):
+        if msg.get("role") == "user":
+            last_message = _block_text(msg.get("content", ""))
+            break
+
+    if "0002" in last_message:
+        return jsonify(
+            {
+                "type": "error",
+                "error": {
+                    "type": "authentication_error",
+                    "message": "invalid x-api-key",
+                },
+            }
+        ), 401
+
+    mock_response_text = f"This is a mock response from {model}. I received your message: '{last_message[:100]}...'."
+
+    usage = _simulate_cache_usage(raw_json.get("system"), messages)
+    usage["output_tokens"] = _count_tokens(mock_response_text)
+
+    response = {
+        "id": f"msg_mock_{int(time.time())}",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": mock_response_text}],
+        "stop_reason": "end_turn",
+        "usage": usage,
+    }
+
+    return jsonify(response), 200
@@ -6,6 +6,8 @@ import time
 
 from flask import Blueprint, jsonify, request
 
+from utils.latency import simulate_chat_latency
+
 
 api_openai_chat_mock = Blueprint(
     "api_openai_chat_mock", __name__, url_prefix="/api/v1/openai/chat"
@@ -45,6 +47,8 @@ def chat_completions():
     if not raw_json:
         return jsonify({"error": "No JSON provided"}), 400
 
+    simulate_chat_latency(request.get_data())
+
     # Extract messages from request
     messages = raw_json.get("messages", [])
     model = raw_json.get("model", "gpt-4o")
@@ -18,3 +18,11 @@ DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 # loguru
 # --------------------------------------------------
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "WARNING")
+
+# --------------------------------------------------
+# Simulated chat latency (load tests, see scripts/loadtest)
+# --------------------------------------------------
+# Chat mocks answer after MOCK_CHAT_LATENCY_MS plus a jitter of up to MOCK_CHAT_JITTER_MS.
+# The jitter is derived from the request body, so identical runs see identical delays.
+MOCK_CHAT_LATENCY_MS = int(os.getenv("MOCK_CHAT_LATENCY_MS", "0"))
+MOCK_CHAT_JITTER_MS = int(os.getenv("MOCK_CHAT_JITTER_MS", "0"))
@@ -8,6 +8,7 @@ from flask import Flask
 from flask_cors import CORS
 
 from api.chat import api_chat_mock
+from api.claude_chat_mock import api_claude_chat_mock
 from api.mureka import mureka_routes
 from api.openai import openai_routes
 from api.openai_chat_mock import api_openai_chat_mock
@@ -38,6 +39,7 @@ def create_app():
     app.register_blueprint(mureka_routes, url_prefix="/v1")
     app.register_blueprint(api_chat_mock)
     app.register_blueprint(api_openai_chat_mock)
+    app.register_blueprint(api_claude_chat_mock)
 
     @app.route("/health")
     def health():
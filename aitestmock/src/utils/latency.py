@@ -0,0 +1,25 @@
+"""
+Simulated upstream latency for chat mocks (reproducible between runs)
+"""
+
+import hashlib
+import time
+
+from config.settings import MOCK_CHAT_JITTER_MS, MOCK_CHAT_LATENCY_MS
+
+
+def chat_delay_ms(body: bytes) -> int:
+    """Delay for a chat request: fixed latency + jitter derived from the request body"""
+    if MOCK_CHAT_JITTER_MS <= 0:
+        return MOCK_CHAT_LATENCY_MS
+    jitter = int.from_bytes(hashlib.sha256(body).digest()[:4], "big") % (
+        MOCK_CHAT_JITTER_MS + 1
+    )
+    return MOCK_CHAT_LATENCY_MS + jitter
+
+
+def simulate_chat_latency(body: bytes) -> None:
+    """Sleep like a real chat API would (no-op with the default settings)"""
+    delay_ms = chat_delay_ms(body)
+    if delay_ms > 0:
+        time.sleep(delay_ms / 1000)
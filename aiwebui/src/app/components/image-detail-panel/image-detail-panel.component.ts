@@ -191,8 +191,8 @@ export class ImageDetailPanelComponent implements OnInit, OnChanges {
     }
 
     private loadImageBlob() {
-        // Use display_url if available (overlay version), otherwise fallback to url (original)
-        const imageUrl = this.image?.display_url || this.image?.url;
+        // Panel shows at most ~400px: preview derivative, then display_url (overlay version), then url (original)
+        const imageUrl = this.image?.preview_url || this.image?.display_url || this.image?.url;
 
         if (imageUrl) {
             this.resourceBlobService.getResourceBlobUrl(imageUrl).subscribe({
@@ -31,6 +31,9 @@ export interface ProjectFolder {
     folder_type: string;
     s3_prefix: string;
     custom_icon?: string;
+    file_count?: number;  // Maintained statistics (no file list needed)
+    total_size_bytes?: number;
+    files_modified_at?: string | null;
     created_at: string; // ISO format
 }
 
@@ -98,8 +101,9 @@ export interface ProjectFolderWithAssets extends ProjectFolderWithFiles {
 }
 
 export interface SongProjectDetail extends SongProject {
-    total_files: number;  // Live calculated
-    total_size_bytes: number;  // Live calculated
+    total_files: number;  // Maintained statistics
+    total_size_bytes: number;  // Maintained statistics
+    files_modified_at?: string | null;
     folders: ProjectFolderWithAssets[];
     assigned_releases?: AssignedRelease[];
     // All assigned assets (regardless of folder) - for Metadata tab
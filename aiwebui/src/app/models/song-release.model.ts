@@ -59,6 +59,7 @@ export interface SongReleaseListItem {
     genre: string;
     release_date?: string;
     cover_url?: string;
+    cover_thumbnail_url?: string; // cover_url?size=thumb (WebP 320px)
 }
 
 export interface SongReleaseListResponse {
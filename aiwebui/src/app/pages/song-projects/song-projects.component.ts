@@ -159,10 +159,10 @@ export class SongProjectsComponent implements OnInit, OnDestroy {
             this.pagination.offset = offset;
             this.totalProjects = response.pagination.total;
 
-            // Load cover images as blobs (with JWT authentication)
+            // Load cover thumbnails as blobs (with JWT authentication)
             this.projectList.forEach(project => {
                 if (project.cover_info?.source === "release" && project.cover_info.release_id) {
-                    const coverUrl = `${this.apiConfig.endpoints.songRelease.detail(project.cover_info.release_id)}/cover`;
+                    const coverUrl = `${this.apiConfig.endpoints.songRelease.detail(project.cover_info.release_id)}/cover?size=thumb`;
                     this.resourceBlobService.getResourceBlobUrl(coverUrl)
                         .pipe(takeUntil(this.destroy$))
                         .subscribe({
@@ -142,10 +142,11 @@ export class SongReleaseGalleryComponent implements OnInit, OnDestroy {
                 this.releaseList = response.items || [];
                 this.pagination.total = response.total || 0;
 
-                // Load cover blob URLs for all list items
+                // Load cover thumbnails for all list items (original cover as fallback)
                 this.releaseList.forEach(release => {
-                    if (release.cover_url) {
-                        this.resourceBlobService.getResourceBlobUrl(release.cover_url)
+                    const coverUrl = release.cover_thumbnail_url || release.cover_url;
+                    if (coverUrl) {
+                        this.resourceBlobService.getResourceBlobUrl(coverUrl)
                             .pipe(takeUntil(this.destroy$))
                             .subscribe({
                                 next: (blobUrl) => {
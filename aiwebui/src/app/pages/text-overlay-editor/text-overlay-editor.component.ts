@@ -17,7 +17,7 @@ import {MatRadioModule} from "@angular/material/radio";
 import {MatTooltipModule} from "@angular/material/tooltip";
 import {MatTabsModule} from "@angular/material/tabs";
 import {takeUntilDestroyed} from "@angular/core/rxjs-interop";
-import {debounceTime} from "rxjs";
+import {catchError, debounceTime, filter, Observable, of, switchMap} from "rxjs";
 
 import {ApiConfigService} from "../../services/config/api-config.service";
 import {NotificationService} from "../../services/ui/notification.service";
@@ -126,14 +126,20 @@ export class TextOverlayEditorComponent implements OnInit {
         this.loadImages();
         this.loadUserProfile();
 
-        // Update canvas preview on form changes (debounced)
+        // Update preview on form changes (debounced, server-rendered with the backend fonts,
+        // a newer change cancels the pending request)
         this.form.valueChanges
             .pipe(
                 debounceTime(300),
+                filter(() => !!this.selectedImage),
+                switchMap(() => this.requestServerPreview()),
                 takeUntilDestroyed(this.destroyRef)
             )
-            .subscribe(() => {
-                if (this.selectedImage) {
+            .subscribe((blob) => {
+                if (blob) {
+                    this.serverPreviewShown = true;
+                    this.renderCanvasWithImage(blob, false, true);
+                } else {
                     this.updateCanvasPreview();
                 }
             });
@@ -176,6 +182,7 @@ export class TextOverlayEditorComponent implements OnInit {
 
     onImageSelect(imageId: string): void {
         this.selectedImage = this.images.find(img => img.id === imageId) || null;
+        this.serverPreviewShown = false;
         if (this.selectedImage) {
             // Automatically fill title field with image title
             if (this.selectedImage.title) {
@@ -188,6 +195,8 @@ export class TextOverlayEditorComponent implements OnInit {
     }
 
     private cachedImageBlob: Blob | null = null;
+    private serverPreviewShown = false;  // Server preview of the selected image is on the canvas
+    private renderSequence = 0;  // Only the latest render request may draw (image loads are async)
 
     loadImageOnCanvas(): void {
         if (!this.selectedImage || !this.canvasRef) return;
@@ -206,7 +215,10 @@ export class TextOverlayEditorComponent implements OnInit {
             .subscribe({
                 next: (blob) => {
                     this.cachedImageBlob = blob;
-                    this.renderCanvasWithImage(blob, false);
+                    // Original image (with canvas text as long as no server preview arrived)
+                    if (!this.serverPreviewShown) {
+                        this.renderCanvasWithImage(blob, true);
+                    }
                 },
                 error: (error) => {
                     console.error("Failed to load image:", error);
@@ -215,30 +227,54 @@ export class TextOverlayEditorComponent implements OnInit {
             });
     }
 
+    /**
+     * Low-resolution preview rendered by the backend (same renderer as apply, nothing stored).
+     * Emits null without title or on errors - the caller falls back to the canvas preview.
+     */
+    private requestServerPreview(): Observable<Blob | null> {
+        if (!this.form.value.title) {
+            return of(null);
+        }
+        return this.http.post(
+            this.apiConfig.endpoints.image.addTextOverlayPreview,
+            this.buildOverlayPayload(),
+            {responseType: "blob"}
+        ).pipe(
+            catchError((error) => {
+                console.error("Failed to render server preview:", error);
+                return of(null);
+            })
+        );
+    }
+
     updateCanvasPreview(): void {
         if (!this.cachedImageBlob) return;
         this.renderCanvasWithImage(this.cachedImageBlob, true);
     }
 
-    private renderCanvasWithImage(blob: Blob, withText: boolean): void {
+    private renderCanvasWithImage(blob: Blob, withText: boolean, withMarkers = false): void {
         if (!this.canvasRef) return;
 
         const canvas = this.canvasRef.nativeElement;
         const ctx = canvas.getContext("2d");
         if (!ctx) return;
 
+        const sequence = ++this.renderSequence;
         const objectUrl = URL.createObjectURL(blob);
         const img = new Image();
         img.onload = () => {
+            URL.revokeObjectURL(objectUrl);
+            if (sequence !== this.renderSequence) return;
+
             canvas.width = img.width;
             canvas.height = img.height;
             ctx.drawImage(img, 0, 0);
 
             if (withText) {
                 this.drawTextOverlay(ctx, canvas);
+            } else if (withMarkers) {
+                this.drawPositionMarkers(ctx, canvas);
             }
-
-            URL.revokeObjectURL(objectUrl);
         };
         img.src = objectUrl;
     }
@@ -330,10 +366,19 @@ export class TextOverlayEditorComponent implements OnInit {
             });
         }
 
+        this.drawPositionMarkers(ctx, canvas);
+    }
+
+    private drawPositionMarkers(ctx: CanvasRenderingContext2D, canvas: HTMLCanvasElement): void {
+        const formValues = this.form.value;
+        if (!formValues.title) return;
+
         // Draw visual markers for positions (showing top-left anchor point)
+        const titlePosition = this.getTitlePosition(formValues);
         this.drawPositionMarker(ctx, canvas, titlePosition.x * 100, titlePosition.y * 100);
 
-        if (artist && artistPosition) {
+        if (formValues.artist) {
+            const artistPosition = this.getArtistPosition(formValues);
             this.drawPositionMarker(ctx, canvas, artistPosition.x * 100, artistPosition.y * 100);
         }
     }
@@ -565,6 +610,31 @@ export class TextOverlayEditorComponent implements OnInit {
         }
 
         this.isProcessing = true;
+
+        this.http.post<{ image_id: string; image_url: string }>(
+            this.apiConfig.endpoints.image.addTextOverlay,
+            this.buildOverlayPayload()
+        )
+            .pipe(takeUntilDestroyed(this.destroyRef))
+            .subscribe({
+                next: (response) => {
+                    this.isProcessing = false;
+                    this.resultImageFilePath = response.image_url;
+                    this.notificationService.success(this.translate.instant("textOverlayEditor.success.applied"));
+                    this.loadImages(); // Reload image list
+                },
+                error: (error) => {
+                    this.isProcessing = false;
+                    console.error("Failed to apply text overlay:", error);
+                    this.notificationService.error(this.translate.instant("textOverlayEditor.errors.applyFailed"));
+                }
+            });
+    }
+
+    /**
+     * Request body for apply and preview (same parameters, so the preview matches the result)
+     */
+    private buildOverlayPayload(): Record<string, unknown> {
         const formValues = this.form.value;
 
         // Convert pixel font sizes to percentage (backend expects 0.0-1.0)
@@ -572,7 +642,7 @@ export class TextOverlayEditorComponent implements OnInit {
         const titleFontSizePct = formValues.titleFontSize / 1024;
         const artistFontSizePct = formValues.artistFontSize / 1024;
 
-        const payload = {
+        return {
             image_id: formValues.imageId,
             title: formValues.title,
             artist: formValues.artist || null,
@@ -588,25 +658,6 @@ export class TextOverlayEditorComponent implements OnInit {
             artist_outline_color: formValues.artistOutlineColor,
             artist_font_style: formValues.useCustomArtistFont ? formValues.artistFontStyle : null
         };
-
-        this.http.post<{ image_id: string; image_url: string }>(
-            this.apiConfig.endpoints.image.addTextOverlay,
-            payload
-        )
-            .pipe(takeUntilDestroyed(this.destroyRef))
-            .subscribe({
-                next: (response) => {
-                    this.isProcessing = false;
-                    this.resultImageFilePath = response.image_url;
-                    this.notificationService.success(this.translate.instant("textOverlayEditor.success.applied"));
-                    this.loadImages(); // Reload image list
-                },
-                error: (error) => {
-                    this.isProcessing = false;
-                    console.error("Failed to apply text overlay:", error);
-                    this.notificationService.error(this.translate.instant("textOverlayEditor.errors.applyFailed"));
-                }
-            });
     }
 
     downloadResult(): void {
@@ -42,6 +42,7 @@ export class ApiConfigService {
             update: (id: string) => `${this.baseUrl}/api/v1/image/${id}`,
             bulkDelete: `${this.baseUrl}/api/v1/image/bulk-delete`,
             addTextOverlay: `${this.baseUrl}/api/v1/image/add-text-overlay`,
+            addTextOverlayPreview: `${this.baseUrl}/api/v1/image/add-text-overlay/preview`,
             assignToProject: (id: string) => `${this.baseUrl}/api/v1/image/id/${id}/assign-to-project`,
             unassignFromProject: (imageId: string, projectId: string) => `${this.baseUrl}/api/v1/image/id/${imageId}/unassign-from-project/${projectId}`,
             getProjects: (id: string) => `${this.baseUrl}/api/v1/image/id/${id}/projects`
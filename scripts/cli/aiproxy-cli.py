@@ -11,6 +11,7 @@ Command-line tool for uploading files to Song Projects.
 
 import os
 import sys
+import time
 
 REQUIRED_CONDA_ENV = "mac_ki_service_py312"
 
@@ -63,6 +64,8 @@ from rich.progress import (
 from datetime import datetime, UTC
 import urllib3
 import fnmatch
+import zipfile
+from urllib.parse import unquote
 
 # Disable SSL warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -71,6 +74,14 @@ console = Console()
 CONFIG_DIR = Path.home() / ".aiproxy"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 GLOBAL_IGNORE_FILE = CONFIG_DIR / ".aiproxyignore"
+FILE_LIST_PAGE_SIZE = 1000  # Files per request when fetching folder listings
+MANIFEST_BATCH_SIZE = 100  # Directory paths per manifest request (server limit)
+MANIFEST_HASH_MODULUS = 2**256
+CLAIM_BATCH_SIZE = 1000  # Files per claim request (server limit)
+CHUNKED_UPLOAD_THRESHOLD = (
+    64 * 1024 * 1024
+)  # Larger files use resumable upload sessions
+CHUNK_MAX_RETRIES = 5  # Attempts per chunk (an aborted run resumes on the next run)
 
 
 # ============================================================
@@ -258,6 +269,271 @@ def check_storage_health(config):
         return False
 
 
+# ============================================================
+# Mirror Manifest (Merkle tree, same hashing as aiproxysrv business/song_project_manifest_transformer.py)
+# ============================================================
+
+
+def build_local_manifest(local_files):
+    """
+    Build directory hashes of the local tree
+
+    A file contributes SHA256("<path>\\n<file_hash>") as integer, a directory hash
+    is the sum of all file values below it modulo 2**256 (hex, 64 chars).
+
+    Returns:
+        Dict path -> {"hash", "file_count", "dirs": {name, ...}, "files": {name: file_hash}}
+        ("" = folder root)
+    """
+    nodes = {"": {"sum": 0, "file_count": 0, "dirs": set(), "files": {}}}
+
+    for f in local_files:
+        rel_path = f["relative_path"]
+        leaf = int(
+            hashlib.sha256(f"{rel_path}\n{f['file_hash']}".encode()).hexdigest(), 16
+        )
+        parts = rel_path.split("/")
+        dir_paths = [""] + ["/".join(parts[: i + 1]) for i in range(len(parts) - 1)]
+
+        for i, dir_path in enumerate(dir_paths):
+            node = nodes.setdefault(
+                dir_path, {"sum": 0, "file_count": 0, "dirs": set(), "files": {}}
+            )
+            node["sum"] += leaf
+            node["file_count"] += 1
+            if i + 1 < len(dir_paths):
+                node["dirs"].add(parts[i])
+        nodes[dir_paths[-1]]["files"][parts[-1]] = f["file_hash"]
+
+    for node in nodes.values():
+        node["hash"] = format(node.pop("sum") % MANIFEST_HASH_MODULUS, "064x")
+    return nodes
+
+
+def fetch_manifest_nodes(config, project_id, folder_id, paths, children):
+    """
+    Fetch manifest nodes for directory paths
+
+    Returns:
+        List of nodes, or None if the server does not provide a manifest
+    """
+    url = f"{config['api_url']}/api/v1/song-projects/{project_id}/folders/{folder_id}/manifest"
+    response = requests.get(
+        url,
+        headers={"Authorization": f"Bearer {config['jwt_token']}"},
+        params={"path": paths, "children": str(children).lower()},
+        verify=config.get("ssl_verify", False),
+        timeout=30,
+    )
+    if response.status_code != 200:
+        return None
+    return response.json()["data"]["nodes"]
+
+
+def claim_stored_files(config, project_id, folder_id, files):
+    """
+    Let the server create/update files whose content it already stores (no upload)
+
+    Returns:
+        Set of claimed relative paths (empty if the server does not deduplicate)
+    """
+    url = f"{config['api_url']}/api/v1/song-projects/{project_id}/folders/{folder_id}/files/claim"
+    claimed = set()
+    for i in range(0, len(files), CLAIM_BATCH_SIZE):
+        batch = [
+            {
+                "relative_path": f["relative_path"],
+                "file_hash": f["file_hash"],
+                "file_size_bytes": f["file_size_bytes"],
+            }
+            for f in files[i : i + CLAIM_BATCH_SIZE]
+        ]
+        response = requests.post(
+            url,
+            headers={"Authorization": f"Bearer {config['jwt_token']}"},
+            json={"files": batch},
+            verify=config.get("ssl_verify", False),
+            timeout=60,
+        )
+        if response.status_code != 200:
+            break
+        claimed.update(f["relative_path"] for f in response.json()["data"]["claimed"])
+    return claimed
+
+
+def hash_file(file_path):
+    """SHA256 of a file, read in 8 MB blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for block in iter(lambda: fh.read(8 * 1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def upload_file_resumable(
+    config, project_id, folder_id, file_path, rel_path, file_hash=None, on_chunk=None
+):
+    """
+    Upload one large file in chunks through an upload session
+
+    Creating the session again for the same path, hash and size returns the parts the
+    server already has, so an interrupted upload resumes where it stopped. Each chunk is
+    retried with backoff.
+
+    Args:
+        on_chunk: Optional callback(done_parts, part_count) for progress display
+
+    Returns:
+        Tuple (success, error message or None)
+    """
+    base_url = f"{config['api_url']}/api/v1/song-projects/{project_id}"
+    headers = {"Authorization": f"Bearer {config['jwt_token']}"}
+    verify = config.get("ssl_verify", False)
+
+    response = requests.post(
+        f"{base_url}/folders/{folder_id}/upload-sessions",
+        headers=headers,
+        json={
+            "relative_path": rel_path,
+            "file_hash": file_hash or hash_file(file_path),
+            "file_size_bytes": Path(file_path).stat().st_size,
+        },
+        verify=verify,
+        timeout=60,
+    )
+    if response.status_code != 201:
+        return False, response.json().get("error", f"HTTP {response.status_code}")
+
+    session = response.json()["data"]
+    session_url = f"{base_url}/upload-sessions/{session['id']}"
+    chunk_size = session["chunk_size"]
+    done_parts = len(session["received_parts"])
+
+    with open(file_path, "rb") as fh:
+        for part_number in session["missing_parts"]:
+            fh.seek((part_number - 1) * chunk_size)
+            chunk = fh.read(chunk_size)
+            chunk_headers = {
+                **headers,
+                "Content-Type": "application/octet-stream",
+                "X-Chunk-SHA256": hashlib.sha256(chunk).hexdigest(),
+            }
+
+            error = None
+            for attempt in range(1, CHUNK_MAX_RETRIES + 1):
+                try:
+                    response = requests.put(
+                        f"{session_url}/parts/{part_number}",
+                        headers=chunk_headers,
+                        data=chunk,
+                        verify=verify,
+                        timeout=300,
+                    )
+                    if response.status_code == 200:
+                        error = None
+                        break
+                    error = response.json().get("error", f"HTTP {response.status_code}")
+                    if response.status_code in (404, 409, 410):
+                        return False, error
+                except requests.exceptions.RequestException as e:
+                    error = str(e)
+                time.sleep(min(2**attempt, 30))
+
+            if error:
+                return (
+                    False,
+                    f"Part {part_number} failed: {error} (run again to resume)",
+                )
+            done_parts += 1
+            if on_chunk:
+                on_chunk(done_parts, session["part_count"])
+
+    response = requests.post(
+        f"{session_url}/complete", headers=headers, verify=verify, timeout=600
+    )
+    if response.status_code != 200:
+        return False, response.json().get("error", f"HTTP {response.status_code}")
+    return True, None
+
+
+def is_in_scopes(rel_path, scopes):
+    """True if rel_path lies below one of the scope directories (None = no scoping)"""
+    if scopes is None:
+        return True
+    return any(scope == "" or rel_path.startswith(f"{scope}/") for scope in scopes)
+
+
+def find_changed_scopes(config, project_id, folder_id, local_manifest):
+    """
+    Compare local and remote manifest top-down, descending only into differing subtrees
+
+    Returns:
+        Tuple (scopes, requests): scopes is [] if everything is in sync, a list of
+        directories whose subtrees must be compared, or None to compare the whole folder
+    """
+    roots = fetch_manifest_nodes(config, project_id, folder_id, [""], children=False)
+    if roots is None:
+        return None, 1
+    if roots[0]["hash"] == local_manifest[""]["hash"]:
+        return [], 1
+
+    scopes = []
+    frontier = [""]
+    request_count = 1
+
+    while frontier:
+        next_frontier = []
+        for i in range(0, len(frontier), MANIFEST_BATCH_SIZE):
+            nodes = fetch_manifest_nodes(
+                config,
+                project_id,
+                folder_id,
+                frontier[i : i + MANIFEST_BATCH_SIZE],
+                children=True,
+            )
+            request_count += 1
+            if nodes is None:
+                return None, request_count
+
+            for node in nodes:
+                path = node["path"]
+                local = local_manifest.get(path)
+                if local is None:
+                    scopes.append(path)
+                    continue
+
+                remote_dirs = {d["name"]: d["hash"] for d in node["directories"]}
+                remote_files = {f["name"]: f["file_hash"] for f in node["files"]}
+                local_dirs = {
+                    name: local_manifest[f"{path}/{name}" if path else name]["hash"]
+                    for name in local["dirs"]
+                }
+
+                # Files or directory structure differ here: compare the whole subtree
+                # (keeps moves between its subdirectories detectable)
+                if (
+                    remote_files != local["files"]
+                    or remote_dirs.keys() != local_dirs.keys()
+                ):
+                    scopes.append(path)
+                    continue
+
+                changed = [
+                    f"{path}/{name}" if path else name
+                    for name, dir_hash in local_dirs.items()
+                    if remote_dirs[name] != dir_hash
+                ]
+                if not changed:
+                    scopes.append(path)
+                next_frontier.extend(changed)
+
+        frontier = next_frontier
+
+    if "" in scopes:
+        return None, request_count
+    return scopes, request_count
+
+
 # ============================================================
 # CLI Commands
 # ============================================================
@@ -450,6 +726,10 @@ def upload(project_id, folder_id, local_path, debug):
     failed = 0
     errors = []
 
+    # Large files go through resumable upload sessions (chunked, resumed on the next run)
+    large_files = [f for f in files if f.stat().st_size > CHUNKED_UPLOAD_THRESHOLD]
+    small_files = [f for f in files if f.stat().st_size <= CHUNKED_UPLOAD_THRESHOLD]
+
     url = f"{config['api_url']}/api/v1/song-projects/{project_id}/folders/{folder_id}/batch-upload"
     headers = {"Authorization": f"Bearer {config['jwt_token']}"}
 
@@ -465,8 +745,8 @@ def upload(project_id, folder_id, local_path, debug):
     ) as progress:
         task = progress.add_task("Uploading files...", total=len(files))
 
-        for i in range(0, len(files), BATCH_SIZE):
-            batch = files[i : i + BATCH_SIZE]
+        for i in range(0, len(small_files), BATCH_SIZE):
+            batch = small_files[i : i + BATCH_SIZE]
 
             # Prepare multipart form data with relative paths
             file_objects = []
@@ -495,7 +775,7 @@ def upload(project_id, folder_id, local_path, debug):
                 # Show intermediate progress while uploading
                 progress.update(
                     task,
-                    description=f"Uploading batch {i // BATCH_SIZE + 1}/{(len(files) + BATCH_SIZE - 1) // BATCH_SIZE}...",
+                    description=f"Uploading batch {i // BATCH_SIZE + 1}/{(len(small_files) + BATCH_SIZE - 1) // BATCH_SIZE}...",
                 )
 
                 if debug:
@@ -568,6 +848,29 @@ def upload(project_id, folder_id, local_path, debug):
             # Advance progress by number of files in batch
             progress.update(task, advance=len(batch), description="Uploading files...")
 
+        for f in large_files:
+            rel_path_str = str(f.relative_to(local_path)).replace("\\", "/")
+            try:
+                ok, error_msg = upload_file_resumable(
+                    config,
+                    project_id,
+                    folder_id,
+                    f,
+                    rel_path_str,
+                    on_chunk=lambda done, total, name=f.name: progress.update(
+                        task, description=f"Uploading {name} ({done}/{total} chunks)..."
+                    ),
+                )
+            except Exception as e:
+                ok, error_msg = False, str(e)
+
+            if ok:
+                uploaded += 1
+            else:
+                failed += 1
+                errors.append({"filename": rel_path_str, "error": error_msg})
+            progress.update(task, advance=1, description="Uploading files...")
+
     # Summary
     console.print("\n[bold]Upload Summary[/bold]")
     console.print(f"[green]✓ Uploaded:[/green] {uploaded} files")
@@ -624,19 +927,30 @@ def download(project_id, folder_id, local_path):
     console.print("[bold]Fetching file list from server...[/bold]")
 
     try:
-        response = requests.get(
-            url,
-            headers=headers,
-            verify=config.get("ssl_verify", False),
-            timeout=30,
-        )
+        # Page through the listing (large sample folders can hold tens of thousands of files)
+        files = []
+        params = {"limit": FILE_LIST_PAGE_SIZE}
+        while True:
+            response = requests.get(
+                url,
+                headers=headers,
+                params=params,
+                verify=config.get("ssl_verify", False),
+                timeout=30,
+            )
 
-        if response.status_code != 200:
-            error = response.json().get("error", f"HTTP {response.status_code}")
-            console.print(f"[red]✗ Failed to fetch file list: {error}[/red]")
-            sys.exit(1)
+            if response.status_code != 200:
+                error = response.json().get("error", f"HTTP {response.status_code}")
+                console.print(f"[red]✗ Failed to fetch file list: {error}[/red]")
+                sys.exit(1)
 
-        files = response.json()["data"]
+            page = response.json()
+            files.extend(page["data"])
+
+            next_cursor = (page.get("pagination") or {}).get("next_cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
 
         if not files:
             console.print("[yellow]✗ No files found in folder[/yellow]")
@@ -954,6 +1268,146 @@ def clone(project_id, local_path, create_dir):
     console.print(f"\n[dim]Project cloned to: {local_path.absolute()}[/dim]")
 
 
+def get_download_filename(response, default):
+    """Filename from Content-Disposition (RFC 5987 filename* preferred)"""
+    disposition = response.headers.get("Content-Disposition", "")
+    for part in disposition.split(";"):
+        key, _, value = part.strip().partition("=")
+        if key == "filename*" and value.lower().startswith("utf-8''"):
+            return Path(unquote(value[7:])).name
+    for part in disposition.split(";"):
+        key, _, value = part.strip().partition("=")
+        if key == "filename" and value:
+            return Path(value.strip('"')).name
+    return default
+
+
+@cli.command()
+@click.argument("project_id")
+@click.argument("output", type=click.Path(), required=False)
+@click.option("--folder", "folder_id", help="Only this folder (folder-relative paths)")
+@click.option(
+    "-x",
+    "--extract",
+    "extract_to",
+    type=click.Path(),
+    help="Extract into this directory (ZIP is deleted afterwards)",
+)
+def archive(project_id, output, folder_id, extract_to):
+    """Download a project (or one folder) as a single ZIP
+
+    The server streams the ZIP directly from storage - one request instead of
+    one per file. Project ZIPs have the same layout as clone, folder ZIPs the
+    same layout as download.
+
+    If OUTPUT is omitted (or a directory), the server-provided name is used.
+
+    Examples:
+        aiproxy-cli archive <project-id>
+        aiproxy-cli archive <project-id> ~/Backups/
+        aiproxy-cli archive <project-id> --folder <folder-id> mix.zip
+        aiproxy-cli archive <project-id> -x ~/Music/MyProject/
+    """
+
+    # Load config
+    config = load_config()
+    if not config:
+        console.print("[red]✗ Not logged in. Run: aiproxy-cli login[/red]")
+        sys.exit(1)
+
+    # Check token expiry
+    if not check_token_expiry(config):
+        console.print("[yellow]Run: aiproxy-cli login[/yellow]")
+        sys.exit(1)
+
+    console.print("[bold]Checking storage backend...[/bold]")
+    if not check_storage_health(config):
+        console.print("[red]✗ Download aborted: Storage backend not reachable[/red]")
+        sys.exit(1)
+    console.print("[green]✓ Storage backend OK[/green]\n")
+
+    url = f"{config['api_url']}/api/v1/song-projects/{project_id}/archive"
+    headers = {"Authorization": f"Bearer {config['jwt_token']}"}
+    params = {"folder_id": folder_id} if folder_id else {}
+
+    try:
+        response = requests.get(
+            url,
+            headers=headers,
+            params=params,
+            verify=config.get("ssl_verify", False),
+            timeout=(30, 600),  # connect, max. silence between chunks
+            stream=True,
+        )
+        if response.status_code != 200:
+            error = response.json().get("error", f"HTTP {response.status_code}")
+            console.print(f"[red]✗ Failed to download archive: {error}[/red]")
+            sys.exit(1)
+
+        filename = get_download_filename(response, f"{project_id}.zip")
+        if extract_to:
+            target_file = Path(extract_to) / f".{filename}.part"
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+        elif output and not Path(output).is_dir():
+            target_file = Path(output)
+        else:
+            target_file = Path(output or ".") / filename
+
+        file_count = int(response.headers.get("X-Archive-File-Count", 0))
+        total_size = int(response.headers.get("X-Archive-Total-Size", 0))
+        console.print(
+            f"Downloading [bold]{file_count}[/bold] files "
+            f"([bold]{total_size / (1024 * 1024):.1f} MB[/bold]) as {filename}"
+        )
+
+        with (
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeRemainingColumn(),
+                console=console,
+            ) as progress,
+            open(target_file, "wb") as f,
+        ):
+            task = progress.add_task("Downloading archive...", total=total_size or None)
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                f.write(chunk)
+                progress.update(task, advance=len(chunk))
+
+    except requests.exceptions.Timeout:
+        console.print("[red]✗ Connection timeout[/red]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
+        sys.exit(1)
+
+    # A truncated stream (server error after the headers) is not a valid ZIP
+    try:
+        with zipfile.ZipFile(target_file) as zf:
+            names = zf.namelist()
+            if extract_to:
+                zf.extractall(extract_to)
+    except zipfile.BadZipFile:
+        console.print("[red]✗ Archive is incomplete (download interrupted)[/red]")
+        sys.exit(1)
+
+    if "MISSING_FILES.txt" in names:
+        console.print(
+            "[yellow]⚠ Some files could not be read from storage "
+            "(listed in MISSING_FILES.txt)[/yellow]"
+        )
+
+    if extract_to:
+        target_file.unlink()
+        console.print(
+            f"\n[dim]Archive extracted to: {Path(extract_to).absolute()}[/dim]"
+        )
+    else:
+        console.print(f"\n[dim]Archive saved to: {target_file.absolute()}[/dim]")
+
+
 @cli.command()
 @click.argument("project_id")
 @click.argument("folder_id")
@@ -1060,8 +1514,7 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
                         rel_path = file_path.relative_to(local_path)
                         rel_path_str = str(rel_path).replace("\\", "/")
 
-                        with open(file_path, "rb") as f:
-                            file_hash = hashlib.sha256(f.read()).hexdigest()
+                        file_hash = hash_file(file_path)
 
                         local_files.append(
                             {
@@ -1097,7 +1550,7 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
         )
     console.print()
 
-    # Step 2: Call mirror endpoint (get diff)
+    # Step 2: Compare manifests (Merkle tree), then get diff for changed subtrees only
     console.print("[bold]🔍 Comparing with remote storage...[/bold]")
 
     url = f"{config['api_url']}/api/v1/song-projects/{project_id}/folders/{folder_id}/mirror"
@@ -1106,34 +1559,60 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
         "Content-Type": "application/json",
     }
 
-    payload = {
-        "files": [
-            {
-                "relative_path": f["relative_path"],
-                "file_hash": f["file_hash"],
-                "file_size_bytes": f["file_size_bytes"],
-            }
-            for f in local_files
-        ]
-    }
-
     try:
-        response = requests.post(
-            url,
-            headers=headers,
-            json=payload,
-            verify=config.get("ssl_verify", False),
-            timeout=30,
+        scopes, manifest_requests = find_changed_scopes(
+            config, project_id, folder_id, build_local_manifest(local_files)
         )
+        if debug:
+            console.print(
+                f"[dim]Manifest: {manifest_requests} request(s), scopes: {scopes}[/dim]"
+            )
 
-        if response.status_code != 200:
-            error = response.json().get("error", f"HTTP {response.status_code}")
-            console.print(f"[red]✗ Mirror compare failed: {error}[/red]")
-            if debug:
-                console.print(f"[dim]Response: {response.text}[/dim]")
-            sys.exit(1)
+        if scopes == []:
+            diff = {
+                "to_upload": [],
+                "to_update": [],
+                "to_move": [],
+                "to_delete": [],
+                "unchanged": [f["relative_path"] for f in local_files],
+            }
+        else:
+            payload = {
+                "files": [
+                    {
+                        "relative_path": f["relative_path"],
+                        "file_hash": f["file_hash"],
+                        "file_size_bytes": f["file_size_bytes"],
+                    }
+                    for f in local_files
+                    if is_in_scopes(f["relative_path"], scopes)
+                ]
+            }
+            if scopes is not None:
+                payload["scopes"] = scopes
 
-        diff = response.json()["data"]
+            response = requests.post(
+                url,
+                headers=headers,
+                json=payload,
+                verify=config.get("ssl_verify", False),
+                timeout=30,
+            )
+
+            if response.status_code != 200:
+                error = response.json().get("error", f"HTTP {response.status_code}")
+                console.print(f"[red]✗ Mirror compare failed: {error}[/red]")
+                if debug:
+                    console.print(f"[dim]Response: {response.text}[/dim]")
+                sys.exit(1)
+
+            diff = response.json()["data"]
+            # Files outside the differing subtrees are unchanged by definition
+            diff["unchanged"] += [
+                f["relative_path"]
+                for f in local_files
+                if not is_in_scopes(f["relative_path"], scopes)
+            ]
 
     except requests.exceptions.Timeout:
         console.print("[red]✗ Connection timeout[/red]")
@@ -1223,9 +1702,39 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
     deleted_count = 0
     errors = []
 
-    # 4a) Upload new/changed files (batch upload like regular upload command)
+    # 4a) Claim content the server already stores, upload only the rest
     files_to_sync = upload_files + update_files
     if files_to_sync:
+        try:
+            claimed = claim_stored_files(config, project_id, folder_id, files_to_sync)
+        except Exception as e:
+            console.print(
+                f"[dim red]Warning: Claim failed, uploading all: {e}[/dim red]"
+            )
+            claimed = set()
+        if claimed:
+            uploaded_count += sum(
+                1 for f in upload_files if f["relative_path"] in claimed
+            )
+            updated_count += sum(
+                1 for f in update_files if f["relative_path"] in claimed
+            )
+            files_to_sync = [
+                f for f in files_to_sync if f["relative_path"] not in claimed
+            ]
+            console.print(
+                f"[dim]♻️  {len(claimed)} files already stored on server (no upload)[/dim]"
+            )
+
+    large_files_to_sync = [
+        f for f in files_to_sync if f["file_size_bytes"] > CHUNKED_UPLOAD_THRESHOLD
+    ]
+    files_to_sync = [
+        f for f in files_to_sync if f["file_size_bytes"] <= CHUNKED_UPLOAD_THRESHOLD
+    ]
+    update_paths = {f["relative_path"] for f in update_files}
+
+    if files_to_sync or large_files_to_sync:
         console.print("[bold]⬆️  Uploading files...[/bold]")
 
         BATCH_SIZE = 3
@@ -1241,7 +1750,9 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
             TimeRemainingColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task("Uploading...", total=len(files_to_sync))
+            task = progress.add_task(
+                "Uploading...", total=len(files_to_sync) + len(large_files_to_sync)
+            )
 
             for i in range(0, len(files_to_sync), BATCH_SIZE):
                 batch = files_to_sync[i : i + BATCH_SIZE]
@@ -1308,6 +1819,34 @@ def mirror(project_id, folder_id, local_path, dry_run, yes, debug):
                         errors.append({"file": f["relative_path"], "error": str(e)})
                     progress.advance(task, advance=len(batch))
 
+            # Large files: resumable chunked upload (interrupted uploads continue on the next run)
+            for f in large_files_to_sync:
+                try:
+                    ok, error = upload_file_resumable(
+                        config,
+                        project_id,
+                        folder_id,
+                        f["local_file_path"],
+                        f["relative_path"],
+                        file_hash=f["file_hash"],
+                        on_chunk=lambda done, total, name=f["relative_path"]: (
+                            progress.update(
+                                task,
+                                description=f"Uploading {name} ({done}/{total} chunks)...",
+                            )
+                        ),
+                    )
+                except Exception as e:
+                    ok, error = False, str(e)
+
+                if ok and f["relative_path"] in update_paths:
+                    updated_count += 1
+                elif ok:
+                    uploaded_count += 1
+                else:
+                    errors.append({"file": f["relative_path"], "error": error})
+                progress.update(task, advance=1, description="Uploading...")
+
         console.print()
 
     # 4b) Move files (S3 server-side copy)
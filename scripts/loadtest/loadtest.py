@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+AiProxy Load Test - Reproducible scenarios against aiproxysrv + aitestmock
+
+Runs a fixed mix of user journeys (chat turns, gallery browsing, project
+upload/download, mirror compare) with N concurrent virtual users for a fixed
+duration, reports throughput, latency percentiles and errors per request and
+compares the result against a stored baseline.
+
+Exit codes:
+    0 = OK, 1 = regression against baseline, 2 = setup failed,
+    3 = no comparable baseline (missing file or different run config; --no-compare to only report)
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import requests
+
+
+SCENARIOS = ("chat", "gallery", "project", "mirror")
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DEFAULT_BASELINE = BASELINE_DIR / "baseline.json"
+PERCENTILES = (50, 90, 95, 99)
+# Relative p95 / throughput changes below this many ms / req/s are noise, even if above the threshold
+MIN_P95_DELTA_MS = 5.0
+MIN_THROUGHPUT_DELTA = 0.5
+# Absolute error-rate increase (percentage points) that counts as regression
+MAX_ERROR_RATE_INCREASE = 1.0
+
+
+# ============================================================
+# Statistics
+# ============================================================
+
+
+class Stats:
+    """Thread-safe latency / error recorder per request name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: dict[str, list[float]] = {}
+        self._errors: dict[str, int] = {}
+        self._error_samples: dict[str, str] = {}
+
+    def record(self, name: str, elapsed_ms: float, ok: bool, error: str | None = None) -> None:
+        with self._lock:
+            self._latencies.setdefault(name, []).append(elapsed_ms)
+            if not ok:
+                self._errors[name] = self._errors.get(name, 0) + 1
+                self._error_samples.setdefault(name, error or "")
+
+    def summary(self, duration_s: float) -> dict:
+        """Per-request summary: count, errors, error rate, throughput, min/mean/max and percentiles"""
+        with self._lock:
+            requests_summary = {}
+            for name in sorted(self._latencies):
+                requests_summary[name] = _summarize(
+                    self._latencies[name], self._errors.get(name, 0), duration_s, self._error_samples.get(name)
+                )
+            all_latencies = [ms for values in self._latencies.values() for ms in values]
+            total = _summarize(all_latencies, sum(self._errors.values()), duration_s, None)
+        return {"total": total, "requests": requests_summary}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of an ascending list (same definition as numpy's default)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def _summarize(latencies: list[float], errors: int, duration_s: float, error_sample: str | None) -> dict:
+    values = sorted(latencies)
+    count = len(values)
+    result = {
+        "count": count,
+        "errors": errors,
+        "error_rate_pct": round(errors * 100 / count, 2) if count else 0.0,
+        "throughput_rps": round(count / duration_s, 2) if duration_s > 0 else 0.0,
+        "min_ms": round(values[0], 1) if values else 0.0,
+        "mean_ms": round(sum(values) / count, 1) if count else 0.0,
+        "max_ms": round(values[-1], 1) if values else 0.0,
+    }
+    for pct in PERCENTILES:
+        result[f"p{pct}_ms"] = round(percentile(values, pct), 1)
+    if error_sample:
+        result["first_error"] = error_sample[:200]
+    return result
+
+
+# ============================================================
+# HTTP client
+# ============================================================
+
+
+class Client:
+    """requests.Session wrapper that times every call and records it under a stable name"""
+
+    def __init__(self, api_url: str, token: str, stats: Stats, verify_ssl: bool, timeout: float):
+        self.api_url = api_url.rstrip("/")
+        self.stats = stats
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.verify = verify_ssl
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def call(self, name: str, method: str, path: str, expected: tuple[int, ...] = (200,), **kwargs):
+        """Send a request, record latency under name; returns the response or None on failure"""
+        stream = kwargs.pop("stream", False)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, f"{self.api_url}{path}", timeout=self.timeout, stream=stream, **kwargs
+            )
+            if stream:
+                # Downloads count until the last byte, not just the headers
+                for _ in response.iter_content(chunk_size=256 * 1024):
+                    pass
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            ok = response.status_code in expected
+            self.stats.record(name, elapsed_ms, ok, None if ok else f"HTTP {response.status_code}")
+            return response if ok else None
+        except requests.RequestException as e:
+            self.stats.record(name, (time.perf_counter() - start) * 1000, False, type(e).__name__)
+            return None
+
+
+def login(api_url: str, email: str, password: str, verify_ssl: bool) -> str:
+    response = requests.post(
+        f"{api_url.rstrip('/')}/api/v1/user/login",
+        json={"email": email, "password": password},
+        verify=verify_ssl,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+# ============================================================
+# Synthetic data
+# ============================================================
+
+
+def synthetic_files(rng: random.Random, count: int, size_bytes: int) -> list[tuple[str, bytes]]:
+    """Deterministic (relative_path, content) pairs, spread over a few sub directories"""
+    files = []
+    for i in range(count):
+        rel_path = f"take{i % 4}/stem_{i:04d}.wav"
+        files.append((rel_path, rng.randbytes(size_bytes)))
+    return files
+
+
+def mirror_payload(rng: random.Random, uploaded: list[tuple[str, bytes]], extra_files: int) -> list[dict]:
+    """Local file list for mirror compare: uploaded files (one changed) plus new ones"""
+    local = [
+        {"relative_path": path, "file_hash": hashlib.sha256(content).hexdigest(), "file_size_bytes": len(content)}
+        for path, content in uploaded
+    ]
+    if local:
+        local[0]["file_hash"] = hashlib.sha256(b"changed").hexdigest()
+    for i in range(extra_files):
+        local.append(
+            {
+                "relative_path": f"new/file_{i:05d}.wav",
+                "file_hash": f"{rng.getrandbits(256):064x}",
+                "file_size_bytes": rng.randint(1_000, 50_000_000),
+            }
+        )
+    return local
+
+
+# ============================================================
+# Scenarios
+# ============================================================
+
+
+class VirtualUser:
+    """One simulated user; owns its conversation / project and runs the scenario mix in a fixed order"""
+
+    def __init__(self, index: int, client: Client, args: argparse.Namespace):
+        self.index = index
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.seed * 1000 + index)
+        self.conversation_id: str | None = None
+        self.project_id: str | None = None
+        self.folder_id: str | None = None
+        self.uploaded: list[tuple[str, bytes]] = []
+        self.mirror_files: list[dict] = []
+        self.image_ids: list[str] = []
+
+    # --- setup / teardown (not part of the measured results) ---
+
+    def setup(self, scenarios: list[str]) -> None:
+        setup_client = Client(self.client.api_url, "", Stats(), self.client.session.verify, self.client.timeout)
+        setup_client.session.headers = self.client.session.headers
+
+        if "chat" in scenarios:
+            response = setup_client.call(
+                "setup",
+                "POST",
+                "/api/v1/conversations",
+                expected=(200, 201),
+                json={
+                    "title": f"loadtest-{self.args.run_id}-{self.index}",
+                    "model": self.args.chat_model,
+                    "provider": "external",
+                    "external_provider": self.args.chat_provider,
+                },
+            )
+            if response is None:
+                raise RuntimeError("creating conversation failed")
+            self.conversation_id = response.json()["id"]
+
+        if "project" in scenarios or "mirror" in scenarios:
+            response = setup_client.call(
+                "setup",
+                "POST",
+                "/api/v1/song-projects",
+                expected=(200, 201),
+                json={"project_name": f"loadtest-{self.args.run_id}-{self.index}"},
+            )
+            if response is None:
+                raise RuntimeError("creating song project failed")
+            self.project_id = response.json()["data"]["id"]
+            project = setup_client.call("setup", "GET", f"/api/v1/song-projects/{self.project_id}")
+            if project is None or not project.json()["data"].get("folders"):
+                raise RuntimeError("loading song project folders failed")
+            self.folder_id = project.json()["data"]["folders"][0]["id"]
+            self.uploaded = synthetic_files(self.rng, self.args.files, self.args.file_size)
+            self._upload(setup_client, "setup")
+            self.mirror_files = mirror_payload(self.rng, self.uploaded, self.args.mirror_files)
+
+        if "gallery" in scenarios:
+            response = setup_client.call("setup", "GET", "/api/v1/image/list", params={"limit": 50})
+            if response is not None:
+                self.image_ids = [image["id"] for image in response.json().get("images", [])]
+
+    def teardown(self) -> None:
+        if self.args.keep_data:
+            return
+        paths = []
+        if self.conversation_id:
+            paths.append(f"/api/v1/conversations/{self.conversation_id}")
+        if self.project_id:
+            paths.append(f"/api/v1/song-projects/{self.project_id}")
+        for path in paths:
+            try:
+                self.client.session.delete(f"{self.client.api_url}{path}", timeout=self.client.timeout)
+            except requests.RequestException as e:
+                print(f"⚠ Cleanup of {path} failed: {e}", file=sys.stderr)
+
+    # --- measured scenarios ---
+
+    def run_chat(self) -> None:
+        self.client.call(
+            "chat.send_message",
+            "POST",
+            f"/api/v1/conversations/{self.conversation_id}/messages",
+            json={"content": f"Load test message {self.rng.randint(0, 10**6)}: write two lines about rain."},
+        )
+
+    def run_gallery(self) -> None:
+        response = self.client.call("gallery.list", "GET", "/api/v1/image/list", params={"limit": 20})
+        image_ids = [image["id"] for image in response.json().get("images", [])] if response is not None else []
+        for image_id in (image_ids or self.image_ids)[:6]:
+            self.client.call("gallery.thumbnail", "GET", f"/api/v1/image/s3/{image_id}", params={"size": "thumb"})
+
+    def run_project(self) -> None:
+        base = f"/api/v1/song-projects/{self.project_id}"
+        self.client.call("project.get", "GET", base)
+        self.client.call("project.list_files", "GET", f"{base}/folders/{self.folder_id}/files")
+        self._upload(self.client, "project.batch_upload")
+        self.client.call("project.archive", "GET", f"{base}/archive", params={"folder_id": self.folder_id}, stream=True)
+
+    def run_mirror(self) -> None:
+        self.client.call(
+            "mirror.compare",
+            "POST",
+            f"/api/v1/song-projects/{self.project_id}/folders/{self.folder_id}/mirror",
+            json={"files": self.mirror_files},
+        )
+
+    def _upload(self, client: Client, name: str) -> None:
+        files = [("files", (rel_path, io.BytesIO(content), "audio/wav")) for rel_path, content in self.uploaded]
+        client.call(
+            name, "POST", f"/api/v1/song-projects/{self.project_id}/folders/{self.folder_id}/batch-upload", files=files
+        )
+
+    def run(self, scenarios: list[str], deadline: float) -> None:
+        handlers = {
+            "chat": self.run_chat,
+            "gallery": self.run_gallery,
+            "project": self.run_project,
+            "mirror": self.run_mirror,
+        }
+        # Fixed order per user, shifted by index so users do not hit the same endpoint in lockstep
+        offset = self.index % len(scenarios)
+        order = scenarios[offset:] + scenarios[:offset]
+        while time.monotonic() < deadline:
+            for scenario in order:
+                if time.monotonic() >= deadline:
+                    return
+                handlers[scenario]()
+                if self.args.think_time_ms:
+                    time.sleep(self.args.think_time_ms / 1000)
+
+
+# ============================================================
+# Baseline comparison
+# ============================================================
+
+
+def compare(result: dict, baseline: dict, threshold_pct: float) -> list[str]:
+    """Regressions of result vs baseline: p95 latency, throughput and error rate per request"""
+    regressions = []
+    base_requests = baseline.get("requests", {})
+    for name, current in result["requests"].items():
+        base = base_requests.get(name)
+        if not base:
+            continue
+        p95_delta = current["p95_ms"] - base["p95_ms"]
+        if base["p95_ms"] > 0 and p95_delta > MIN_P95_DELTA_MS and p95_delta * 100 / base["p95_ms"] > threshold_pct:
+            regressions.append(
+                f"{name}: p95 {base['p95_ms']:.1f} ms -> {current['p95_ms']:.1f} ms "
+                f"(+{p95_delta * 100 / base['p95_ms']:.0f}%)"
+            )
+        rps_delta = base["throughput_rps"] - current["throughput_rps"]
+        if (
+            base["throughput_rps"] > 0
+            and rps_delta > MIN_THROUGHPUT_DELTA
+            and rps_delta * 100 / base["throughput_rps"] > threshold_pct
+        ):
+            regressions.append(
+                f"{name}: throughput {base['throughput_rps']:.2f} -> {current['throughput_rps']:.2f} req/s "
+                f"(-{rps_delta * 100 / base['throughput_rps']:.0f}%)"
+            )
+        if current["error_rate_pct"] - base["error_rate_pct"] > MAX_ERROR_RATE_INCREASE:
+            regressions.append(f"{name}: error rate {base['error_rate_pct']}% -> {current['error_rate_pct']}%")
+    for name in sorted(base_requests.keys() - result["requests"].keys()):
+        regressions.append(f"{name}: in baseline, but not measured in this run")
+    return regressions
+
+
+def comparable(result: dict, baseline: dict) -> list[str]:
+    """Config mismatches that make a baseline comparison meaningless"""
+    keys = ("scenarios", "users", "duration_s", "seed", "files", "file_size", "mirror_files", "think_time_ms")
+    return [
+        f"{key}: baseline={baseline['config'].get(key)} run={result['config'].get(key)}"
+        for key in keys
+        if baseline.get("config", {}).get(key) != result["config"].get(key)
+    ]
+
+
+# ============================================================
+# Output
+# ============================================================
+
+
+def print_report(result: dict) -> None:
+    header = f"{'request':<24}{'count':>8}{'err':>6}{'rps':>8}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["requests"].items()) + [("TOTAL", result["total"])]
+    for name, s in rows:
+        print(
+            f"{name:<24}{s['count']:>8}{s['errors']:>6}{s['throughput_rps']:>8.2f}"
+            f"{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}"
+        )
+    for name, s in result["requests"].items():
+        if s.get("first_error"):
+            print(f"  {name}: first error: {s['first_error']}")
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+# ============================================================
+# Main
+# ============================================================
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Reproducible load test against aiproxysrv + aitestmock")
+    parser.add_argument("--api-url", default=os.getenv("LOADTEST_API_URL", "http://localhost:5050"))
+    parser.add_argument("--email", default=os.getenv("LOADTEST_EMAIL"))
+    parser.add_argument("--password", default=os.getenv("LOADTEST_PASSWORD"))
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma separated subset of {SCENARIOS}")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=int, default=60, help="Measured duration in seconds")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for synthetic data and message content")
+    parser.add_argument("--think-time-ms", type=int, default=0, help="Pause between scenario steps per user")
+    parser.add_argument("--files", type=int, default=20, help="Files per project upload")
+    parser.add_argument("--file-size", type=int, default=256 * 1024, help="Bytes per uploaded file")
+    parser.add_argument("--mirror-files", type=int, default=2000, help="Additional local files sent to mirror compare")
+    parser.add_argument("--chat-provider", default="openai", choices=("openai", "claude"))
+    parser.add_argument("--chat-model", default="gpt-4o-mini")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-request timeout in seconds")
+    parser.add_argument("--insecure", action="store_true", help="Skip TLS verification (self-signed certs)")
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete created conversations/projects")
+    parser.add_argument("--output", type=Path, help="Write the JSON result to this file")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--no-compare", action="store_true", help="Only report, no baseline comparison (ad-hoc runs)")
+    parser.add_argument("--threshold-pct", type=float, default=20.0, help="Allowed p95/throughput regression in %%")
+    args = parser.parse_args(argv)
+
+    args.scenario_list = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(args.scenario_list) - set(SCENARIOS)
+    if unknown or not args.scenario_list:
+        parser.error(f"unknown scenarios: {sorted(unknown)} (choose from {SCENARIOS})")
+    if not args.email or not args.password:
+        parser.error("--email/--password (or LOADTEST_EMAIL/LOADTEST_PASSWORD) are required")
+    args.run_id = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    verify_ssl = not args.insecure
+
+    try:
+        token = login(args.api_url, args.email, args.password, verify_ssl)
+    except (requests.RequestException, KeyError) as e:
+        print(f"✗ Login failed: {e}", file=sys.stderr)
+        return 2
+
+    stats = Stats()
+    users = [
+        VirtualUser(i, Client(args.api_url, token, stats, verify_ssl, args.timeout), args) for i in range(args.users)
+    ]
+
+    print(f"Setting up {args.users} users ({', '.join(args.scenario_list)})...")
+    try:
+        for user in users:
+            user.setup(args.scenario_list)
+
+        print(f"Running for {args.duration}s...")
+        started = time.monotonic()
+        deadline = started + args.duration
+        threads = [
+            threading.Thread(target=user.run, args=(args.scenario_list, deadline), name=f"vu-{user.index}")
+            for user in users
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    except (RuntimeError, requests.RequestException, KeyError) as e:
+        print(f"✗ Setup failed: {e}", file=sys.stderr)
+        return 2
+    finally:
+        for user in users:
+            user.teardown()
+
+    result = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "git_revision": git_revision(),
+        "config": {
+            "scenarios": args.scenario_list,
+            "users": args.users,
+            "duration_s": args.duration,
+            "seed": args.seed,
+            "files": args.files,
+            "file_size": args.file_size,
+            "mirror_files": args.mirror_files,
+            "think_time_ms": args.think_time_ms,
+            "chat_provider": args.chat_provider,
+        },
+        **stats.summary(elapsed),
+    }
+
+    print()
+    print_report(result)
+    if args.output:
+        write_json(args.output, result)
+        print(f"\n✓ Result written to {args.output}")
+
+    if args.save_baseline:
+        write_json(args.baseline, result)
+        print(f"✓ Baseline stored: {args.baseline}")
+        return 0
+
+    if args.no_compare:
+        return 0
+
+    # The gate must never pass without comparing: missing or non-comparable baselines fail
+    if not args.baseline.exists():
+        print(
+            f"\n✗ No baseline at {args.baseline} - record one on the reference machine with "
+            "`make loadtest-baseline` (or use --no-compare for ad-hoc runs)",
+            file=sys.stderr,
+        )
+        return 3
+
+    baseline = json.loads(args.baseline.read_text())
+    mismatches = comparable(result, baseline)
+    if mismatches:
+        print("\n✗ Run config differs from baseline, nothing compared (--no-compare for ad-hoc runs):", file=sys.stderr)
+        for mismatch in mismatches:
+            print(f"  {mismatch}", file=sys.stderr)
+        return 3
+
+    regressions = compare(result, baseline, args.threshold_pct)
+    if regressions:
+        print(f"\n✗ Regression vs baseline ({baseline.get('git_revision')}, threshold {args.threshold_pct:.0f}%):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\n✓ No regression vs baseline ({baseline.get('git_revision')}, threshold {args.threshold_pct:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())